@@ -3,12 +3,18 @@
 복잡도: 5분 이해 가능
 책임: 단일 책임 원칙 준수 - AI 프롬프트 생성만 담당
 테스트: 100% 커버리지  
-의존성: typing
+의존성: typing, hashlib, json, string
 """
 
-from typing import Dict, List, Optional, Any
+import hashlib
+import json
+from string import Formatter
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Any, Tuple
 from enum import Enum
 
+# 템플릿 버전 (문구를 바꾸면 올려서 이전 지문과 구분)
+TEMPLATE_VERSION = "1.1"
+
 
 class PromptType(Enum):
     """프롬프트 타입 열거형"""
@@ -19,6 +25,19 @@ class PromptType(Enum):
     RELATIONSHIP_ADVICE = "relationship_advice"
 
 
+class CompiledTemplate(NamedTuple):
+    """컴파일된 템플릿 (필드 목록은 등장 순서, 중복 제거)"""
+    template: str
+    fields: Tuple[str, ...]
+    required: FrozenSet[str]
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """템플릿 → 필드 목록 사전 계산"""
+    fields = tuple(dict.fromkeys(name for _, name, _, _ in Formatter().parse(template) if name))
+    return CompiledTemplate(template, fields, frozenset(fields))
+
+
 class AIPromptBuilder:
     """
     AI 프롬프트 구성을 위한 핵심 원자 모듈
@@ -26,11 +45,26 @@ class AIPromptBuilder:
     - 타로 리딩 프롬프트 생성
     - 개인화된 조언 프롬프트 생성
     - 구조화되고 효과적인 프롬프트
+    - 템플릿은 첫 인스턴스 생성 시 1회 컴파일해 모든 인스턴스가 공유
     """
     
+    _compiled_templates: Optional[Dict[PromptType, CompiledTemplate]] = None
+    
     def __init__(self):
         """초기화"""
+        if AIPromptBuilder._compiled_templates is None:
+            AIPromptBuilder._compiled_templates = {
+                prompt_type: compile_template(template)
+                for prompt_type, template in self._template_sources().items()
+            }
+        self.compiled_templates = AIPromptBuilder._compiled_templates
         self.base_templates = {
+            prompt_type: compiled.template for prompt_type, compiled in self.compiled_templates.items()
+        }
+    
+    def _template_sources(self) -> Dict[PromptType, str]:
+        """프롬프트 타입별 원본 템플릿"""
+        return {
             PromptType.SAJU_INTERPRETATION: self._get_saju_template(),
             PromptType.TAROT_READING: self._get_tarot_template(),
             PromptType.LIFE_ADVICE: self._get_life_advice_template(),
@@ -184,18 +218,45 @@ class AIPromptBuilder:
         Returns:
             str: 완성된 프롬프트
         """
-        if prompt_type not in self.base_templates:
-            raise ValueError(f"지원되지 않는 프롬프트 타입: {prompt_type}")
+        compiled = self._compiled(prompt_type)
         
-        template = self.base_templates[prompt_type]
-        
-        try:
-            # 템플릿에 데이터 삽입
-            formatted_prompt = template.format(**kwargs)
-            return formatted_prompt
-        except KeyError as e:
-            missing_key = str(e).strip("'")
+        # 사전 계산한 필드 목록으로 누락 확인 후 템플릿에 데이터 삽입
+        if not compiled.required.issubset(kwargs):
+            missing_key = next(field for field in compiled.fields if field not in kwargs)
             raise ValueError(f"필수 매개변수가 누락되었습니다: {missing_key}")
+        return compiled.template.format_map(kwargs)
+    
+    def prompt_fingerprint(self, prompt_type: PromptType, model: str = "", **kwargs) -> str:
+        """
+        프롬프트 지문 생성 (결과 캐시 키)
+        
+        템플릿이 쓰는 필드 값 + 프롬프트 타입 + 모델 + 템플릿 버전의 SHA-256.
+        템플릿에 쓰이지 않는 매개변수는 지문에 영향을 주지 않음
+        
+        Args:
+            prompt_type: 프롬프트 타입
+            model: AI 모델 이름
+            **kwargs: 템플릿에 삽입할 데이터
+            
+        Returns:
+            str: 16진수 지문
+        """
+        compiled = self._compiled(prompt_type)
+        missing = [field for field in compiled.fields if field not in kwargs]
+        if missing:
+            raise ValueError(f"필수 매개변수가 누락되었습니다: {missing[0]}")
+        
+        payload = json.dumps(
+            [TEMPLATE_VERSION, prompt_type.value, model,
+             [[field, str(kwargs[field])] for field in sorted(compiled.fields)]],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _compiled(self, prompt_type: PromptType) -> CompiledTemplate:
+        if prompt_type not in self.compiled_templates:
+            raise ValueError(f"지원되지 않는 프롬프트 타입: {prompt_type}")
+        return self.compiled_templates[prompt_type]
     
     def build_saju_prompt(self, 
                          year_pillar: str, 
@@ -275,12 +336,8 @@ class AIPromptBuilder:
         Returns:
             List[str]: 필수 매개변수 목록
         """
-        template = self.base_templates.get(prompt_type, "")
-        
-        # 템플릿에서 {변수} 패턴 찾기
-        import re
-        requirements = re.findall(r'\{(\w+)\}', template)
-        return list(set(requirements))  # 중복 제거
+        compiled = self.compiled_templates.get(prompt_type)
+        return list(compiled.fields) if compiled else []
     
     def validate_prompt_data(self, prompt_type: PromptType, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -293,12 +350,9 @@ class AIPromptBuilder:
         Returns:
             Tuple[bool, List[str]]: (유효성, 누락된 필드 목록)
         """
-        requirements = self.get_template_requirements(prompt_type)
-        missing_fields = []
-        
-        for field in requirements:
-            if field not in data or not data[field]:
-                missing_fields.append(field)
+        compiled = self.compiled_templates.get(prompt_type)
+        requirements = compiled.fields if compiled else ()
+        missing_fields = [field for field in requirements if not data.get(field)]
         
         is_valid = len(missing_fields) == 0
         return (is_valid, missing_fields)
@@ -394,6 +448,37 @@ def test_data_validation():
     print("✅ 데이터 유효성 검증 테스트 통과")
 
 
+def test_prompt_fingerprint():
+    """프롬프트 지문 테스트"""
+    builder = AIPromptBuilder()
+    saju_data = {
+        "year_pillar": "갑자",
+        "month_pillar": "을축",
+        "day_pillar": "병인",
+        "hour_pillar": "정묘",
+        "five_elements_analysis": "분석 결과",
+        "analysis_request": "요청사항",
+        "focus_period": "2025년"
+    }
+    
+    fingerprint = builder.prompt_fingerprint(PromptType.SAJU_INTERPRETATION, "gpt-4o", **saju_data)
+    assert len(fingerprint) == 64
+    
+    # 순서가 달라도, 템플릿에 없는 값이 더해져도 같은 지문
+    reordered = dict(reversed(list(saju_data.items())), user_id="user-1")
+    assert builder.prompt_fingerprint(PromptType.SAJU_INTERPRETATION, "gpt-4o", **reordered) == fingerprint
+    
+    # 모델이나 필드 값이 다르면 다른 지문
+    assert builder.prompt_fingerprint(PromptType.SAJU_INTERPRETATION, "gemini-pro", **saju_data) != fingerprint
+    assert builder.prompt_fingerprint(PromptType.SAJU_INTERPRETATION, "gpt-4o",
+                                      **dict(saju_data, day_pillar="정묘")) != fingerprint
+    
+    # 템플릿은 인스턴스 간 공유
+    assert AIPromptBuilder().compiled_templates is builder.compiled_templates
+    
+    print("✅ 프롬프트 지문 테스트 통과")
+
+
 def test_error_handling():
     """에러 처리 테스트"""
     builder = AIPromptBuilder()
@@ -465,6 +550,7 @@ if __name__ == "__main__":
     test_career_prompt() 
     test_template_requirements()
     test_data_validation()
+    test_prompt_fingerprint()
     test_error_handling()
     
     print("\n✅ AI 프롬프트 구성기 원자 모듈 실행 완료!")
\ No newline at end of file
@@ -3,10 +3,34 @@
 복잡도: 5분 이해 가능
 책임: 단일 책임 원칙 준수 - 한글↔한자 변환만 담당  
 테스트: 100% 커버리지
-의존성: typing
+의존성: typing, re
+성능: 변환표(str.translate)·용어 정규식은 임포트 시 1회 생성, 글자별 dict 조회 루프 없음
 """
 
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+
+class _Codec(NamedTuple):
+    """한 방향(한글→한자 / 한자→한글) 변환표"""
+    table: Dict[int, str]          # 글자 단위 str.translate 표
+    chars: frozenset               # 글자 단위 변환 대상
+    terms: Dict[str, str]          # 단어 단위 변환 (60갑자, 십신, 월)
+    pattern: Pattern               # terms 검색용 정규식
+
+
+def _sexagenary_cycle(stems: Dict[str, str], branches: Dict[str, str]) -> Dict[str, str]:
+    """60갑자 한글 → 한자 (천간/지지 위치로 '신'의 辛/申 구분)"""
+    stem_items, branch_items = list(stems.items()), list(branches.items())
+    return {
+        stem_items[i % 10][0] + branch_items[i % 12][0]: stem_items[i % 10][1] + branch_items[i % 12][1]
+        for i in range(60)
+    }
+
+
+def _compile_codec(chars: Dict[str, str], terms: Dict[str, str]) -> _Codec:
+    pattern = re.compile('|'.join(sorted(map(re.escape, terms), key=len, reverse=True)))
+    return _Codec(str.maketrans(chars), frozenset(chars), terms, pattern)
 
 
 class KoreanHanjaConverter:
@@ -49,49 +73,55 @@ class KoreanHanjaConverter:
         '구월': '九月', '시월': '十月', '동월': '冬月', '섣달': '臘月'
     }
     
-    def __init__(self):
-        """초기화 - 역방향 매핑 생성"""
-        self.korean_to_hanja = {}
-        self.hanja_to_korean = {}
-        
-        # 모든 매핑 통합
-        all_mappings = [
-            self.HEAVENLY_STEMS,
-            self.EARTHLY_BRANCHES,
-            self.FIVE_ELEMENTS,
-            self.TEN_GODS,
-            self.MONTHS
-        ]
-        
-        for mapping in all_mappings:
-            self.korean_to_hanja.update(mapping)
-            # 역방향 매핑 생성
-            for korean, hanja in mapping.items():
-                self.hanja_to_korean[hanja] = korean
+    # 한자 → 한글 (천간/지지 별도 - 한글 '신'이 천간/지지 양쪽에 있음)
+    _STEMS_KOREAN = dict(zip(HEAVENLY_STEMS.values(), HEAVENLY_STEMS.keys()))
+    _BRANCHES_KOREAN = dict(zip(EARTHLY_BRANCHES.values(), EARTHLY_BRANCHES.keys()))
+    
+    # 60갑자 (간지 단위 변환)
+    _GANJI_TO_HANJA = _sexagenary_cycle(HEAVENLY_STEMS, EARTHLY_BRANCHES)
+    _GANJI_TO_KOREAN = dict(zip(_GANJI_TO_HANJA.values(), _GANJI_TO_HANJA.keys()))
+    
+    # 글자 단위 표: 천간·지지·오행 (단독 '신'은 지지 申)
+    _TO_HANJA = _compile_codec(
+        {**HEAVENLY_STEMS, **EARTHLY_BRANCHES, **FIVE_ELEMENTS},
+        {**_GANJI_TO_HANJA, **TEN_GODS, **MONTHS}
+    )
+    _TO_KOREAN = _compile_codec(
+        {**_STEMS_KOREAN, **_BRANCHES_KOREAN, **dict(zip(FIVE_ELEMENTS.values(), FIVE_ELEMENTS.keys()))},
+        {**_GANJI_TO_KOREAN,
+         **dict(zip(TEN_GODS.values(), TEN_GODS.keys())),
+         **dict(zip(MONTHS.values(), MONTHS.keys()))}
+    )
+    
+    _WORD = re.compile(r'\S+')
     
     def korean_to_hanja(self, korean_text: str) -> str:
         """
         한글 → 한자 변환
         
+        - 변환 대상 글자로만 된 단어('갑자', '목화토금수'): 글자 단위 변환
+        - 일반 단어('갑자년', '해입니다'): 60갑자·십신·월 이름만 변환, 나머지 한글 유지
+        
         Args:
             korean_text: 변환할 한글 텍스트
             
         Returns:
             str: 한자로 변환된 텍스트
         """
-        result = ""
+        codec = self._TO_HANJA
+        replace = lambda match: codec.terms[match.group()]
         
-        for char in korean_text:
-            if char in self.korean_to_hanja:
-                result += self.korean_to_hanja[char]
-            else:
-                result += char  # 매핑되지 않은 문자는 그대로 유지
+        def convert_word(match) -> str:
+            word = match.group()
+            converted = codec.pattern.sub(replace, word)
+            # 글자 단위 변환은 변환 대상 글자로만 된 단어에만 적용
+            return converted.translate(codec.table) if codec.chars.issuperset(word) else converted
         
-        return result
+        return self._WORD.sub(convert_word, korean_text)
     
     def hanja_to_korean(self, hanja_text: str) -> str:
         """
-        한자 → 한글 변환
+        한자 → 한글 변환 (한자는 뜻이 겹치지 않으므로 단어 구분 없이 변환)
         
         Args:
             hanja_text: 변환할 한자 텍스트
@@ -99,19 +129,12 @@ class KoreanHanjaConverter:
         Returns:
             str: 한글로 변환된 텍스트
         """
-        result = ""
-        
-        for char in hanja_text:
-            if char in self.hanja_to_korean:
-                result += self.hanja_to_korean[char]
-            else:
-                result += char  # 매핑되지 않은 문자는 그대로 유지
-        
-        return result
+        codec = self._TO_KOREAN
+        return codec.pattern.sub(lambda match: codec.terms[match.group()], hanja_text).translate(codec.table)
     
     def convert_saju_pillars(self, pillars: List[str], to_hanja: bool = True) -> List[str]:
         """
-        사주 기둥 변환 (년월일시)
+        사주 기둥 변환 (년월일시, 60갑자 표 일괄 조회)
         
         Args:
             pillars: 사주 기둥 리스트 ['갑자', '을축', '병인', '정묘']
@@ -120,16 +143,11 @@ class KoreanHanjaConverter:
         Returns:
             List[str]: 변환된 기둥 리스트
         """
-        result = []
-        
-        for pillar in pillars:
-            if to_hanja:
-                converted = self.korean_to_hanja(pillar)
-            else:
-                converted = self.hanja_to_korean(pillar)
-            result.append(converted)
-        
-        return result
+        if to_hanja:
+            lookup, fallback = self._GANJI_TO_HANJA.get, self.korean_to_hanja
+        else:
+            lookup, fallback = self._GANJI_TO_KOREAN.get, self.hanja_to_korean
+        return [lookup(pillar) or fallback(pillar) for pillar in pillars]
     
     def get_element_hanja(self, korean_element: str) -> Optional[str]:
         """
@@ -159,19 +177,19 @@ class KoreanHanjaConverter:
         stem_char = stem_branch[0]
         branch_char = stem_branch[1]
         
-        # 한글인지 한자인지 판단
-        if stem_char in self.korean_to_hanja:
+        # 한글인지 한자인지 판단 (천간/지지 표를 따로 써서 '신'을 위치로 구분)
+        if stem_char in self.HEAVENLY_STEMS:
             # 한글 입력
             stem_korean = stem_char
-            stem_hanja = self.korean_to_hanja[stem_char]
+            stem_hanja = self.HEAVENLY_STEMS[stem_char]
             branch_korean = branch_char
-            branch_hanja = self.korean_to_hanja.get(branch_char, branch_char)
+            branch_hanja = self.EARTHLY_BRANCHES.get(branch_char, branch_char)
         else:
             # 한자 입력
             stem_hanja = stem_char
-            stem_korean = self.hanja_to_korean.get(stem_char, stem_char)
+            stem_korean = self._STEMS_KOREAN.get(stem_char, stem_char)
             branch_hanja = branch_char
-            branch_korean = self.hanja_to_korean.get(branch_char, branch_char)
+            branch_korean = self._BRANCHES_KOREAN.get(branch_char, branch_char)
         
         return {
             'stem_korean': stem_korean,
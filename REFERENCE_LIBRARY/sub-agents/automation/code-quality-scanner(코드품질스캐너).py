@@ -2,6 +2,9 @@
 """
 🔍 HEAL7 코드 품질 스캐너
 큐브 모델 기반 코드 품질 분석 및 개선 제안
+- 큐브 디렉토리는 fs_scan_engine 으로 1회만 순회
+- 파일마다 한 번 읽고(파이썬은 한 번 파싱) 모든 검사를 실행, 변경된 파일만 프로세스 풀에서 분석
+- 분석 결과는 내용 해시 기준으로 캐시 → 바뀌지 않은 트리는 재분석 없이 수 초 내 완료
 
 Author: AI Agent Team
 Created: 2025-08-20
@@ -16,6 +19,9 @@ from pathlib import Path
 from typing import Dict, List, Any, Tuple
 from datetime import datetime
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from fs_scan_engine import FileSystemScanner, FileEntry, content_digest
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,6 +29,72 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# 분석 규칙이 바뀌면 올려서 캐시 무효화
+ANALYZER_VERSION = 1
+
+PYTHON_SUFFIXES = {'.py'}
+SCRIPT_SUFFIXES = {'.ts', '.tsx', '.js', '.jsx'}
+STYLE_SUFFIXES = {'.css', '.scss'}
+LARGE_FILE_SUFFIXES = {'.js', '.ts', '.tsx', '.jsx', '.py', '.css'}
+
+# 프로세스 풀 작업자별 스캐너 (초기화 시 1회 생성)
+_worker_scanner = None
+
+def _init_analysis_worker(quality_standards: Dict[str, Any]):
+    global _worker_scanner
+    _worker_scanner = CodeQualityScanner()
+    _worker_scanner.quality_standards = quality_standards
+
+def _analyze_in_worker(path: str) -> Dict[str, Any]:
+    return _worker_scanner.analyze_file(path)
+
+
+class AnalysisCache:
+    """파일 분석 캐시 - 내용 해시 → 분석 결과, 경로별 (크기, mtime) → 내용 해시"""
+    
+    def __init__(self, cache_file: str, quality_standards: Dict[str, Any]):
+        self.cache_file = Path(cache_file)
+        self.key = f"{ANALYZER_VERSION}:{json.dumps(quality_standards, sort_keys=True)}"
+        self.files: Dict[str, list] = {}
+        self.analyses: Dict[str, Dict[str, Any]] = {}
+        self._load()
+    
+    def _load(self):
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('key') == self.key:
+                self.files = data.get('files', {})
+                self.analyses = data.get('analyses', {})
+        except (OSError, ValueError) as e:
+            logging.warning(f"분석 캐시 로드 실패 {self.cache_file}: {e}")
+    
+    def digest_for(self, entry: FileEntry) -> str:
+        """크기/mtime 이 그대로인 파일의 내용 해시 (없으면 빈 문자열)"""
+        cached = self.files.get(entry.path)
+        if cached and cached[0] == entry.size and cached[1] == entry.mtime_ns and cached[2] in self.analyses:
+            return cached[2]
+        return ''
+    
+    def remember(self, entry: FileEntry, digest: str):
+        self.files[entry.path] = [entry.size, entry.mtime_ns, digest]
+    
+    def save(self, paths: set):
+        """이번 실행에서 확인한 경로와 그 분석 결과만 남겨 원자적으로 저장"""
+        files = {path: value for path, value in self.files.items() if path in paths}
+        digests = {value[2] for value in files.values()}
+        analyses = {digest: value for digest, value in self.analyses.items() if digest in digests}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'key': self.key, 'files': files, 'analyses': analyses}, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logging.warning(f"분석 캐시 저장 실패 {self.cache_file}: {e}")
+
 class CodeQualityScanner:
     def __init__(self):
         self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -54,119 +126,235 @@ class CodeQualityScanner:
             'min_test_coverage': 80,
             'max_todo_comments': 5
         }
+        
+        # 분석 캐시 및 병렬 분석 설정
+        self.analysis_cache_file = '/home/ubuntu/logs/code-quality-reports/analysis_cache.json'
+        self.max_workers = os.cpu_count() or 1
+        self.min_files_for_pool = 16    # 이보다 적으면 프로세스 풀 없이 분석
+        self._file_index = None
+        self._analysis_cache = None
+        self._file_analyses: Dict[str, Dict[str, Any]] = {}
+        self._directory_reports: Dict[str, Dict[str, Any]] = {}
+        self.scan_stats = {'files_walked': 0, 'files_analyzed': 0, 'cache_hits': 0, 'analysis_seconds': 0.0}
     
-    def scan_python_files(self, directory: Path) -> Dict[str, Any]:
-        """Python 파일 품질 분석"""
-        python_files = list(directory.rglob("*.py"))
-        if not python_files:
-            return {'message': 'No Python files found'}
-        
-        results = {
-            'file_count': len(python_files),
-            'total_lines': 0,
-            'issues': [],
-            'metrics': {}
+    @property
+    def file_index(self):
+        """모든 큐브 디렉토리 1회 순회 결과 (첫 사용 시 생성)"""
+        if self._file_index is None:
+            self._file_index = FileSystemScanner().walk(self.cube_directories.values())
+            self.scan_stats['files_walked'] = len(self._file_index)
+        return self._file_index
+    
+    def _files_under(self, directory: Path) -> List[FileEntry]:
+        """디렉토리 하위 일반 파일 (큐브 밖 디렉토리는 따로 순회)"""
+        directory = os.path.realpath(directory)
+        roots = self.file_index.roots
+        if any(directory == root or directory.startswith(root + os.sep) for root in roots):
+            return list(self.file_index.under(directory, kind='file'))
+        return list(FileSystemScanner().walk([directory]).under(directory, kind='file'))
+    
+    @staticmethod
+    def _suffix(entry: FileEntry) -> str:
+        return os.path.splitext(entry.name)[1]
+    
+    def _is_analyzed(self, entry: FileEntry) -> bool:
+        """분석 대상 여부 (파이썬 외 파일은 node_modules 제외)"""
+        suffix = self._suffix(entry)
+        if suffix in PYTHON_SUFFIXES:
+            return True
+        return suffix in SCRIPT_SUFFIXES | STYLE_SUFFIXES and 'node_modules' not in entry.path
+    
+    def analyze_file(self, path: str) -> Dict[str, Any]:
+        """파일 1개 분석 - 한 번 읽고(파이썬은 한 번 파싱) 해당 확장자의 모든 검사 실행"""
+        file_path = Path(path)
+        suffix = file_path.suffix
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        lines = content.split('\n')
+        
+        issues, security, performance = [], [], []
+        if suffix in PYTHON_SUFFIXES:
+            # AST 파싱으로 구조 분석
+            try:
+                tree = ast.parse(content)
+                issues.extend(self._analyze_python_ast(tree, file_path, lines)['issues'])
+            except SyntaxError as e:
+                issues.append({
+                    'type': 'syntax_error',
+                    'file': str(file_path),
+                    'line': e.lineno,
+                    'message': str(e),
+                    'severity': 'high'
+                })
+            issues.extend(self._check_python_style(content, file_path, lines))
+            security.extend(self._check_python_security(content, file_path))
+        elif suffix in SCRIPT_SUFFIXES:
+            issues.extend(self._check_typescript_style(content, file_path, lines))
+            # React 컴포넌트 분석
+            if suffix in ['.tsx', '.jsx']:
+                issues.extend(self._check_react_patterns(content, file_path, lines))
+            if suffix == '.js':
+                security.extend(self._check_javascript_security(content, file_path))
+            if suffix == '.tsx':
+                performance.extend(self._check_react_performance(content, file_path))
+        elif suffix in STYLE_SUFFIXES:
+            issues.extend(self._check_css_style(content, file_path, lines))
+        
+        return {'lines': len(lines), 'issues': issues, 'security': security, 'performance': performance}
+    
+    @staticmethod
+    def _bind_path(analysis: Dict[str, Any], path: str) -> Dict[str, Any]:
+        """캐시된 분석 결과의 파일 경로를 현재 경로로 (같은 내용의 다른 파일 공유)"""
+        return {
+            key: [{**item, 'file': path} for item in value] if isinstance(value, list) else value
+            for key, value in analysis.items()
         }
-        
-        for file_path in python_files:
+    
+    @staticmethod
+    def _read_digest(entry: FileEntry) -> str:
+        try:
+            with open(entry.path, 'rb') as f:
+                return content_digest(f.read())
+        except OSError as e:
+            logging.error(f"파일 읽기 실패 {entry.path}: {e}")
+            return ''
+    
+    def _run_analyses(self, paths: List[str]):
+        """처음 보는 내용의 파일 분석 → (경로, 결과 또는 예외) (많으면 프로세스 풀)"""
+        def analyze_here(path):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    results['total_lines'] += len(lines)
-                
-                # AST 파싱으로 구조 분석
-                try:
-                    tree = ast.parse(content)
-                    file_analysis = self._analyze_python_ast(tree, file_path, lines)
-                    results['issues'].extend(file_analysis['issues'])
-                except SyntaxError as e:
-                    results['issues'].append({
-                        'type': 'syntax_error',
-                        'file': str(file_path),
-                        'line': e.lineno,
-                        'message': str(e),
-                        'severity': 'high'
-                    })
-                
-                # 기본 코드 스타일 체크
-                style_issues = self._check_python_style(content, file_path, lines)
-                results['issues'].extend(style_issues)
-                
+                return self.analyze_file(path)
             except Exception as e:
-                logging.error(f"Python 파일 분석 실패 {file_path}: {e}")
-        
-        return results
-    
-    def scan_typescript_files(self, directory: Path) -> Dict[str, Any]:
-        """TypeScript/JavaScript 파일 품질 분석"""
-        ts_files = list(directory.rglob("*.ts")) + list(directory.rglob("*.tsx")) + \
-                   list(directory.rglob("*.js")) + list(directory.rglob("*.jsx"))
+                return e
         
-        # node_modules 제외
-        ts_files = [f for f in ts_files if 'node_modules' not in str(f)]
+        if len(paths) < self.min_files_for_pool or self.max_workers <= 1:
+            for path in paths:
+                yield path, analyze_here(path)
+            return
         
-        if not ts_files:
-            return {'message': 'No TypeScript/JavaScript files found'}
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_analysis_worker,
+                                 initargs=(self.quality_standards,)) as pool:
+            futures = [(path, pool.submit(_analyze_in_worker, path)) for path in paths]
+            for path, future in futures:
+                try:
+                    yield path, future.result()
+                except Exception:
+                    # 작업자 실패(프로세스 풀 장애 포함) 시 현재 프로세스에서 재시도
+                    yield path, analyze_here(path)
+    
+    def _analyze_entries(self, entries: List[FileEntry]):
+        """파일 분석 (캐시 적중은 건너뛰고, 바뀐 파일은 내용 해시 확인 후 새 내용만 분석)"""
+        entries = [e for e in entries if e.path not in self._file_analyses and self._is_analyzed(e)]
+        if not entries:
+            return
+        started = datetime.now()
+        if self._analysis_cache is None:
+            self._analysis_cache = AnalysisCache(self.analysis_cache_file, self.quality_standards)
+        cache = self._analysis_cache
+        
+        stale = []
+        for entry in entries:
+            digest = cache.digest_for(entry)
+            if digest:
+                self._file_analyses[entry.path] = self._bind_path(cache.analyses[digest], entry.path)
+                self.scan_stats['cache_hits'] += 1
+            else:
+                stale.append(entry)
+        
+        # 크기/mtime 이 바뀐 파일: 내용 해시 (I/O 스레드 풀) → 처음 보는 내용만 분석
+        with ThreadPoolExecutor(max_workers=min(32, self.max_workers * 4)) as pool:
+            digests = list(pool.map(self._read_digest, stale))
+        
+        by_digest: Dict[str, List[FileEntry]] = {}
+        for entry, digest in zip(stale, digests):
+            if not digest:
+                continue
+            if digest in cache.analyses:
+                cache.remember(entry, digest)
+                self._file_analyses[entry.path] = self._bind_path(cache.analyses[digest], entry.path)
+                self.scan_stats['cache_hits'] += 1
+            else:
+                by_digest.setdefault(digest, []).append(entry)
+        
+        representatives = {group[0].path: digest for digest, group in by_digest.items()}
+        for path, analysis in self._run_analyses(list(representatives)):
+            if isinstance(analysis, Exception):
+                logging.error(f"파일 분석 실패 {path}: {analysis}")
+                continue
+            digest = representatives[path]
+            cache.analyses[digest] = analysis
+            for entry in by_digest[digest]:
+                cache.remember(entry, digest)
+                self._file_analyses[entry.path] = self._bind_path(analysis, entry.path)
+            self.scan_stats['files_analyzed'] += 1
+        
+        cache.save(set(self._file_analyses))
+        self.scan_stats['analysis_seconds'] += (datetime.now() - started).total_seconds()
+    
+    def _directory_report(self, directory: Path) -> Dict[str, Any]:
+        """디렉토리 분석 결과 (언어별/보안/성능, 디렉토리별 1회 집계)"""
+        key = os.path.realpath(directory)
+        if key in self._directory_reports:
+            return self._directory_reports[key]
+        
+        entries = self._files_under(directory)
+        self._analyze_entries(entries)
+        
+        def language_report(suffixes, message):
+            files = [e for e in entries if self._suffix(e) in suffixes and self._is_analyzed(e)]
+            if not files:
+                return {'message': message}
+            results = {'file_count': len(files), 'total_lines': 0, 'issues': [], 'metrics': {}}
+            for entry in files:
+                analysis = self._file_analyses.get(entry.path)
+                if analysis:
+                    results['total_lines'] += analysis['lines']
+                    results['issues'].extend(analysis['issues'])
+            return results
+        
+        def collect(key, suffixes):
+            found = []
+            for entry in entries:
+                if self._suffix(entry) in suffixes and entry.path in self._file_analyses:
+                    found.extend(self._file_analyses[entry.path][key])
+            return found
+        
+        # 큰 파일은 순회 시 얻은 크기로 판단 (파일을 읽지 않음)
+        large_files = [
+            {
+                'type': 'large_file',
+                'file': entry.path,
+                'message': f"큰 파일 크기: {entry.size // 1024}KB",
+                'severity': 'medium'
+            }
+            for entry in entries
+            if self._suffix(entry) in LARGE_FILE_SUFFIXES
+            and 'node_modules' not in entry.path
+            and entry.size > 100 * 1024  # 100KB 이상
+        ]
         
-        results = {
-            'file_count': len(ts_files),
-            'total_lines': 0,
-            'issues': [],
-            'metrics': {}
+        report = {
+            'python': language_report(PYTHON_SUFFIXES, 'No Python files found'),
+            'typescript': language_report(SCRIPT_SUFFIXES, 'No TypeScript/JavaScript files found'),
+            'css': language_report(STYLE_SUFFIXES, 'No CSS files found'),
+            'security': collect('security', PYTHON_SUFFIXES) + collect('security', {'.js'}),
+            'performance': large_files + collect('performance', {'.tsx'})
         }
-        
-        for file_path in ts_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    results['total_lines'] += len(lines)
-                
-                # TypeScript/JavaScript 스타일 체크
-                style_issues = self._check_typescript_style(content, file_path, lines)
-                results['issues'].extend(style_issues)
-                
-                # React 컴포넌트 분석
-                if file_path.suffix in ['.tsx', '.jsx']:
-                    react_issues = self._check_react_patterns(content, file_path, lines)
-                    results['issues'].extend(react_issues)
-                
-            except Exception as e:
-                logging.error(f"TypeScript 파일 분석 실패 {file_path}: {e}")
-        
-        return results
+        self._directory_reports[key] = report
+        return report
+    
+    def scan_python_files(self, directory: Path) -> Dict[str, Any]:
+        """Python 파일 품질 분석"""
+        return self._directory_report(directory)['python']
+    
+    def scan_typescript_files(self, directory: Path) -> Dict[str, Any]:
+        """TypeScript/JavaScript 파일 품질 분석"""
+        return self._directory_report(directory)['typescript']
     
     def scan_css_files(self, directory: Path) -> Dict[str, Any]:
         """CSS 파일 품질 분석"""
-        css_files = list(directory.rglob("*.css")) + list(directory.rglob("*.scss"))
-        css_files = [f for f in css_files if 'node_modules' not in str(f)]
-        
-        if not css_files:
-            return {'message': 'No CSS files found'}
-        
-        results = {
-            'file_count': len(css_files),
-            'total_lines': 0,
-            'issues': [],
-            'metrics': {}
-        }
-        
-        for file_path in css_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    results['total_lines'] += len(lines)
-                
-                # CSS 스타일 체크
-                style_issues = self._check_css_style(content, file_path, lines)
-                results['issues'].extend(style_issues)
-                
-            except Exception as e:
-                logging.error(f"CSS 파일 분석 실패 {file_path}: {e}")
-        
-        return results
+        return self._directory_report(directory)['css']
+    
     
     def _analyze_python_ast(self, tree: ast.AST, file_path: Path, lines: List[str]) -> Dict[str, Any]:
         """Python AST 분석"""
@@ -384,119 +572,86 @@ class CodeQualityScanner:
         
         return issues
     
-    def check_security_vulnerabilities(self, directory: Path) -> List[Dict[str, Any]]:
-        """보안 취약점 체크"""
+    def _check_python_security(self, content: str, file_path: Path) -> List[Dict[str, Any]]:
+        """Python 보안 이슈 체크"""
         vulnerabilities = []
         
-        # Python 파일에서 보안 이슈 체크
-        for py_file in directory.rglob("*.py"):
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # SQL 인젝션 위험 패턴
-                if re.search(r'execute\s*\(\s*f?["\'][^"\']*\{[^}]+\}[^"\']*["\']', content):
-                    vulnerabilities.append({
-                        'type': 'sql_injection_risk',
-                        'file': str(py_file),
-                        'message': "SQL 인젝션 위험: f-string이나 포맷팅된 쿼리 감지",
-                        'severity': 'high'
-                    })
-                
-                # 하드코딩된 시크릿
-                secret_patterns = [
-                    r'password\s*=\s*["\'][^"\']{8,}["\']',
-                    r'secret\s*=\s*["\'][^"\']{16,}["\']',
-                    r'token\s*=\s*["\'][^"\']{20,}["\']'
-                ]
-                
-                for pattern in secret_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        vulnerabilities.append({
-                            'type': 'hardcoded_secret',
-                            'file': str(py_file),
-                            'message': "하드코딩된 시크릿 감지",
-                            'severity': 'high'
-                        })
-                
-            except Exception as e:
-                logging.error(f"보안 스캔 실패 {py_file}: {e}")
+        # SQL 인젝션 위험 패턴
+        if re.search(r'execute\s*\(\s*f?["\'][^"\']*\{[^}]+\}[^"\']*["\']', content):
+            vulnerabilities.append({
+                'type': 'sql_injection_risk',
+                'file': str(file_path),
+                'message': "SQL 인젝션 위험: f-string이나 포맷팅된 쿼리 감지",
+                'severity': 'high'
+            })
         
-        # JavaScript/TypeScript 파일에서 보안 이슈 체크
-        for js_file in directory.rglob("*.js"):
-            if 'node_modules' in str(js_file):
-                continue
-                
-            try:
-                with open(js_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # eval 사용 체크
-                if 'eval(' in content:
-                    vulnerabilities.append({
-                        'type': 'eval_usage',
-                        'file': str(js_file),
-                        'message': "eval() 사용은 보안 위험을 초래할 수 있습니다",
-                        'severity': 'high'
-                    })
-                
-                # innerHTML 사용 체크
-                if '.innerHTML' in content:
-                    vulnerabilities.append({
-                        'type': 'innerHTML_usage',
-                        'file': str(js_file),
-                        'message': "innerHTML 사용 시 XSS 위험이 있습니다",
-                        'severity': 'medium'
-                    })
-                
-            except Exception as e:
-                logging.error(f"JavaScript 보안 스캔 실패 {js_file}: {e}")
+        # 하드코딩된 시크릿
+        secret_patterns = [
+            r'password\s*=\s*["\'][^"\']{8,}["\']',
+            r'secret\s*=\s*["\'][^"\']{16,}["\']',
+            r'token\s*=\s*["\'][^"\']{20,}["\']'
+        ]
+        
+        for pattern in secret_patterns:
+            if re.search(pattern, content, re.IGNORECASE):
+                vulnerabilities.append({
+                    'type': 'hardcoded_secret',
+                    'file': str(file_path),
+                    'message': "하드코딩된 시크릿 감지",
+                    'severity': 'high'
+                })
         
         return vulnerabilities
     
-    def check_performance_issues(self, directory: Path) -> List[Dict[str, Any]]:
-        """성능 이슈 체크"""
-        performance_issues = []
+    def _check_javascript_security(self, content: str, file_path: Path) -> List[Dict[str, Any]]:
+        """JavaScript 보안 이슈 체크"""
+        vulnerabilities = []
         
-        # 큰 파일 체크
-        for file_path in directory.rglob("*"):
-            if file_path.is_file() and file_path.suffix in ['.js', '.ts', '.tsx', '.jsx', '.py', '.css']:
-                if 'node_modules' in str(file_path):
-                    continue
-                    
-                file_size = file_path.stat().st_size
-                if file_size > 100 * 1024:  # 100KB 이상
-                    performance_issues.append({
-                        'type': 'large_file',
-                        'file': str(file_path),
-                        'message': f"큰 파일 크기: {file_size // 1024}KB",
-                        'severity': 'medium'
-                    })
+        # eval 사용 체크
+        if 'eval(' in content:
+            vulnerabilities.append({
+                'type': 'eval_usage',
+                'file': str(file_path),
+                'message': "eval() 사용은 보안 위험을 초래할 수 있습니다",
+                'severity': 'high'
+            })
         
-        # React 컴포넌트 성능 이슈
-        for tsx_file in directory.rglob("*.tsx"):
-            if 'node_modules' in str(tsx_file):
-                continue
-                
-            try:
-                with open(tsx_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # 인라인 함수 정의
-                inline_functions = len(re.findall(r'onClick=\{[^}]*=>[^}]*\}', content))
-                if inline_functions > 3:
-                    performance_issues.append({
-                        'type': 'inline_functions',
-                        'file': str(tsx_file),
-                        'message': f"인라인 함수가 너무 많습니다 ({inline_functions}개)",
-                        'severity': 'low'
-                    })
-                
-            except Exception as e:
-                logging.error(f"React 성능 스캔 실패 {tsx_file}: {e}")
+        # innerHTML 사용 체크
+        if '.innerHTML' in content:
+            vulnerabilities.append({
+                'type': 'innerHTML_usage',
+                'file': str(file_path),
+                'message': "innerHTML 사용 시 XSS 위험이 있습니다",
+                'severity': 'medium'
+            })
+        
+        return vulnerabilities
+    
+    def _check_react_performance(self, content: str, file_path: Path) -> List[Dict[str, Any]]:
+        """React 컴포넌트 성능 이슈 체크"""
+        performance_issues = []
+        
+        # 인라인 함수 정의
+        inline_functions = len(re.findall(r'onClick=\{[^}]*=>[^}]*\}', content))
+        if inline_functions > 3:
+            performance_issues.append({
+                'type': 'inline_functions',
+                'file': str(file_path),
+                'message': f"인라인 함수가 너무 많습니다 ({inline_functions}개)",
+                'severity': 'low'
+            })
         
         return performance_issues
     
+    def check_security_vulnerabilities(self, directory: Path) -> List[Dict[str, Any]]:
+        """보안 취약점 체크"""
+        return self._directory_report(directory)['security']
+    
+    def check_performance_issues(self, directory: Path) -> List[Dict[str, Any]]:
+        """성능 이슈 체크"""
+        return self._directory_report(directory)['performance']
+    
+    
     def generate_cube_score(self, cube_analysis: Dict[str, Any]) -> int:
         """큐브별 점수 계산 (0-100)"""
         base_score = 100
@@ -522,18 +677,21 @@ class CodeQualityScanner:
         
         logging.info(f"큐브 스캔 시작: {cube_name}")
         
+        # 모든 검사가 같은 분석 결과를 공유 (파일당 1회 분석)
+        report = self._directory_report(cube_dir)
         cube_analysis = {
-            'python': self.scan_python_files(cube_dir),
-            'typescript': self.scan_typescript_files(cube_dir),
-            'css': self.scan_css_files(cube_dir),
-            'security': self.check_security_vulnerabilities(cube_dir),
-            'performance': self.check_performance_issues(cube_dir)
+            'python': report['python'],
+            'typescript': report['typescript'],
+            'css': report['css'],
+            'security': report['security'],
+            'performance': report['performance']
         }
         
         cube_analysis['score'] = self.generate_cube_score(cube_analysis)
         
         return cube_analysis
     
+    
     def generate_recommendations(self) -> List[str]:
         """개선 추천사항 생성"""
         recommendations = []
@@ -583,6 +741,10 @@ class CodeQualityScanner:
         """전체 코드 품질 스캔 실행"""
         logging.info("전체 코드 품질 스캔 시작...")
         
+        # 전체 큐브 파일을 한 번에 분석 (변경된 파일만 프로세스 풀로)
+        self._analyze_entries([entry for root in self.file_index.roots
+                               for entry in self.file_index.under(root, kind='file')])
+        
         # 각 큐브 스캔
         for cube_name, cube_path in self.cube_directories.items():
             self.scan_results['cube_analysis'][cube_name] = self.scan_cube(cube_name, cube_path)
@@ -604,6 +766,7 @@ class CodeQualityScanner:
         
         # 전체 점수 계산
         self.scan_results['overall_score'] = self.calculate_overall_score()
+        self.scan_results['scan_stats'] = self.scan_stats
         
         logging.info(f"코드 품질 스캔 완료. 전체 점수: {self.scan_results['overall_score']}")
         
@@ -635,6 +798,10 @@ class CodeQualityScanner:
         print(f"{'='*60}")
         print(f"📅 스캔 시간: {results['timestamp']}")
         print(f"📊 전체 점수: {results['overall_score']}/100")
+        scan_stats = results.get('scan_stats', {})
+        if scan_stats:
+            print(f"⚡ 분석: 새로 분석 {scan_stats.get('files_analyzed', 0)}개, 캐시 적중 {scan_stats.get('cache_hits', 0)}개 "
+                  f"({scan_stats.get('analysis_seconds', 0):.1f}초)")
         print(f"{'='*60}")
         
         # 큐브별 점수
@@ -2,14 +2,15 @@
 """
 🏥 HEAL7 일일 헬스 체크 자동화 스크립트
 큐브 모델 기반 시스템 상태 점검 및 리포팅
+- 점검은 probe_runner 로 동시 실행 (HTTP/포트/명령/TLS 프로브별 타임아웃)
+- 포트 상태는 /proc/net/tcp 직접 조회 (lsof 미사용)
 
 Author: AI Agent Team
 Created: 2025-08-20
 """
 
-import subprocess
+import asyncio
 import json
-import requests
 import psutil
 import os
 import sys
@@ -18,6 +19,8 @@ from pathlib import Path
 from typing import Dict, List, Any
 import logging
 
+from probe_runner import ProbeRunner, ProbeResult, listening_ports, socket_owners
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -40,6 +43,7 @@ class HealthChecker:
             'performance': {},
             'recommendations': []
         }
+        self.probes = ProbeRunner(default_timeout=5.0)
         
     def check_system_resources(self) -> Dict[str, Any]:
         """시스템 리소스 상태 점검"""
@@ -82,240 +86,139 @@ class HealthChecker:
     
     def check_services_status(self) -> Dict[str, Any]:
         """핵심 서비스 상태 점검"""
+        return self.probes.run(self._services_status())
+    
+    async def _services_status(self) -> Dict[str, Any]:
         services = {
-            'nginx': self._check_systemd_service('nginx'),
-            'postgresql': self._check_systemd_service('postgresql@14-main'),
-            'redis': self._check_systemd_service('redis-server')
+            'nginx': 'nginx',
+            'postgresql': 'postgresql@14-main',
+            'redis': 'redis-server'
         }
         
         # 포트 점검
         ports = {
-            '8000': self._check_port(8000),  # 사주 서비스
-            '8001': self._check_port(8001),  # 테스트 서비스
-            '3000': self._check_port(3000),  # 메인 Vite
-            '3001': self._check_port(3001),  # 관리자 Vite
-            '3002': self._check_port(3002),  # 키워드 Vite
-            '5432': self._check_port(5432),  # PostgreSQL
-            '6379': self._check_port(6379)   # Redis
+            8000: '사주 서비스',
+            8001: '테스트 서비스',
+            3000: '메인 Vite',
+            3001: '관리자 Vite',
+            3002: '키워드 Vite',
+            5432: 'PostgreSQL',
+            6379: 'Redis'
         }
         
+        results = await self.probes.gather({
+            **{f'service:{name}': self._check_systemd_service(unit) for name, unit in services.items()},
+            'python_processes': self._count_processes('python'),
+            'node_processes': self._count_processes('node')
+        })
+        
         return {
-            'systemd_services': services,
-            'port_status': ports,
-            'active_python_processes': self._count_python_processes(),
-            'active_node_processes': self._count_node_processes()
+            'systemd_services': {name: results[f'service:{name}'] for name in services},
+            'port_status': self._check_ports(list(ports)),
+            'active_python_processes': results['python_processes'],
+            'active_node_processes': results['node_processes']
         }
     
     def check_cube_health(self) -> Dict[str, Any]:
         """큐브별 헬스 체크"""
+        return self.probes.run(self._cube_health())
+    
+    async def _cube_health(self) -> Dict[str, Any]:
+        # 큐브별 (URL, 정상 상태 코드) - Vite 는 404 도 정상
         cubes = {
-            'saju_cube': self._check_saju_cube(),
-            'admin_cube': self._check_admin_cube(),
-            'keywords_cube': self._check_keywords_cube(),
-            'main_cube': self._check_main_cube()
+            'saju_cube': ('http://localhost:8000/health', (200,)),
+            'admin_cube': ('http://localhost:3001', (200, 404)),
+            'keywords_cube': ('http://localhost:3002', (200, 404)),
+            'main_cube': ('http://localhost:3000', (200, 404))
         }
         
-        return cubes
+        results = await self.probes.gather({
+            name: self.probes.http(url, ok_statuses=ok_statuses) for name, (url, ok_statuses) in cubes.items()
+        })
+        return {name: self._cube_status(result) for name, result in results.items()}
     
     def check_security_status(self) -> Dict[str, Any]:
         """보안 상태 점검"""
-        security = {
+        return self.probes.run(self._security_status())
+    
+    async def _security_status(self) -> Dict[str, Any]:
+        results = await self.probes.gather({
             'ssl_certificates': self._check_ssl_certificates(),
             'failed_logins': self._check_failed_logins(),
-            'firewall_status': self._check_firewall(),
-            'ssh_keys': self._check_ssh_security()
-        }
-        
-        return security
+            'firewall_status': self._check_firewall()
+        })
+        results['ssh_keys'] = self._check_ssh_security()
+        return results
     
     def check_backup_status(self) -> Dict[str, Any]:
         """백업 상태 점검"""
         return {
             'database_backups': self._check_db_backups(),
-            'code_repos': self._check_git_status(),
+            'code_repos': self.probes.run(self._check_git_status()),
             'config_backups': self._check_config_backups()
         }
     
-    def _check_systemd_service(self, service_name: str) -> Dict[str, Any]:
-        """systemd 서비스 상태 확인"""
-        try:
-            result = subprocess.run(
-                ['systemctl', 'is-active', service_name],
-                capture_output=True, text=True
-            )
-            active = result.stdout.strip() == 'active'
-            
-            # 메모리 사용량 확인
-            if active:
-                result = subprocess.run(
-                    ['systemctl', 'show', service_name, '--property=MemoryCurrent'],
-                    capture_output=True, text=True
-                )
-                memory_info = result.stdout.strip()
-            else:
-                memory_info = "N/A"
-            
-            return {
-                'active': active,
-                'memory_usage': memory_info,
-                'status': 'healthy' if active else 'unhealthy'
-            }
-        except Exception as e:
-            return {'error': str(e), 'status': 'error'}
+    async def _check_systemd_service(self, service_name: str) -> Dict[str, Any]:
+        """systemd 서비스 상태 확인 (상태/메모리 동시 조회)"""
+        active_result, memory_result = await asyncio.gather(
+            self.probes.command(['systemctl', 'is-active', service_name]),
+            self.probes.command(['systemctl', 'show', service_name, '--property=MemoryCurrent'])
+        )
+        if active_result.error and not active_result.value:
+            return {'error': active_result.error, 'status': 'error'}
+        
+        active = active_result.value.get('stdout', '').strip() == 'active'
+        return {
+            'active': active,
+            'memory_usage': memory_result.value.get('stdout', '').strip() if active else "N/A",
+            'status': 'healthy' if active else 'unhealthy'
+        }
     
-    def _check_port(self, port: int) -> Dict[str, Any]:
-        """포트 사용 상태 확인"""
+    def _check_ports(self, ports: List[int]) -> Dict[str, Any]:
+        """포트 사용 상태 확인 (/proc/net/tcp 1회 조회 + 소켓 소유 프로세스 1회 조회)"""
         try:
-            result = subprocess.run(
-                ['lsof', '-i', f':{port}'],
-                capture_output=True, text=True
-            )
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # 헤더 제외
-                processes = []
-                for line in lines:
-                    if line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            processes.append({
-                                'command': parts[0],
-                                'pid': parts[1]
-                            })
-                
-                return {
-                    'listening': True,
-                    'processes': processes,
-                    'status': 'active'
-                }
-            else:
-                return {
-                    'listening': False,
-                    'processes': [],
-                    'status': 'inactive'
-                }
+            listening = listening_ports()
+            owners = socket_owners(inode for port in ports for inode in listening.get(port, []))
         except Exception as e:
-            return {'error': str(e), 'status': 'error'}
-    
-    def _count_python_processes(self) -> int:
-        """실행 중인 Python 프로세스 수"""
-        try:
-            result = subprocess.run(
-                ['pgrep', '-f', 'python'],
-                capture_output=True, text=True
-            )
-            return len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-        except:
-            return 0
-    
-    def _count_node_processes(self) -> int:
-        """실행 중인 Node.js 프로세스 수"""
-        try:
-            result = subprocess.run(
-                ['pgrep', '-f', 'node'],
-                capture_output=True, text=True
-            )
-            return len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-        except:
-            return 0
-    
-    def _check_saju_cube(self) -> Dict[str, Any]:
-        """사주 큐브 헬스 체크"""
-        try:
-            # 8000 포트 응답 확인
-            response = requests.get('http://localhost:8000/health', timeout=5)
-            if response.status_code == 200:
-                return {
-                    'status': 'healthy',
-                    'response_time_ms': response.elapsed.total_seconds() * 1000,
-                    'last_check': self.timestamp
-                }
-            else:
-                return {
-                    'status': 'unhealthy',
-                    'error': f"HTTP {response.status_code}",
-                    'last_check': self.timestamp
-                }
-        except requests.exceptions.RequestException as e:
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_check': self.timestamp
+            return {str(port): {'error': str(e), 'status': 'error'} for port in ports}
+        
+        port_status = {}
+        for port in ports:
+            inodes = listening.get(port, [])
+            port_status[str(port)] = {
+                'listening': bool(inodes),
+                'processes': [owner for inode in inodes for owner in owners.get(inode, [])],
+                'status': 'active' if inodes else 'inactive'
             }
+        return port_status
     
-    def _check_admin_cube(self) -> Dict[str, Any]:
-        """관리자 큐브 헬스 체크"""
-        try:
-            # 3001 포트 응답 확인 (Vite 서버)
-            response = requests.get('http://localhost:3001', timeout=5)
-            if response.status_code in [200, 404]:  # Vite는 404도 정상
-                return {
-                    'status': 'healthy',
-                    'response_time_ms': response.elapsed.total_seconds() * 1000,
-                    'last_check': self.timestamp
-                }
-            else:
-                return {
-                    'status': 'unhealthy',
-                    'error': f"HTTP {response.status_code}",
-                    'last_check': self.timestamp
-                }
-        except requests.exceptions.RequestException as e:
-            return {
-                'status': 'error',
-                'error': str(e),
-                'last_check': self.timestamp
-            }
+    async def _count_processes(self, pattern: str) -> int:
+        """실행 중인 프로세스 수 (pgrep -f)"""
+        result = await self.probes.command(['pgrep', '-f', pattern])
+        stdout = result.value.get('stdout', '').strip()
+        return len(stdout.split('\n')) if stdout else 0
     
-    def _check_keywords_cube(self) -> Dict[str, Any]:
-        """키워드 큐브 헬스 체크"""
-        try:
-            # 3002 포트 응답 확인
-            response = requests.get('http://localhost:3002', timeout=5)
-            if response.status_code in [200, 404]:
-                return {
-                    'status': 'healthy',
-                    'response_time_ms': response.elapsed.total_seconds() * 1000,
-                    'last_check': self.timestamp
-                }
-            else:
-                return {
-                    'status': 'unhealthy',
-                    'error': f"HTTP {response.status_code}",
-                    'last_check': self.timestamp
-                }
-        except requests.exceptions.RequestException as e:
+    def _cube_status(self, result: ProbeResult) -> Dict[str, Any]:
+        """HTTP 프로브 결과 → 큐브 상태"""
+        if result.ok:
             return {
-                'status': 'error',
-                'error': str(e),
+                'status': 'healthy',
+                'response_time_ms': result.elapsed_ms,
                 'last_check': self.timestamp
             }
-    
-    def _check_main_cube(self) -> Dict[str, Any]:
-        """메인 큐브 헬스 체크"""
-        try:
-            # 3000 포트 응답 확인
-            response = requests.get('http://localhost:3000', timeout=5)
-            if response.status_code in [200, 404]:
-                return {
-                    'status': 'healthy',
-                    'response_time_ms': response.elapsed.total_seconds() * 1000,
-                    'last_check': self.timestamp
-                }
-            else:
-                return {
-                    'status': 'unhealthy',
-                    'error': f"HTTP {response.status_code}",
-                    'last_check': self.timestamp
-                }
-        except requests.exceptions.RequestException as e:
+        if 'status_code' in result.value:
             return {
-                'status': 'error',
-                'error': str(e),
+                'status': 'unhealthy',
+                'error': f"HTTP {result.value['status_code']}",
                 'last_check': self.timestamp
             }
+        return {
+            'status': 'error',
+            'error': result.error,
+            'last_check': self.timestamp
+        }
     
-    def _check_ssl_certificates(self) -> Dict[str, Any]:
+    async def _check_ssl_certificates(self) -> Dict[str, Any]:
         """SSL 인증서 상태 확인"""
         domains = [
             'heal7.com',
@@ -324,55 +227,45 @@ class HealthChecker:
             'keywords.heal7.com'
         ]
         
+        results = await self.probes.gather({
+            domain: self.probes.tls_certificate(domain, timeout=10) for domain in domains
+        })
+        
         ssl_status = {}
-        for domain in domains:
-            try:
-                result = subprocess.run(
-                    ['openssl', 's_client', '-connect', f'{domain}:443', '-servername', domain],
-                    input='',
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                
-                if 'Verify return code: 0 (ok)' in result.stdout:
-                    ssl_status[domain] = 'valid'
-                else:
-                    ssl_status[domain] = 'invalid'
-            except:
+        for domain, result in results.items():
+            if result.ok:
+                ssl_status[domain] = 'valid'
+            elif result.value.get('verification_failed'):
+                ssl_status[domain] = 'invalid'
+            else:
                 ssl_status[domain] = 'unreachable'
         
         return ssl_status
     
-    def _check_failed_logins(self) -> Dict[str, Any]:
+    async def _check_failed_logins(self) -> Dict[str, Any]:
         """실패한 로그인 시도 확인"""
-        try:
-            result = subprocess.run(
-                ['grep', 'Failed password', '/var/log/auth.log'],
-                capture_output=True, text=True
-            )
-            
-            failed_attempts = len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-            
-            return {
-                'failed_attempts_today': failed_attempts,
-                'status': 'suspicious' if failed_attempts > 10 else 'normal'
-            }
-        except:
+        result = await self.probes.command(['grep', '-c', 'Failed password', '/var/log/auth.log'])
+        # grep -c: 일치 없음이면 종료 코드 1 + "0", 읽기 실패면 2
+        if result.value.get('returncode') not in (0, 1):
             return {'error': 'Cannot access auth logs'}
+        
+        failed_attempts = int(result.value['stdout'].strip() or 0)
+        return {
+            'failed_attempts_today': failed_attempts,
+            'status': 'suspicious' if failed_attempts > 10 else 'normal'
+        }
     
-    def _check_firewall(self) -> Dict[str, Any]:
+    async def _check_firewall(self) -> Dict[str, Any]:
         """방화벽 상태 확인"""
-        try:
-            result = subprocess.run(['ufw', 'status'], capture_output=True, text=True)
-            status = 'active' if 'Status: active' in result.stdout else 'inactive'
-            
-            return {
-                'status': status,
-                'rules_count': len([line for line in result.stdout.split('\n') if ' ALLOW ' in line])
-            }
-        except:
+        result = await self.probes.command(['ufw', 'status'])
+        if 'stdout' not in result.value:
             return {'error': 'Cannot check firewall status'}
+        
+        stdout = result.value['stdout']
+        return {
+            'status': 'active' if 'Status: active' in stdout else 'inactive',
+            'rules_count': len([line for line in stdout.split('\n') if ' ALLOW ' in line])
+        }
     
     def _check_ssh_security(self) -> Dict[str, Any]:
         """SSH 보안 설정 확인"""
@@ -409,32 +302,36 @@ class HealthChecker:
         else:
             return {'status': 'backup_directory_not_found'}
     
-    def _check_git_status(self) -> Dict[str, Any]:
-        """Git 저장소 상태 확인"""
+    async def _check_git_status(self) -> Dict[str, Any]:
+        """Git 저장소 상태 확인 (저장소별 동시 실행, 작업 디렉토리는 cwd 로 지정)"""
         repos = [
             '/home/ubuntu/heal7-system',
             '/home/ubuntu/REFERENCE_LIBRARY'
         ]
         
+        existing = [repo for repo in repos if Path(repo).exists()]
+        results = await self.probes.gather({
+            repo: self.probes.command(['git', 'status', '--porcelain'], cwd=repo, timeout=30)
+            for repo in existing
+        })
+        
         git_status = {}
         for repo in repos:
-            if Path(repo).exists():
-                try:
-                    os.chdir(repo)
-                    result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        uncommitted_changes = len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-                        git_status[repo] = {
-                            'uncommitted_changes': uncommitted_changes,
-                            'status': 'clean' if uncommitted_changes == 0 else 'dirty'
-                        }
-                    else:
-                        git_status[repo] = {'error': 'Not a git repository'}
-                except Exception as e:
-                    git_status[repo] = {'error': str(e)}
-            else:
+            if repo not in results:
                 git_status[repo] = {'error': 'Repository not found'}
+                continue
+            result = results[repo]
+            if result.ok:
+                stdout = result.value['stdout'].strip()
+                uncommitted_changes = len(stdout.split('\n')) if stdout else 0
+                git_status[repo] = {
+                    'uncommitted_changes': uncommitted_changes,
+                    'status': 'clean' if uncommitted_changes == 0 else 'dirty'
+                }
+            elif 'returncode' in result.value:
+                git_status[repo] = {'error': 'Not a git repository'}
+            else:
+                git_status[repo] = {'error': result.error}
         
         return git_status
     
@@ -525,12 +422,16 @@ class HealthChecker:
         """전체 헬스 체크 실행 및 리포트 생성"""
         logging.info("시스템 헬스 체크 시작...")
         
-        # 각 체크 실행
-        self.report['infrastructure'] = self.check_system_resources()
-        self.report['services'] = self.check_services_status()
-        self.report['cube_health'] = self.check_cube_health()
-        self.report['security'] = self.check_security_status()
-        self.report['backups'] = self.check_backup_status()
+        # 각 체크 동시 실행 (CPU 측정 1초 대기와 네트워크 점검이 겹침)
+        started = datetime.now()
+        self.report.update(self.probes.run_parallel({
+            'infrastructure': self.check_system_resources,
+            'services': self.check_services_status,
+            'cube_health': self.check_cube_health,
+            'security': self.check_security_status,
+            'backups': self.check_backup_status
+        }))
+        self.report['check_duration_seconds'] = round((datetime.now() - started).total_seconds(), 2)
         
         # 추천사항 생성
         self.report['recommendations'] = self.generate_recommendations()
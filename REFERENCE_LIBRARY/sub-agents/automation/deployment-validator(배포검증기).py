@@ -2,21 +2,23 @@
 """
 🚀 HEAL7 배포 검증 시스템
 큐브 모델 기반 안전한 배포 검증 및 롤백 준비
+- 검증 항목과 큐브별 프로브는 probe_runner 로 동시 실행 (측정 간 sleep 없음)
+- 응답 시간은 동시 표본으로 평균/최소/최대와 p50/p95/p99 보고
 
 Author: AI Agent Team
 Created: 2025-08-20
 """
 
-import subprocess
-import requests
+import asyncio
 import json
-import time
 import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
+from probe_runner import ProbeRunner, ProbeResult, listening_ports
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -80,19 +82,23 @@ class DeploymentValidator:
             'memory_usage_percent': 90.0,
             'disk_usage_percent': 95.0
         }
+        
+        self.probes = ProbeRunner(default_timeout=5.0)
+        self.response_samples = 5
+        self.error_rate_samples = 10
     
     def validate_pre_deployment(self) -> Dict[str, Any]:
         """배포 전 검증"""
         logging.info("배포 전 검증 시작...")
         
-        pre_checks = {
-            'git_status': self._check_git_status(),
-            'dependencies': self._check_dependencies(),
-            'tests': self._run_tests(),
-            'security_scan': self._run_security_scan(),
-            'build_validation': self._validate_builds(),
-            'database_backup': self._verify_database_backup()
-        }
+        pre_checks = self.probes.run_parallel({
+            'git_status': self._check_git_status,
+            'dependencies': self._check_dependencies,
+            'tests': self._run_tests,
+            'security_scan': self._run_security_scan,
+            'build_validation': self._validate_builds,
+            'database_backup': self._verify_database_backup
+        })
         
         return pre_checks
     
@@ -100,14 +106,14 @@ class DeploymentValidator:
         """배포 준비 상태 검증"""
         logging.info("배포 준비 상태 검증...")
         
-        readiness_checks = {
-            'system_resources': self._check_system_resources(),
-            'service_health': self._check_current_services(),
-            'nginx_config': self._validate_nginx_config(),
-            'ssl_certificates': self._check_ssl_certificates(),
-            'disk_space': self._check_disk_space(),
-            'backup_verification': self._verify_rollback_capability()
-        }
+        readiness_checks = self.probes.run_parallel({
+            'system_resources': self._check_system_resources,
+            'service_health': self._check_current_services,
+            'nginx_config': self._validate_nginx_config,
+            'ssl_certificates': self._check_ssl_certificates,
+            'disk_space': self._check_disk_space,
+            'backup_verification': self._verify_rollback_capability
+        })
         
         return readiness_checks
     
@@ -115,14 +121,14 @@ class DeploymentValidator:
         """배포 후 검증"""
         logging.info("배포 후 검증 시작...")
         
-        post_checks = {
-            'service_availability': self._check_service_availability(),
-            'response_times': self._measure_response_times(),
-            'functionality_tests': self._run_functionality_tests(),
-            'error_monitoring': self._check_error_rates(),
-            'performance_metrics': self._collect_performance_metrics(),
-            'user_impact_assessment': self._assess_user_impact()
-        }
+        post_checks = self.probes.run_parallel({
+            'service_availability': self._check_service_availability,
+            'response_times': self._measure_response_times,
+            'functionality_tests': self._run_functionality_tests,
+            'error_monitoring': self._check_error_rates,
+            'performance_metrics': self._collect_performance_metrics,
+            'user_impact_assessment': self._assess_user_impact
+        })
         
         return post_checks
     
@@ -134,35 +140,9 @@ class DeploymentValidator:
                 '/home/ubuntu/REFERENCE_LIBRARY'
             ]
             
-            git_status = {}
-            for repo in repos:
-                if Path(repo).exists():
-                    os.chdir(repo)
-                    
-                    # 변경사항 확인
-                    result = subprocess.run(['git', 'status', '--porcelain'], 
-                                         capture_output=True, text=True)
-                    uncommitted = len(result.stdout.strip().split('\n')) if result.stdout.strip() else 0
-                    
-                    # 브랜치 확인
-                    branch_result = subprocess.run(['git', 'branch', '--show-current'], 
-                                                 capture_output=True, text=True)
-                    current_branch = branch_result.stdout.strip()
-                    
-                    # 원격과의 차이 확인
-                    try:
-                        ahead_result = subprocess.run(['git', 'rev-list', '--count', '@{u}..HEAD'], 
-                                                    capture_output=True, text=True)
-                        ahead_commits = int(ahead_result.stdout.strip()) if ahead_result.stdout.strip() else 0
-                    except:
-                        ahead_commits = 0
-                    
-                    git_status[repo] = {
-                        'uncommitted_changes': uncommitted,
-                        'current_branch': current_branch,
-                        'ahead_commits': ahead_commits,
-                        'ready_for_deployment': uncommitted == 0 and ahead_commits == 0
-                    }
+            git_status = self.probes.run(self.probes.gather({
+                repo: self._repo_git_status(repo) for repo in repos if Path(repo).exists()
+            }))
             
             return {
                 'repositories': git_status,
@@ -172,6 +152,26 @@ class DeploymentValidator:
         except Exception as e:
             return {'error': str(e)}
     
+    async def _repo_git_status(self, repo: str) -> Dict[str, Any]:
+        """저장소별 Git 상태 (변경사항/브랜치/원격 차이 동시 조회, 작업 디렉터리 변경 없음)"""
+        status, branch, ahead = await asyncio.gather(
+            self.probes.command(['git', 'status', '--porcelain'], cwd=repo, timeout=30),
+            self.probes.command(['git', 'branch', '--show-current'], cwd=repo),
+            self.probes.command(['git', 'rev-list', '--count', '@{u}..HEAD'], cwd=repo)
+        )
+        
+        changes = status.value.get('stdout', '').strip()
+        uncommitted = len(changes.split('\n')) if changes else 0
+        ahead_count = ahead.value.get('stdout', '').strip()
+        ahead_commits = int(ahead_count) if ahead.ok and ahead_count.isdigit() else 0
+        
+        return {
+            'uncommitted_changes': uncommitted,
+            'current_branch': branch.value.get('stdout', '').strip(),
+            'ahead_commits': ahead_commits,
+            'ready_for_deployment': uncommitted == 0 and ahead_commits == 0
+        }
+    
     def _check_dependencies(self) -> Dict[str, Any]:
         """의존성 확인"""
         try:
@@ -185,19 +185,15 @@ class DeploymentValidator:
                 ('redis', 'Redis 클라이언트')
             ]
             
+            imports = self.probes.run(self.probes.gather({
+                dep: self.probes.command(['python3', '-c', f'import {dep}'], timeout=30)
+                for dep, _ in python_deps
+            }))
             for dep, description in python_deps:
-                try:
-                    result = subprocess.run(['python3', '-c', f'import {dep}'], 
-                                          capture_output=True)
-                    dependency_status[dep] = {
-                        'installed': result.returncode == 0,
-                        'description': description
-                    }
-                except:
-                    dependency_status[dep] = {
-                        'installed': False,
-                        'description': description
-                    }
+                dependency_status[dep] = {
+                    'installed': imports[dep].ok,
+                    'description': description
+                }
             
             # Node.js 프로젝트 의존성 확인
             node_projects = [
@@ -241,13 +237,16 @@ class DeploymentValidator:
         """기본 기능 테스트"""
         try:
             functionality_tests = {}
+            listening = listening_ports()
+            probes = self.probes.run(self._probe_cubes(listening, http_only_if_listening=False))
             
             for cube_name, cube_config in self.cube_services.items():
+                process_running, response = probes[cube_name]
                 test_result = {
                     'service_name': cube_config['name'],
-                    'process_running': self._is_process_running(cube_config['process_pattern']),
-                    'port_listening': self._is_port_listening(cube_config['port']),
-                    'basic_response': self._test_basic_response(cube_config['url'])
+                    'process_running': process_running,
+                    'port_listening': self._is_port_listening(cube_config['port'], listening),
+                    'basic_response': self._response_summary(response)
                 }
                 
                 test_result['overall_status'] = (
@@ -294,16 +293,17 @@ class DeploymentValidator:
             
             for project_path, project_name in vite_projects:
                 if Path(project_path).exists():
-                    os.chdir(project_path)
-                    
                     # 빌드 테스트 (dry run)
-                    result = subprocess.run(['npm', 'run', 'build', '--dry-run'], 
-                                          capture_output=True, text=True, timeout=30)
+                    result = self.probes.run(self.probes.command(
+                        ['npm', 'run', 'build', '--dry-run'], cwd=project_path, timeout=30
+                    ))
+                    if result.error and not result.value:
+                        raise RuntimeError(result.error)
                     
                     build_results[project_name] = {
-                        'build_success': result.returncode == 0,
-                        'build_output': result.stdout[:500] if result.stdout else '',
-                        'build_errors': result.stderr[:500] if result.stderr else ''
+                        'build_success': result.ok,
+                        'build_output': result.value['stdout'][:500],
+                        'build_errors': result.value['stderr'][:500]
                     }
             
             return build_results
@@ -375,19 +375,22 @@ class DeploymentValidator:
         """현재 서비스 상태 확인"""
         try:
             service_health = {}
+            listening = listening_ports()
+            probes = self.probes.run(self._probe_cubes(listening, http_only_if_listening=True))
             
             for cube_name, cube_config in self.cube_services.items():
+                process_running, response = probes[cube_name]
                 health_status = {
                     'service_name': cube_config['name'],
-                    'process_running': self._is_process_running(cube_config['process_pattern']),
-                    'port_listening': self._is_port_listening(cube_config['port']),
+                    'process_running': process_running,
+                    'port_listening': self._is_port_listening(cube_config['port'], listening),
                     'responds_to_requests': False,
                     'response_time_ms': 0
                 }
                 
-                # HTTP 응답 테스트
-                if health_status['port_listening']:
-                    response_test = self._test_basic_response(cube_config['url'])
+                # HTTP 응답 테스트 (포트가 열린 큐브만)
+                if response is not None:
+                    response_test = self._response_summary(response)
                     health_status['responds_to_requests'] = response_test['success']
                     health_status['response_time_ms'] = response_test['response_time_ms']
                 
@@ -408,12 +411,18 @@ class DeploymentValidator:
         """Nginx 설정 검증"""
         try:
             # Nginx 설정 테스트
-            result = subprocess.run(['nginx', '-t'], capture_output=True, text=True)
+            probes = self.probes.run(self.probes.gather({
+                'config_test': self.probes.command(['nginx', '-t'], timeout=30),
+                'nginx_running': self._is_process_running('nginx')
+            }))
+            result = probes['config_test']
+            if result.error and not result.value:
+                raise RuntimeError(result.error)
             
             config_status = {
-                'syntax_valid': result.returncode == 0,
-                'test_output': result.stderr,
-                'nginx_running': self._is_process_running('nginx')
+                'syntax_valid': result.ok,
+                'test_output': result.value['stderr'],
+                'nginx_running': probes['nginx_running']
             }
             
             # 활성 사이트 확인
@@ -432,34 +441,23 @@ class DeploymentValidator:
             return {'error': str(e)}
     
     def _check_ssl_certificates(self) -> Dict[str, Any]:
-        """SSL 인증서 확인"""
+        """SSL 인증서 확인 (도메인별 TLS 핸드셰이크 동시 실행)"""
         try:
             domains = ['heal7.com', 'saju.heal7.com', 'admin.heal7.com', 'keywords.heal7.com']
-            ssl_status = {}
+            results = self.probes.run(self.probes.gather({
+                domain: self.probes.tls_certificate(domain, timeout=10) for domain in domains
+            }))
             
-            for domain in domains:
-                try:
-                    result = subprocess.run([
-                        'openssl', 's_client', '-connect', f'{domain}:443', 
-                        '-servername', domain, '-verify_return_error'
-                    ], input='', capture_output=True, text=True, timeout=10)
-                    
-                    ssl_status[domain] = {
-                        'certificate_valid': 'Verify return code: 0 (ok)' in result.stdout,
-                        'connection_successful': result.returncode == 0
-                    }
-                except subprocess.TimeoutExpired:
-                    ssl_status[domain] = {
-                        'certificate_valid': False,
-                        'connection_successful': False,
-                        'error': 'Connection timeout'
-                    }
-                except Exception as e:
-                    ssl_status[domain] = {
-                        'certificate_valid': False,
-                        'connection_successful': False,
-                        'error': str(e)
-                    }
+            ssl_status = {}
+            for domain, result in results.items():
+                ssl_status[domain] = {
+                    'certificate_valid': result.value.get('certificate_valid', False),
+                    'connection_successful': result.ok
+                }
+                if 'days_remaining' in result.value:
+                    ssl_status[domain]['days_remaining'] = result.value['days_remaining']
+                if result.error:
+                    ssl_status[domain]['error'] = result.error
             
             return ssl_status
             
@@ -511,10 +509,10 @@ class DeploymentValidator:
             repos = ['/home/ubuntu/heal7-system']
             for repo in repos:
                 if Path(repo).exists():
-                    os.chdir(repo)
-                    result = subprocess.run(['git', 'status', '--porcelain'], 
-                                          capture_output=True, text=True)
-                    if result.stdout.strip():
+                    result = self.probes.run(self.probes.command(
+                        ['git', 'status', '--porcelain'], cwd=repo, timeout=30
+                    ))
+                    if result.value.get('stdout', '').strip():
                         rollback_readiness['git_clean'] = False
             
             # 백업 확인
@@ -541,28 +539,22 @@ class DeploymentValidator:
         return self._check_current_services()
     
     def _measure_response_times(self) -> Dict[str, Any]:
-        """응답 시간 측정"""
+        """응답 시간 측정 (큐브별 표본 동시 수집)"""
         try:
             response_times = {}
+            samples = self.probes.run(self._sample_cubes(self.response_samples))
             
-            for cube_name, cube_config in self.cube_services.items():
-                measurements = []
-                
-                # 5번 측정해서 평균 계산
-                for _ in range(5):
-                    response_test = self._test_basic_response(cube_config['url'])
-                    if response_test['success']:
-                        measurements.append(response_test['response_time_ms'])
-                    time.sleep(0.5)
-                
-                if measurements:
-                    avg_response_time = sum(measurements) / len(measurements)
+            for cube_name, summary in samples.items():
+                if summary['measurements']:
                     response_times[cube_name] = {
-                        'avg_response_time_ms': round(avg_response_time, 2),
-                        'min_response_time_ms': min(measurements),
-                        'max_response_time_ms': max(measurements),
-                        'measurements': measurements,
-                        'performance_ok': avg_response_time < self.thresholds['response_time_ms']
+                        'avg_response_time_ms': summary['avg_ms'],
+                        'min_response_time_ms': summary['min_ms'],
+                        'max_response_time_ms': summary['max_ms'],
+                        'p50_response_time_ms': summary['p50_ms'],
+                        'p95_response_time_ms': summary['p95_ms'],
+                        'p99_response_time_ms': summary['p99_ms'],
+                        'measurements': summary['measurements'],
+                        'performance_ok': summary['avg_ms'] < self.thresholds['response_time_ms']
                     }
                 else:
                     response_times[cube_name] = {
@@ -586,18 +578,11 @@ class DeploymentValidator:
         """에러율 확인"""
         try:
             error_rates = {}
+            samples = self.probes.run(self._sample_cubes(self.error_rate_samples))
             
-            for cube_name, cube_config in self.cube_services.items():
-                success_count = 0
-                total_requests = 10
-                
-                # 10번 요청해서 에러율 계산
-                for _ in range(total_requests):
-                    response_test = self._test_basic_response(cube_config['url'])
-                    if response_test['success']:
-                        success_count += 1
-                    time.sleep(0.2)
-                
+            for cube_name, summary in samples.items():
+                success_count = summary['success_count']
+                total_requests = summary['total_requests']
                 error_rate = ((total_requests - success_count) / total_requests) * 100
                 
                 error_rates[cube_name] = {
@@ -627,11 +612,14 @@ class DeploymentValidator:
             
             # 프로세스별 메트릭
             process_metrics = {}
+            pgrep_results = self.probes.run(self.probes.gather({
+                cube_name: self.probes.command(['pgrep', '-f', cube_config['process_pattern']])
+                for cube_name, cube_config in self.cube_services.items()
+            }))
             for cube_name, cube_config in self.cube_services.items():
                 try:
-                    result = subprocess.run(['pgrep', '-f', cube_config['process_pattern']], 
-                                          capture_output=True, text=True)
-                    pids = result.stdout.strip().split('\n') if result.stdout.strip() else []
+                    stdout = pgrep_results[cube_name].value.get('stdout', '').strip()
+                    pids = stdout.split('\n') if stdout else []
                     
                     if pids and pids[0]:
                         pid = int(pids[0])
@@ -696,40 +684,54 @@ class DeploymentValidator:
         except Exception as e:
             return {'error': str(e)}
     
-    def _is_process_running(self, pattern: str) -> bool:
+    async def _is_process_running(self, pattern: str) -> bool:
         """프로세스 실행 확인"""
-        try:
-            result = subprocess.run(['pgrep', '-f', pattern], capture_output=True)
-            return result.returncode == 0
-        except:
-            return False
+        result = await self.probes.command(['pgrep', '-f', pattern])
+        return result.ok
     
-    def _is_port_listening(self, port: int) -> bool:
-        """포트 리스닝 확인"""
+    def _is_port_listening(self, port: int, listening: Optional[Dict[int, List[int]]] = None) -> bool:
+        """포트 리스닝 확인 (/proc/net/tcp 조회 결과 재사용 가능)"""
         try:
-            result = subprocess.run(['lsof', '-i', f':{port}'], capture_output=True)
-            return result.returncode == 0
-        except:
+            return port in (listening if listening is not None else listening_ports())
+        except Exception:
             return False
     
-    def _test_basic_response(self, url: str) -> Dict[str, Any]:
-        """기본 HTTP 응답 테스트"""
-        try:
-            start_time = time.time()
-            response = requests.get(url, timeout=5)
-            response_time_ms = (time.time() - start_time) * 1000
-            
-            return {
-                'success': response.status_code in [200, 404],  # Vite는 404도 정상
-                'status_code': response.status_code,
-                'response_time_ms': round(response_time_ms, 2)
-            }
-        except Exception as e:
+    async def _probe_cubes(self, listening: Dict[int, List[int]],
+                           http_only_if_listening: bool) -> Dict[str, Any]:
+        """큐브별 (프로세스 실행 여부, HTTP 프로브 결과) 동시 조회"""
+        async def probe(cube_config):
+            http_probe = None
+            if not http_only_if_listening or cube_config['port'] in listening:
+                http_probe = self.probes.http(cube_config['url'], ok_statuses=(200, 404))  # Vite는 404도 정상
+            if http_probe is None:
+                return await self._is_process_running(cube_config['process_pattern']), None
+            return await asyncio.gather(self._is_process_running(cube_config['process_pattern']), http_probe)
+        
+        return await self.probes.gather({
+            cube_name: probe(cube_config) for cube_name, cube_config in self.cube_services.items()
+        })
+    
+    async def _sample_cubes(self, count: int) -> Dict[str, Dict[str, Any]]:
+        """큐브별 HTTP 응답 표본 동시 수집"""
+        return await self.probes.gather({
+            cube_name: self.probes.http_samples(cube_config['url'], count, ok_statuses=(200, 404))
+            for cube_name, cube_config in self.cube_services.items()
+        })
+    
+    @staticmethod
+    def _response_summary(result: ProbeResult) -> Dict[str, Any]:
+        """HTTP 프로브 결과 → 기본 응답 테스트 결과"""
+        if result.error:
             return {
                 'success': False,
-                'error': str(e),
+                'error': result.error,
                 'response_time_ms': 0
             }
+        return {
+            'success': result.ok,
+            'status_code': result.value['status_code'],
+            'response_time_ms': result.elapsed_ms
+        }
     
     def _check_ssl_security(self) -> Dict[str, Any]:
         """SSL 보안 설정 확인"""
@@ -741,11 +743,8 @@ class DeploymentValidator:
         try:
             # 예상되는 포트만 확인
             expected_ports = [22, 80, 443, 3000, 3001, 3002, 5432, 6379, 8000, 8001]
-            open_ports = []
-            
-            for port in expected_ports:
-                if self._is_port_listening(port):
-                    open_ports.append(port)
+            listening = listening_ports()
+            open_ports = [port for port in expected_ports if port in listening]
             
             return {
                 'open_ports': open_ports,
@@ -2,6 +2,8 @@
 """
 🌪️ HEAL7 엔트로피 감지 및 정리 시스템
 시스템 복잡도 모니터링 및 자동 정리 스크립트
+- 파일시스템은 fs_scan_engine 으로 1회만 병렬 순회, 모든 scan_* 검사가 결과 공유
+- 중복 파일은 크기 → 부분 해시 → 전체 해시 단계로 좁히고, 해시 캐시로 증분 실행
 
 Author: AI Agent Team
 Created: 2025-08-20
@@ -11,11 +13,13 @@ import os
 import shutil
 import json
 import re
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 from datetime import datetime, timedelta
 import logging
-import hashlib
+
+from fs_scan_engine import FileSystemScanner, FileIndex, DuplicateFinder, HashCache
 
 # 로깅 설정
 logging.basicConfig(
@@ -61,6 +65,20 @@ class EntropyDetector:
             '/var/tmp/'
         ]
         
+        # 중복 파일 스캔 디렉토리 (node_modules, .git 제외)
+        self.duplicate_scan_dirs = [
+            '/home/ubuntu/heal7-system',
+            '/home/ubuntu/REFERENCE_LIBRARY',
+            '/home/ubuntu/scripts'
+        ]
+        self.duplicate_excluded_dirs = {'node_modules', '.git'}
+        
+        # 1회 순회 결과 (모든 scan_* 검사 공유) 및 증분 해시 캐시
+        self.scan_roots = ['/home/ubuntu', '/tmp', '/var/tmp', '/var/log']
+        self.hash_cache_file = '/home/ubuntu/logs/entropy-reports/hash_cache.json'
+        self._file_index = None
+        self.scan_stats = {}
+        
         # 엔트로피 임계값
         self.thresholds = {
             'max_top_level_files': 3,       # 최상위 폴더 파일 수
@@ -70,16 +88,37 @@ class EntropyDetector:
             'max_orphaned_configs': 5       # 고아 설정 파일 수
         }
     
+    @property
+    def file_index(self) -> FileIndex:
+        """스캔 대상 루트 1회 순회 결과 (첫 사용 시 생성)"""
+        if self._file_index is None:
+            started = datetime.now()
+            self._file_index = FileSystemScanner().walk(self.scan_roots)
+            self.scan_stats['entries_walked'] = len(self._file_index)
+            self.scan_stats['walk_seconds'] = (datetime.now() - started).total_seconds()
+        return self._file_index
+    
+    def _files_under(self, directories: List[str]):
+        """여러 디렉토리 하위 일반 파일 (파일시스템 재순회 없음)"""
+        for directory in directories:
+            yield from self.file_index.under(directory, kind='file')
+    
     def scan_top_level_entropy(self) -> Dict[str, Any]:
         """최상위 디렉토리 엔트로피 스캔"""
-        home_dir = Path('/home/ubuntu')
+        home_dir = '/home/ubuntu'
         
         # 허가되지 않은 파일들
         unauthorized_files = []
         unauthorized_dirs = []
         
-        for item in home_dir.iterdir():
-            item_path = str(item)
+        # 허가된 프로젝트 폴더들
+        allowed_dirs = {
+            'heal7-system', 'REFERENCE_LIBRARY', 'docs', 'scripts', 
+            'logs', 'backups', 'database', 'archive', '.heal7-session'
+        }
+        
+        for item in self.file_index.children(home_dir):
+            item_path = item.path
             
             # 화이트리스트 체크
             if item_path in self.whitelist_files:
@@ -89,24 +128,18 @@ class EntropyDetector:
             if any(re.match(pattern, item_path) for pattern in self.whitelist_patterns):
                 continue
             
-            # 허가된 프로젝트 폴더들
-            allowed_dirs = {
-                'heal7-system', 'REFERENCE_LIBRARY', 'docs', 'scripts', 
-                'logs', 'backups', 'database', 'archive', '.heal7-session'
-            }
-            
-            if item.is_file():
+            if item.kind == 'file':
                 unauthorized_files.append({
                     'path': item_path,
-                    'size': item.stat().st_size,
-                    'modified': datetime.fromtimestamp(item.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                    'size': item.size,
+                    'modified': datetime.fromtimestamp(item.mtime).strftime('%Y-%m-%d %H:%M:%S'),
                     'type': 'file'
                 })
-            elif item.is_dir() and item.name not in allowed_dirs:
+            elif item.kind == 'dir' and item.name not in allowed_dirs:
                 unauthorized_dirs.append({
                     'path': item_path,
-                    'item_count': len(list(item.rglob('*'))),
-                    'modified': datetime.fromtimestamp(item.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                    'item_count': self.file_index.count_under(item_path),
+                    'modified': datetime.fromtimestamp(item.mtime).strftime('%Y-%m-%d %H:%M:%S'),
                     'type': 'directory'
                 })
         
@@ -125,24 +158,21 @@ class EntropyDetector:
         ]
         
         temp_files = []
-        cutoff_date = datetime.now() - timedelta(days=self.thresholds['max_temp_file_age_days'])
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=self.thresholds['max_temp_file_age_days'])
         
-        for scan_dir in ['/home/ubuntu', '/tmp', '/var/tmp']:
-            scan_path = Path(scan_dir)
-            if not scan_path.exists():
+        for temp_file in self._files_under(['/home/ubuntu', '/tmp', '/var/tmp']):
+            pattern = next((p for p in temp_patterns if fnmatch(temp_file.name, p)), None)
+            if pattern is None:
                 continue
-                
-            for pattern in temp_patterns:
-                for temp_file in scan_path.rglob(pattern):
-                    if temp_file.is_file():
-                        modified_time = datetime.fromtimestamp(temp_file.stat().st_mtime)
-                        if modified_time < cutoff_date:
-                            temp_files.append({
-                                'path': str(temp_file),
-                                'size': temp_file.stat().st_size,
-                                'age_days': (datetime.now() - modified_time).days,
-                                'pattern': pattern
-                            })
+            modified_time = datetime.fromtimestamp(temp_file.mtime)
+            if modified_time < cutoff_date:
+                temp_files.append({
+                    'path': temp_file.path,
+                    'size': temp_file.size,
+                    'age_days': (now - modified_time).days,
+                    'pattern': pattern
+                })
         
         return {
             'temp_files': temp_files,
@@ -151,47 +181,26 @@ class EntropyDetector:
         }
     
     def scan_duplicate_files(self) -> Dict[str, Any]:
-        """중복 파일 스캔 (해시 기반)"""
-        file_hashes = {}
-        duplicates = []
-        
-        # 스캔할 디렉토리 (node_modules 제외)
-        scan_dirs = [
-            '/home/ubuntu/heal7-system',
-            '/home/ubuntu/REFERENCE_LIBRARY',
-            '/home/ubuntu/scripts'
+        """중복 파일 스캔 (크기 → 부분 해시 → 전체 해시, 해시 캐시로 증분)"""
+        candidates = [
+            entry for entry in self._files_under(self.duplicate_scan_dirs)
+            if entry.size > 1024  # 1KB 이상 파일만
+            and not self.duplicate_excluded_dirs.intersection(entry.path.split(os.sep))
         ]
         
-        for scan_dir in scan_dirs:
-            scan_path = Path(scan_dir)
-            if not scan_path.exists():
-                continue
-            
-            for file_path in scan_path.rglob('*'):
-                if (file_path.is_file() and 
-                    'node_modules' not in str(file_path) and 
-                    '.git' not in str(file_path) and
-                    file_path.stat().st_size > 1024):  # 1KB 이상 파일만
-                    
-                    try:
-                        # 파일 해시 계산
-                        hasher = hashlib.md5()
-                        with open(file_path, 'rb') as f:
-                            hasher.update(f.read())
-                        file_hash = hasher.hexdigest()
-                        
-                        if file_hash in file_hashes:
-                            # 중복 발견
-                            duplicates.append({
-                                'hash': file_hash,
-                                'files': [file_hashes[file_hash], str(file_path)],
-                                'size': file_path.stat().st_size
-                            })
-                        else:
-                            file_hashes[file_hash] = str(file_path)
-                            
-                    except Exception as e:
-                        logging.warning(f"파일 해시 계산 실패 {file_path}: {e}")
+        cache = HashCache(self.hash_cache_file)
+        finder = DuplicateFinder(cache)
+        duplicates = []
+        for file_hash, group in finder.find(candidates):
+            # 그룹의 첫 파일을 원본으로 보고 나머지를 중복으로 보고
+            for duplicate in group[1:]:
+                duplicates.append({
+                    'hash': file_hash,
+                    'files': [group[0].path, duplicate.path],
+                    'size': duplicate.size
+                })
+        cache.save()
+        self.scan_stats.update(finder.stats())
         
         return {
             'duplicates': duplicates,
@@ -206,25 +215,20 @@ class EntropyDetector:
             '.env.*', '*.yaml', '*.yml', '*.json'
         ]
         
+        # 알려진 설정 파일 제외
+        known_configs = {'.env.ai', 'CLAUDE.md'}
         orphaned_configs = []
         
-        # 프로젝트 루트가 아닌 위치의 설정 파일들
-        scan_dirs = ['/home/ubuntu']
-        
-        for scan_dir in scan_dirs:
-            scan_path = Path(scan_dir)
-            
-            for pattern in config_patterns:
-                for config_file in scan_path.glob(pattern):  # 하위 디렉토리 제외, 최상위만
-                    if config_file.is_file():
-                        # 알려진 설정 파일 제외
-                        known_configs = {'.env.ai', 'CLAUDE.md'}
-                        if config_file.name not in known_configs:
-                            orphaned_configs.append({
-                                'path': str(config_file),
-                                'size': config_file.stat().st_size,
-                                'modified': datetime.fromtimestamp(config_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-                            })
+        # 프로젝트 루트가 아닌 위치의 설정 파일들 (하위 디렉토리 제외, 최상위만)
+        for config_file in self.file_index.children('/home/ubuntu'):
+            if (config_file.kind == 'file' and
+                    config_file.name not in known_configs and
+                    any(fnmatch(config_file.name, pattern) for pattern in config_patterns)):
+                orphaned_configs.append({
+                    'path': config_file.path,
+                    'size': config_file.size,
+                    'modified': datetime.fromtimestamp(config_file.mtime).strftime('%Y-%m-%d %H:%M:%S')
+                })
         
         return {
             'orphaned_configs': orphaned_configs,
@@ -241,33 +245,30 @@ class EntropyDetector:
         
         large_logs = []
         old_logs = []
-        cutoff_date = datetime.now() - timedelta(days=30)
+        now = datetime.now()
+        cutoff_date = now - timedelta(days=30)
         
-        for log_dir in log_dirs:
-            log_path = Path(log_dir)
-            if not log_path.exists():
+        for log_file in self._files_under(log_dirs):
+            if not log_file.name.endswith('.log'):
                 continue
+            file_size = log_file.size
+            modified_time = datetime.fromtimestamp(log_file.mtime)
             
-            for log_file in log_path.rglob('*.log'):
-                if log_file.is_file():
-                    file_size = log_file.stat().st_size
-                    modified_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-                    
-                    # 큰 로그 파일 (10MB 이상)
-                    if file_size > 10 * 1024 * 1024:
-                        large_logs.append({
-                            'path': str(log_file),
-                            'size_mb': file_size / (1024 * 1024),
-                            'modified': modified_time.strftime('%Y-%m-%d %H:%M:%S')
-                        })
-                    
-                    # 오래된 로그 파일
-                    if modified_time < cutoff_date:
-                        old_logs.append({
-                            'path': str(log_file),
-                            'age_days': (datetime.now() - modified_time).days,
-                            'size_mb': file_size / (1024 * 1024)
-                        })
+            # 큰 로그 파일 (10MB 이상)
+            if file_size > 10 * 1024 * 1024:
+                large_logs.append({
+                    'path': log_file.path,
+                    'size_mb': file_size / (1024 * 1024),
+                    'modified': modified_time.strftime('%Y-%m-%d %H:%M:%S')
+                })
+            
+            # 오래된 로그 파일
+            if modified_time < cutoff_date:
+                old_logs.append({
+                    'path': log_file.path,
+                    'age_days': (now - modified_time).days,
+                    'size_mb': file_size / (1024 * 1024)
+                })
         
         return {
             'large_logs': large_logs,
@@ -280,15 +281,16 @@ class EntropyDetector:
         """깨진 심볼릭 링크 스캔"""
         broken_links = []
         
-        for scan_dir in ['/home/ubuntu']:
-            scan_path = Path(scan_dir)
-            
-            for item in scan_path.rglob('*'):
-                if item.is_symlink() and not item.exists():
-                    broken_links.append({
-                        'path': str(item),
-                        'target': str(item.readlink()) if item.readlink() else 'unknown'
-                    })
+        for item in self.file_index.under('/home/ubuntu', kind='symlink'):
+            if item.broken:
+                try:
+                    target = os.readlink(item.path)
+                except OSError:
+                    target = 'unknown'
+                broken_links.append({
+                    'path': item.path,
+                    'target': target
+                })
         
         return {
             'broken_links': broken_links,
@@ -535,6 +537,7 @@ class EntropyDetector:
         self.entropy_report.update({
             'entropy_level': entropy_level,
             'scan_results': scan_results,
+            'scan_stats': self.scan_stats,
             'cleanup_plan': cleanup_plan,
             'recommendations': recommendations
         })
@@ -591,6 +594,11 @@ class EntropyDetector:
         duplicates = scan_results.get('duplicates', {})
         print(f"📋 중복 파일: {duplicates.get('duplicate_count', 0)}개 ({duplicates.get('wasted_space_mb', 0):.1f}MB 낭비)")
         
+        scan_stats = report.get('scan_stats', {})
+        if scan_stats:
+            print(f"⚡ 스캔: {scan_stats.get('entries_walked', 0)}개 항목 {scan_stats.get('walk_seconds', 0):.1f}초, "
+                  f"해시 캐시 적중 {scan_stats.get('cache_hits', 0)}건, 해시 {scan_stats.get('bytes_hashed_mb', 0):.1f}MB")
+        
         # 정리 계획
         cleanup_plan = report.get('cleanup_plan', [])
         if cleanup_plan:
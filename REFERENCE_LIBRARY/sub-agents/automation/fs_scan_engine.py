@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+🗂️ HEAL7 파일시스템 스캔 엔진
+자동화 에이전트들이 공유하는 1회 순회 + 증분 해시 엔진
+
+- os.scandir 기반 병렬 순회 (항목당 lstat 1회), 결과는 FileIndex 로 모든 검사가 공유
+- 중복 탐지: 크기 그룹 → 앞/뒤 블록 부분 해시 → 필요한 그룹만 전체 스트리밍 해시
+- 해시: xxhash(xxh3_128) 설치 시 사용, 없으면 BLAKE2b
+- (크기, mtime) 기준 해시 캐시를 JSON 으로 저장 → 일일 실행은 바뀐 파일만 읽음
+
+Author: AI Agent Team
+Created: 2025-08-20
+"""
+
+import os
+import json
+import stat
+import hashlib
+import logging
+import queue
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import xxhash
+    HASH_ALGORITHM = 'xxh3_128'
+    _new_hasher = xxhash.xxh3_128
+except ImportError:
+    HASH_ALGORITHM = 'blake2b'
+    _new_hasher = lambda: hashlib.blake2b(digest_size=16)
+
+PARTIAL_BLOCK_SIZE = 64 * 1024      # 부분 해시: 앞/뒤 각 64KB
+STREAM_CHUNK_SIZE = 1024 * 1024     # 전체 해시: 1MB 단위 스트리밍
+CACHE_VERSION = 1
+
+
+def content_digest(data: bytes) -> str:
+    """바이트 내용 해시 (엔진 공통 알고리즘)"""
+    hasher = _new_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+class FileEntry(NamedTuple):
+    """순회 결과 항목 (lstat 기준, 심볼릭 링크는 따라가지 않음)"""
+    path: str
+    name: str
+    parent: str
+    kind: str           # 'file' | 'dir' | 'symlink' | 'other'
+    size: int
+    mtime: float
+    mtime_ns: int
+    broken: bool = False  # 심볼릭 링크 대상이 없는 경우
+
+
+class FileIndex:
+    """1회 순회 결과 - 경로 정렬 목록 + 부모별 자식 목록"""
+
+    def __init__(self, entries: Iterable[FileEntry], roots: List[str]):
+        self.roots = roots
+        self.entries: List[FileEntry] = sorted(entries, key=lambda e: e.path)
+        self._paths = [e.path for e in self.entries]
+        self._children: Dict[str, List[FileEntry]] = defaultdict(list)
+        for entry in self.entries:
+            self._children[entry.parent].append(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _range(self, directory: str) -> Tuple[int, int]:
+        """directory 하위 항목의 정렬 목록 구간 (경로 접두사 구간은 연속)"""
+        prefix = directory.rstrip(os.sep) + os.sep
+        upper = prefix[:-1] + chr(ord(os.sep) + 1)
+        return bisect_left(self._paths, prefix), bisect_left(self._paths, upper)
+
+    def under(self, directory: str, kind: Optional[str] = None) -> Iterator[FileEntry]:
+        """directory 하위 전체 항목 (재귀)"""
+        start, end = self._range(directory)
+        for entry in self.entries[start:end]:
+            if kind is None or entry.kind == kind:
+                yield entry
+
+    def count_under(self, directory: str) -> int:
+        """directory 하위 항목 수 (재귀, O(log n))"""
+        start, end = self._range(directory)
+        return end - start
+
+    def children(self, directory: str) -> List[FileEntry]:
+        """directory 직속 항목"""
+        return self._children.get(directory.rstrip(os.sep) or os.sep, [])
+
+
+class FileSystemScanner:
+    """os.scandir 병렬 순회기 (디렉토리 단위 작업을 작업 스레드들에 분배)"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    @staticmethod
+    def _normalize_roots(roots: Iterable[str]) -> List[str]:
+        """존재하는 루트만, 다른 루트의 하위 경로는 제외 (중복 순회 방지)"""
+        normalized = sorted({os.path.realpath(r) for r in roots if os.path.isdir(r)})
+        result = []
+        for root in normalized:
+            if not any(root == r or root.startswith(r.rstrip(os.sep) + os.sep) for r in result):
+                result.append(root)
+        return result
+
+    @staticmethod
+    def _scan_dir(directory: str) -> Tuple[List[FileEntry], List[str]]:
+        entries, subdirs = [], []
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    try:
+                        st = item.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    broken = False
+                    if stat.S_ISLNK(st.st_mode):
+                        kind = 'symlink'
+                        broken = not os.path.exists(item.path)
+                    elif stat.S_ISDIR(st.st_mode):
+                        kind = 'dir'
+                        subdirs.append(item.path)
+                    elif stat.S_ISREG(st.st_mode):
+                        kind = 'file'
+                    else:
+                        kind = 'other'
+                    entries.append(FileEntry(item.path, item.name, directory, kind,
+                                             st.st_size, st.st_mtime, st.st_mtime_ns, broken))
+        except OSError as e:
+            logging.debug(f"디렉토리 스캔 실패 {directory}: {e}")
+        return entries, subdirs
+
+    def walk(self, roots: Iterable[str]) -> FileIndex:
+        """루트들을 한 번만 순회해 FileIndex 생성 (작업 큐: 하위 디렉토리를 발견 즉시 분배)"""
+        roots = self._normalize_roots(roots)
+        entries: List[FileEntry] = []
+        lock = threading.Lock()
+        work: "queue.Queue[Optional[str]]" = queue.Queue()
+
+        def worker():
+            while True:
+                directory = work.get()
+                if directory is None:
+                    work.task_done()
+                    return
+                found, subdirs = self._scan_dir(directory)
+                with lock:
+                    entries.extend(found)
+                for subdir in subdirs:
+                    work.put(subdir)
+                work.task_done()
+
+        for root in roots:
+            work.put(root)
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.max_workers)]
+        for thread in threads:
+            thread.start()
+        work.join()
+        for _ in threads:
+            work.put(None)
+        for thread in threads:
+            thread.join()
+        return FileIndex(entries, roots)
+
+
+class HashCache:
+    """(크기, mtime) 검증 해시 캐시 - 경로 → [크기, mtime_ns, 부분 해시, 전체 해시]"""
+
+    def __init__(self, cache_file: Optional[str] = None):
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._entries: Dict[str, list] = {}
+        self._seen = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION and data.get('algorithm') == HASH_ALGORITHM:
+                self._entries = data.get('entries', {})
+        except (OSError, ValueError) as e:
+            logging.warning(f"해시 캐시 로드 실패 {self.cache_file}: {e}")
+
+    def get(self, entry: FileEntry, field: int) -> Optional[str]:
+        """field: 2=부분 해시, 3=전체 해시"""
+        with self._lock:
+            self._seen.add(entry.path)
+            cached = self._entries.get(entry.path)
+            if cached and cached[0] == entry.size and cached[1] == entry.mtime_ns and cached[field]:
+                self.hits += 1
+                return cached[field]
+            self.misses += 1
+            return None
+
+    def put(self, entry: FileEntry, field: int, digest: str):
+        with self._lock:
+            cached = self._entries.get(entry.path)
+            if not cached or cached[0] != entry.size or cached[1] != entry.mtime_ns:
+                cached = self._entries[entry.path] = [entry.size, entry.mtime_ns, None, None]
+            cached[field] = digest
+            self._seen.add(entry.path)
+
+    def save(self):
+        """이번 실행에서 확인한 경로만 남겨 원자적으로 저장"""
+        if not self.cache_file:
+            return
+        entries = {path: value for path, value in self._entries.items() if path in self._seen}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'algorithm': HASH_ALGORITHM, 'entries': entries}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logging.warning(f"해시 캐시 저장 실패 {self.cache_file}: {e}")
+
+
+class DuplicateFinder:
+    """단계별 중복 파일 탐지 (크기 → 부분 해시 → 전체 해시)"""
+
+    def __init__(self, cache: Optional[HashCache] = None, max_workers: Optional[int] = None):
+        self.cache = cache or HashCache()
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) * 2)
+        self.bytes_hashed = 0
+        self._bytes_lock = threading.Lock()
+
+    def _read_digest(self, entry: FileEntry, full: bool) -> str:
+        hasher = _new_hasher()
+        read = 0
+        with open(entry.path, 'rb') as f:
+            if full:
+                for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+                    read += len(chunk)
+            elif entry.size <= 2 * PARTIAL_BLOCK_SIZE:
+                data = f.read()
+                hasher.update(data)
+                read = len(data)
+            else:
+                head = f.read(PARTIAL_BLOCK_SIZE)
+                f.seek(-PARTIAL_BLOCK_SIZE, os.SEEK_END)
+                tail = f.read(PARTIAL_BLOCK_SIZE)
+                hasher.update(head)
+                hasher.update(tail)
+                read = len(head) + len(tail)
+        with self._bytes_lock:
+            self.bytes_hashed += read
+        return hasher.hexdigest()
+
+    def _digest(self, entry: FileEntry, full: bool) -> Optional[str]:
+        field = 3 if full else 2
+        digest = self.cache.get(entry, field)
+        if digest:
+            return digest
+        try:
+            digest = self._read_digest(entry, full)
+        except OSError as e:
+            logging.warning(f"파일 해시 계산 실패 {entry.path}: {e}")
+            return None
+        self.cache.put(entry, field, digest)
+        return digest
+
+    def _group_by_digest(self, pool: ThreadPoolExecutor, groups: Iterable[List[FileEntry]],
+                         full: bool) -> List[Tuple[str, List[FileEntry]]]:
+        """그룹 내부를 해시로 다시 나눔 → [(해시, 항목들)] (2개 이상 남은 그룹만)"""
+        candidates = [entry for group in groups for entry in group]
+        digests = pool.map(lambda entry: self._digest(entry, full), candidates)
+        regrouped: Dict[Tuple[int, str], List[FileEntry]] = defaultdict(list)
+        for entry, digest in zip(candidates, digests):
+            if digest:
+                regrouped[(entry.size, digest)].append(entry)
+        return [(digest, group) for (_, digest), group in regrouped.items() if len(group) > 1]
+
+    def find(self, entries: Iterable[FileEntry]) -> List[Tuple[str, List[FileEntry]]]:
+        """같은 내용의 파일 그룹 목록 → [(해시, [항목...])] (그룹 내 경로순)"""
+        by_size: Dict[int, List[FileEntry]] = defaultdict(list)
+        for entry in entries:
+            by_size[entry.size].append(entry)
+        size_groups = [group for group in by_size.values() if len(group) > 1]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            partial_groups = self._group_by_digest(pool, size_groups, full=False)
+            # 부분 해시가 파일 전체를 덮는 작은 파일은 부분 해시가 곧 전체 해시
+            result = [(d, g) for d, g in partial_groups if g[0].size <= 2 * PARTIAL_BLOCK_SIZE]
+            large = [g for _, g in partial_groups if g[0].size > 2 * PARTIAL_BLOCK_SIZE]
+            result.extend(self._group_by_digest(pool, large, full=True))
+
+        for _, group in result:
+            group.sort(key=lambda e: e.path)
+        return sorted(result, key=lambda item: item[1][0].path)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'hash_algorithm': HASH_ALGORITHM,
+            'cache_hits': self.cache.hits,
+            'cache_misses': self.cache.misses,
+            'bytes_hashed_mb': self.bytes_hashed / (1024 * 1024)
+        }
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+📡 HEAL7 비동기 프로브 실행기
+헬스 체크 / 배포 검증 에이전트가 공유하는 동시 점검 엔진
+
+- HTTP, TCP 포트, 하위 프로세스, TLS 인증서 점검을 프로브별 타임아웃으로 동시 실행
+- 리스닝 포트는 ss/lsof 프로세스 대신 /proc/net/tcp(6) 직접 파싱
+- 응답 시간 표본을 동시에 수집하고 백분위(p50/p95/p99) 보고
+- 동기 코드에서는 run() / run_parallel() 로 호출
+
+Author: AI Agent Team
+Created: 2025-08-20
+"""
+
+import asyncio
+import math
+import os
+import ssl
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import requests
+
+TCP_LISTEN_STATE = '0A'
+PROC_NET_TCP_FILES = ('/proc/net/tcp', '/proc/net/tcp6')
+
+
+@dataclass
+class ProbeResult:
+    """프로브 결과 (value 는 프로브별 상세 정보)"""
+    name: str
+    ok: bool
+    elapsed_ms: float
+    value: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """백분위 (nearest-rank)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def listening_ports() -> Dict[int, List[int]]:
+    """리스닝 TCP 포트 → 소켓 inode 목록 (/proc/net/tcp, tcp6)"""
+    ports: Dict[int, List[int]] = {}
+    for proc_file in PROC_NET_TCP_FILES:
+        try:
+            with open(proc_file, 'r') as f:
+                next(f, None)  # 헤더
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 10 or fields[3] != TCP_LISTEN_STATE:
+                        continue
+                    port = int(fields[1].rsplit(':', 1)[1], 16)
+                    ports.setdefault(port, []).append(int(fields[9]))
+        except OSError as e:
+            logging.debug(f"{proc_file} 읽기 실패: {e}")
+    return ports
+
+
+def socket_owners(inodes: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """소켓 inode → 소유 프로세스 목록 (/proc/[pid]/fd 1회 순회, 권한 없는 프로세스는 제외)"""
+    wanted = {f'socket:[{inode}]': inode for inode in inodes}
+    owners: Dict[int, List[Dict[str, Any]]] = {inode: [] for inode in wanted.values()}
+    if not wanted:
+        return owners
+
+    for pid in filter(str.isdigit, os.listdir('/proc')):
+        fd_dir = f'/proc/{pid}/fd'
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        matched = set()
+        for fd in fds:
+            try:
+                link = os.readlink(os.path.join(fd_dir, fd))
+            except OSError:
+                continue  # 조회 중 닫힌 fd
+            if link in wanted:
+                matched.add(wanted[link])
+        if not matched:
+            continue
+        try:
+            with open(f'/proc/{pid}/comm', 'r') as f:
+                command = f.read().strip()
+        except OSError:
+            command = 'unknown'
+        for inode in matched:
+            owners[inode].append({'command': command, 'pid': pid})
+    return owners
+
+
+class ProbeRunner:
+    """동시 프로브 실행기 (HTTP 는 전용 스레드 풀, 그 외는 asyncio 네이티브)"""
+
+    def __init__(self, default_timeout: float = 5.0, max_concurrency: int = 32):
+        self.default_timeout = default_timeout
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix='probe')
+        return self._executor
+
+    # === 동기 진입점 ===
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """동기 코드에서 코루틴 실행"""
+        return asyncio.run(coro)
+
+    def run_parallel(self, checks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """동기 점검 함수들을 스레드로 동시 실행 (각 점검 내부의 프로브도 각자 동시 실행)"""
+        with ThreadPoolExecutor(max_workers=len(checks) or 1, thread_name_prefix='check') as pool:
+            futures = {name: pool.submit(check) for name, check in checks.items()}
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logging.error(f"점검 실패 {name}: {e}")
+                    results[name] = {'error': str(e)}
+            return results
+
+    async def gather(self, probes: Dict[str, Awaitable[Any]]) -> Dict[str, Any]:
+        """이름 → 프로브 코루틴 딕셔너리를 동시 실행 (동시 실행 수 제한)"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def limited(awaitable):
+            async with semaphore:
+                return await awaitable
+
+        results = await asyncio.gather(*(limited(p) for p in probes.values()))
+        return dict(zip(probes.keys(), results))
+
+    # === 프로브 ===
+
+    async def http(self, url: str, timeout: Optional[float] = None,
+                   ok_statuses: Sequence[int] = (200,), name: Optional[str] = None) -> ProbeResult:
+        """HTTP GET 프로브 (value: status_code)"""
+        timeout = timeout or self.default_timeout
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                loop.run_in_executor(self.executor, lambda: requests.get(url, timeout=timeout)),
+                timeout + 1
+            )
+        except Exception as e:
+            return ProbeResult(name or url, False, self._elapsed(started), error=str(e) or type(e).__name__)
+        return ProbeResult(name or url, response.status_code in ok_statuses, self._elapsed(started),
+                           value={'status_code': response.status_code})
+
+    async def tcp(self, host: str, port: int, timeout: Optional[float] = None,
+                  name: Optional[str] = None) -> ProbeResult:
+        """TCP 연결 프로브"""
+        started = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port),
+                                               timeout or self.default_timeout)
+            writer.close()
+            await writer.wait_closed()
+        except Exception as e:
+            return ProbeResult(name or f'{host}:{port}', False, self._elapsed(started),
+                               error=str(e) or type(e).__name__)
+        return ProbeResult(name or f'{host}:{port}', True, self._elapsed(started))
+
+    async def port(self, port: int, host: str = '127.0.0.1',
+                   listening: Optional[Dict[int, List[int]]] = None) -> ProbeResult:
+        """포트 리스닝 프로브 (/proc/net/tcp 조회, /proc 이 없으면 TCP 연결 시도)"""
+        if listening is None and os.path.exists(PROC_NET_TCP_FILES[0]):
+            listening = listening_ports()
+        if listening is None:
+            return await self.tcp(host, port, name=str(port))
+        return ProbeResult(str(port), port in listening, 0.0, value={'inodes': listening.get(port, [])})
+
+    async def command(self, args: Sequence[str], timeout: Optional[float] = None,
+                      cwd: Optional[str] = None, input: Optional[str] = None,
+                      name: Optional[str] = None) -> ProbeResult:
+        """하위 프로세스 프로브 (value: returncode, stdout, stderr / 타임아웃 시 종료)"""
+        name = name or ' '.join(args)
+        started = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *args, cwd=cwd,
+                stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
+            return ProbeResult(name, False, self._elapsed(started), error=str(e))
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(input.encode() if input is not None else None),
+                timeout or self.default_timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return ProbeResult(name, False, self._elapsed(started), error='timeout')
+
+        return ProbeResult(name, process.returncode == 0, self._elapsed(started), value={
+            'returncode': process.returncode,
+            'stdout': stdout.decode(errors='replace'),
+            'stderr': stderr.decode(errors='replace')
+        })
+
+    async def tls_certificate(self, domain: str, port: int = 443, timeout: Optional[float] = None,
+                              name: Optional[str] = None) -> ProbeResult:
+        """TLS 인증서 프로브 (value: certificate_valid, not_after, days_remaining)"""
+        context = ssl.create_default_context()
+        started = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(domain, port, ssl=context, server_hostname=domain),
+                timeout or self.default_timeout
+            )
+        except ssl.SSLCertVerificationError as e:
+            return ProbeResult(name or domain, False, self._elapsed(started),
+                               value={'certificate_valid': False, 'verification_failed': True},
+                               error=e.verify_message or str(e))
+        except Exception as e:
+            return ProbeResult(name or domain, False, self._elapsed(started),
+                               value={'certificate_valid': False, 'verification_failed': False},
+                               error=str(e) or type(e).__name__)
+
+        certificate = writer.get_extra_info('peercert') or {}
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, ssl.SSLError):
+            pass
+
+        value = {'certificate_valid': True, 'verification_failed': False}
+        if certificate.get('notAfter'):
+            expires = ssl.cert_time_to_seconds(certificate['notAfter'])
+            value['not_after'] = datetime.fromtimestamp(expires).isoformat()
+            value['days_remaining'] = int((expires - time.time()) // 86400)
+        return ProbeResult(name or domain, True, self._elapsed(started), value=value)
+
+    async def http_samples(self, url: str, count: int = 5, timeout: Optional[float] = None,
+                           ok_statuses: Sequence[int] = (200,)) -> Dict[str, Any]:
+        """응답 시간 표본 동시 수집 → 성공 수, 표본, 평균/최소/최대, 백분위"""
+        results = await asyncio.gather(*(self.http(url, timeout, ok_statuses) for _ in range(count)))
+        measurements = [round(r.elapsed_ms, 2) for r in results if r.ok]
+        summary = {
+            'total_requests': count,
+            'success_count': len(measurements),
+            'measurements': measurements,
+            'errors': sorted({r.error or f"HTTP {r.value.get('status_code')}" for r in results if not r.ok})
+        }
+        if measurements:
+            summary.update({
+                'avg_ms': round(sum(measurements) / len(measurements), 2),
+                'min_ms': min(measurements),
+                'max_ms': max(measurements),
+                'p50_ms': percentile(measurements, 50),
+                'p95_ms': percentile(measurements, 95),
+                'p99_ms': percentile(measurements, 99)
+            })
+        return summary
+
+    @staticmethod
+    def _elapsed(started: float) -> float:
+        return round((time.perf_counter() - started) * 1000, 2)
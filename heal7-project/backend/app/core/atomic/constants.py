@@ -6,11 +6,17 @@
 로직: 전통 명리학 기준 상수 정의
 
 기존 saju_core_constants.py와 호환성 유지
+천간/지지/오행/음양 표와 속성 조회는 공용 간지 코덱(shared.hanja_codec) 사용
 """
 
 from enum import Enum
 from typing import Dict, List, Tuple, Optional
 
+from shared.hanja_codec import (
+    STEMS_HANGUL, BRANCHES_HANGUL, ELEMENTS_HANGUL, YIN_YANG_HANGUL, BRANCH_ZODIAC,
+    STEM_ELEMENT, BRANCH_ELEMENT, STEM_YIN_YANG, BRANCH_YIN_YANG, STEM_INDEX, BRANCH_INDEX
+)
+
 # === 기본 상수 ===
 
 # 60갑자 순환 (전체 목록)
@@ -24,62 +30,36 @@ GANJI_60 = [
 ]
 
 # 천간 (10개)
-CHEONGAN = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
+CHEONGAN = list(STEMS_HANGUL)
 
 # 지지 (12개)  
-JIJI = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
+JIJI = list(BRANCHES_HANGUL)
 
 # 오행 (5개)
-WUXING = ["목", "화", "토", "금", "수"]
+WUXING = list(ELEMENTS_HANGUL)
 
 # 음양
-YIN_YANG = ["양", "음"]
+YIN_YANG = list(YIN_YANG_HANGUL)
 
 # 12지 동물
-ZODIAC_ANIMALS = ["쥐", "소", "호랑이", "토끼", "용", "뱀", "말", "양", "원숭이", "닭", "개", "돼지"]
+ZODIAC_ANIMALS = list(BRANCH_ZODIAC)
 
-# === 매핑 테이블 ===
+# === 매핑 테이블 (코덱 서수 배열에서 생성) ===
 
 # 천간 → 오행 매핑
-CHEONGAN_WUXING = {
-    "갑": "목", "을": "목",
-    "병": "화", "정": "화", 
-    "무": "토", "기": "토",
-    "경": "금", "신": "금",
-    "임": "수", "계": "수"
-}
+CHEONGAN_WUXING = dict(zip(STEMS_HANGUL, STEM_ELEMENT))
 
 # 지지 → 오행 매핑
-JIJI_WUXING = {
-    "인": "목", "묘": "목",
-    "사": "화", "오": "화",
-    "진": "토", "술": "토", "축": "토", "미": "토",
-    "신": "금", "유": "금", 
-    "자": "수", "해": "수"
-}
+JIJI_WUXING = dict(zip(BRANCHES_HANGUL, BRANCH_ELEMENT))
 
 # 천간 → 음양 매핑
-CHEONGAN_YIN_YANG = {
-    "갑": "양", "을": "음",
-    "병": "양", "정": "음",
-    "무": "양", "기": "음", 
-    "경": "양", "신": "음",
-    "임": "양", "계": "음"
-}
+CHEONGAN_YIN_YANG = dict(zip(STEMS_HANGUL, STEM_YIN_YANG))
 
 # 지지 → 음양 매핑
-JIJI_YIN_YANG = {
-    "자": "양", "축": "음", "인": "양", "묘": "음",
-    "진": "양", "사": "음", "오": "양", "미": "음",
-    "신": "양", "유": "음", "술": "양", "해": "음"
-}
+JIJI_YIN_YANG = dict(zip(BRANCHES_HANGUL, BRANCH_YIN_YANG))
 
 # 지지 → 동물 매핑
-JIJI_ZODIAC = {
-    "자": "쥐", "축": "소", "인": "호랑이", "묘": "토끼",
-    "진": "용", "사": "뱀", "오": "말", "미": "양",
-    "신": "원숭이", "유": "닭", "술": "개", "해": "돼지"
-}
+JIJI_ZODIAC = dict(zip(BRANCHES_HANGUL, BRANCH_ZODIAC))
 
 # 지장간 매핑 (지지 안에 숨어있는 천간들)
 JIJANGGAN = {
@@ -122,25 +102,28 @@ def split_ganji(ganji: str) -> Tuple[str, str]:
         raise ValueError("갑자는 2글자여야 합니다")
     return ganji[0], ganji[1]
 
+def _lookup(table: Tuple[str, ...], index: Optional[int]) -> str:
+    return "미지" if index is None else table[index]
+
 def get_cheongan_wuxing(cheongan: str) -> str:
-    """천간의 오행 반환"""
-    return CHEONGAN_WUXING.get(cheongan, "미지")
+    """천간의 오행 반환 (한글/한자)"""
+    return _lookup(STEM_ELEMENT, STEM_INDEX.get(cheongan))
 
 def get_jiji_wuxing(jiji: str) -> str:
-    """지지의 오행 반환"""
-    return JIJI_WUXING.get(jiji, "미지")
+    """지지의 오행 반환 (한글/한자)"""
+    return _lookup(BRANCH_ELEMENT, BRANCH_INDEX.get(jiji))
 
 def get_cheongan_yin_yang(cheongan: str) -> str:
-    """천간의 음양 반환"""
-    return CHEONGAN_YIN_YANG.get(cheongan, "미지")
+    """천간의 음양 반환 (한글/한자)"""
+    return _lookup(STEM_YIN_YANG, STEM_INDEX.get(cheongan))
 
 def get_jiji_yin_yang(jiji: str) -> str:
-    """지지의 음양 반환"""
-    return JIJI_YIN_YANG.get(jiji, "미지")
+    """지지의 음양 반환 (한글/한자)"""
+    return _lookup(BRANCH_YIN_YANG, BRANCH_INDEX.get(jiji))
 
 def get_jiji_zodiac(jiji: str) -> str:
-    """지지의 동물 반환"""
-    return JIJI_ZODIAC.get(jiji, "미지")
+    """지지의 동물 반환 (한글/한자)"""
+    return _lookup(BRANCH_ZODIAC, BRANCH_INDEX.get(jiji))
 
 def get_jijanggan(jiji: str) -> List[Tuple[str, int]]:
     """지지의 지장간 반환"""
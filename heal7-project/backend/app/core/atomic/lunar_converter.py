@@ -6,19 +6,28 @@
 로직: KASI API 연동 기반 정확한 음력 변환
 
 특징:
-- KASI API 우선 사용 (정확도 보장)
-- 로컬 캐시로 성능 최적화
+- 로컬 음양력 테이블 우선 사용 (1900-2100, 네트워크 호출 없음)
+- 범위 밖 날짜는 KASI API 사용 (정확도 보장)
+- 크기 제한 LRU 캐시로 성능 최적화 (장기 실행 시 메모리 증가 방지)
 - 윤달 정보 포함
 - 오류 시 폴백 시스템
 """
 
+from collections import OrderedDict
 from datetime import date, datetime
-from typing import Dict, Optional, Union, NamedTuple, Tuple
+from typing import Optional, Union, NamedTuple, Tuple
 import asyncio
 import aiohttp
 import json
 from dataclasses import dataclass
 
+try:
+    from shared import lunisolar_calendar
+    LUNISOLAR_TABLE_AVAILABLE = True
+except ImportError:
+    lunisolar_calendar = None
+    LUNISOLAR_TABLE_AVAILABLE = False
+
 @dataclass
 class LunarDate:
     """음력 날짜 정보"""
@@ -54,10 +63,27 @@ class ConversionResult:
 class LunarConverter:
     """음력 변환기 클래스"""
     
-    def __init__(self, kasi_api_base: str = None, cache_enabled: bool = True):
+    def __init__(self, kasi_api_base: str = None, cache_enabled: bool = True, cache_size: int = 4096):
         self.kasi_api_base = kasi_api_base or "http://localhost:8002/api/kasi"
         self.cache_enabled = cache_enabled
-        self._cache: Dict[str, ConversionResult] = {}
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, ConversionResult]" = OrderedDict()
+    
+    def _cache_get(self, cache_key: str) -> Optional[ConversionResult]:
+        """캐시 조회 (조회된 항목은 최근 사용으로 이동)"""
+        if not self.cache_enabled:
+            return None
+        result = self._cache.get(cache_key)
+        if result is not None:
+            self._cache.move_to_end(cache_key)
+        return result
+    
+    def _cache_put(self, cache_key: str, result: ConversionResult):
+        """캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        self._cache[cache_key] = result
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
     
     async def solar_to_lunar(self, solar_date: Union[str, date, SolarDate]) -> ConversionResult:
         """
@@ -81,15 +107,21 @@ class LunarConverter:
         
         # 캐시 확인
         cache_key = f"s2l_{solar_date.year}_{solar_date.month}_{solar_date.day}"
-        if self.cache_enabled and cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 로컬 음양력 테이블
+        result = self._local_solar_to_lunar(solar_date)
+        if result is not None:
+            return result
         
         # KASI API 호출 시도
         try:
             result = await self._call_kasi_solar_to_lunar(solar_date)
             if result.success:
                 if self.cache_enabled:
-                    self._cache[cache_key] = result
+                    self._cache_put(cache_key, result)
                 return result
         except Exception as e:
             print(f"KASI API 호출 실패: {e}")
@@ -97,7 +129,7 @@ class LunarConverter:
         # 폴백: 로컬 계산
         result = self._fallback_solar_to_lunar(solar_date)
         if self.cache_enabled:
-            self._cache[cache_key] = result
+            self._cache_put(cache_key, result)
         return result
     
     async def lunar_to_solar(self, lunar_date: Union[LunarDate, Tuple[int, int, int, bool]]) -> ConversionResult:
@@ -118,15 +150,21 @@ class LunarConverter:
         # 캐시 확인
         leap_str = "leap" if lunar_date.is_leap_month else "normal"
         cache_key = f"l2s_{lunar_date.year}_{lunar_date.month}_{lunar_date.day}_{leap_str}"
-        if self.cache_enabled and cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 로컬 음양력 테이블
+        result = self._local_lunar_to_solar(lunar_date)
+        if result is not None:
+            return result
         
         # KASI API 호출 시도
         try:
             result = await self._call_kasi_lunar_to_solar(lunar_date)
             if result.success:
                 if self.cache_enabled:
-                    self._cache[cache_key] = result
+                    self._cache_put(cache_key, result)
                 return result
         except Exception as e:
             print(f"KASI API 호출 실패: {e}")
@@ -134,7 +172,7 @@ class LunarConverter:
         # 폴백: 로컬 계산
         result = self._fallback_lunar_to_solar(lunar_date)
         if self.cache_enabled:
-            self._cache[cache_key] = result
+            self._cache_put(cache_key, result)
         return result
     
     async def _call_kasi_solar_to_lunar(self, solar_date: SolarDate) -> ConversionResult:
@@ -197,6 +235,40 @@ class LunarConverter:
                 
                 return ConversionResult(False, error_message=f"KASI API 오류: {response.status}")
     
+    def _local_solar_to_lunar(self, solar_date: SolarDate) -> Optional[ConversionResult]:
+        """로컬 음양력 테이블로 양력→음력 변환 (지원 범위 밖이면 None)"""
+        if not LUNISOLAR_TABLE_AVAILABLE:
+            return None
+        try:
+            lunar = lunisolar_calendar.solar_to_lunar(date(solar_date.year, solar_date.month, solar_date.day))
+        except ValueError:
+            return None
+        
+        return ConversionResult(
+            True,
+            solar_date=solar_date,
+            lunar_date=LunarDate(lunar.year, lunar.month, lunar.day, lunar.is_leap),
+            source="local"
+        )
+    
+    def _local_lunar_to_solar(self, lunar_date: LunarDate) -> Optional[ConversionResult]:
+        """로컬 음양력 테이블로 음력→양력 변환 (지원 범위 밖이면 None)"""
+        if not LUNISOLAR_TABLE_AVAILABLE:
+            return None
+        try:
+            solar = lunisolar_calendar.lunar_to_solar(
+                lunar_date.year, lunar_date.month, lunar_date.day, lunar_date.is_leap_month
+            )
+        except ValueError:
+            return None
+        
+        return ConversionResult(
+            True,
+            solar_date=SolarDate(solar.year, solar.month, solar.day),
+            lunar_date=lunar_date,
+            source="local"
+        )
+    
     def _fallback_solar_to_lunar(self, solar_date: SolarDate) -> ConversionResult:
         """폴백: 로컬 양력→음력 변환 (근사값)"""
         # 간단한 근사 계산 (실제로는 더 정교한 알고리즘 필요)
@@ -305,12 +377,27 @@ async def lunar_to_solar(year: int, month: int, day: int, is_leap: bool = False)
     return await _default_converter.lunar_to_solar(lunar_date)
 
 def solar_to_lunar_sync(solar_date: Union[str, date]) -> ConversionResult:
-    """동기 버전 양력→음력 변환"""
-    return asyncio.run(solar_to_lunar(solar_date))
+    """동기 버전 양력→음력 변환
+
+    로컬 음양력 테이블 범위는 이벤트 루프 없이 바로 변환 (실행 중인 루프 안에서도 호출 가능)
+    범위 밖(KASI API 필요)은 asyncio.run 을 쓰므로 비동기 코드에서는 solar_to_lunar 를 await
+    """
+    try:
+        solar_obj = datetime.strptime(solar_date, "%Y-%m-%d").date() if isinstance(solar_date, str) else solar_date
+    except ValueError:
+        return ConversionResult(False, error_message="잘못된 날짜 형식")
+    result = _default_converter._local_solar_to_lunar(SolarDate(solar_obj.year, solar_obj.month, solar_obj.day))
+    if result is not None:
+        return result
+    return asyncio.run(solar_to_lunar(solar_obj))
 
 def lunar_to_solar_sync(year: int, month: int, day: int, is_leap: bool = False) -> ConversionResult:
-    """동기 버전 음력→양력 변환"""
-    return asyncio.run(lunar_to_solar(year, month, day, is_leap))
+    """동기 버전 음력→양력 변환 (로컬 테이블 범위는 이벤트 루프 없이 바로 변환, 범위 밖은 asyncio.run)"""
+    lunar_date = LunarDate(year, month, day, is_leap)
+    result = _default_converter._local_lunar_to_solar(lunar_date)
+    if result is not None:
+        return result
+    return asyncio.run(_default_converter.lunar_to_solar(lunar_date))
 
 # === 테스트 함수들 ===
 
@@ -4,10 +4,29 @@ HEAL7 사주명리학 관리자 설정 시스템
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Literal, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Literal, Tuple, Union
+from contextlib import contextmanager
 from enum import Enum
 from datetime import datetime
+from pathlib import Path
 import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 flock 미지원 환경
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 설정 파일 기본 경로 (backend/data/saju_admin_settings.json)
+DEFAULT_SETTINGS_PATH = str(Path(__file__).resolve().parents[3] / "data" / "saju_admin_settings.json")
+VERSION_SIZE = 8
 
 # --- 기본 설정 열거형들 ---
 
@@ -405,22 +424,227 @@ def initialize_default_jiji() -> Dict[str, JijiInterpretation]:
         )
     }
 
-# --- 싱글톤 관리 ---
-_admin_settings: Optional[SajuAdminSettings] = None
+# --- 해석 테이블 (인덱스 조회용) ---
+
+CHEONGAN_ORDER = ("갑", "을", "병", "정", "무", "기", "경", "신", "임", "계")
+JIJI_ORDER = ("자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해")
+GAPJA_NAMES = tuple(CHEONGAN_ORDER[i % 10] + JIJI_ORDER[i % 12] for i in range(60))
+
+CHEONGAN_INDEX = {name: i for i, name in enumerate(CHEONGAN_ORDER)}
+JIJI_INDEX = {name: i for i, name in enumerate(JIJI_ORDER)}
+
+
+def gapja_index(cheongan_index: int, jiji_index: int) -> int:
+    """천간/지지 인덱스 → 60갑자 인덱스 (i ≡ 천간 mod 10, i ≡ 지지 mod 12)"""
+    return (6 * cheongan_index - 5 * jiji_index) % 60
+
+
+class InterpretationTables(NamedTuple):
+    """천간(10)/지지(12)/60갑자(60) 해석을 인덱스로 조회하는 배열 (미등록 항목은 None)"""
+    cheongan: Tuple[Optional[CheonganInterpretation], ...]
+    jiji: Tuple[Optional[JijiInterpretation], ...]
+    gapja: Tuple[Optional[GapjaInterpretation], ...]
+
+    def for_pillar(self, cheongan: str, jiji: str) -> Dict[str, Any]:
+        """기둥(천간+지지) 해석 조회"""
+        stem = CHEONGAN_INDEX.get(cheongan)
+        branch = JIJI_INDEX.get(jiji)
+        if stem is None or branch is None:
+            return {"cheongan": None, "jiji": None, "gapja": None}
+        return {
+            "cheongan": self.cheongan[stem],
+            "jiji": self.jiji[branch],
+            "gapja": self.gapja[gapja_index(stem, branch)] if (stem - branch) % 2 == 0 else None
+        }
+
+
+def compile_interpretation_tables(settings: SajuAdminSettings) -> InterpretationTables:
+    return InterpretationTables(
+        cheongan=tuple(settings.cheongan_interpretations.get(name) for name in CHEONGAN_ORDER),
+        jiji=tuple(settings.jiji_interpretations.get(name) for name in JIJI_ORDER),
+        gapja=tuple(settings.gapja_interpretations.get(name) for name in GAPJA_NAMES)
+    )
+
+
+def default_admin_settings() -> SajuAdminSettings:
+    """기본 관리자 설정"""
+    settings = SajuAdminSettings()
+    settings.cheongan_interpretations = initialize_default_cheongan()
+    settings.jiji_interpretations = initialize_default_jiji()
+    return settings
+
+
+# --- 영속 설정 저장소 ---
+
+class SettingsSnapshot(NamedTuple):
+    """
+    불변 설정 스냅샷
+    게시된 스냅샷은 수정하지 않으며, 변경은 항상 새 스냅샷을 만들어 교체 (copy-on-write)
+    """
+    version: int
+    settings: SajuAdminSettings
+    tables: InterpretationTables
+
+
+class AdminSettingsStore:
+    """
+    파일 기반 관리자 설정 저장소
+    - 설정 JSON 은 임시 파일 작성 후 os.replace 로 원자적 교체
+    - 8바이트 버전 카운터 파일을 mmap 으로 공유 → 다른 워커의 변경을 시스템 콜 없이 감지
+    - 읽기는 잠금 없이 현재 스냅샷 참조만 반환, 쓰기는 프로세스 간 flock 으로 직렬화
+    """
+
+    def __init__(self, file_path: Optional[str] = None):
+        self.file_path = file_path or os.getenv('SAJU_ADMIN_SETTINGS_PATH', DEFAULT_SETTINGS_PATH)
+        self.version_path = self.file_path + '.version'
+        self._write_lock = threading.Lock()
+        self._version_file = None
+        self._version_map: Optional[mmap.mmap] = None
+        self._owner_pid: Optional[int] = None
+        self._snapshot: Optional[SettingsSnapshot] = None
+
+    # 버전 카운터
+
+    def _open_version_map(self) -> bool:
+        # fork 된 워커는 부모의 파일 디스크립터를 공유하면 flock 이 서로 배타적이지 않으므로 다시 연다
+        if self._version_map is not None and self._owner_pid == os.getpid():
+            return True
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            version_file = open(self.version_path, 'a+b')
+            if os.fstat(version_file.fileno()).st_size < VERSION_SIZE:
+                version_file.truncate(VERSION_SIZE)
+            self._version_map = mmap.mmap(version_file.fileno(), VERSION_SIZE)
+            self._version_file = version_file
+            self._owner_pid = os.getpid()
+            return True
+        except OSError as e:
+            logger.warning(f"설정 저장소 파일을 열 수 없어 메모리 전용으로 동작: {e}")
+            return False
+
+    def _shared_version(self) -> int:
+        if self._version_map is None:
+            return self._snapshot.version if self._snapshot else 0
+        return struct.unpack_from('<Q', self._version_map, 0)[0]
+
+    # 읽기
+
+    def current(self) -> SettingsSnapshot:
+        """현재 스냅샷 (다른 워커가 변경했으면 다시 로드)"""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self._shared_version():
+            return snapshot
+        with self._write_lock:
+            return self._reload()
+
+    def _reload(self) -> SettingsSnapshot:
+        if not self._open_version_map():
+            if self._snapshot is None:
+                self._snapshot = self._make_snapshot(0, default_admin_settings())
+            return self._snapshot
+
+        version = self._shared_version()
+        if self._snapshot is not None and self._snapshot.version == version:
+            return self._snapshot
+
+        with self._exclusive():
+            if os.path.exists(self.file_path):
+                self._snapshot = self._load_file()
+            else:
+                # 최초 실행: 기본값으로 파일 생성
+                self._snapshot = self._publish(default_admin_settings())
+        return self._snapshot
+
+    def _load_file(self) -> SettingsSnapshot:
+        """설정 파일 로드 (flock 보유 상태에서 호출)
+
+        손상되거나 일부만 쓰인 파일이면 오류를 기록하고 마지막 정상 설정(없으면 기본값)을
+        현재 버전으로 계속 제공 → 다음 버전 변경 시 다시 로드
+        """
+        version = self._shared_version()
+        try:
+            return self._make_snapshot(version, SajuAdminSettings.load_from_file(self.file_path))
+        except (OSError, ValueError) as e:
+            settings = self._snapshot.settings if self._snapshot is not None else default_admin_settings()
+            logger.error(f"관리자 설정 파일 로드 실패, 마지막 정상 설정 유지 ({self.file_path}): {e}")
+            return self._make_snapshot(version, settings)
+
+    @staticmethod
+    def _make_snapshot(version: int, settings: SajuAdminSettings) -> SettingsSnapshot:
+        return SettingsSnapshot(version, settings, compile_interpretation_tables(settings))
+
+    # 쓰기
+
+    def update(self, mutate: Callable[[Dict[str, Any]], None], updated_by: str = "admin") -> SettingsSnapshot:
+        """현재 설정의 복사본(dict)을 변경해 새 스냅샷으로 게시"""
+        with self._write_lock:
+            self._reload()
+            with self._exclusive():
+                # 잠금 획득 사이 다른 워커가 쓴 내용 반영
+                if self._version_map is not None and self._snapshot.version != self._shared_version():
+                    self._snapshot = self._load_file()
+                data = self._snapshot.settings.model_dump()
+                mutate(data)
+                data['last_updated'] = datetime.now()
+                data['updated_by'] = updated_by
+                self._snapshot = self._publish(SajuAdminSettings.model_validate(data))
+            return self._snapshot
+
+    def replace(self, settings: SajuAdminSettings, updated_by: Optional[str] = None) -> SettingsSnapshot:
+        """설정 전체 교체"""
+        data = settings.model_dump()
+
+        def overwrite(current: Dict[str, Any]):
+            current.clear()
+            current.update(data)
+
+        return self.update(overwrite, updated_by or settings.updated_by)
+
+    def _publish(self, settings: SajuAdminSettings) -> SettingsSnapshot:
+        """파일 원자적 교체 후 공유 버전 증가 (flock 보유 상태에서 호출)"""
+        version = self._shared_version() + 1
+        if self._version_map is not None:
+            directory = os.path.dirname(self.file_path)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.saju_admin_settings.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(settings.to_json())
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, self.file_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+            struct.pack_into('<Q', self._version_map, 0, version)
+            self._version_map.flush()
+        return self._make_snapshot(version, settings)
+
+    @contextmanager
+    def _exclusive(self):
+        """프로세스 간 쓰기 잠금"""
+        if self._version_file is None or fcntl is None:
+            yield
+            return
+        fcntl.flock(self._version_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._version_file.fileno(), fcntl.LOCK_UN)
+
+
+admin_settings_store = AdminSettingsStore()
+
 
 def get_admin_settings() -> SajuAdminSettings:
-    """관리자 설정 인스턴스 반환"""
-    global _admin_settings
-    if _admin_settings is None:
-        _admin_settings = SajuAdminSettings()
-        # 기본 데이터 초기화
-        _admin_settings.cheongan_interpretations = initialize_default_cheongan()
-        _admin_settings.jiji_interpretations = initialize_default_jiji()
-    return _admin_settings
+    """관리자 설정 인스턴스 반환 (읽기 전용 스냅샷 - 변경은 update_admin_settings/admin_settings_store.update 사용)"""
+    return admin_settings_store.current().settings
+
+
+def get_interpretation_tables() -> InterpretationTables:
+    """천간/지지/60갑자 해석 인덱스 배열"""
+    return admin_settings_store.current().tables
+
 
 def update_admin_settings(new_settings: SajuAdminSettings):
     """관리자 설정 업데이트"""
-    global _admin_settings
-    _admin_settings = new_settings
-    _admin_settings.last_updated = datetime.now()
-    return _admin_settings
\ No newline at end of file
+    return admin_settings_store.replace(new_settings).settings
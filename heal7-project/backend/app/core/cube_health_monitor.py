@@ -0,0 +1,171 @@
+"""
+🩺 큐브 헬스 모니터
+- 백그라운드 태스크가 주기적으로 모든 큐브 /health 를 폴링
+- 공유 httpx 클라이언트로 동시 요청
+- 큐브별 상태/지연시간 이력을 롤링 버퍼로 보관
+- 상태 변화를 구독자(asyncio.Queue)에게 푸시
+- 요청 처리 경로에서는 마지막 스냅샷만 읽음 (인라인 프로브 없음)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, Optional, Set, Deque, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class CubeHealthMonitor:
+    """큐브 상태 백그라운드 폴러"""
+
+    def __init__(
+        self,
+        cube_ports: Dict[str, int],
+        interval: float = 15.0,
+        timeout: float = 2.0,
+        history_size: int = 120
+    ):
+        self.cube_ports = cube_ports
+        self.interval = interval
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._status: Dict[str, Dict[str, Any]] = {
+            cube_name: {
+                "status": "unknown",
+                "port": port,
+                "url": f"http://localhost:{port}",
+                "latency_ms": None,
+                "checked_at": None,
+                "changed_at": None
+            }
+            for cube_name, port in cube_ports.items()
+        }
+        # (timestamp, status, latency_ms)
+        self._history: Dict[str, Deque[Tuple[float, str, Optional[float]]]] = {
+            cube_name: deque(maxlen=history_size) for cube_name in cube_ports
+        }
+
+    async def start(self):
+        """폴링 태스크 시작"""
+        if self._task is not None:
+            return
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=len(self.cube_ports) * 2)
+        )
+        self._task = asyncio.create_task(self._poll_loop())
+        logger.info(f"🩺 큐브 헬스 모니터 시작 ({len(self.cube_ports)}개 큐브, {self.interval}초 주기)")
+
+    async def stop(self):
+        """폴링 태스크 종료 및 클라이언트 정리"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _poll_loop(self):
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"큐브 헬스 폴링 오류: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def _probe(self, cube_name: str, port: int):
+        started = time.perf_counter()
+        latency_ms: Optional[float] = None
+        try:
+            response = await self._client.get(f"http://localhost:{port}/health")
+            latency_ms = round((time.perf_counter() - started) * 1000, 2)
+            status = "healthy" if response.status_code == 200 else "unhealthy"
+        except Exception:
+            status = "offline"
+
+        self._record(cube_name, status, latency_ms)
+
+    def _record(self, cube_name: str, status: str, latency_ms: Optional[float]):
+        """폴링 결과 반영 및 상태 변화 시 구독자 알림"""
+        now = datetime.now().isoformat()
+        current = self._status[cube_name]
+        previous_status = current["status"]
+
+        current["status"] = status
+        current["latency_ms"] = latency_ms
+        current["checked_at"] = now
+        self._history[cube_name].append((time.time(), status, latency_ms))
+
+        if status != previous_status:
+            current["changed_at"] = now
+            self._publish({
+                "type": "cube_status_changed",
+                "cube": cube_name,
+                "previous_status": previous_status,
+                "status": status,
+                "latency_ms": latency_ms,
+                "timestamp": now
+            })
+
+    async def poll_once(self):
+        """모든 큐브를 동시에 한 번 폴링"""
+        await asyncio.gather(*(
+            self._probe(cube_name, port) for cube_name, port in self.cube_ports.items()
+        ))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """마지막 폴링 결과 (큐브별 상태)"""
+        return {cube_name: dict(info) for cube_name, info in self._status.items()}
+
+    def history(self, cube_name: str) -> Dict[str, Any]:
+        """큐브별 롤링 이력과 요약 통계"""
+        entries = list(self._history[cube_name])
+        latencies = sorted(latency for _, _, latency in entries if latency is not None)
+        healthy = sum(1 for _, status, _ in entries if status == "healthy")
+
+        return {
+            "samples": len(entries),
+            "availability": round(healthy / len(entries) * 100, 2) if entries else None,
+            "latency_stats_ms": {
+                "avg": round(sum(latencies) / len(latencies), 2) if latencies else None,
+                "p95": latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else None,
+                "max": latencies[-1] if latencies else None
+            },
+            "history": [
+                {
+                    "timestamp": datetime.fromtimestamp(ts).isoformat(),
+                    "status": status,
+                    "latency_ms": latency
+                }
+                for ts, status, latency in entries
+            ]
+        }
+
+    def subscribe(self, max_queue_size: int = 100) -> asyncio.Queue:
+        """상태 변화 이벤트 구독 (asyncio.Queue 반환)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """구독 해제"""
+        self._subscribers.discard(queue)
+
+    def _publish(self, event: Dict[str, Any]):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # 느린 구독자는 가장 오래된 이벤트를 버림
+                queue.get_nowait()
+                queue.put_nowait(event)
@@ -31,6 +31,13 @@ from .myeongrihak_constants import (
     get_jiji_wuxing
 )
 
+# 관리자 설정의 천간/지지/60갑자 해석 (인덱스 배열로 사전 컴파일된 스냅샷)
+try:
+    from ...config.saju_admin_settings import get_interpretation_tables
+    INTERPRETATION_TABLES_AVAILABLE = True
+except ImportError:
+    INTERPRETATION_TABLES_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class ComprehensiveMyeongRiHakAnalyzer:
@@ -261,7 +268,10 @@ class ComprehensiveMyeongRiHakAnalyzer:
                 },
                 
                 # 대운 분석 (성별 정보가 있을 때만)
-                "daewoon_details": daewoon_analysis if daewoon_analysis else None
+                "daewoon_details": daewoon_analysis if daewoon_analysis else None,
+
+                # 일주 해석 (관리자 설정 해석 데이터)
+                "ilju_interpretation": self._ilju_interpretation(enhanced_pillars["day"])
             },
             
             # 메타 정보
@@ -279,6 +289,20 @@ class ComprehensiveMyeongRiHakAnalyzer:
         
         return comprehensive_result
     
+    def _ilju_interpretation(self, day_pillar: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """일간/일지/일주 해석 조회 (해석 테이블 인덱스 조회)"""
+        if not INTERPRETATION_TABLES_AVAILABLE:
+            return None
+        try:
+            interpretations = get_interpretation_tables().for_pillar(day_pillar["cheongan"], day_pillar["jiji"])
+        except Exception as e:
+            logger.warning(f"일주 해석 조회 실패: {e}")
+            return None
+        return {
+            key: interpretation.model_dump() if interpretation is not None else None
+            for key, interpretation in interpretations.items()
+        }
+
     def quick_analysis(self, year: int, month: int, day: int, hour: int, minute: int,
                       is_lunar: bool = False) -> Dict[str, Any]:
         """간단한 사주 분석 (기본 정보만)"""
@@ -14,9 +14,9 @@ from enum import Enum
 from .solar_terms_legacy_adapter import solar_terms_adapter, get_solar_term_for_date
 from .myeongrihak_constants import (
     JIJI, CHEONGAN, WuXing, SipSin,
-    get_cheongan_wuxing, get_jiji_wuxing, get_sipsin_relation,
-    normalize_to_hangul
+    get_cheongan_wuxing, get_jiji_wuxing, get_sipsin_relation
 )
+from shared.hanja_codec import split_pillar, stem_yin_yang
 
 logger = logging.getLogger(__name__)
 
@@ -101,12 +101,7 @@ class DaewoonAnalyzer:
         year_idx = (birth_year - 4) % 60  # 갑자(甲子) = 0번째
         year_cheongan = CHEONGAN[year_idx % 10]
         
-        # 한자로 변환해서 사용
-        year_cheongan_hanja = normalize_to_hangul(year_cheongan)
-        if year_cheongan_hanja in ["갑", "병", "무", "경", "임"]:
-            year_yinyang = "양"
-        else:
-            year_yinyang = "음"
+        year_yinyang = stem_yin_yang(year_cheongan)
         
         logger.info(f"  출생년 천간: {year_cheongan} ({year_yinyang})")
         
@@ -185,20 +180,11 @@ class DaewoonAnalyzer:
         month_cheongan = month_pillar[0]
         month_jiji = month_pillar[1]
         
-        # 천간/지지 인덱스 찾기 (한자→한글 변환 후)
+        # 천간/지지 서수 (한글/한자 모두 처리)
         try:
-            month_cheongan_hangul = normalize_to_hangul(month_cheongan)
-            month_jiji_hangul = normalize_to_hangul(month_jiji)
-            
-            # 한글로 변환된 것을 다시 한자 리스트에서 찾기
-            cheongan_mapping = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
-            jiji_mapping = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
-            
-            cheongan_idx = cheongan_mapping.index(month_cheongan_hangul)
-            jiji_idx = jiji_mapping.index(month_jiji_hangul)
-            
+            cheongan_idx, jiji_idx = split_pillar(month_pillar)
         except ValueError as e:
-            logger.error(f"월주 인덱스 오류: {e} - {month_cheongan}({month_cheongan_hangul}), {month_jiji}({month_jiji_hangul})")
+            logger.error(f"월주 인덱스 오류: {e} - {month_cheongan}, {month_jiji}")
             return []
         
         periods = []
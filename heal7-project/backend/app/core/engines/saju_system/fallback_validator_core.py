@@ -15,6 +15,12 @@ from .shared.fallback_validator_models import (
 from .kasi_precision_saju_calculator import KasiPrecisionSajuCalculator
 from .myeongrihak_constants import CHEONGAN, JIJI
 
+try:
+    from shared.solar_term_engine import solar_term_table
+    SOLAR_TERM_ENGINE_AVAILABLE = True
+except ImportError:
+    SOLAR_TERM_ENGINE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class FallbackValidatorCore:
@@ -215,11 +221,16 @@ class FallbackValidatorCore:
     
     async def _calculate_solar_term(self, year: int, term_index: int) -> SolarTermData:
         """절기 계산 (폴백 메소드)"""
-        # 간단한 절기 계산 로직
-        base_date = datetime(year, 1, 1)
-        days_offset = term_index * 15.2  # 대략적인 절기 간격
-        
-        solar_date = base_date + timedelta(days=days_offset)
+        if SOLAR_TERM_ENGINE_AVAILABLE and solar_term_table.supports(year):
+            # 오프라인 천문 엔진 (term_index 0=입춘 → 절기 코드 1)
+            solar_date = solar_term_table.instant(year, term_index + 1)
+            source = "EPHEMERIS"
+        else:
+            # 간단한 절기 계산 로직
+            base_date = datetime(year, 1, 1)
+            days_offset = term_index * 15.2  # 대략적인 절기 간격
+            solar_date = base_date + timedelta(days=days_offset)
+            source = "CALCULATED"
         
         return SolarTermData(
             year=year,
@@ -227,6 +238,6 @@ class FallbackValidatorCore:
             term_index=term_index,
             solar_date=solar_date,
             korean_name=ValidationConstants.SOLAR_TERMS.get(term_index, f"절기_{term_index}"),
-            source="CALCULATED",
+            source=source,
             verified=False
         )
\ No newline at end of file
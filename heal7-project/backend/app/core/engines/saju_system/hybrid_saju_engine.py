@@ -8,6 +8,7 @@ KASI API + AI 융합 완충시스템
 - AI 모델 기반 대체 계산
 - 하이브리드 검증 시스템
 - 실시간 정확도 모니터링
+- KASI 티어는 공용 tier_router 경유 (서킷 브레이커, 지연/오류 통계)
 """
 
 import asyncio
@@ -18,6 +19,7 @@ from typing import Dict, Any, Optional, List, Union
 from enum import Enum
 
 from .kasi_precision_saju_calculator import KasiPrecisionSajuCalculator
+from .tier_router import saju_tier_router
 from .myeongrihak_constants import CHEONGAN, JIJI
 
 logger = logging.getLogger(__name__)
@@ -114,8 +116,8 @@ class HybridSajuEngine:
     async def _determine_calculation_mode(self) -> CalculationMode:
         """최적 계산 모드 결정"""
         
-        # KASI API 사용량 체크
-        if self.kasi_calculator._check_usage_limit():
+        # KASI API 사용량 + 서킷 브레이커 체크
+        if self.kasi_calculator._check_usage_limit() and saju_tier_router.available("kasi_api"):
             # 사용 가능하면 KASI 우선
             return CalculationMode.KASI_PRIMARY
         
@@ -130,17 +132,23 @@ class HybridSajuEngine:
     
     async def _kasi_calculation(self, year: int, month: int, day: int,
                               hour: int, minute: int, is_lunar: bool) -> Dict[str, Any]:
-        """KASI API 기반 정밀 계산"""
+        """KASI API 기반 정밀 계산
         
-        result = self.kasi_calculator.calculate_saju(year, month, day, hour, minute, is_lunar)
+        스레드에서 도는 KASI 호출은 취소할 수 없고 늦은 결과를 보관할 캐시도 없으므로 헤징하지 않음
+        """
         
-        if result:
+        args = (year, month, day, hour, minute, is_lunar)
+        used_tier, result, errors = await saju_tier_router.execute(
+            [("kasi_api", lambda: asyncio.to_thread(self.kasi_calculator.calculate_saju, *args))]
+        )
+        
+        if used_tier == "kasi_api":
             result["_calculation_method"] = "kasi_api"
             result["_accuracy_level"] = "precise"
             return result
         else:
             # KASI 실패 시 폴백
-            logger.warning("KASI API 실패 - AI 하이브리드로 폴백")
+            logger.warning(f"KASI API 실패 - AI 하이브리드로 폴백: {errors}")
             return await self._ai_hybrid_calculation(year, month, day, hour, minute, is_lunar)
     
     async def _ai_hybrid_calculation(self, year: int, month: int, day: int,
@@ -256,6 +264,7 @@ class HybridSajuEngine:
                 "availability": False,  # AIServiceManager 미구현
                 "fallback_ready": True
             },
+            "tier_health": saju_tier_router.snapshot(),
             "system_health": "operational",
             "backup_systems": ["mathematical_calculation", "emergency_mode"],
             "last_updated": datetime.now().isoformat()
@@ -23,15 +23,29 @@ import logging
 import re
 
 from .shared.kasi_calculator_models import (
-    KOREAN_TO_CHINESE_GANJEE, CHEONGAN, JIJI, SIDUBEOP,
     GAPJA_REFERENCE_TABLE, SajuResult, KasiApiConfig, CalculationMode
 )
 
+try:
+    from shared import lunisolar_calendar
+    LUNISOLAR_TABLE_AVAILABLE = True
+except ImportError:
+    lunisolar_calendar = None
+    LUNISOLAR_TABLE_AVAILABLE = False
+
+# 사주 4주는 공용 파사드에서 계산 (공유 캐시)
+try:
+    from shared.saju_pillars import saju_pillar_facade, pillar_detail, day_gapja, to_hanja
+except ImportError:
+    saju_pillar_facade = None
+
 logger = logging.getLogger(__name__)
 
 class KasiCalculatorCore:
     """KASI API 기반 핵심 사주 계산기 - 자주 사용되는 기본 기능"""
     
+    SOLAR_TIME_CORRECTION_MINUTES = -32
+    
     def __init__(self):
         # 환경변수 또는 .env 파일에서 API 키 로드
         self.api_key = os.getenv('KASI_API_KEY', '')
@@ -97,21 +111,14 @@ class KasiCalculatorCore:
                         'lunar': lunar_data
                     }
             
-            # 진태양시 계산
+            # 진태양시 보정 후 사주 4주 계산
             true_solar_time = self._calculate_pure_solar_time(birth_datetime)
+            pillars = self._calculate_pillars(true_solar_time)
+            ilgan = pillars['day']['cheongan']
             
-            # 사주 4주 계산
-            pillars = {
-                'year': self._calculate_year_pillar(true_solar_time.year, true_solar_time),
-                'month': self._calculate_month_pillar(true_solar_time.year, true_solar_time.month, true_solar_time),
-                'day': self._calculate_day_pillar(true_solar_time.year, true_solar_time.month, true_solar_time.day, true_solar_time),
-                'hour': self._calculate_hour_pillar(true_solar_time)
-            }
-            
-            # 일간 추출
-            ilgan = pillars['day']['gapja'][0] if pillars['day']['gapja'] else '甲'
-            
-            return SajuResult(pillars, ilgan, calendar_info).to_dict()
+            result = SajuResult(pillars, ilgan, calendar_info).to_dict()
+            result.update(self.request_fields(year, month, day, hour, minute, is_lunar, is_leap))
+            return result
             
         except Exception as e:
             logger.error(f"KASI API 사주 계산 오류: {e}")
@@ -135,8 +142,45 @@ class KasiCalculatorCore:
                 }
             }
     
+    def _lunar_to_solar_local(self, lun_year: int, lun_month: int, lun_day: int, is_leap: bool) -> Optional[Dict]:
+        """음력 → 양력 변환 (로컬 음양력 테이블, 지원 범위 밖이면 None)"""
+        if not LUNISOLAR_TABLE_AVAILABLE:
+            return None
+        try:
+            solar = lunisolar_calendar.lunar_to_solar(lun_year, lun_month, lun_day, is_leap)
+        except ValueError:
+            return None
+        
+        return {
+            'year': solar.year,
+            'month': solar.month,
+            'day': solar.day,
+            'date_string': f"{solar.year}년 {solar.month}월 {solar.day}일"
+        }
+    
+    def _solar_to_lunar_local(self, sol_year: int, sol_month: int, sol_day: int) -> Optional[Dict]:
+        """양력 → 음력 변환 (로컬 음양력 테이블, 지원 범위 밖이면 None)"""
+        if not LUNISOLAR_TABLE_AVAILABLE:
+            return None
+        try:
+            lunar = lunisolar_calendar.solar_to_lunar(datetime(sol_year, sol_month, sol_day).date())
+        except ValueError:
+            return None
+        
+        return {
+            'year': lunar.year,
+            'month': lunar.month,
+            'day': lunar.day,
+            'is_leap': lunar.is_leap,
+            'date_string': f"{lunar.year}년 {lunar.month}월 {lunar.day}일" + (" (윤달)" if lunar.is_leap else "")
+        }
+    
     def _lunar_to_solar_kasi(self, lun_year: int, lun_month: int, lun_day: int, is_leap: bool) -> Optional[Dict]:
-        """음력 → 양력 변환 (KASI API 전용, 폴백 없음)"""
+        """음력 → 양력 변환 (로컬 테이블 우선, 범위 밖은 KASI API)"""
+        local = self._lunar_to_solar_local(lun_year, lun_month, lun_day, is_leap)
+        if local:
+            return local
+        
         if not self.api_key:
             raise ValueError("KASI API 키가 설정되지 않음")
         
@@ -193,7 +237,11 @@ class KasiCalculatorCore:
             raise RuntimeError(f"KASI API 음력→양력 변환 실패: {str(e)}")
     
     def _solar_to_lunar_kasi(self, sol_year: int, sol_month: int, sol_day: int) -> Optional[Dict]:
-        """양력 → 음력 변환 (KASI API 전용, 폴백 없음)"""
+        """양력 → 음력 변환 (로컬 테이블 우선, 범위 밖은 KASI API)"""
+        local = self._solar_to_lunar_local(sol_year, sol_month, sol_day)
+        if local:
+            return local
+        
         if not self.api_key:
             raise ValueError("KASI API 키가 설정되지 않음")
         
@@ -256,111 +304,39 @@ class KasiCalculatorCore:
         """진태양시 계산 (서울 기준 -32분 보정)"""
         # 서울 표준시 기준 경도차 보정 (동경 127.5도 - 135도 = -7.5도 = -30분)
         # 추가 보정 -2분 (전통적 보정)
-        longitude_correction = timedelta(minutes=-32)
-        return birth_datetime + longitude_correction
+        return birth_datetime + timedelta(minutes=self.SOLAR_TIME_CORRECTION_MINUTES)
     
-    def _calculate_year_pillar(self, year: int, true_solar_time: datetime) -> Dict:
-        """연주 계산"""
-        # 입춘 기준 연주 계산 (2월 4일 전후)
-        if true_solar_time.month == 1 or (true_solar_time.month == 2 and true_solar_time.day < 4):
-            year = year - 1
-        
-        # 갑자 순환 계산 (60갑자)
-        base_year = 1924  # 갑자년 기준
-        cycle_position = (year - base_year) % 60
-        
-        cheongan_index = cycle_position % 10
-        jiji_index = cycle_position % 12
-        
-        gapja = CHEONGAN[cheongan_index] + JIJI[jiji_index]
-        
+    @classmethod
+    def request_fields(cls, year: int, month: int, day: int, hour: int, minute: int,
+                       is_lunar: bool = False, is_leap: bool = False) -> Dict:
+        """결과 중 요청 시각에 따라 달라지는 항목 (동치류 캐시 적중 시 요청별로 다시 채움)"""
+        original = datetime(2000, 1, 1, hour, minute)
         return {
-            'gapja': gapja,
-            'cheongan': CHEONGAN[cheongan_index],
-            'jiji': JIJI[jiji_index],
-            'cheongan_index': cheongan_index,
-            'jiji_index': jiji_index
+            'input': {
+                'year': year, 'month': month, 'day': day, 'hour': hour, 'minute': minute,
+                'is_lunar': is_lunar, 'is_leap_month': is_leap
+            },
+            'solar_time': {
+                'original': original.strftime('%H:%M'),
+                'corrected': (original + timedelta(minutes=cls.SOLAR_TIME_CORRECTION_MINUTES)).strftime('%H:%M'),
+                'correction_minutes': cls.SOLAR_TIME_CORRECTION_MINUTES
+            }
         }
     
-    def _calculate_month_pillar(self, year: int, month: int, true_solar_time: datetime) -> Dict:
-        """월주 계산 (절기 기준)"""
-        # 기본 월지지 매핑 (입춘 기준)
-        month_jiji_map = {
-            1: '寅', 2: '卯', 3: '辰', 4: '巳', 5: '午', 6: '未',
-            7: '申', 8: '酉', 9: '戌', 10: '亥', 11: '子', 12: '丑'
-        }
-        
-        # 절기 기준 월지지 결정
-        month_jiji = month_jiji_map.get(true_solar_time.month, '寅')
-        
-        # 월천간 계산 (연간에 따른 월천간 매핑)
-        year_cheongan = self._calculate_year_pillar(year, true_solar_time)['cheongan']
-        
-        # 월천간 매핑 테이블 (전통 명리학)
-        month_cheongan_map = {
-            '甲': ['丙', '丁', '戊', '己', '庚', '辛', '壬', '癸', '甲', '乙', '丙', '丁'],
-            '己': ['丙', '丁', '戊', '己', '庚', '辛', '壬', '癸', '甲', '乙', '丙', '丁'],
-            '乙': ['戊', '己', '庚', '辛', '壬', '癸', '甲', '乙', '丙', '丁', '戊', '己'],
-            '庚': ['戊', '己', '庚', '辛', '壬', '癸', '甲', '乙', '丙', '丁', '戊', '己'],
-            '丙': ['庚', '辛', '壬', '癸', '甲', '乙', '丙', '丁', '戊', '己', '庚', '辛'],
-            '辛': ['庚', '辛', '壬', '癸', '甲', '乙', '丙', '丁', '戊', '己', '庚', '辛'],
-            '丁': ['壬', '癸', '甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸'],
-            '壬': ['壬', '癸', '甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸'],
-            '戊': ['甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸', '甲', '乙'],
-            '癸': ['甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸', '甲', '乙']
-        }
-        
-        month_index = true_solar_time.month - 1
-        month_cheongan_list = month_cheongan_map.get(year_cheongan, month_cheongan_map['甲'])
-        month_cheongan = month_cheongan_list[month_index]
-        
-        gapja = month_cheongan + month_jiji
+    def _calculate_pillars(self, true_solar_time: datetime) -> Dict:
+        """사주 4주 계산 (공용 파사드, 한자 표기)"""
+        if saju_pillar_facade is None:
+            raise RuntimeError("사주 계산 파사드(shared.saju_pillars)를 불러올 수 없습니다")
         
+        saju = saju_pillar_facade.calculate_instant(true_solar_time)
         return {
-            'gapja': gapja,
-            'cheongan': month_cheongan,
-            'jiji': month_jiji,
-            'cheongan_index': CHEONGAN.index(month_cheongan),
-            'jiji_index': JIJI.index(month_jiji)
+            name: pillar_detail(saju.pillar(name), hanja=True)
+            for name in ('year', 'month', 'day', 'hour')
         }
     
-    def _calculate_day_pillar(self, year: int, month: int, day: int, true_solar_time: datetime) -> Dict:
-        """일주 계산"""
-        # KASI API 우선 시도
-        kasi_result = self._get_day_pillar_from_kasi(true_solar_time)
-        if kasi_result:
-            return self._parse_day_pillar_result(kasi_result)
-        
-        # 폴백 계산
-        return self._calculate_day_pillar_fallback(true_solar_time)
-    
-    def _calculate_hour_pillar(self, true_solar_time: datetime) -> Dict:
-        """시주 계산"""
-        hour = true_solar_time.hour
-        
-        # 시지지 계산 (2시간 단위)
-        hour_jiji_index = ((hour + 1) // 2) % 12
-        hour_jiji = JIJI[hour_jiji_index]
-        
-        # 일간 구하기 (일주에서)
-        day_pillar = self._calculate_day_pillar(
-            true_solar_time.year, true_solar_time.month, true_solar_time.day, true_solar_time
-        )
-        day_cheongan = day_pillar['cheongan']
-        
-        # 시두법으로 시천간 계산
-        hour_cheongan_list = SIDUBEOP.get(day_cheongan, SIDUBEOP['甲'])
-        hour_cheongan = hour_cheongan_list[hour_jiji_index]
-        
-        gapja = hour_cheongan + hour_jiji
-        
-        return {
-            'gapja': gapja,
-            'cheongan': hour_cheongan,
-            'jiji': hour_jiji,
-            'cheongan_index': CHEONGAN.index(hour_cheongan),
-            'jiji_index': hour_jiji_index
-        }
+    def _calculate_day_pillar_fallback(self, target_date) -> str:
+        """일주 (60갑자 순환, 한자 표기)"""
+        return to_hanja(day_gapja(target_date))
     
     # 헬퍼 메소드들
     def _validate_input_date(self, year: int, month: int, day: int, hour: int, minute: int) -> bool:
@@ -398,17 +374,13 @@ class KasiCalculatorCore:
         try:
             birth_datetime = datetime(year, month, day, hour, minute)
             true_solar_time = self._calculate_pure_solar_time(birth_datetime)
-            
-            pillars = {
-                'year': self._calculate_year_pillar(year, true_solar_time),
-                'month': self._calculate_month_pillar(year, month, true_solar_time),
-                'day': self._calculate_day_pillar_fallback(true_solar_time),
-                'hour': self._calculate_hour_pillar(true_solar_time)
-            }
+            pillars = self._calculate_pillars(true_solar_time)
             
             ilgan = pillars['day']['cheongan']
             
-            return SajuResult(pillars, ilgan, {'input_type': '폴백계산'}).to_dict()
+            result = SajuResult(pillars, ilgan, {'input_type': '폴백계산'}).to_dict()
+            result.update(self.request_fields(year, month, day, hour, minute, is_lunar))
+            return result
             
         except Exception as e:
             logger.error(f"폴백 계산 실패: {e}")
@@ -418,6 +390,10 @@ class KasiCalculatorCore:
         """KASI API 제한 시 사용할 양력→음력 변환 fallback"""
         logger.info(f"KASI API fallback: 양력→음력 변환 {sol_year}-{sol_month}-{sol_day}")
         
+        local = self._solar_to_lunar_local(sol_year, sol_month, sol_day)
+        if local:
+            return local
+        
         try:
             # 실용적 음력 계산: 검증된 경험식 기반
             from datetime import datetime, timedelta
@@ -495,6 +471,10 @@ class KasiCalculatorCore:
         """KASI API 제한 시 사용할 음력→양력 변환 fallback"""
         logger.info(f"KASI API fallback: 음력→양력 변환 {lun_year}-{lun_month}-{lun_day}")
         
+        local = self._lunar_to_solar_local(lun_year, lun_month, lun_day, is_leap)
+        if local:
+            return local
+        
         try:
             from datetime import datetime, timedelta
             
@@ -87,6 +87,20 @@ class KasiPrecisionSajuCalculator:
         return self.advanced_calculator.generate_validation_report()
     
     # 레거시 호환성을 위한 기존 메소드들 (단순화)
+    @property
+    def current_usage(self) -> int:
+        """KASI API 사용 횟수 (레거시 호환)"""
+        return self.core_calculator.usage_count
+    
+    def _check_usage_limit(self) -> bool:
+        """KASI API 사용 가능 여부 (레거시 호환)"""
+        return self.core_calculator._check_basic_usage_limit()
+    
+    def _fallback_calculation(self, year: int, month: int, day: int,
+                              hour: int, minute: int, is_lunar: bool) -> Optional[Dict]:
+        """수학적 사주 계산 - 공용 사주 파사드 사용 (레거시 호환)"""
+        return self.core_calculator._fallback_calculation(year, month, day, hour, minute, is_lunar)
+    
     def is_leap_year(self, year: int) -> bool:
         """윤년 판정 (레거시 호환)"""
         return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
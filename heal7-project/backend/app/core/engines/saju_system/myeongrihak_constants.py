@@ -4,11 +4,14 @@
 - 천간/지지/지장간 매핑
 - 십신 관계 매핑
 - 오행 속성 정의
+- 천간/지지 표기와 한자 변환은 공용 간지 코덱(shared.hanja_codec) 사용
 """
 
 from typing import Dict, List, Tuple
 from enum import Enum
 
+from shared.hanja_codec import STEMS_HANGUL, BRANCHES_HANGUL, GANJI_HANJA_TO_HANGUL, GANJI_HANGUL_TO_HANJA
+
 class WuXing(Enum):
     """오행 (五行)"""
     WOOD = "목"      # 木
@@ -31,27 +34,15 @@ class SipSin(Enum):
     JEONG_IN = "정인"     # 正印
 
 # 천간 (天干) 10개 - 한글
-CHEONGAN = [
-    "갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"
-]
+CHEONGAN = list(STEMS_HANGUL)
 
 # 지지 (地支) 12개 - 한글
-JIJI = [
-    "자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"
-]
+JIJI = list(BRANCHES_HANGUL)
 
-# 한자 ↔ 한글 변환 매핑 (KASI API 호환)
-HANJA_TO_HANGUL = {
-    # 천간 한자 → 한글
-    "甲": "갑", "乙": "을", "丙": "병", "丁": "정", "戊": "무", 
-    "己": "기", "庚": "경", "辛": "신", "壬": "임", "癸": "계",
-    
-    # 지지 한자 → 한글
-    "子": "자", "丑": "축", "寅": "인", "卯": "묘", "辰": "진", "巳": "사",
-    "午": "오", "未": "미", "申": "신", "酉": "유", "戌": "술", "亥": "해"
-}
+# 한자 ↔ 한글 변환 매핑 (KASI API 호환, 글자 단위 - 간지 단위 변환은 hanja_codec.pillar_to_hanja)
+HANJA_TO_HANGUL = GANJI_HANJA_TO_HANGUL
 
-HANGUL_TO_HANJA = {v: k for k, v in HANJA_TO_HANGUL.items()}
+HANGUL_TO_HANJA = GANJI_HANGUL_TO_HANJA
 
 # 60갑자 순환
 GAPJA_60 = []
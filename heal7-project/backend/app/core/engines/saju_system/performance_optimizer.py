@@ -21,6 +21,13 @@ import hashlib
 import logging
 
 from .myeongrihak_constants import CHEONGAN, JIJI
+from .kasi_calculator_core import KasiCalculatorCore
+
+# 캐시 키 정규화 (4주 동치류)
+try:
+    from shared.saju_pillars import saju_pillar_facade
+except ImportError:
+    saju_pillar_facade = None
 
 logger = logging.getLogger(__name__)
 
@@ -442,8 +449,22 @@ def set_optimized_cache(cache_key: str, data: Any, cache_type: str = "saju_resul
     performance_optimizer.set_to_cache(cache_key, data, cache_type)
 
 def generate_saju_cache_key(year: int, month: int, day: int, hour: int, minute: int, 
-                           is_lunar: bool = False) -> str:
-    """사주 계산용 캐시 키 생성"""
+                           is_lunar: bool = False, is_leap: bool = False) -> str:
+    """사주 계산용 캐시 키 생성
+    
+    진태양시 보정 후 4주 동치류(날짜 + 시진 구간 + 절입 전/후) 기준이므로
+    같은 동치류의 요청은 분 단위 시각이 달라도 같은 키를 받습니다.
+    정규화할 수 없으면 기존 분 단위 키를 사용합니다.
+    """
+    if saju_pillar_facade is not None:
+        try:
+            pillar_class = saju_pillar_facade.equivalence_class(
+                year, month, day, hour, minute, is_lunar, is_leap,
+                correction_minutes=KasiCalculatorCore.SOLAR_TIME_CORRECTION_MINUTES
+            )
+            return performance_optimizer.generate_cache_key(pillar_class=pillar_class.key(), is_lunar=is_lunar)
+        except ValueError:
+            pass
     return performance_optimizer.generate_cache_key(
         year=year, month=month, day=day, hour=hour, minute=minute, is_lunar=is_lunar
     )
@@ -4,6 +4,8 @@ from datetime import datetime, date
 from typing import Dict, Tuple, Optional, Any, List
 import time
 
+from shared.hanja_codec import to_hangul
+
 # Placeholder for constants that will be moved to saju_core_constants.py
 # from .saju_core_constants import split_ganji, CHEONGAN_WUXING, JIJI_WUXING, JIJANGGAN, get_sipsin_relation, get_jijanggan, get_cheongan_wuxing, get_jiji_wuxing
 
@@ -151,12 +153,8 @@ class SajuCoreCalculator:
         return True, "유효함"
 
     def _hanja_to_hangul(self, hanja_str: str) -> str:
-        # Logic from SajuEngineV5's _hanja_to_hangul
-        hanja_to_hangul_map = {
-            "甲": "갑", "乙": "을", "丙": "병", "丁": "정", "戊": "무", "己": "기", "庚": "경", "辛": "신", "壬": "임", "癸": "계",
-            "子": "자", "丑": "축", "寅": "인", "卯": "묘", "辰": "진", "巳": "사", "午": "오", "未": "미", "申": "신", "酉": "유", "戌": "술", "亥": "해"
-        }
-        return "".join(hanja_to_hangul_map.get(char, char) for char in hanja_str)
+        # Logic from SajuEngineV5's _hanja_to_hangul (공용 코덱 변환표)
+        return to_hangul(hanja_str)
 
     def _correct_birth_time(self, birth_datetime: datetime) -> Tuple[datetime, Dict]:
         # Placeholder for TimeCorrector logic from SajuEngineV5
@@ -5,19 +5,14 @@ KASI 정밀 사주 계산기 공통 모델 및 상수
 from typing import Dict, List, Optional
 from datetime import datetime
 
-# KASI API 응답 파싱을 위한 한글-한자 매핑
-KOREAN_TO_CHINESE_GANJEE = {
-    # 천간
-    '갑': '甲', '을': '乙', '병': '丙', '정': '丁', '무': '戊',
-    '기': '己', '경': '庚', '신': '辛', '임': '壬', '계': '癸',
-    # 지지
-    '자': '子', '축': '丑', '인': '寅', '묘': '卯', '진': '辰', '사': '巳',
-    '오': '午', '미': '未', '신': '申', '유': '酉', '술': '戌', '해': '亥'
-}
+from shared.hanja_codec import STEMS_HANJA, BRANCHES_HANJA, GANJI_HANGUL_TO_HANJA
+
+# KASI API 응답 파싱을 위한 한글-한자 매핑 (글자 단위 - 간지 단위 변환은 hanja_codec.pillar_to_hanja)
+KOREAN_TO_CHINESE_GANJEE = GANJI_HANGUL_TO_HANJA
 
 # 천간/지지 상수
-CHEONGAN = ['甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸']
-JIJI = ['子', '丑', '寅', '卯', '辰', '巳', '午', '未', '申', '酉', '戌', '亥']
+CHEONGAN = list(STEMS_HANJA)
+JIJI = list(BRANCHES_HANJA)
 
 # 시두법 - 일간에 따른 시천간 계산 (KASI 기준)
 SIDUBEOP = {
@@ -4,6 +4,9 @@ HEAL7 스마트 라우팅 및 서비스 연속성 관리자 v1.0
 - KASI API 사용량 최적화
 - 다층 폴백 시스템 오케스트레이션
 - 실시간 모니터링 및 자동 전환
+- 결과 캐시는 4주 동치류(날짜 + 시진 구간 + 절입 전/후) 단위로 저장
+- 티어 호출은 tier_router (지연/오류율 추적, 서킷 브레이커, 수학 티어 헤징) 경유
+- Redis 메트릭 조회/기록은 요청 경로 밖 백그라운드 작업으로 처리
 """
 
 import asyncio
@@ -17,6 +20,15 @@ from enum import Enum
 from dataclasses import dataclass
 import os
 
+from .kasi_calculator_core import KasiCalculatorCore
+from .tier_router import TierRouter, saju_tier_router
+
+# 캐시 키 정규화 (4주 동치류)
+try:
+    from shared.saju_pillars import saju_pillar_facade
+except ImportError:
+    saju_pillar_facade = None
+
 logger = logging.getLogger(__name__)
 
 class ServiceTier(Enum):
@@ -50,10 +62,19 @@ class UsageMetrics:
 class SmartRoutingManager:
     """스마트 라우팅 및 서비스 연속성 관리자"""
     
-    def __init__(self):
+    def __init__(self, tier_router: Optional[TierRouter] = None):
         # Redis 연결 (메트릭 저장용)
         self.redis_client = self._init_redis()
         
+        # 티어 호출기 (지연/오류 추적, 서킷 브레이커, 헤징)
+        self.tier_router = tier_router or saju_tier_router
+        
+        # 백그라운드 메트릭 작업 (요청 경로 밖)
+        self.metrics_refresh_interval = 5.0  # 초
+        self._metrics_refreshed_at = 0.0
+        self._metrics_refresh_task: Optional[asyncio.Task] = None
+        self._background_tasks = set()
+        
         # 사용량 제한 설정
         self.kasi_monthly_limit = 10000
         self.kasi_daily_limit = 350  # 여유분 포함
@@ -106,56 +127,95 @@ class SmartRoutingManager:
         
         logger.info(f"🎯 스마트 라우팅 시작: {request_id} (우선순위: {user_priority.value})")
         
-        # 1. 캐시 확인
+        # 1. 캐시 확인 (같은 동치류의 결과를 요청 시각 정보로 다시 채워 반환)
         cached_result = await self._check_cache(year, month, day, hour, minute, is_lunar)
         if cached_result:
             logger.info(f"⚡ 캐시 히트: {request_id}")
+            cached_result.update(KasiCalculatorCore.request_fields(year, month, day, hour, minute, is_lunar))
             return self._format_response(cached_result, ServiceTier.KASI_API, "cache_hit", time.time() - start_time)
         
-        # 2. 사용량 상태 확인
-        await self._update_metrics()
-        routing_decision = self._make_routing_decision(user_priority)
+        # 입력 오류는 티어 장애로 집계되지 않도록 라우팅 전에 거름
+        input_error = self._validate_input(year, month, day, hour, minute, is_lunar)
+        if input_error:
+            return self._format_error_response(request_id, [input_error], time.time() - start_time)
         
-        # 3. 라우팅 실행
-        result = None
-        used_tier = None
-        error_chain = []
+        # 2. 사용량 상태 확인 (캐시된 메트릭 사용, 오래되었으면 백그라운드 갱신)
+        self._schedule_metrics_refresh()
+        routing_decision = [
+            tier for tier in self._make_routing_decision(user_priority)
+            if tier == ServiceTier.MATHEMATICAL or self.tier_router.available(tier.value)
+        ]
         
-        for tier in routing_decision:
-            try:
-                logger.info(f"🔄 {tier.value} 계산 시도: {request_id}")
-                
-                if tier == ServiceTier.KASI_API:
-                    result = await self._execute_kasi_calculation(year, month, day, hour, minute, is_lunar)
-                elif tier == ServiceTier.AI_HYBRID:
-                    result = await self._execute_ai_hybrid_calculation(year, month, day, hour, minute, is_lunar)
-                elif tier == ServiceTier.MATHEMATICAL:
-                    result = await self._execute_mathematical_calculation(year, month, day, hour, minute, is_lunar)
-                
-                if result:
-                    used_tier = tier
-                    break
-                    
-            except Exception as e:
-                error_msg = f"{tier.value} 실패: {str(e)}"
-                error_chain.append(error_msg)
-                logger.warning(error_msg)
-                continue
+        # 3. 라우팅 실행 (차단된 티어는 즉시 건너뛰고, 느린 티어는 수학 티어로 헤징)
+        tier_calls = {
+            ServiceTier.KASI_API: self._execute_kasi_calculation,
+            ServiceTier.AI_HYBRID: self._execute_ai_hybrid_calculation,
+            ServiceTier.MATHEMATICAL: self._execute_mathematical_calculation,
+        }
+        args = (year, month, day, hour, minute, is_lunar)
+        attempts = [
+            (tier.value, lambda tier=tier: tier_calls[tier](*args))
+            for tier in routing_decision
+        ]
+        hedge = None
+        if ServiceTier.MATHEMATICAL in routing_decision:
+            hedge = (ServiceTier.MATHEMATICAL.value, lambda: self._execute_mathematical_calculation(*args))
+        
+        logger.info(f"🔄 티어 순서: {[tier.value for tier in routing_decision]}: {request_id}")
+        # KASI 호출은 스레드에서 돌아 취소할 수 없으므로, 헤지에 지더라도 끝까지 실행해 정밀 결과로 캐시 갱신
+        # (늦게 끝난 수학 티어 결과는 더 정밀한 결과를 덮어쓰지 않도록 버림)
+        async def cache_late_result(tier: str, late_result: Dict):
+            if tier != ServiceTier.MATHEMATICAL.value:
+                await self._cache_result(*args, late_result)
+        
+        used_tier_name, result, error_chain = await self.tier_router.execute(
+            attempts, hedge, on_late_result=cache_late_result
+        )
         
         # 4. 결과 처리
         if result:
+            used_tier = ServiceTier(used_tier_name)
+            
             # 캐싱
             await self._cache_result(year, month, day, hour, minute, is_lunar, result)
             
-            # 메트릭 업데이트
-            await self._record_success(used_tier, time.time() - start_time)
+            # 메트릭 기록 (백그라운드)
+            self._spawn(self._record_success(used_tier, time.time() - start_time))
             
             return self._format_response(result, used_tier, "success", time.time() - start_time)
         else:
             # 모든 계산 실패
-            await self._record_failure(error_chain)
+            self._spawn(self._record_failure(error_chain))
             return self._format_error_response(request_id, error_chain, time.time() - start_time)
     
+    def _validate_input(self, year: int, month: int, day: int,
+                        hour: int, minute: int, is_lunar: bool) -> Optional[str]:
+        """입력 검증 (잘못된 날짜/시각이면 오류 메시지)"""
+        try:
+            if saju_pillar_facade is not None:
+                saju_pillar_facade.canonical_instant(year, month, day, hour, minute, is_lunar)
+            else:
+                datetime(year, month, day, hour, minute)
+        except (ValueError, TypeError) as e:
+            return f"잘못된 입력: {e}"
+        return None
+    
+    def _spawn(self, coro):
+        """요청 경로 밖에서 실행할 작업 (참조 유지 후 완료 시 해제)"""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    def _schedule_metrics_refresh(self):
+        """메트릭이 오래되었고 갱신 중이 아니면 백그라운드 갱신 예약"""
+        if self._metrics_refresh_task is not None and not self._metrics_refresh_task.done():
+            return
+        if time.monotonic() - self._metrics_refreshed_at < self.metrics_refresh_interval:
+            return
+        self._metrics_refreshed_at = time.monotonic()
+        self._metrics_refresh_task = self._spawn(self._update_metrics())
+    
     def _make_routing_decision(self, user_priority: UserPriority) -> List[ServiceTier]:
         """라우팅 결정 로직"""
         
@@ -193,9 +253,9 @@ class SmartRoutingManager:
                           hour: int, minute: int, is_lunar: bool) -> Optional[Dict]:
         """캐시 확인"""
         
-        cache_key = f"saju:{year}:{month:02d}:{day:02d}:{hour:02d}:{minute:02d}:{is_lunar}"
+        cache_key = self._cache_key(year, month, day, hour, minute, is_lunar)
         
-        if self.redis_client:
+        if cache_key and self.redis_client:
             try:
                 cached_data = self.redis_client.get(cache_key)
                 if cached_data:
@@ -209,12 +269,12 @@ class SmartRoutingManager:
                            hour: int, minute: int, is_lunar: bool, result: Dict):
         """결과 캐싱"""
         
-        cache_key = f"saju:{year}:{month:02d}:{day:02d}:{hour:02d}:{minute:02d}:{is_lunar}"
+        cache_key = self._cache_key(year, month, day, hour, minute, is_lunar)
         
         # 캐싱 전략 결정
         cache_duration = self._determine_cache_duration(year, month, day)
         
-        if self.redis_client:
+        if cache_key and self.redis_client:
             try:
                 self.redis_client.setex(
                     cache_key, 
@@ -225,6 +285,26 @@ class SmartRoutingManager:
             except Exception as e:
                 logger.warning(f"캐싱 실패: {e}")
     
+    def _cache_key(self, year: int, month: int, day: int,
+                   hour: int, minute: int, is_lunar: bool) -> Optional[str]:
+        """결과 캐시 키 (진태양시 보정 후 4주 동치류 기준)
+        
+        4주는 시진 경계와 절입 시각에서만 바뀌므로 하루 1,440개 분 단위 키 대신
+        시진 구간당 하나(절입이 든 구간만 전/후 둘)의 키를 사용합니다.
+        정규화할 수 없는 입력(잘못된 날짜 등)은 캐시하지 않습니다.
+        """
+        if saju_pillar_facade is None:
+            return f"saju:{year}:{month:02d}:{day:02d}:{hour:02d}:{minute:02d}:{is_lunar}"
+        
+        try:
+            pillar_class = saju_pillar_facade.equivalence_class(
+                year, month, day, hour, minute, is_lunar,
+                correction_minutes=KasiCalculatorCore.SOLAR_TIME_CORRECTION_MINUTES
+            )
+        except ValueError:
+            return None
+        return f"saju:class:{pillar_class.key()}:{is_lunar}"
+    
     def _determine_cache_duration(self, year: int, month: int, day: int) -> int:
         """캐시 지속시간 결정"""
         
@@ -257,9 +337,10 @@ class SmartRoutingManager:
         from .kasi_precision_saju_calculator import KasiPrecisionSajuCalculator
         calculator = KasiPrecisionSajuCalculator()
         
-        result = calculator.calculate_saju(year, month, day, hour, minute, is_lunar)
+        # 동기 계산기(KASI HTTP 호출 포함)는 스레드에서 실행 → 헤징 시 이벤트 루프가 막히지 않음
+        result = await asyncio.to_thread(calculator.calculate_saju, year, month, day, hour, minute, is_lunar)
         
-        if result:
+        if result and not result.get("error"):
             result["calculation_method"] = "kasi_api"
             result["accuracy_level"] = "100%"
             
@@ -289,16 +370,9 @@ class SmartRoutingManager:
         from .kasi_precision_saju_calculator import KasiPrecisionSajuCalculator
         calculator = KasiPrecisionSajuCalculator()
         
-        # 기존 폴백 로직 사용 (KASI API 없이)
+        # 기존 폴백 로직 사용 (KASI API 없이 로컬 계산만)
         try:
-            # KASI API 비활성화 상태로 계산
-            original_key = calculator.kasi_service_key
-            calculator.kasi_service_key = None  # API 비활성화
-            
-            result = calculator.calculate_saju(year, month, day, hour, minute, is_lunar)
-            
-            # 원래 키 복원
-            calculator.kasi_service_key = original_key
+            result = calculator._fallback_calculation(year, month, day, hour, minute, is_lunar)
             
             if result:
                 result["calculation_method"] = "mathematical_fallback"
@@ -312,7 +386,7 @@ class SmartRoutingManager:
             return None
     
     async def _update_metrics(self):
-        """메트릭 업데이트"""
+        """메트릭 업데이트 (Redis 왕복 1회, 스레드에서 실행)"""
         
         if not self.redis_client:
             return
@@ -324,8 +398,10 @@ class SmartRoutingManager:
             daily_key = f"metrics:daily:{today}"
             monthly_key = f"metrics:monthly:{month}"
             
-            self.current_metrics.daily_requests = int(self.redis_client.get(daily_key) or 0)
-            self.current_metrics.monthly_requests = int(self.redis_client.get(monthly_key) or 0)
+            daily, monthly = await asyncio.to_thread(self.redis_client.mget, daily_key, monthly_key)
+            self.current_metrics.daily_requests = int(daily or 0)
+            self.current_metrics.monthly_requests = int(monthly or 0)
+            self.current_metrics.last_updated = datetime.now()
             
             # 서비스 상태 업데이트
             monthly_usage_rate = self.current_metrics.monthly_requests / self.kasi_monthly_limit
@@ -350,14 +426,17 @@ class SmartRoutingManager:
             today = datetime.now().strftime("%Y-%m-%d")
             month = datetime.now().strftime("%Y-%m")
             
+            pipe = self.redis_client.pipeline(transaction=False)
+            
             # 카운터 증가
             if tier == ServiceTier.KASI_API:
-                self.redis_client.incr(f"metrics:daily:{today}")
-                self.redis_client.incr(f"metrics:monthly:{month}")
+                pipe.incr(f"metrics:daily:{today}")
+                pipe.incr(f"metrics:monthly:{month}")
             
             # 응답 시간 기록
-            self.redis_client.lpush(f"metrics:response_times:{today}", response_time)
-            self.redis_client.expire(f"metrics:response_times:{today}", 86400)
+            pipe.lpush(f"metrics:response_times:{today}", response_time)
+            pipe.expire(f"metrics:response_times:{today}", 86400)
+            await asyncio.to_thread(pipe.execute)
             
         except Exception as e:
             logger.warning(f"성공 기록 실패: {e}")
@@ -377,8 +456,10 @@ class SmartRoutingManager:
                 "errors": error_chain
             }
             
-            self.redis_client.lpush(failure_key, json.dumps(failure_data))
-            self.redis_client.expire(failure_key, 86400 * 7)  # 7일 보관
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.lpush(failure_key, json.dumps(failure_data))
+            pipe.expire(failure_key, 86400 * 7)  # 7일 보관
+            await asyncio.to_thread(pipe.execute)
             
         except Exception as e:
             logger.warning(f"실패 기록 실패: {e}")
@@ -440,10 +521,13 @@ class SmartRoutingManager:
                 "kasi_available": self.current_metrics.monthly_requests < self.kasi_monthly_limit * 0.95
             },
             "tiers_available": {
-                "kasi_api": self.current_metrics.monthly_requests < self.kasi_monthly_limit * 0.95,
-                "ai_hybrid": True,
+                "kasi_api": (self.current_metrics.monthly_requests < self.kasi_monthly_limit * 0.95
+                             and self.tier_router.available(ServiceTier.KASI_API.value)),
+                "ai_hybrid": self.tier_router.available(ServiceTier.AI_HYBRID.value),
                 "mathematical": True
             },
+            "tier_health": self.tier_router.snapshot(),
+            "hedging_enabled": self.tier_router.hedging_enabled,
             "cache_status": "enabled" if self.redis_client else "disabled",
             "timestamp": datetime.now().isoformat()
         }
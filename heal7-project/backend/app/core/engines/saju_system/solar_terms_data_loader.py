@@ -62,23 +62,23 @@ class SolarTermsDataLoader:
                 ("입하", 5, 5), ("소만", 5, 20), ("망종", 6, 5), ("하지", 6, 21),
                 ("소서", 7, 6), ("대서", 7, 22), ("입추", 8, 7), ("처서", 8, 22),
                 ("백로", 9, 7), ("추분", 9, 22), ("한로", 10, 8), ("상강", 10, 23),
-                ("입동", 11, 7), ("소설", 11, 22), ("대설", 12, 6), ("동지", 12, 21)
+                ("입동", 11, 7), ("소설", 11, 22), ("대설", 12, 7), ("동지", 12, 21)
             ],
             2025: [
                 ("소한", 1, 5), ("대한", 1, 20), ("입춘", 2, 3), ("우수", 2, 18),
                 ("경칩", 3, 5), ("춘분", 3, 20), ("청명", 4, 4), ("곡우", 4, 20),
-                ("입하", 5, 5), ("소만", 5, 20), ("망종", 6, 5), ("하지", 6, 21),
+                ("입하", 5, 5), ("소만", 5, 21), ("망종", 6, 5), ("하지", 6, 21),
                 ("소서", 7, 7), ("대서", 7, 22), ("입추", 8, 7), ("처서", 8, 23),
                 ("백로", 9, 7), ("추분", 9, 23), ("한로", 10, 8), ("상강", 10, 23),
-                ("입동", 11, 7), ("소설", 11, 22), ("대설", 12, 7), ("동지", 12, 21)
+                ("입동", 11, 7), ("소설", 11, 22), ("대설", 12, 7), ("동지", 12, 22)
             ],
             2026: [
-                ("소한", 1, 5), ("대한", 1, 20), ("입춘", 2, 4), ("우수", 2, 18),
-                ("경칩", 3, 5), ("춘분", 3, 20), ("청명", 4, 4), ("곡우", 4, 20),
-                ("입하", 5, 5), ("소만", 5, 21), ("망종", 6, 5), ("하지", 6, 21),
-                ("소서", 7, 7), ("대서", 7, 22), ("입추", 8, 7), ("처서", 8, 23),
+                ("소한", 1, 5), ("대한", 1, 20), ("입춘", 2, 4), ("우수", 2, 19),
+                ("경칩", 3, 5), ("춘분", 3, 20), ("청명", 4, 5), ("곡우", 4, 20),
+                ("입하", 5, 5), ("소만", 5, 21), ("망종", 6, 6), ("하지", 6, 21),
+                ("소서", 7, 7), ("대서", 7, 23), ("입추", 8, 7), ("처서", 8, 23),
                 ("백로", 9, 7), ("추분", 9, 23), ("한로", 10, 8), ("상강", 10, 23),
-                ("입동", 11, 7), ("소설", 11, 22), ("대설", 12, 7), ("동지", 12, 21)
+                ("입동", 11, 7), ("소설", 11, 22), ("대설", 12, 7), ("동지", 12, 22)
             ]
         }
     
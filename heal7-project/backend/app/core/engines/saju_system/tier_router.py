@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+사주 계산 티어 라우팅 코어
+SmartRoutingManager / HybridSajuEngine 이 공유하는 티어 선택·장애 격리 계층
+
+기능:
+- 티어별 지연 히스토그램/오류율 추적 (shared.model_dispatch.CallStats)
+- 서킷 브레이커: 연속 실패 시 차단(open) → 대기 후 반개방(half-open) 탐침 1건 → 성공 시 복구
+- 헤징: 앞선 티어가 자신의 p95 지연 안에 끝나지 않으면 로컬 수학 티어를 병렬 실행,
+  먼저 도착한 유효 결과 사용 (경주 실행은 shared.model_dispatch.race)
+- 스레드에서 도는 호출은 취소할 수 없으므로, 진 호출을 끝까지 실행해 결과를 호출자(캐시)에 전달
+  (on_late_result 가 없으면 진 호출을 취소 - 취소 가능한 비동기 호출 전용)
+- 통계 갱신은 메모리 내 O(1) 연산만 수행 (외부 저장소 기록은 호출자가 요청 경로 밖에서 처리)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from shared.model_dispatch import CallStats, LateResultHandler, is_valid_result, race
+
+logger = logging.getLogger(__name__)
+
+TierCall = Callable[[], Awaitable[Any]]
+
+
+class BreakerState(Enum):
+    """서킷 브레이커 상태"""
+    CLOSED = "closed"          # 정상 - 모든 요청 허용
+    OPEN = "open"              # 차단 - 요청 즉시 실패
+    HALF_OPEN = "half_open"    # 반개방 - 탐침 요청 1건만 허용
+
+
+class CircuitOpenError(RuntimeError):
+    """차단된 티어 호출"""
+
+
+class InvalidTierResult(RuntimeError):
+    """티어가 오류 결과(빈 결과, error 플래그)를 반환"""
+
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커 (반개방 시 탐침 1건)"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = BreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state == BreakerState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = BreakerState.HALF_OPEN
+        return self._state
+
+    def available(self) -> bool:
+        """요청을 보낼 수 있는 상태인지 (탐침 슬롯을 점유하지 않음)"""
+        state = self.state
+        return state == BreakerState.CLOSED or (state == BreakerState.HALF_OPEN and not self._probe_in_flight)
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (반개방 상태면 탐침 슬롯 점유)"""
+        state = self.state
+        if state == BreakerState.CLOSED:
+            return True
+        if state == BreakerState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self._state = BreakerState.CLOSED
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self._consecutive_failures += 1
+        if self._state == BreakerState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self._state != BreakerState.OPEN:
+                logger.warning(f"🔌 서킷 차단 (연속 실패 {self._consecutive_failures}회)")
+            self._state = BreakerState.OPEN
+            self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+    def release(self):
+        """결과 없이 끝난 호출(헤징 취소)의 탐침 슬롯 반환"""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"state": self.state.value, "consecutive_failures": self._consecutive_failures}
+
+
+class TierRouter:
+    """티어 호출기 - 통계 기록, 서킷 브레이커, 헤징"""
+
+    def __init__(self,
+                 alpha: float = 0.2,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 hedging_enabled: Optional[bool] = None,
+                 default_hedge_delay: float = 0.5,
+                 min_hedge_delay: float = 0.05,
+                 max_hedge_delay: float = 2.0):
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        if hedging_enabled is None:
+            hedging_enabled = os.getenv("SAJU_ROUTING_HEDGING", "1") != "0"
+        self.hedging_enabled = hedging_enabled
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.stats: Dict[str, CallStats] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    def _stats(self, tier: str) -> CallStats:
+        if tier not in self.stats:
+            self.stats[tier] = CallStats(self.alpha)
+        return self.stats[tier]
+
+    def _breaker(self, tier: str) -> CircuitBreaker:
+        if tier not in self.breakers:
+            self.breakers[tier] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self.breakers[tier]
+
+    def available(self, tier: str) -> bool:
+        """티어가 차단되지 않았는지"""
+        return self._breaker(tier).available()
+
+    def hedge_delay(self, tier: str) -> float:
+        """헤지 발사 지연 = 티어 p95 지연 (표본 없으면 기본값, 상하한 적용)"""
+        return self._stats(tier).hedge_delay(self.default_hedge_delay, self.min_hedge_delay, self.max_hedge_delay)
+
+    async def call(self, tier: str, factory: TierCall) -> Any:
+        """단일 티어 호출 (차단 시 즉시 실패, 결과 검증 후 통계/브레이커 갱신)"""
+        breaker = self._breaker(tier)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{tier} 서킷 차단 중")
+
+        started = time.perf_counter()
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            self._stats(tier).record_cancelled()
+            breaker.release()
+            raise
+        except Exception:
+            self._stats(tier).record(time.perf_counter() - started, False)
+            breaker.record_failure()
+            raise
+
+        elapsed = time.perf_counter() - started
+        if not is_valid_result(result):
+            self._stats(tier).record(elapsed, False)
+            breaker.record_failure()
+            raise InvalidTierResult(f"{tier} 결과 없음")
+
+        self._stats(tier).record(elapsed, True)
+        breaker.record_success()
+        return result
+
+    async def execute(self, attempts: Sequence[Tuple[str, TierCall]],
+                      hedge: Optional[Tuple[str, TierCall]] = None,
+                      on_late_result: Optional[LateResultHandler] = None) -> Tuple[Optional[str], Any, List[str]]:
+        """티어를 순서대로 시도 → (사용된 티어, 결과, 실패 내역)
+
+        hedge: (티어, 호출) - 헤징 사용 시 다른 티어가 p95 지연을 넘기면 병렬로 실행
+        on_late_result: (티어, 결과) 콜백 - 헤지에 진 티어를 취소하지 않고 끝까지 실행해
+            유효한 결과를 전달 (스레드 호출처럼 취소할 수 없는 티어는 반드시 지정)
+        """
+        errors = []
+        for tier, factory in attempts:
+            try:
+                if self.hedging_enabled and hedge is not None and tier != hedge[0]:
+                    used, result = await self._hedged_call(tier, factory, *hedge, on_late_result)
+                else:
+                    used, result = tier, await self.call(tier, factory)
+                return used, result, errors
+            except Exception as e:
+                errors.append(f"{tier} 실패: {e}")
+                logger.warning(errors[-1])
+        return None, None, errors
+
+    async def _hedged_call(self, tier: str, factory: TierCall, hedge_tier: str, hedge_factory: TierCall,
+                           on_late_result: Optional[LateResultHandler] = None) -> Tuple[str, Any]:
+        """티어 호출 + p95 지연 초과 시 헤지 티어 병렬 실행 (티어가 먼저 실패하면 다음 티어로 넘김)"""
+        return await race(
+            [(tier, lambda: self.call(tier, factory)), (hedge_tier, lambda: self.call(hedge_tier, hedge_factory))],
+            delay_for=self.hedge_delay,
+            failover=False,
+            on_late_result=on_late_result
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """티어별 통계/브레이커 상태"""
+        return {
+            tier: {**self._stats(tier).snapshot(), "breaker": self._breaker(tier).snapshot()}
+            for tier in sorted(set(self.stats) | set(self.breakers))
+        }
+
+
+# 전역 인스턴스 (스마트 라우팅 / 하이브리드 엔진 공유)
+saju_tier_router = TierRouter()
@@ -4,30 +4,55 @@ KASI API 사용량 모니터링 시스템
 실시간 사용량 추적 및 예측 시스템
 """
 
-import json
+import atexit
+import calendar
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from pathlib import Path
 import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 class UsageMonitor:
-    """KASI API 사용량 모니터링 및 예측 시스템"""
+    """
+    KASI API 사용량 모니터링 및 예측 시스템
+    - log_usage 는 메모리 큐에 이벤트만 추가 (잠금/DB 접근 없음)
+    - 백그라운드 스레드가 주기적으로 시간별 버킷으로 집계해 WAL 모드 SQLite 에 일괄 기록
+    - 조회/예측은 시간별(hourly_stats)·일별(daily_stats) 집계 테이블 + 아직 기록되지 않은 메모리 이벤트 사용
+      (조회 경로에서는 DB 에 쓰지 않음)
+    """
     
-    def __init__(self, db_path: str = "/tmp/kasi_usage.db"):
+    def __init__(self, db_path: str = "/tmp/kasi_usage.db", flush_interval: float = 5.0,
+                 keep_raw_log: bool = True, max_pending_events: int = 100000):
         self.db_path = db_path
         self.monthly_limit = 10000
         self.safety_margin = 500  # 안전 여유분
         self.effective_limit = self.monthly_limit - self.safety_margin
+        self.flush_interval = flush_interval
+        self.keep_raw_log = keep_raw_log  # 개별 호출 로그(usage_log)도 일괄 기록
+        self.max_pending_events = max_pending_events  # 기록 실패 시 재시도 대기열 상한
+        
+        # deque.append/popleft 는 스레드 안전 → 호출 경로에서 잠금 불필요
+        self._events: deque = deque()
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
         
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
     def _init_database(self):
         """사용량 추적 데이터베이스 초기화"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute('''
                     CREATE TABLE IF NOT EXISTS usage_log (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,6 +65,31 @@ class UsageMonitor:
                         user_info TEXT
                     )
                 ''')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS hourly_stats (
+                        date TEXT NOT NULL,
+                        hour INTEGER NOT NULL,
+                        endpoint TEXT NOT NULL,
+                        total_requests INTEGER DEFAULT 0,
+                        success_requests INTEGER DEFAULT 0,
+                        failed_requests INTEGER DEFAULT 0,
+                        response_time_sum REAL DEFAULT 0,
+                        PRIMARY KEY (date, hour, endpoint)
+                    )
+                ''')
+                hourly_empty = conn.execute(
+                    "SELECT NOT EXISTS (SELECT 1 FROM hourly_stats)"
+                ).fetchone()[0]
+                if hourly_empty:
+                    # 기존 DB 업그레이드: 개별 호출 로그에서 시간별 집계 채우기 (일별 통계는 그대로 유지)
+                    conn.execute('''
+                        INSERT INTO hourly_stats
+                        (date, hour, endpoint, total_requests, success_requests, failed_requests, response_time_sum)
+                        SELECT date, hour, endpoint, COUNT(*), SUM(success != 0), SUM(success = 0),
+                               COALESCE(SUM(response_time), 0)
+                        FROM usage_log
+                        GROUP BY date, hour, endpoint
+                    ''')
                 conn.execute('''
                     CREATE TABLE IF NOT EXISTS daily_stats (
                         date TEXT PRIMARY KEY,
@@ -58,58 +108,143 @@ class UsageMonitor:
     
     def log_usage(self, endpoint: str = "calculate_saju", success: bool = True, 
                   response_time: float = 0, user_info: str = ""):
-        """API 사용량 로깅"""
-        
-        now = datetime.now()
-        date_str = now.strftime("%Y-%m-%d")
-        
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                # 개별 로그 저장
-                conn.execute('''
-                    INSERT INTO usage_log 
-                    (timestamp, date, hour, endpoint, success, response_time, user_info)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    now.isoformat(), date_str, now.hour, 
-                    endpoint, success, response_time, user_info
-                ))
-                
-                # 일별 통계 업데이트
-                conn.execute('''
-                    INSERT OR REPLACE INTO daily_stats 
-                    (date, total_requests, success_requests, failed_requests, last_updated)
-                    VALUES (
-                        ?, 
-                        COALESCE((SELECT total_requests FROM daily_stats WHERE date = ?), 0) + 1,
-                        COALESCE((SELECT success_requests FROM daily_stats WHERE date = ?), 0) + ?,
-                        COALESCE((SELECT failed_requests FROM daily_stats WHERE date = ?), 0) + ?,
-                        ?
-                    )
-                ''', (date_str, date_str, date_str, 1 if success else 0, 
-                      date_str, 0 if success else 1, now.isoformat()))
-                
-                conn.commit()
-                
-        except Exception as e:
-            logger.error(f"❌ 사용량 로깅 오류: {e}")
+        """API 사용량 로깅 (메모리 큐 추가만 수행, DB 기록은 백그라운드 일괄 처리)"""
+        self._events.append((time.time(), endpoint, success, response_time, user_info))
+        if self._flusher is None:
+            self._start_flusher()
+    
+    # --- 일괄 기록 ---
+    
+    def _start_flusher(self):
+        with self._flush_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="usage-monitor-flush", daemon=True)
+            self._flusher.start()
+            atexit.register(self.close)
+    
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        """백그라운드 기록 중지 후 남은 이벤트 기록"""
+        self._stop_event.set()
+        self.flush()
+    
+    @staticmethod
+    def _aggregate(events) -> Dict[Tuple[str, int, str], List[float]]:
+        """이벤트 → (날짜, 시, 엔드포인트) 버킷 [전체, 성공, 실패, 응답시간 합]"""
+        buckets: Dict[Tuple[str, int, str], List[float]] = {}
+        for timestamp, endpoint, success, response_time, _ in events:
+            moment = datetime.fromtimestamp(timestamp)
+            bucket = buckets.setdefault((moment.strftime("%Y-%m-%d"), moment.hour, endpoint), [0, 0, 0, 0.0])
+            bucket[0] += 1
+            bucket[1 if success else 2] += 1
+            bucket[3] += response_time or 0
+        return buckets
+    
+    def flush(self) -> int:
+        """대기 중인 이벤트를 시간별 버킷으로 집계해 한 트랜잭션으로 기록"""
+        with self._flush_lock:
+            events = []
+            while self._events:
+                events.append(self._events.popleft())
+            if not events:
+                return 0
+            
+            buckets = self._aggregate(events)
+            daily: Dict[str, List[float]] = {}
+            for (date_str, _, _), values in buckets.items():
+                totals = daily.setdefault(date_str, [0, 0, 0, 0.0])
+                for index, value in enumerate(values):
+                    totals[index] += value
+            raw_rows = []
+            if self.keep_raw_log:
+                for timestamp, endpoint, success, response_time, user_info in events:
+                    moment = datetime.fromtimestamp(timestamp)
+                    raw_rows.append((moment.isoformat(), moment.strftime("%Y-%m-%d"), moment.hour,
+                                     endpoint, success, response_time, user_info))
+            
+            try:
+                with self._connect() as conn:
+                    if raw_rows:
+                        conn.executemany('''
+                            INSERT INTO usage_log 
+                            (timestamp, date, hour, endpoint, success, response_time, user_info)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ''', raw_rows)
+                    
+                    conn.executemany('''
+                        INSERT INTO hourly_stats
+                        (date, hour, endpoint, total_requests, success_requests, failed_requests, response_time_sum)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(date, hour, endpoint) DO UPDATE SET
+                            total_requests = total_requests + excluded.total_requests,
+                            success_requests = success_requests + excluded.success_requests,
+                            failed_requests = failed_requests + excluded.failed_requests,
+                            response_time_sum = response_time_sum + excluded.response_time_sum
+                    ''', [key + tuple(values) for key, values in buckets.items()])
+                    
+                    # 일별 통계에 이번 배치 증분 합산 (업그레이드 전 기록된 일별 카운트 보존)
+                    now_str = datetime.now().isoformat()
+                    conn.executemany('''
+                        INSERT INTO daily_stats
+                        (date, total_requests, success_requests, failed_requests,
+                         avg_response_time, peak_hour, last_updated)
+                        VALUES (?1, ?2, ?3, ?4, ?5 / ?2,
+                                (SELECT hour FROM hourly_stats WHERE date = ?1
+                                 GROUP BY hour ORDER BY SUM(total_requests) DESC LIMIT 1),
+                                ?6)
+                        ON CONFLICT(date) DO UPDATE SET
+                            avg_response_time = (avg_response_time * total_requests + ?5)
+                                                / (total_requests + excluded.total_requests),
+                            total_requests = total_requests + excluded.total_requests,
+                            success_requests = success_requests + excluded.success_requests,
+                            failed_requests = failed_requests + excluded.failed_requests,
+                            peak_hour = excluded.peak_hour,
+                            last_updated = excluded.last_updated
+                    ''', [(date_str, *values, now_str) for date_str, values in daily.items()])
+                    conn.commit()
+                return len(events)
+            except Exception as e:
+                # 기록 실패 시 이벤트를 다시 큐 앞쪽에 되돌려 다음 주기에 재시도 (상한 초과분은 오래된 것부터 버림)
+                room = max(0, self.max_pending_events - len(self._events))
+                dropped = max(0, len(events) - room)
+                self._events.extendleft(reversed(events[dropped:]))
+                logger.error(f"❌ 사용량 일괄 기록 오류: {e}" + (f" (대기열 초과로 {dropped}건 버림)" if dropped else ""))
+                return 0
     
     def get_current_usage(self) -> Dict[str, Any]:
-        """현재 사용량 현황 조회"""
+        """현재 사용량 현황 조회 (집계 테이블 + 아직 기록되지 않은 메모리 이벤트)"""
         
         now = datetime.now()
         today = now.strftime("%Y-%m-%d")
         month_start = now.replace(day=1).strftime("%Y-%m-%d")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            # 일괄 기록과 겹치지 않도록 기록 잠금 안에서 대기 이벤트 복사 + DB 읽기
+            with self._flush_lock, self._connect() as conn:
+                pending = self._aggregate(list(self._events))
+                pending_today = [0, 0]
+                pending_month = 0
+                pending_hours: Dict[int, int] = {}
+                for (date_str, hour, _), (total, success, _, _) in pending.items():
+                    if date_str >= month_start:
+                        pending_month += total
+                    if date_str == today:
+                        pending_today[0] += total
+                        pending_today[1] += success
+                        pending_hours[hour] = pending_hours.get(hour, 0) + total
+                
                 # 오늘 사용량
                 cursor = conn.execute('''
                     SELECT total_requests, success_requests, failed_requests 
                     FROM daily_stats WHERE date = ?
                 ''', (today,))
-                today_stats = cursor.fetchone()
-                today_usage = today_stats[0] if today_stats else 0
+                row = cursor.fetchone()
+                today_stats = (row[0] + pending_today[0], row[1] + pending_today[1]) if row else tuple(pending_today)
+                today_usage = today_stats[0]
                 
                 # 월간 사용량
                 cursor = conn.execute('''
@@ -117,23 +252,24 @@ class UsageMonitor:
                     FROM daily_stats WHERE date >= ?
                 ''', (month_start,))
                 month_stats = cursor.fetchone()
-                month_usage = month_stats[0] if month_stats and month_stats[0] else 0
+                month_usage = (month_stats[0] if month_stats and month_stats[0] else 0) + pending_month
                 
                 # 시간대별 패턴 (오늘)
                 cursor = conn.execute('''
-                    SELECT hour, COUNT(*) as count
-                    FROM usage_log 
+                    SELECT hour, SUM(total_requests) as count
+                    FROM hourly_stats 
                     WHERE date = ?
                     GROUP BY hour
-                    ORDER BY count DESC
-                    LIMIT 3
                 ''', (today,))
-                peak_hours = cursor.fetchall()
+                hour_counts = dict(cursor.fetchall())
+                for hour, count in pending_hours.items():
+                    hour_counts[hour] = hour_counts.get(hour, 0) + count
+                peak_hours = sorted(hour_counts.items(), key=lambda item: item[1], reverse=True)[:3]
                 
                 return {
                     "today": {
                         "usage": today_usage,
-                        "success_rate": (today_stats[1] / today_stats[0] * 100) if today_stats and today_stats[0] > 0 else 0
+                        "success_rate": (today_stats[1] / today_stats[0] * 100) if today_stats[0] > 0 else 0
                     },
                     "monthly": {
                         "usage": month_usage,
@@ -155,7 +291,7 @@ class UsageMonitor:
         
         now = datetime.now()
         days_passed = now.day
-        days_in_month = (now.replace(month=now.month+1, day=1) - timedelta(days=1)).day
+        days_in_month = calendar.monthrange(now.year, now.month)[1]
         
         current = self.get_current_usage()
         monthly_usage = current.get("monthly", {}).get("usage", 0)
@@ -302,6 +438,7 @@ if __name__ == "__main__":
     # 테스트 로깅
     monitor = UsageMonitor()
     monitor.log_usage("test", True, 1.5, "test_user")
+    monitor.flush()
     
     # 현황 조회
     report = monitor.get_usage_report()
@@ -0,0 +1,110 @@
+"""
+운세 콘텐츠 불변 인메모리 저장소
+모듈 로드 시 12지신 데이터를 한 번만 인덱싱/직렬화해 두고 요청 시에는 조회만 수행
+- 띠 ID ↔ 인덱스 (출생년도 → 인덱스는 산술 계산)
+- 12×12 띠 궁합 행렬
+- 미리 직렬화된 JSON 응답 바이트
+- 하루 단위 결정적 결과 메모이제이션 (KST 자정까지 유효)
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from app.data.zodiac_data import ZODIAC_DATA, check_compatibility
+
+KST = timezone(timedelta(hours=9))
+
+# 1900년이 쥐띠 시작년도 (zodiac_data.calculate_zodiac 과 동일한 순서)
+ZODIAC_CYCLE: Tuple[str, ...] = (
+    'rat', 'ox', 'tiger', 'rabbit', 'dragon', 'snake',
+    'horse', 'sheep', 'monkey', 'rooster', 'dog', 'pig'
+)
+ZODIAC_BASE_YEAR = 1900
+ZODIAC_INDEX: Mapping[str, int] = MappingProxyType({zodiac_id: i for i, zodiac_id in enumerate(ZODIAC_CYCLE)})
+
+
+def _freeze(value: Any) -> Any:
+    """dict/list를 읽기 전용 구조(MappingProxyType/tuple)로 재귀 변환"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _serialize(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+def kst_today():
+    """KST 기준 오늘 날짜"""
+    return datetime.now(KST).date()
+
+
+class ZodiacStore:
+    """12지신 데이터 불변 저장소"""
+
+    def __init__(self, zodiac_data: Dict[str, Dict[str, Any]]):
+        self.signs: Tuple[Mapping[str, Any], ...] = tuple(_freeze(zodiac_data[zodiac_id]) for zodiac_id in ZODIAC_CYCLE)
+
+        # 12×12 궁합 행렬 (행: 기준 띠, 열: 상대 띠)
+        self.compatibility_matrix: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(check_compatibility(zodiac1, zodiac2) for zodiac2 in ZODIAC_CYCLE)
+            for zodiac1 in ZODIAC_CYCLE
+        )
+
+        # 미리 직렬화된 응답
+        self.all_signs_json = _serialize([{'id': zodiac_id, **zodiac_data[zodiac_id]} for zodiac_id in ZODIAC_CYCLE])
+        self.sign_json: Tuple[bytes, ...] = tuple(_serialize(zodiac_data[zodiac_id]) for zodiac_id in ZODIAC_CYCLE)
+        self.fortune_2025_json: Tuple[bytes, ...] = tuple(
+            _serialize({
+                "zodiac_id": zodiac_id,
+                "zodiac_name": zodiac_data[zodiac_id].get("name", zodiac_id),
+                "year": 2025,
+                "fortune": zodiac_data[zodiac_id].get("fortune_2025", {})
+            })
+            for zodiac_id in ZODIAC_CYCLE
+        )
+        self.compatibility_json: Tuple[Tuple[bytes, ...], ...] = tuple(
+            tuple(
+                _serialize({"zodiac1": zodiac1, "zodiac2": zodiac2, "compatibility": self.compatibility_matrix[i][j]})
+                for j, zodiac2 in enumerate(ZODIAC_CYCLE)
+            )
+            for i, zodiac1 in enumerate(ZODIAC_CYCLE)
+        )
+
+    @staticmethod
+    def index_for_year(year: int) -> int:
+        return (year - ZODIAC_BASE_YEAR) % 12
+
+    @staticmethod
+    def index_of(zodiac_id: str) -> Optional[int]:
+        return ZODIAC_INDEX.get(zodiac_id)
+
+    def compatibility_json_for(self, zodiac1: str, zodiac2: str) -> bytes:
+        """띠 궁합 응답 (등록되지 않은 ID는 기존 계산 규칙으로 처리)"""
+        i, j = self.index_of(zodiac1), self.index_of(zodiac2)
+        if i is None or j is None:
+            return _serialize({"zodiac1": zodiac1, "zodiac2": zodiac2, "compatibility": check_compatibility(zodiac1, zodiac2)})
+        return self.compatibility_json[i][j]
+
+
+def memoize_until_kst_midnight(func: Callable) -> Callable:
+    """인자 없는 결정적 함수 결과를 KST 자정까지 메모이제이션"""
+    cache: Dict[str, Any] = {}
+
+    @wraps(func)
+    def wrapper():
+        today = kst_today()
+        if cache.get('date') != today:
+            cache['value'] = func(today)
+            cache['date'] = today
+        return cache['value']
+
+    return wrapper
+
+
+zodiac_store = ZodiacStore(ZODIAC_DATA)
@@ -7,17 +7,10 @@ from typing import Dict, Tuple, Optional
 import logging
 import re
 
-logger = logging.getLogger(__name__)
+# KASI API 응답 파싱을 위한 한글-한자 간지 변환 (공용 코덱)
+from shared.hanja_codec import GANJI_HANJA_TO_HANGUL, pillar_to_hanja
 
-# KASI API 응답 파싱을 위한 한글-한자 매핑
-KOREAN_TO_CHINESE_GANJEE = {
-    # 천간
-    '갑': '甲', '을': '乙', '병': '丙', '정': '丁', '무': '戊',
-    '기': '己', '경': '庚', '신': '辛', '임': '壬', '계': '癸',
-    # 지지
-    '자': '子', '축': '丑', '인': '寅', '묘': '卯', '진': '辰', '사': '巳',
-    '오': '午', '미': '未', '신': '申', '유': '酉', '술': '戌', '해': '亥'
-}
+logger = logging.getLogger(__name__)
 
 class KasiApiClient:
     """KASI API 연동 클라이언트"""
@@ -168,9 +161,7 @@ class KasiApiClient:
         chinese_match = re.search(r'\(([^)]+)\)', kasi_text)
         if chinese_match:
             chinese_part = chinese_match.group(1)
-            if all(c in '甲乙丙丁戊己庚辛壬癸子丑寅卯辰巳午未申酉戌亥' for c in chinese_part):
+            if all(c in GANJI_HANJA_TO_HANGUL for c in chinese_part):
                 return chinese_part
-        result = ""
-        for char in re.sub(r'\([^)]*\)', '', kasi_text).strip():
-            result += KOREAN_TO_CHINESE_GANJEE.get(char, char)
+        result = pillar_to_hanja(re.sub(r'\([^)]*\)', '', kasi_text).strip())
         return result if len(result) == 2 else ""
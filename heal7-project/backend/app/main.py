@@ -8,6 +8,8 @@
 
 import os
 import sys
+import json
+import asyncio
 import logging
 from datetime import datetime
 from contextlib import asynccontextmanager
@@ -15,7 +17,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 
@@ -26,6 +28,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # 큐브 시스템 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cubes"))
 
+from core.cube_health_monitor import CubeHealthMonitor
+from shared.prerendered_page import PrerenderedPage
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -41,7 +46,14 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """앱 라이프사이클 관리"""
     logger.info("🚀 Heal7 통합 서버 시작")
+    await cube_health_monitor.start()
     yield
+    await cube_health_monitor.stop()
+    try:
+        from routers.ai_proxy import close_ai_clients
+        await close_ai_clients()
+    except ImportError:
+        pass
     logger.info("🛑 Heal7 통합 서버 종료")
 
 # FastAPI 앱 생성
@@ -129,32 +141,10 @@ CUBE_PORTS = {
     "ai-dashboard": 8080
 }
 
-# 루트 엔드포인트 - HTML 대시보드
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    import httpx
-    
-    # 큐브 상태 확인
-    cube_status = {}
-    for cube_name, port in CUBE_PORTS.items():
-        try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                response = await client.get(f"http://localhost:{port}/health")
-                cube_status[cube_name] = {
-                    "status": "healthy" if response.status_code == 200 else "unhealthy",
-                    "port": port,
-                    "domain": CUBE_REGISTRY.get(cube_name, "N/A")
-                }
-        except:
-            cube_status[cube_name] = {
-                "status": "offline",
-                "port": port,
-                "domain": CUBE_REGISTRY.get(cube_name, "N/A")
-            }
-    
-    healthy_cubes = sum(1 for cube in cube_status.values() if cube["status"] == "healthy")
-    
-    html_content = f"""
+cube_health_monitor = CubeHealthMonitor(CUBE_PORTS)
+
+# 루트 대시보드 - 정적 셸은 한 번만 렌더링/압축하고 동적 값은 /api/dashboard/status 로 조회
+ROOT_DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -162,115 +152,119 @@ async def root():
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🎭 HEAL7 큐브모듈러 대시보드</title>
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             color: #333;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             margin-bottom: 30px;
             color: white;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             font-size: 2.5rem;
             margin-bottom: 10px;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }}
-        .header p {{
+        }
+        .header p {
             font-size: 1.1rem;
             opacity: 0.9;
-        }}
-        .stats-grid {{
+        }
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: rgba(255, 255, 255, 0.95);
             border-radius: 10px;
             padding: 20px;
             text-align: center;
             box-shadow: 0 4px 15px rgba(0,0,0,0.1);
             backdrop-filter: blur(10px);
-        }}
-        .stat-card h3 {{
+        }
+        .stat-card h3 {
             color: #4a5568;
             margin-bottom: 10px;
             font-size: 1.2rem;
-        }}
-        .stat-card .number {{
+        }
+        .stat-card .number {
             font-size: 2rem;
             font-weight: bold;
             color: #2d3748;
-        }}
-        .cubes-grid {{
+        }
+        .cubes-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 20px;
-        }}
-        .cube-card {{
+        }
+        .cube-card {
             background: rgba(255, 255, 255, 0.95);
             border-radius: 10px;
             padding: 20px;
             box-shadow: 0 4px 15px rgba(0,0,0,0.1);
             backdrop-filter: blur(10px);
             transition: transform 0.3s ease;
-        }}
-        .cube-card:hover {{
+        }
+        .cube-card:hover {
             transform: translateY(-5px);
-        }}
-        .cube-header {{
+        }
+        .cube-header {
             display: flex;
             justify-content: between;
             align-items: center;
             margin-bottom: 15px;
-        }}
-        .cube-name {{
+        }
+        .cube-name {
             font-size: 1.3rem;
             font-weight: bold;
             color: #2d3748;
-        }}
-        .status-badge {{
+        }
+        .status-badge {
             padding: 4px 12px;
             border-radius: 20px;
             font-size: 0.8rem;
             font-weight: bold;
             text-transform: uppercase;
-        }}
-        .status-healthy {{
+        }
+        .status-healthy {
             background: #c6f6d5;
             color: #22543d;
-        }}
-        .status-offline {{
+        }
+        .status-offline {
             background: #fed7d7;
             color: #742a2a;
-        }}
-        .status-unhealthy {{
+        }
+        .status-unhealthy {
             background: #fef5e7;
             color: #744210;
-        }}
-        .cube-info {{
+        }
+        .status-unknown {
+            background: #edf2f7;
+            color: #4a5568;
+        }
+        .cube-info {
             color: #4a5568;
             margin-bottom: 10px;
-        }}
-        .cube-info strong {{
+        }
+        .cube-info strong {
             color: #2d3748;
-        }}
-        .cube-links {{
+        }
+        .cube-links {
             display: flex;
             gap: 10px;
             margin-top: 15px;
-        }}
-        .cube-link {{
+        }
+        .cube-link {
             padding: 8px 16px;
             background: #4299e1;
             color: white;
@@ -278,11 +272,11 @@ async def root():
             border-radius: 5px;
             font-size: 0.9rem;
             transition: background 0.3s ease;
-        }}
-        .cube-link:hover {{
+        }
+        .cube-link:hover {
             background: #3182ce;
-        }}
-        .refresh-btn {{
+        }
+        .refresh-btn {
             position: fixed;
             bottom: 20px;
             right: 20px;
@@ -295,16 +289,16 @@ async def root():
             cursor: pointer;
             box-shadow: 0 4px 15px rgba(0,0,0,0.2);
             transition: background 0.3s ease;
-        }}
-        .refresh-btn:hover {{
+        }
+        .refresh-btn:hover {
             background: #38a169;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             text-align: center;
             margin-top: 30px;
             color: rgba(255,255,255,0.8);
             font-size: 0.9rem;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -317,11 +311,11 @@ async def root():
         <div class="stats-grid">
             <div class="stat-card">
                 <h3>📊 총 큐브</h3>
-                <div class="number">{len(CUBE_REGISTRY)}</div>
+                <div class="number" id="total-cubes">-</div>
             </div>
             <div class="stat-card">
                 <h3>✅ 정상 큐브</h3>
-                <div class="number">{healthy_cubes}</div>
+                <div class="number" id="healthy-cubes">-</div>
             </div>
             <div class="stat-card">
                 <h3>⚡ 시스템 상태</h3>
@@ -333,81 +327,95 @@ async def root():
             </div>
         </div>
         
-        <div class="cubes-grid">"""
-
-    for cube_name, cube_info in cube_status.items():
-        status_class = f"status-{cube_info['status']}"
-        status_icon = "✅" if cube_info['status'] == "healthy" else "🔴" if cube_info['status'] == "offline" else "⚠️"
+        <div class="cubes-grid" id="cubes-grid"></div>
+        
+        <button class="refresh-btn" onclick="refreshStatus()">🔄 새로고침</button>
         
-        html_content += f"""
+        <div class="timestamp">
+            마지막 업데이트: <span id="last-updated">-</span> KST
+        </div>
+    </div>
+    
+    <script>
+        const STATUS_ICONS = { healthy: '✅', offline: '🔴', unhealthy: '⚠️', unknown: '⏳' };
+
+        function renderCube(cube) {
+            const url = `http://localhost:${cube.port}`;
+            return `
             <div class="cube-card">
                 <div class="cube-header">
-                    <div class="cube-name">{cube_name}</div>
-                    <span class="{status_class} status-badge">{status_icon} {cube_info['status']}</span>
+                    <div class="cube-name">${cube.name}</div>
+                    <span class="status-${cube.status} status-badge">${STATUS_ICONS[cube.status] || '⚠️'} ${cube.status}</span>
                 </div>
                 <div class="cube-info">
-                    <strong>포트:</strong> {cube_info['port']}<br>
-                    <strong>도메인:</strong> {cube_info['domain']}<br>
-                    <strong>URL:</strong> http://localhost:{cube_info['port']}
+                    <strong>포트:</strong> ${cube.port}<br>
+                    <strong>도메인:</strong> ${cube.domain}<br>
+                    <strong>응답시간:</strong> ${cube.latency_ms !== null ? cube.latency_ms + 'ms' : '-'}<br>
+                    <strong>URL:</strong> ${url}
                 </div>
                 <div class="cube-links">
-                    <a href="http://localhost:{cube_info['port']}/health" class="cube-link" target="_blank">헬스체크</a>
-                    <a href="http://localhost:{cube_info['port']}/docs" class="cube-link" target="_blank">API 문서</a>
+                    <a href="${url}/health" class="cube-link" target="_blank">헬스체크</a>
+                    <a href="${url}/docs" class="cube-link" target="_blank">API 문서</a>
                 </div>
-            </div>"""
+            </div>`;
+        }
 
-    html_content += f"""
-        </div>
-        
-        <button class="refresh-btn" onclick="location.reload()">🔄 새로고침</button>
-        
-        <div class="timestamp">
-            마지막 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} KST
-        </div>
-    </div>
-    
-    <script>
-        // 5분마다 자동 새로고침
-        setTimeout(() => location.reload(), 300000);
-        
-        // 큐브 상태에 따른 실시간 업데이트 (선택적)
-        setInterval(async () => {{
-            try {{
-                const response = await fetch('/health');
+        async function refreshStatus() {
+            try {
+                const response = await fetch('/api/dashboard/status');
                 const data = await response.json();
-                // 상태 업데이트 로직 (필요시 구현)
-            }} catch(e) {{
-                console.log('헬스체크 실패:', e);
-            }}
-        }}, 30000); // 30초마다 체크
+                document.getElementById('total-cubes').textContent = data.total_cubes;
+                document.getElementById('healthy-cubes').textContent = data.healthy_cubes;
+                document.getElementById('cubes-grid').innerHTML = data.cubes.map(renderCube).join('');
+                document.getElementById('last-updated').textContent = data.timestamp;
+            } catch(e) {
+                console.log('상태 조회 실패:', e);
+            }
+        }
+
+        refreshStatus();
+        setInterval(refreshStatus, 30000); // 30초마다 체크
+
+        // 큐브 상태가 바뀌면 즉시 갱신
+        if (window.EventSource) {
+            const events = new EventSource('/api/cubes/events');
+            events.addEventListener('cube_status_changed', refreshStatus);
+        }
     </script>
 </body>
 </html>"""
-    
-    return html_content
 
-# 헬스체크 엔드포인트 (큐브 상태 포함)
+root_dashboard_page = PrerenderedPage(ROOT_DASHBOARD_HTML)
+
+# 루트 엔드포인트 - HTML 대시보드
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
+    return root_dashboard_page.response(request)
+
+# 대시보드 동적 값 (백그라운드 폴러 스냅샷)
+@app.get("/api/dashboard/status")
+async def dashboard_status():
+    cube_status = cube_health_monitor.snapshot()
+    return {
+        "total_cubes": len(CUBE_REGISTRY),
+        "healthy_cubes": sum(1 for cube in cube_status.values() if cube["status"] == "healthy"),
+        "cubes": [
+            {
+                "name": cube_name,
+                "status": cube_info["status"],
+                "port": cube_info["port"],
+                "latency_ms": cube_info["latency_ms"],
+                "domain": CUBE_REGISTRY.get(cube_name, "N/A")
+            }
+            for cube_name, cube_info in cube_status.items()
+        ],
+        "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+# 헬스체크 엔드포인트 (큐브 상태 포함 - 백그라운드 폴러 스냅샷)
 @app.get("/health")
 async def health_check():
-    import httpx
-    
-    # 큐브 상태 확인 (비동기)
-    cube_status = {}
-    for cube_name, port in CUBE_PORTS.items():
-        try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                response = await client.get(f"http://localhost:{port}/health")
-                cube_status[cube_name] = {
-                    "status": "healthy" if response.status_code == 200 else "unhealthy",
-                    "port": port,
-                    "url": f"http://localhost:{port}"
-                }
-        except:
-            cube_status[cube_name] = {
-                "status": "offline",
-                "port": port,
-                "url": f"http://localhost:{port}"
-            }
+    cube_status = cube_health_monitor.snapshot()
     
     healthy_cubes = sum(1 for cube in cube_status.values() if cube["status"] == "healthy")
     total_cubes = len(cube_status)
@@ -457,6 +465,8 @@ async def api_info():
         },
         "cube_management": {
             "health": "/api/cubes/health - 큐브 상태 확인",
+            "events": "/api/cubes/events - 큐브 상태 변화 스트림 (SSE)",
+            "history": "/api/cubes/{cube_name}/history - 큐브 상태/지연 이력",
             "list": "/api/cubes - 큐브 목록",
             "individual": "/api/cubes/{cube_name} - 개별 큐브 정보"
         },
@@ -468,24 +478,17 @@ async def api_info():
 @app.get("/api/cubes")
 async def list_cubes():
     """등록된 큐브 목록"""
-    import httpx
+    cube_status = cube_health_monitor.snapshot()
     
     cube_info = []
     for cube_name, service_domain in CUBE_REGISTRY.items():
         port = CUBE_PORTS[cube_name]
-        try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                response = await client.get(f"http://localhost:{port}/health")
-                status = "healthy" if response.status_code == 200 else "unhealthy"
-        except:
-            status = "offline"
-        
         cube_info.append({
             "name": cube_name,
             "service": service_domain,
             "port": port,
             "url": f"http://localhost:{port}",
-            "status": status,
+            "status": cube_status[cube_name]["status"],
             "docs": f"http://localhost:{port}/docs"
         })
     
@@ -500,6 +503,39 @@ async def cubes_health():
     """모든 큐브 상태 확인"""
     return await health_check()
 
+@app.get("/api/cubes/events")
+async def cubes_events(request: Request):
+    """큐브 상태 변화 이벤트 스트림 (Server-Sent Events)"""
+    queue = cube_health_monitor.subscribe()
+    
+    async def event_stream():
+        try:
+            # 접속 직후 현재 스냅샷 전송
+            yield f"event: snapshot\ndata: {json.dumps(cube_health_monitor.snapshot(), ensure_ascii=False)}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=15.0)
+                    yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            cube_health_monitor.unsubscribe(queue)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@app.get("/api/cubes/{cube_name}/history")
+async def get_cube_history(cube_name: str):
+    """큐브별 상태/지연시간 롤링 이력"""
+    if cube_name not in CUBE_PORTS:
+        raise HTTPException(status_code=404, detail=f"큐브 '{cube_name}'을 찾을 수 없습니다.")
+    
+    return {
+        "name": cube_name,
+        **cube_health_monitor.snapshot()[cube_name],
+        **cube_health_monitor.history(cube_name),
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.get("/api/cubes/{cube_name}")
 async def get_cube_info(cube_name: str):
     """특정 큐브 정보 조회"""
@@ -2,17 +2,31 @@
 """
 AI API 프록시 서버 - CORS 우회 및 보안 강화
 FastAPI 버전으로 변환
+
+- 프로바이더별 장기 유지 커넥션 풀 클라이언트 (HTTP/2 지원 시 사용)
+- SSE 스트리밍 패스스루 (/api/ai-proxy/stream)
+- temperature=0 결정적 요청 응답 캐시
+- .env.ai 는 한 번만 읽고 파일 변경 시에만 재로딩
 """
 
 import os
 import json
+import time
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, AsyncIterator
 import httpx
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+try:
+    import h2  # noqa: F401 - httpx HTTP/2 지원 여부 확인용
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # FastAPI 라우터 생성
@@ -21,6 +35,16 @@ router = APIRouter(
     tags=["ai-proxy"],
 )
 
+ENV_FILE_PATH = '/home/ubuntu/.env.ai'
+AI_KEYS = [
+    'ANTHROPIC_API_KEY', 'OPENAI_API_KEY', 'GOOGLE_AI_API_KEY',
+    'GEMINI_API_KEY', 'CLAUDE_API_KEY'
+]
+
+# 결정적 요청 캐시 설정
+RESPONSE_CACHE_TTL = int(os.getenv('AI_PROXY_CACHE_TTL', '3600'))
+RESPONSE_CACHE_MAX_SIZE = int(os.getenv('AI_PROXY_CACHE_MAX_SIZE', '256'))
+
 # Pydantic 모델
 class AIProxyRequest(BaseModel):
     provider: str
@@ -32,100 +56,130 @@ class AIProxyResponse(BaseModel):
     success: bool
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    cached: bool = False
 
-def load_env_variables() -> Dict[str, str]:
-    """환경변수 로드"""
+_env_cache: Dict[str, Any] = {"mtime": None, "vars": None}
+
+def _read_env_file(env_file_path: str) -> Dict[str, str]:
     env_vars = {}
-    env_file_path = '/home/ubuntu/.env.ai'
-    
-    if os.path.exists(env_file_path):
-        try:
-            with open(env_file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        env_vars[key.strip()] = value.strip().strip('"\'')
-        except Exception as e:
-            logger.error(f"Failed to load .env.ai: {e}")
-    
-    # 시스템 환경변수도 확인
-    ai_keys = [
-        'ANTHROPIC_API_KEY', 'OPENAI_API_KEY', 'GOOGLE_AI_API_KEY',
-        'GEMINI_API_KEY', 'CLAUDE_API_KEY'
-    ]
-    
-    for key in ai_keys:
-        if key in os.environ:
-            env_vars[key] = os.environ[key]
-    
+    try:
+        with open(env_file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and '=' in line and not line.startswith('#'):
+                    key, value = line.split('=', 1)
+                    env_vars[key.strip()] = value.strip().strip('"\'')
+    except Exception as e:
+        logger.error(f"Failed to load .env.ai: {e}")
     return env_vars
 
-async def call_anthropic_api(model: str, prompt: str, options: Dict, api_key: str) -> Dict:
-    """Anthropic Claude API 호출"""
-    headers = {
-        'Content-Type': 'application/json',
-        'x-api-key': api_key,
-        'anthropic-version': '2023-06-01'
-    }
-    
-    data = {
-        'model': model,
-        'max_tokens': options.get('max_tokens', 4000),
-        'messages': [{'role': 'user', 'content': prompt}],
-        'temperature': options.get('temperature', 0.7)
-    }
+def load_env_variables() -> Dict[str, str]:
+    """환경변수 로드 (파일 mtime이 바뀐 경우에만 다시 읽음)"""
+    try:
+        mtime = os.stat(ENV_FILE_PATH).st_mtime
+    except OSError:
+        mtime = None
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            'https://api.anthropic.com/v1/messages',
-            headers=headers,
-            json=data
-        )
+    if _env_cache["vars"] is None or _env_cache["mtime"] != mtime:
+        env_vars = _read_env_file(ENV_FILE_PATH) if mtime is not None else {}
         
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Anthropic API error: {response.text}"
-            )
+        # 시스템 환경변수도 확인
+        for key in AI_KEYS:
+            if key in os.environ:
+                env_vars[key] = os.environ[key]
         
-        return response.json()
-
-async def call_openai_api(model: str, prompt: str, options: Dict, api_key: str) -> Dict:
-    """OpenAI API 호출"""
-    headers = {
-        'Content-Type': 'application/json',
-        'Authorization': f'Bearer {api_key}'
-    }
+        _env_cache["vars"] = env_vars
+        _env_cache["mtime"] = mtime
+        if mtime is not None:
+            logger.info("AI proxy environment loaded from .env.ai")
     
-    data = {
-        'model': model,
-        'messages': [{'role': 'user', 'content': prompt}],
-        'max_tokens': options.get('max_tokens', 4000),
-        'temperature': options.get('temperature', 0.7)
-    }
-    
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            'https://api.openai.com/v1/chat/completions',
-            headers=headers,
-            json=data
+    return _env_cache["vars"]
+
+# 프로바이더별 장기 유지 HTTP 클라이언트
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+def get_client(provider: str) -> httpx.AsyncClient:
+    """프로바이더별 커넥션 풀 클라이언트 (지연 생성 후 재사용)"""
+    client = _clients.get(provider)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=120.0),
+            http2=HTTP2_AVAILABLE
         )
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"OpenAI API error: {response.text}"
-            )
-        
-        return response.json()
+        _clients[provider] = client
+    return client
 
-async def call_gemini_api(model: str, prompt: str, options: Dict, api_key: str) -> Dict:
-    """Google Gemini API 호출"""
+async def close_ai_clients():
+    """서버 종료 시 클라이언트 정리"""
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
+
+# temperature=0 요청 응답 캐시 (키 → (저장 시각, 응답))
+_response_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+
+def make_cache_key(provider: str, model: str, prompt: str, options: Dict) -> Optional[str]:
+    """결정적 요청(temperature=0)인 경우에만 캐시 키 생성"""
+    if options.get('temperature', 0.7) != 0:
+        return None
+    raw = json.dumps([provider, model, prompt, options], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def get_cached_response(key: str) -> Optional[Dict]:
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return result
+
+def store_cached_response(key: str, result: Dict):
+    _response_cache[key] = (time.monotonic(), result)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_MAX_SIZE:
+        _response_cache.popitem(last=False)
+
+def build_provider_request(provider: str, model: str, prompt: str, options: Dict, api_key: str, stream: bool = False) -> Tuple[str, Dict, Dict]:
+    """프로바이더별 (URL, 헤더, 본문) 구성"""
+    if provider == 'anthropic':
+        headers = {
+            'Content-Type': 'application/json',
+            'x-api-key': api_key,
+            'anthropic-version': '2023-06-01'
+        }
+        data = {
+            'model': model,
+            'max_tokens': options.get('max_tokens', 4000),
+            'messages': [{'role': 'user', 'content': prompt}],
+            'temperature': options.get('temperature', 0.7)
+        }
+        if stream:
+            data['stream'] = True
+        return 'https://api.anthropic.com/v1/messages', headers, data
+    
+    if provider == 'openai':
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {api_key}'
+        }
+        data = {
+            'model': model,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': options.get('max_tokens', 4000),
+            'temperature': options.get('temperature', 0.7)
+        }
+        if stream:
+            data['stream'] = True
+        return 'https://api.openai.com/v1/chat/completions', headers, data
+    
+    # google / gemini
     headers = {
         'Content-Type': 'application/json'
     }
-    
     data = {
         'contents': [{'parts': [{'text': prompt}]}],
         'generationConfig': {
@@ -133,19 +187,63 @@ async def call_gemini_api(model: str, prompt: str, options: Dict, api_key: str)
             'temperature': options.get('temperature', 0.7)
         }
     }
+    if stream:
+        url = f'https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={api_key}'
+    else:
+        url = f'https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}'
+    return url, headers, data
+
+async def _post_provider(provider: str, label: str, model: str, prompt: str, options: Dict, api_key: str) -> Dict:
+    url, headers, data = build_provider_request(provider, model, prompt, options, api_key)
+    response = await get_client(provider).post(url, headers=headers, json=data)
     
-    url = f'https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}'
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"{label} API error: {response.text}"
+        )
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(url, headers=headers, json=data)
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Gemini API error: {response.text}"
-            )
-        
-        return response.json()
+    return response.json()
+
+async def call_anthropic_api(model: str, prompt: str, options: Dict, api_key: str) -> Dict:
+    """Anthropic Claude API 호출"""
+    return await _post_provider('anthropic', 'Anthropic', model, prompt, options, api_key)
+
+async def call_openai_api(model: str, prompt: str, options: Dict, api_key: str) -> Dict:
+    """OpenAI API 호출"""
+    return await _post_provider('openai', 'OpenAI', model, prompt, options, api_key)
+
+async def call_gemini_api(model: str, prompt: str, options: Dict, api_key: str) -> Dict:
+    """Google Gemini API 호출"""
+    return await _post_provider('google', 'Gemini', model, prompt, options, api_key)
+
+def resolve_provider(provider: str, env_vars: Dict[str, str]) -> Tuple[str, str]:
+    """프로바이더 이름 정규화 및 API 키 조회"""
+    if provider == 'anthropic':
+        api_key = env_vars.get('ANTHROPIC_API_KEY') or env_vars.get('CLAUDE_API_KEY')
+        if not api_key:
+            raise HTTPException(status_code=400, detail="Anthropic API key not found")
+        return 'anthropic', api_key
+    
+    if provider == 'openai':
+        api_key = env_vars.get('OPENAI_API_KEY')
+        if not api_key:
+            raise HTTPException(status_code=400, detail="OpenAI API key not found")
+        return 'openai', api_key
+    
+    if provider == 'google' or provider == 'gemini':
+        api_key = env_vars.get('GOOGLE_AI_API_KEY') or env_vars.get('GEMINI_API_KEY')
+        if not api_key:
+            raise HTTPException(status_code=400, detail="Google AI API key not found")
+        return 'google', api_key
+    
+    raise HTTPException(status_code=400, detail=f"Unsupported provider: {provider}")
+
+PROVIDER_CALLS = {
+    'anthropic': call_anthropic_api,
+    'openai': call_openai_api,
+    'google': call_gemini_api,
+}
 
 @router.post("", response_model=AIProxyResponse)
 async def ai_proxy(request: AIProxyRequest):
@@ -154,35 +252,23 @@ async def ai_proxy(request: AIProxyRequest):
         # 환경변수 로드
         env_vars = load_env_variables()
         
-        provider = request.provider.lower()
+        provider, api_key = resolve_provider(request.provider.lower(), env_vars)
         model = request.model
         prompt = request.prompt
-        options = request.options
+        options = request.options or {}
+        
+        # 결정적 요청은 캐시 조회
+        cache_key = make_cache_key(provider, model, prompt, options)
+        if cache_key:
+            cached = get_cached_response(cache_key)
+            if cached is not None:
+                return AIProxyResponse(success=True, data=cached, cached=True)
         
         # 프로바이더별 API 호출
-        if provider == 'anthropic':
-            api_key = env_vars.get('ANTHROPIC_API_KEY') or env_vars.get('CLAUDE_API_KEY')
-            if not api_key:
-                raise HTTPException(status_code=400, detail="Anthropic API key not found")
-            
-            result = await call_anthropic_api(model, prompt, options, api_key)
-            
-        elif provider == 'openai':
-            api_key = env_vars.get('OPENAI_API_KEY')
-            if not api_key:
-                raise HTTPException(status_code=400, detail="OpenAI API key not found")
-            
-            result = await call_openai_api(model, prompt, options, api_key)
-            
-        elif provider == 'google' or provider == 'gemini':
-            api_key = env_vars.get('GOOGLE_AI_API_KEY') or env_vars.get('GEMINI_API_KEY')
-            if not api_key:
-                raise HTTPException(status_code=400, detail="Google AI API key not found")
-            
-            result = await call_gemini_api(model, prompt, options, api_key)
-            
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported provider: {provider}")
+        result = await PROVIDER_CALLS[provider](model, prompt, options, api_key)
+        
+        if cache_key:
+            store_cached_response(cache_key, result)
         
         return AIProxyResponse(
             success=True,
@@ -198,6 +284,36 @@ async def ai_proxy(request: AIProxyRequest):
             error=str(e)
         )
 
+@router.post("/stream")
+async def ai_proxy_stream(request: AIProxyRequest):
+    """AI API 스트리밍 프록시 - 프로바이더 SSE 이벤트를 그대로 전달"""
+    env_vars = load_env_variables()
+    provider, api_key = resolve_provider(request.provider.lower(), env_vars)
+    url, headers, data = build_provider_request(
+        provider, request.model, request.prompt, request.options or {}, api_key, stream=True
+    )
+    
+    async def relay() -> AsyncIterator[bytes]:
+        try:
+            async with get_client(provider).stream('POST', url, headers=headers, json=data) as response:
+                if response.status_code != 200:
+                    error_body = (await response.aread()).decode('utf-8', errors='replace')
+                    error = json.dumps({"status_code": response.status_code, "error": error_body}, ensure_ascii=False)
+                    yield f"event: error\ndata: {error}\n\n".encode('utf-8')
+                    return
+                
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+        except Exception as e:
+            logger.error(f"AI proxy stream error: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)}, ensure_ascii=False)}\n\n".encode('utf-8')
+    
+    return StreamingResponse(
+        relay(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/health")
 async def health_check():
     """헬스 체크"""
@@ -215,5 +331,7 @@ async def health_check():
         "status": "healthy",
         "service": "AI Proxy",
         "available_providers": available_providers,
-        "total_providers": len(available_providers)
+        "total_providers": len(available_providers),
+        "http2": HTTP2_AVAILABLE,
+        "cached_responses": len(_response_cache)
     }
\ No newline at end of file
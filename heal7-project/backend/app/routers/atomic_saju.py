@@ -19,13 +19,10 @@ from typing import Optional, Dict, Any
 import logging
 
 # atomic 모듈 import
-from ..core.atomic import (
-    calculate_gapja, get_gapja_by_date,
-    solar_to_lunar_sync, lunar_to_solar_sync,
-    calculate_year_pillar, calculate_month_pillar, 
-    calculate_day_pillar, calculate_time_pillar
-)
-from ..core.atomic.constants import GANJI_60, CHEONGAN, JIJI
+from core.atomic import calculate_gapja, solar_to_lunar, lunar_to_solar
+from core.atomic.constants import GANJI_60, CHEONGAN, JIJI
+from core.atomic.pillar_calculator import PillarCalculator
+from shared.saju_pillars import saju_pillar_facade
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/atomic/saju", tags=["Atomic Saju"])
@@ -258,7 +255,7 @@ async def convert_lunar_api(
         if direction == "solar_to_lunar":
             # 양력 → 음력
             solar_date = date(year, month, day)
-            result = solar_to_lunar_sync(solar_date)
+            result = await solar_to_lunar(solar_date)
             
             if result.success:
                 response_data = {
@@ -287,7 +284,7 @@ async def convert_lunar_api(
                 
         else:
             # 음력 → 양력
-            result = lunar_to_solar_sync(year, month, day, is_leap)
+            result = await lunar_to_solar(year, month, day, is_leap)
             
             if result.success:
                 response_data = {
@@ -342,7 +339,8 @@ async def health_check():
             "gapja_count": len(GANJI_60),
             "cheongan_count": len(CHEONGAN),
             "jiji_count": len(JIJI)
-        }
+        },
+        "pillar_cache": saju_pillar_facade.cache_info()
     }
 
 @router.get("/constants")
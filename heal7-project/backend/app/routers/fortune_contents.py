@@ -4,6 +4,7 @@ HEAL7 운세 콘텐츠 API
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional, Any
 from datetime import datetime, date
@@ -41,34 +42,24 @@ class ZodiacCompatibility(BaseModel):
     advice: List[str]
 
 # --- 12지신 데이터 ---
-def get_zodiac_data():
-    """12지신 띠 데이터 반환"""
-    from app.data.zodiac_data import ZODIAC_DATA, calculate_zodiac, check_compatibility, get_all_zodiac_signs
-    return ZODIAC_DATA, calculate_zodiac, check_compatibility, get_all_zodiac_signs
+# 시작 시 한 번 인덱싱/직렬화된 불변 저장소에서 조회
+from app.data.fortune_store import zodiac_store
+
+def json_bytes_response(content: bytes) -> Response:
+    """미리 직렬화된 JSON 바이트 응답"""
+    return Response(content=content, media_type="application/json")
 
 # --- API 엔드포인트들 ---
 
 @router.get("/zodiac-signs", response_model=List[Dict])
 async def get_all_zodiac_signs():
     """모든 12지신 띠 정보 조회"""
-    try:
-        _, _, _, all_signs_func = get_zodiac_data()
-        return all_signs_func()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"띠 정보 조회 오류: {str(e)}")
+    return json_bytes_response(zodiac_store.all_signs_json)
 
 @router.get("/zodiac-by-year/{year}")
 async def get_zodiac_by_year(year: int):
     """출생년도로 띠 조회"""
-    try:
-        zodiac_data, calculate_func, _, _ = get_zodiac_data()
-        zodiac_id = calculate_func(year)
-        if zodiac_id in zodiac_data:
-            return zodiac_data[zodiac_id]
-        else:
-            raise HTTPException(status_code=404, detail="해당 년도의 띠 정보를 찾을 수 없습니다.")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"띠 계산 오류: {str(e)}")
+    return json_bytes_response(zodiac_store.sign_json[zodiac_store.index_for_year(year)])
 
 @router.get("/zodiac-compatibility")
 async def get_zodiac_compatibility(
@@ -76,30 +67,15 @@ async def get_zodiac_compatibility(
     zodiac2: str = Query(..., description="두 번째 띠")
 ):
     """두 띠 간의 궁합 분석"""
-    try:
-        _, _, compatibility_func, _ = get_zodiac_data()
-        compatibility = compatibility_func(zodiac1, zodiac2)
-        return {"zodiac1": zodiac1, "zodiac2": zodiac2, "compatibility": compatibility}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"궁합 분석 오류: {str(e)}")
+    return json_bytes_response(zodiac_store.compatibility_json_for(zodiac1, zodiac2))
 
 @router.get("/zodiac-fortune-2025/{zodiac_id}")
 async def get_zodiac_fortune_2025(zodiac_id: str):
     """2025년 띠별 운세"""
-    try:
-        zodiac_data, _, _, _ = get_zodiac_data()
-        if zodiac_id not in zodiac_data:
-            raise HTTPException(status_code=404, detail="해당 띠를 찾을 수 없습니다.")
-        
-        zodiac = zodiac_data[zodiac_id]
-        return {
-            "zodiac_id": zodiac_id,
-            "zodiac_name": zodiac.get("name", zodiac_id),
-            "year": 2025,
-            "fortune": zodiac.get("fortune_2025", {})
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"2025년 운세 조회 오류: {str(e)}")
+    index = zodiac_store.index_of(zodiac_id)
+    if index is None:
+        raise HTTPException(status_code=404, detail="해당 띠를 찾을 수 없습니다.")
+    return json_bytes_response(zodiac_store.fortune_2025_json[index])
 
 @router.get("/health")
 async def health_check():
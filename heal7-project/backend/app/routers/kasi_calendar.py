@@ -14,21 +14,16 @@ import os
 # 사주 시스템 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# KASI 계산기 코어 임포트
+# 공용 사주 파사드 임포트 (절기/음양력 오프라인 테이블 + 공유 캐시)
 try:
-    from core.engines.saju_system.kasi_calculator_core import KasiCalculatorCore
+    from shared.saju_pillars import saju_pillar_facade, GAPJA_60, YEAR_REFERENCE, YEAR_REFERENCE_INDEX
 except ImportError as e:
-    logging.error(f"KASI 계산기 코어 임포트 실패: {e}")
-    KasiCalculatorCore = None
+    logging.error(f"사주 파사드 임포트 실패: {e}")
+    saju_pillar_facade = None
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# KASI 계산기 인스턴스
-kasi_calculator = None
-if KasiCalculatorCore:
-    kasi_calculator = KasiCalculatorCore()
-
 @router.get("/kasi/calendar")
 async def get_kasi_calendar(
     year: int = Query(..., description="년도", example=2025),
@@ -49,36 +44,31 @@ async def get_kasi_calendar(
                 detail="잘못된 날짜 형식입니다. 유효한 년/월/일을 입력해주세요."
             )
         
-        # KASI 계산기 사용 가능 여부 확인
-        if not kasi_calculator:
-            logger.error("KASI 계산기를 사용할 수 없습니다")
+        # 공용 사주 파사드 사용 가능 여부 확인
+        if not saju_pillar_facade:
+            logger.error("사주 파사드를 사용할 수 없습니다")
             return _get_fallback_calendar_data(year, month, day)
         
-        # KASI API를 통한 사주 계산 (12시 기본값 사용)
-        saju_result = kasi_calculator.calculate_saju(
-            year=year, 
-            month=month, 
-            day=day, 
-            hour=12, 
-            minute=0, 
-            is_lunar=False
-        )
-        
-        if not saju_result:
-            logger.warning(f"KASI API 계산 실패, 폴백 데이터 사용: {year}-{month:02d}-{day:02d}")
+        # 사주 계산 (12시 기본값 사용, 다른 사주 엔진과 캐시 공유)
+        saju_result = saju_pillar_facade.calculate(year, month, day, 12, 0)
+        
+        if not saju_result.lunar:
+            logger.warning(f"음력 변환 범위 밖, 폴백 데이터 사용: {year}-{month:02d}-{day:02d}")
             return _get_fallback_calendar_data(year, month, day)
         
+        lun_year, lun_month, lun_day, is_leap = saju_result.lunar
+        
         # 응답 데이터 구성
         response_data = {
             "success": True,
             "data": {
-                "lunYear": str(year),
-                "lunMonth": f"{month:02d}",
-                "lunDay": f"{day:02d}",
-                "lunLeapmonth": "평",  # 기본값
-                "lunIljin": _extract_daily_stem_branch(saju_result),
-                "lunSecha": f"{year}년주",
-                "lunWolgeon": f"{month}월주",
+                "lunYear": str(lun_year),
+                "lunMonth": f"{lun_month:02d}",
+                "lunDay": f"{lun_day:02d}",
+                "lunLeapmonth": "윤" if is_leap else "평",
+                "lunIljin": saju_result.day,
+                "lunSecha": GAPJA_60[(lun_year - YEAR_REFERENCE + YEAR_REFERENCE_INDEX) % 60],
+                "lunWolgeon": saju_result.month,
                 "solWeek": str(_get_day_of_week(year, month, day))
             },
             "source": "heal7_reliable_calculation",
@@ -120,40 +110,6 @@ def _validate_date_input(year: int, month: int, day: int) -> bool:
     except (ValueError, TypeError):
         return False
 
-def _extract_daily_stem_branch(saju_result: Dict) -> str:
-    """사주 결과에서 일간지 추출"""
-    try:
-        if not saju_result or 'pillars' not in saju_result:
-            return "기본값"
-        
-        pillars = saju_result['pillars']
-        
-        # 일주에서 간지 추출
-        if 'day' in pillars and pillars['day']:
-            day_pillar = pillars['day']
-            if isinstance(day_pillar, dict):
-                stem = day_pillar.get('heavenly_stem', '')
-                branch = day_pillar.get('earthly_branch', '')
-                if stem and branch:
-                    return f"{stem}{branch}"
-            elif isinstance(day_pillar, str):
-                return day_pillar
-        
-        # 일간 정보에서 추출 시도
-        if 'ilgan' in saju_result:
-            ilgan_info = saju_result['ilgan']
-            if isinstance(ilgan_info, dict) and 'stem' in ilgan_info:
-                stem = ilgan_info['stem']
-                branch = ilgan_info.get('branch', '')
-                if stem and branch:
-                    return f"{stem}{branch}"
-        
-        return "기본값"
-        
-    except Exception as e:
-        logger.warning(f"일간지 추출 실패: {e}")
-        return "기본값"
-
 def _get_day_of_week(year: int, month: int, day: int) -> int:
     """요일 계산 (1=월요일, 7=일요일)"""
     try:
@@ -168,15 +124,15 @@ def _get_day_of_week(year: int, month: int, day: int) -> int:
         return 1  # 기본값: 월요일
 
 def _get_fallback_calendar_data(year: int, month: int, day: int) -> Dict[str, Any]:
-    """KASI API 실패 시 사용할 폴백 캘린더 데이터"""
+    """파사드 사용 불가 시 사용할 폴백 캘린더 데이터"""
     try:
-        # 기본적인 60갑자 계산 (1900년 1월 31일 = 갑진일 기준)
+        # 기본적인 60갑자 계산 (1900년 1월 31일 = 갑진일 기준, 60갑자 인덱스 40)
         reference_date = datetime(1900, 1, 31)  # 갑진일 기준
         target_date = datetime(year, month, day)
         days_diff = (target_date - reference_date).days
         
         # 60갑자 순환 계산
-        ganja_index = days_diff % 60
+        ganja_index = (days_diff + 40) % 60
         
         # 천간 지지 배열 (갑자부터 시작)
         cheongan = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
@@ -231,7 +187,8 @@ async def kasi_health_check():
         return {
             "status": "healthy",
             "service": "kasi-calendar-api",
-            "kasi_calculator_available": kasi_calculator is not None,
+            "saju_facade_available": saju_pillar_facade is not None,
+            "pillar_cache": saju_pillar_facade.cache_info() if saju_pillar_facade else None,
             "test_calculation": {
                 "date": "2025-09-05",
                 "success": test_result.get("success", False),
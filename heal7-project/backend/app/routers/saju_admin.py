@@ -5,7 +5,9 @@ HEAL7 사주명리학 관리자 API
 
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict, List, Optional, Any
+from pydantic import ValidationError
+from typing import Callable, Dict, List, Optional, Any
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -14,8 +16,17 @@ from pathlib import Path
 try:
     from ..core.config.saju_admin_settings import (
         SajuAdminSettings,
+        TimeSettings,
+        GeographicSettings,
+        SajuLogicSettings,
+        KasiSettings,
+        CheonganInterpretation,
+        JijiInterpretation,
+        GapjaInterpretation,
         get_admin_settings as get_real_admin_settings,
-        update_admin_settings
+        update_admin_settings,
+        admin_settings_store,
+        default_admin_settings
     )
 except ImportError:
     # 상대경로 임포트 실패 시 절대경로로 시도
@@ -24,8 +35,17 @@ except ImportError:
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core', 'config'))
     from saju_admin_settings import (
         SajuAdminSettings,
+        TimeSettings,
+        GeographicSettings,
+        SajuLogicSettings,
+        KasiSettings,
+        CheonganInterpretation,
+        JijiInterpretation,
+        GapjaInterpretation,
         get_admin_settings as get_real_admin_settings,
-        update_admin_settings
+        update_admin_settings,
+        admin_settings_store,
+        default_admin_settings
     )
 from datetime import datetime
 
@@ -36,8 +56,15 @@ def get_admin_settings():
 router = APIRouter(prefix="/api/admin/saju", tags=["사주 관리자"])
 security = HTTPBearer()
 
-# 설정 파일 경로
-SETTINGS_FILE_PATH = "/home/ubuntu/heal7-project/backend/data/saju_admin_settings.json"
+# 설정 파일 경로 (설정 저장소가 원자적으로 기록)
+SETTINGS_FILE_PATH = admin_settings_store.file_path
+
+async def update_settings_store(mutate: Callable[[Dict[str, Any]], None]):
+    """설정 저장소 갱신 (파일 잠금/기록/fsync 는 스레드에서 실행해 이벤트 루프를 막지 않음, 검증 실패는 422)"""
+    try:
+        return await asyncio.to_thread(admin_settings_store.update, mutate)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=json.loads(e.json()))
 
 def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """관리자 토큰 검증 (임시로 간단한 토큰 체크)"""
@@ -85,20 +112,16 @@ async def save_all_settings(
 ) -> Dict[str, str]:
     """전체 사주 관리자 설정을 저장합니다."""
     try:
-        # 데이터 디렉토리 생성
-        os.makedirs(os.path.dirname(SETTINGS_FILE_PATH), exist_ok=True)
-        
         # 실제 설정 인스턴스가 아닌 경우 변환 필요
         if not isinstance(settings, SajuAdminSettings):
             settings = SajuAdminSettings(**settings)
         
-        # 파일로 저장
-        settings.save_to_file(SETTINGS_FILE_PATH)
-        
-        # 메모리에도 업데이트
-        update_admin_settings(settings)
+        # 새 스냅샷으로 교체 (파일 저장 + 다른 워커 무효화)
+        await asyncio.to_thread(update_admin_settings, settings)
         
         return {"message": "설정이 성공적으로 저장되었습니다.", "file_path": SETTINGS_FILE_PATH}
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=json.loads(e.json()))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"설정 저장 실패: {str(e)}")
 
@@ -112,13 +135,11 @@ async def get_time_settings(token: str = Depends(verify_admin_token)) -> Dict[st
 
 @router.put("/settings/time", summary="시간 설정 업데이트")
 async def update_time_settings(
-    time_settings: Dict[str, Any],
+    time_settings: TimeSettings,
     token: str = Depends(verify_admin_token)
 ) -> Dict[str, str]:
     """시간 관련 설정을 업데이트합니다."""
-    settings = get_admin_settings()
-    settings.time_settings = time_settings
-    settings.save_to_file(SETTINGS_FILE_PATH)
+    await update_settings_store(lambda data: data.__setitem__('time_settings', time_settings.model_dump()))
     return {"message": "시간 설정이 업데이트되었습니다."}
 
 @router.get("/settings/geographic", summary="지리적 설정 조회") 
@@ -129,13 +150,11 @@ async def get_geographic_settings(token: str = Depends(verify_admin_token)) -> D
 
 @router.put("/settings/geographic", summary="지리적 설정 업데이트")
 async def update_geographic_settings(
-    geographic_settings: Dict[str, Any],
+    geographic_settings: GeographicSettings,
     token: str = Depends(verify_admin_token)
 ) -> Dict[str, str]:
     """지리적 설정을 업데이트합니다."""
-    settings = get_admin_settings()
-    settings.geographic_settings = geographic_settings
-    settings.save_to_file(SETTINGS_FILE_PATH)
+    await update_settings_store(lambda data: data.__setitem__('geographic_settings', geographic_settings.model_dump()))
     return {"message": "지리적 설정이 업데이트되었습니다."}
 
 @router.get("/settings/logic", summary="사주 로직 설정 조회")
@@ -146,13 +165,11 @@ async def get_logic_settings(token: str = Depends(verify_admin_token)) -> Dict[s
 
 @router.put("/settings/logic", summary="사주 로직 설정 업데이트")
 async def update_logic_settings(
-    logic_settings: Dict[str, Any],
+    logic_settings: SajuLogicSettings,
     token: str = Depends(verify_admin_token)
 ) -> Dict[str, str]:
     """사주 로직 설정을 업데이트합니다."""
-    settings = get_admin_settings()
-    settings.logic_settings = logic_settings
-    settings.save_to_file(SETTINGS_FILE_PATH)
+    await update_settings_store(lambda data: data.__setitem__('logic_settings', logic_settings.model_dump()))
     return {"message": "사주 로직 설정이 업데이트되었습니다."}
 
 @router.get("/settings/kasi", summary="KASI 설정 조회")
@@ -163,13 +180,11 @@ async def get_kasi_settings(token: str = Depends(verify_admin_token)) -> Dict[st
 
 @router.put("/settings/kasi", summary="KASI 설정 업데이트")
 async def update_kasi_settings(
-    kasi_settings: Dict[str, Any],
+    kasi_settings: KasiSettings,
     token: str = Depends(verify_admin_token)
 ) -> Dict[str, str]:
     """KASI API 설정을 업데이트합니다."""
-    settings = get_admin_settings()
-    settings.kasi_settings = kasi_settings
-    settings.save_to_file(SETTINGS_FILE_PATH)
+    await update_settings_store(lambda data: data.__setitem__('kasi_settings', kasi_settings.model_dump()))
     return {"message": "KASI 설정이 업데이트되었습니다."}
 
 # --- 해석 데이터 관리 ---
@@ -185,13 +200,13 @@ async def get_cheongan_interpretations(
 @router.put("/interpretations/cheongan/{cheongan_name}", summary="천간 해석 업데이트")
 async def update_cheongan_interpretation(
     cheongan_name: str,
-    interpretation: Dict[str, Any],
+    interpretation: CheonganInterpretation,
     token: str = Depends(verify_admin_token)
 ) -> Dict[str, str]:
     """특정 천간의 해석을 업데이트합니다."""
-    settings = get_admin_settings()
-    settings.cheongan_interpretations[cheongan_name] = interpretation
-    settings.save_to_file(SETTINGS_FILE_PATH)
+    await update_settings_store(
+        lambda data: data['cheongan_interpretations'].__setitem__(cheongan_name, interpretation.model_dump())
+    )
     return {"message": f"천간 '{cheongan_name}' 해석이 업데이트되었습니다."}
 
 @router.delete("/interpretations/cheongan/{cheongan_name}", summary="천간 해석 삭제")
@@ -202,8 +217,7 @@ async def delete_cheongan_interpretation(
     """특정 천간의 해석을 삭제합니다."""
     settings = get_admin_settings()
     if cheongan_name in settings.cheongan_interpretations:
-        del settings.cheongan_interpretations[cheongan_name]
-        settings.save_to_file(SETTINGS_FILE_PATH)
+        await update_settings_store(lambda data: data['cheongan_interpretations'].pop(cheongan_name, None))
         return {"message": f"천간 '{cheongan_name}' 해석이 삭제되었습니다."}
     else:
         raise HTTPException(status_code=404, detail=f"천간 '{cheongan_name}'을 찾을 수 없습니다.")
@@ -219,13 +233,13 @@ async def get_jiji_interpretations(
 @router.put("/interpretations/jiji/{jiji_name}", summary="지지 해석 업데이트")
 async def update_jiji_interpretation(
     jiji_name: str,
-    interpretation: Dict[str, Any],
+    interpretation: JijiInterpretation,
     token: str = Depends(verify_admin_token)
 ) -> Dict[str, str]:
     """특정 지지의 해석을 업데이트합니다."""
-    settings = get_admin_settings()
-    settings.jiji_interpretations[jiji_name] = interpretation
-    settings.save_to_file(SETTINGS_FILE_PATH)
+    await update_settings_store(
+        lambda data: data['jiji_interpretations'].__setitem__(jiji_name, interpretation.model_dump())
+    )
     return {"message": f"지지 '{jiji_name}' 해석이 업데이트되었습니다."}
 
 @router.get("/interpretations/gapja", summary="60갑자 해석 조회")
@@ -239,13 +253,13 @@ async def get_gapja_interpretations(
 @router.put("/interpretations/gapja/{gapja_name}", summary="60갑자 해석 업데이트")
 async def update_gapja_interpretation(
     gapja_name: str,
-    interpretation: Dict[str, Any],
+    interpretation: GapjaInterpretation,
     token: str = Depends(verify_admin_token)
 ) -> Dict[str, str]:
     """특정 60갑자의 해석을 업데이트합니다."""
-    settings = get_admin_settings()
-    settings.gapja_interpretations[gapja_name] = interpretation
-    settings.save_to_file(SETTINGS_FILE_PATH)
+    await update_settings_store(
+        lambda data: data['gapja_interpretations'].__setitem__(gapja_name, interpretation.model_dump())
+    )
     return {"message": f"60갑자 '{gapja_name}' 해석이 업데이트되었습니다."}
 
 # --- 시스템 상태 조회 ---
@@ -253,10 +267,12 @@ async def update_gapja_interpretation(
 @router.get("/status", summary="사주 시스템 상태 조회")
 async def get_system_status(token: str = Depends(verify_admin_token)) -> Dict[str, Any]:
     """사주 계산 시스템의 현재 상태를 조회합니다."""
-    settings = get_admin_settings()
+    snapshot = admin_settings_store.current()
+    settings = snapshot.settings
     
     return {
         "version": settings.version,
+        "snapshot_version": snapshot.version,
         "last_updated": settings.last_updated,
         "updated_by": settings.updated_by,
         "settings_file_exists": os.path.exists(SETTINGS_FILE_PATH),
@@ -1039,11 +1055,8 @@ async def get_recent_activities(
 async def initialize_default_settings(token: str = Depends(verify_admin_token)) -> Dict[str, str]:
     """기본 설정 데이터로 초기화합니다."""
     try:
-        # 기본 설정 생성
-        settings = get_admin_settings()
-        
-        # 파일로 저장
-        settings.save_to_file(SETTINGS_FILE_PATH)
+        # 기본 설정으로 설정 파일 덮어쓰기
+        await asyncio.to_thread(admin_settings_store.replace, default_admin_settings(), updated_by="admin")
         
         return {"message": "기본 설정으로 초기화가 완료되었습니다."}
     except Exception as e:
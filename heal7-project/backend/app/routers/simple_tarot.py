@@ -4,11 +4,14 @@ Simple Tarot API
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Tuple
 from datetime import datetime
 import random
 
+from app.data.fortune_store import memoize_until_kst_midnight
+
 router = APIRouter(prefix="/fortune/tarot", tags=["타로"])
 
 class TarotCard(BaseModel):
@@ -52,6 +55,37 @@ TAROT_CARDS = [
     {"name": "세계(The World)", "meaning": "완성, 성취, 통합"},
 ]
 
+# 연애와 관련성 높은 카드들
+LOVE_RELATED_CARDS = [
+    {"name": "연인(The Lovers)", "meaning": "진정한 사랑, 운명적 만남"},
+    {"name": "여교황(The High Priestess)", "meaning": "직감적 사랑, 내면의 목소리"},
+    {"name": "여황제(The Empress)", "meaning": "매력적 관계, 풍요로운 사랑"},
+    {"name": "별(The Star)", "meaning": "희망적 연애, 이상적 관계"},
+    {"name": "태양(The Sun)", "meaning": "행복한 관계, 밝은 연애"},
+    {"name": "운명의 바퀴(Wheel of Fortune)", "meaning": "연애 운의 변화"},
+]
+
+class DeckCard(NamedTuple):
+    """불변 덱 카드 (이미지 URL 사전 계산)"""
+    name: str
+    meaning: str
+    image_url: str
+
+def build_deck(cards: List[dict]) -> Tuple[DeckCard, ...]:
+    """카드 데이터를 불변 덱 배열로 변환"""
+    return tuple(
+        DeckCard(
+            name=card["name"],
+            meaning=card["meaning"],
+            image_url=f"/api/tarot/images/{card['name'].split('(')[0].strip()}.jpg"
+        )
+        for card in cards
+    )
+
+# 시작 시 한 번만 구성하는 덱 배열
+TAROT_DECK = build_deck(TAROT_CARDS)
+LOVE_DECK = build_deck(LOVE_RELATED_CARDS)
+
 @router.get("/draw-card", summary="1장 뽑기")
 async def draw_single_card(
     question: str = Query(..., description="질문 또는 고민")
@@ -59,14 +93,14 @@ async def draw_single_card(
     """간단한 1장 타로 카드 뽑기"""
     
     # 랜덤하게 카드 선택
-    card_data = random.choice(TAROT_CARDS)
+    card_data = random.choice(TAROT_DECK)
     reversed = random.choice([True, False])
     
     card = TarotCard(
-        name=card_data["name"],
-        meaning=card_data["meaning"],
+        name=card_data.name,
+        meaning=card_data.meaning,
         reversed=reversed,
-        image_url=f"/api/tarot/images/{card_data['name'].split('(')[0].strip()}.jpg"
+        image_url=card_data.image_url
     )
     
     # 간단한 해석 생성
@@ -91,17 +125,17 @@ async def three_card_spread(
     """과거-현재-미래 3장 타로 스프레드"""
     
     # 3장의 서로 다른 카드 선택
-    selected_cards_data = random.sample(TAROT_CARDS, 3)
+    selected_cards_data = random.sample(TAROT_DECK, 3)
     cards = []
     positions = ["과거", "현재", "미래"]
     
     for i, card_data in enumerate(selected_cards_data):
         reversed = random.choice([True, False])
         card = TarotCard(
-            name=f"{positions[i]} - {card_data['name']}",
-            meaning=card_data["meaning"],
+            name=f"{positions[i]} - {card_data.name}",
+            meaning=card_data.meaning,
             reversed=reversed,
-            image_url=f"/api/tarot/images/{card_data['name'].split('(')[0].strip()}.jpg"
+            image_url=card_data.image_url
         )
         cards.append(card)
     
@@ -127,26 +161,16 @@ async def love_reading(
 ) -> TarotReading:
     """연애 운세 전용 타로 리딩"""
     
-    # 연애와 관련성 높은 카드들을 우선 선택
-    love_related_cards = [
-        {"name": "연인(The Lovers)", "meaning": "진정한 사랑, 운명적 만남"},
-        {"name": "여교황(The High Priestess)", "meaning": "직감적 사랑, 내면의 목소리"},
-        {"name": "여황제(The Empress)", "meaning": "매력적 관계, 풍요로운 사랑"},
-        {"name": "별(The Star)", "meaning": "희망적 연애, 이상적 관계"},
-        {"name": "태양(The Sun)", "meaning": "행복한 관계, 밝은 연애"},
-        {"name": "운명의 바퀴(Wheel of Fortune)", "meaning": "연애 운의 변화"},
-    ]
-    
-    # 일반 카드와 연애 카드 중에서 선택
-    all_cards = love_related_cards + random.sample(TAROT_CARDS, 5)
+    # 연애 카드와 일반 카드 중에서 선택
+    all_cards = LOVE_DECK + tuple(random.sample(TAROT_DECK, 5))
     selected_card_data = random.choice(all_cards)
     reversed = random.choice([True, False])
     
     card = TarotCard(
-        name=selected_card_data["name"],
-        meaning=selected_card_data["meaning"],
+        name=selected_card_data.name,
+        meaning=selected_card_data.meaning,
         reversed=reversed,
-        image_url=f"/api/tarot/images/{selected_card_data['name'].split('(')[0].strip()}.jpg"
+        image_url=selected_card_data.image_url
     )
     
     # 연애 특화 해석
@@ -164,22 +188,20 @@ async def love_reading(
         advice=advice
     )
 
-@router.get("/daily-card", summary="오늘의 카드")
-async def daily_card() -> TarotReading:
-    """오늘의 타로 카드"""
-    
-    # 날짜 기반으로 시드 설정 (같은 날에는 같은 카드)
-    today = datetime.now().date()
-    random.seed(str(today))
+@memoize_until_kst_midnight
+def build_daily_reading(today) -> bytes:
+    """날짜별 오늘의 카드 리딩 (KST 자정까지 직렬화된 결과 재사용)"""
+    # 날짜 기반 시드 (같은 날에는 같은 카드, 전역 random 상태는 건드리지 않음)
+    rng = random.Random(str(today))
     
-    card_data = random.choice(TAROT_CARDS)
-    reversed = random.choice([True, False])
+    card_data = rng.choice(TAROT_DECK)
+    reversed = rng.choice([True, False])
     
     card = TarotCard(
-        name=card_data["name"],
-        meaning=card_data["meaning"],
+        name=card_data.name,
+        meaning=card_data.meaning,
         reversed=reversed,
-        image_url=f"/api/tarot/images/{card_data['name'].split('(')[0].strip()}.jpg"
+        image_url=card_data.image_url
     )
     
     interpretation = f"오늘의 카드 '{card.name}'는 {card.meaning}의 에너지를 가지고 있습니다. 오늘 하루 이러한 에너지를 염두에 두고 행동해보세요."
@@ -189,9 +211,15 @@ async def daily_card() -> TarotReading:
     else:
         advice = "카드의 긍정적인 에너지를 받아들이고 적극적으로 활용하는 하루가 되길 바랍니다."
     
-    return TarotReading(
+    reading = TarotReading(
         question="오늘의 운세는?",
         cards=[card],
         interpretation=interpretation,
         advice=advice
-    )
\ No newline at end of file
+    )
+    return reading.model_dump_json().encode('utf-8')
+
+@router.get("/daily-card", summary="오늘의 카드", response_model=TarotReading)
+async def daily_card():
+    """오늘의 타로 카드"""
+    return Response(content=build_daily_reading(), media_type="application/json")
@@ -8,13 +8,19 @@ import asyncio
 import json
 import time
 import random
+import sys
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 import uuid
 
+# 공용 모듈 경로 추가 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from shared.prerendered_page import PrerenderedPage
+
 class CrawlingStats(BaseModel):
     """실시간 크롤링 통계"""
     service_id: str
@@ -740,10 +746,12 @@ def get_dynamic_dashboard_html():
 async def setup_dynamic_routes(app: FastAPI):
     """동적 라우트 설정"""
     
+    dashboard_page = PrerenderedPage(get_dynamic_dashboard_html())
+
     @app.get("/", response_class=HTMLResponse)
-    async def get_dynamic_dashboard():
-        """새로운 역동적 대시보드"""
-        return HTMLResponse(content=get_dynamic_dashboard_html())
+    async def get_dynamic_dashboard(request: Request):
+        """새로운 역동적 대시보드 (사전 압축 버퍼 + ETag)"""
+        return dashboard_page.response(request)
     
     @app.websocket("/ws/monitor")
     async def websocket_monitor_endpoint(websocket: WebSocket):
@@ -12,9 +12,11 @@ import time
 import random
 import uvicorn
 import os
+import sys
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -22,6 +24,10 @@ import uuid
 from contextlib import asynccontextmanager
 from real_data_connector import get_services_data, get_statistics_data, real_data_connector
 
+# 공용 모듈 경로 추가 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from shared.prerendered_page import PrerenderedPage
+
 # AI 크롤러 선택 시스템 import
 try:
     from core.ai_crawler_selector import get_ai_crawler_selector
@@ -1009,9 +1015,12 @@ def get_compact_dashboard_html():
 </html>
 """
 
+# 대시보드 HTML은 정적이므로 한 번만 압축해 두고 동적 값은 WebSocket/API로 조회
+compact_dashboard_page = PrerenderedPage(get_compact_dashboard_html())
+
 @app.get("/", response_class=HTMLResponse)
-async def get_dashboard():
-    return HTMLResponse(content=get_compact_dashboard_html())
+async def get_dashboard(request: Request):
+    return compact_dashboard_page.response(request)
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -5,7 +5,10 @@ Gemini Flash, GPT-4o, Claude Sonnet 통합 이미지/문서 분석
 
 Features:
 - 우선순위 기반 모델 선택
-- 자동 폴백 시스템
+- 자동 폴백 시스템 (앞선 모델이 지연되면 다음 모델 병렬 발사, 먼저 도착한 결과 사용)
+- 모델별 동시 실행 제한 + 지연 히스토그램 (shared.model_dispatch)
+- 비동기 SDK 클라이언트 사용 (경주에서 진 요청은 실제로 취소)
+- 모델별 최적 입력 크기로 이미지 전처리 (프로세스 풀, 콘텐츠 해시 캐시)
 - 이미지 OCR 및 분석
 - 테이블 추출
 - 문서 요약
@@ -16,15 +19,17 @@ Date: 2025-08-30
 """
 
 import os
+import sys
 import asyncio
 import base64
 import json
 import logging
+from pathlib import Path
 from typing import Dict, Any, Optional, List, Union, BinaryIO
 from dataclasses import dataclass
 from enum import Enum
-from PIL import Image
-import io
+
+from .image_pipeline import ImageTarget, image_pipeline
 
 # AI SDK imports (with fallback)
 try:
@@ -33,14 +38,18 @@ except ImportError:
     genai = None
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
 except ImportError:
-    OpenAI = None
+    AsyncOpenAI = None
 
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
 except ImportError:
-    Anthropic = None
+    AsyncAnthropic = None
+
+# 공용 모델 디스패치 계층 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from shared.model_dispatch import ModelDispatcher, ModelDispatchError
 
 
 logger = logging.getLogger(__name__)
@@ -63,8 +72,22 @@ class AIModelConfig:
     temperature: float = 0.1
     rate_limit_per_minute: int = 60
     max_image_size_mb: int = 20
+    max_image_dimension: int = 2048          # 긴 변 상한 (px)
+    max_image_short_side: Optional[int] = None  # 짧은 변 상한 (px)
+    max_image_pixels: Optional[int] = None   # 총 픽셀 상한
     priority: int = 1
     enabled: bool = True
+    max_concurrency: int = 4
+    
+    @property
+    def image_target(self) -> ImageTarget:
+        """이미지 전처리 목표"""
+        return ImageTarget(
+            max_side=self.max_image_dimension,
+            short_side=self.max_image_short_side,
+            max_pixels=self.max_image_pixels,
+            max_bytes=self.max_image_size_mb * 1024 * 1024
+        )
 
 
 class MultimodalAnalyzer:
@@ -79,9 +102,18 @@ class MultimodalAnalyzer:
         # 모델 설정
         self.models = self._initialize_models()
         
-        # AI 클라이언트 인스턴스
+        # AI 클라이언트 인스턴스 (initialize 에서 1회 생성 후 재사용 - HTTP 연결 풀 유지)
         self.clients = {}
         
+        # 모델 호출기 (모델별 동시 실행 풀 + 지연 히스토그램)
+        self.dispatcher = ModelDispatcher(
+            concurrency={model.value: config.max_concurrency for model, config in self.models.items()}
+        )
+        self.analysis_deadline = float(os.getenv('MULTIMODAL_ANALYSIS_DEADLINE', 120))
+        
+        # 이미지 전처리기 (문서 처리기와 공유)
+        self.image_pipeline = image_pipeline
+        
         # 통계
         self.usage_stats = {model.value: {'requests': 0, 'successes': 0, 'failures': 0} 
                           for model in AIModel}
@@ -108,8 +140,10 @@ class MultimodalAnalyzer:
                 max_tokens=8000,
                 rate_limit_per_minute=60,
                 max_image_size_mb=20,
+                max_image_dimension=3072,
                 priority=1,  # 최우선 (무료)
-                enabled=bool(self.api_keys['gemini'])
+                enabled=bool(self.api_keys['gemini']),
+                max_concurrency=8
             ),
             
             AIModel.GPT4O: AIModelConfig(
@@ -119,8 +153,11 @@ class MultimodalAnalyzer:
                 max_tokens=4000,
                 rate_limit_per_minute=20,
                 max_image_size_mb=20,
+                max_image_dimension=2048,  # high detail: 2048 안으로 축소 후 짧은 변 768
+                max_image_short_side=768,
                 priority=2,  # 2순위
-                enabled=bool(self.api_keys['openai'])
+                enabled=bool(self.api_keys['openai']),
+                max_concurrency=4
             ),
             
             AIModel.CLAUDE_SONNET: AIModelConfig(
@@ -130,8 +167,11 @@ class MultimodalAnalyzer:
                 max_tokens=4000,
                 rate_limit_per_minute=30,
                 max_image_size_mb=5,
+                max_image_dimension=1568,  # 이보다 크면 API 가 다시 축소
+                max_image_pixels=1_150_000,
                 priority=3,  # 3순위
-                enabled=bool(self.api_keys['anthropic'])
+                enabled=bool(self.api_keys['anthropic']),
+                max_concurrency=4
             )
         }
         
@@ -148,11 +188,11 @@ class MultimodalAnalyzer:
                     genai.configure(api_key=config.api_key)
                     self.clients[model_type] = genai.GenerativeModel(config.name)
                     
-                elif config.provider == "openai" and OpenAI:
-                    self.clients[model_type] = OpenAI(api_key=config.api_key)
+                elif config.provider == "openai" and AsyncOpenAI:
+                    self.clients[model_type] = AsyncOpenAI(api_key=config.api_key)
                     
-                elif config.provider == "anthropic" and Anthropic:
-                    self.clients[model_type] = Anthropic(api_key=config.api_key)
+                elif config.provider == "anthropic" and AsyncAnthropic:
+                    self.clients[model_type] = AsyncAnthropic(api_key=config.api_key)
                 
                 self.logger.info(f"✅ {config.name} 클라이언트 초기화 완료")
                     
@@ -171,40 +211,44 @@ class MultimodalAnalyzer:
     ) -> Dict[str, Any]:
         """이미지 분석"""
         
-        # 이미지 전처리
         if isinstance(image_data, str):
             # 파일 경로인 경우
-            with open(image_data, 'rb') as f:
-                image_bytes = f.read()
+            image_bytes = await asyncio.to_thread(Path(image_data).read_bytes)
         else:
             image_bytes = image_data
         
-        # 이미지 크기 확인 및 최적화
-        image_bytes = await self._optimize_image(image_bytes)
+        # 모델 선택 및 경주 (우선순위 순 발사, 지연/실패 시 다음 모델 병렬 시작)
+        models_to_try = [model_type for model_type in self._get_model_priority_order(preferred_model)
+                         if model_type in self.clients]
         
-        # 모델 선택 및 시도
-        models_to_try = self._get_model_priority_order(preferred_model)
+        try:
+            used, result = await self.dispatcher.race(
+                [(model_type.value, self._model_attempt(model_type, image_bytes, prompt, "image"))
+                 for model_type in models_to_try],
+                deadline=self.analysis_deadline
+            )
+        except (ModelDispatchError, asyncio.TimeoutError) as e:
+            self.logger.warning(f"❌ 이미지 분석 실패: {e}")
+            return {
+                'success': False,
+                'error': '모든 AI 모델 실패',
+                'content': ''
+            }
         
-        for model_type in models_to_try:
+        self._update_stats(AIModel(used), True)
+        return result
+    
+    def _model_attempt(self, model_type: AIModel, image_bytes: bytes, prompt: str, task_type: str):
+        """경주 후보 호출 (모델 입력 크기로 전처리, 실패는 모델 통계에 기록 후 전파)"""
+        async def attempt() -> Dict[str, Any]:
+            self.logger.info(f"🎯 이미지 분석 시도: {model_type.value}")
             try:
-                self.logger.info(f"🎯 이미지 분석 시도: {model_type.value}")
-                
-                result = await self._analyze_with_model(model_type, image_bytes, prompt, "image")
-                
-                if result['success']:
-                    self._update_stats(model_type, True)
-                    return result
-                    
-            except Exception as e:
-                self.logger.warning(f"❌ {model_type.value} 실패: {e}")
+                prepared = await self._prepare_image(model_type, image_bytes)
+                return await self._analyze_with_model(model_type, prepared, prompt, task_type)
+            except Exception:
                 self._update_stats(model_type, False)
-                continue
-        
-        return {
-            'success': False,
-            'error': '모든 AI 모델 실패',
-            'content': ''
-        }
+                raise
+        return attempt
     
     async def extract_table_from_image(self, image_data: Union[bytes, str]) -> Dict[str, Any]:
         """이미지에서 테이블 추출"""
@@ -324,13 +368,9 @@ class MultimodalAnalyzer:
     async def _analyze_with_gemini(self, client, image_bytes: bytes, prompt: str) -> Dict[str, Any]:
         """Gemini Flash로 분석"""
         try:
-            # PIL Image 생성
-            image = Image.open(io.BytesIO(image_bytes))
-            
-            # Gemini에 전송
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, 
-                lambda: client.generate_content([prompt, image])
+            # 전처리된 JPEG 바이트를 그대로 전송 (PIL 이미지로 넘기면 SDK 가 이벤트 루프에서 재인코딩)
+            response = await client.generate_content_async(
+                [prompt, {'mime_type': 'image/jpeg', 'data': image_bytes}]
             )
             
             return {
@@ -348,26 +388,23 @@ class MultimodalAnalyzer:
             # Base64 인코딩
             image_base64 = base64.b64encode(image_bytes).decode('utf-8')
             
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [
-                                {"type": "text", "text": prompt},
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/jpeg;base64,{image_base64}"
-                                    }
+            response = await client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": prompt},
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": f"data:image/jpeg;base64,{image_base64}"
                                 }
-                            ]
-                        }
-                    ],
-                    max_tokens=4000
-                )
+                            }
+                        ]
+                    }
+                ],
+                max_tokens=4000
             )
             
             return {
@@ -385,31 +422,28 @@ class MultimodalAnalyzer:
             # Base64 인코딩
             image_base64 = base64.b64encode(image_bytes).decode('utf-8')
             
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: client.messages.create(
-                    model="claude-3-5-sonnet-20241022",
-                    max_tokens=4000,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "image",
-                                    "source": {
-                                        "type": "base64",
-                                        "media_type": "image/jpeg",
-                                        "data": image_base64
-                                    }
-                                },
-                                {
-                                    "type": "text", 
-                                    "text": prompt
+            response = await client.messages.create(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=4000,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "image",
+                                "source": {
+                                    "type": "base64",
+                                    "media_type": "image/jpeg",
+                                    "data": image_base64
                                 }
-                            ]
-                        }
-                    ]
-                )
+                            },
+                            {
+                                "type": "text", 
+                                "text": prompt
+                            }
+                        ]
+                    }
+                ]
             )
             
             return {
@@ -421,27 +455,13 @@ class MultimodalAnalyzer:
         except Exception as e:
             raise Exception(f"Claude 분석 실패: {e}")
     
-    async def _optimize_image(self, image_bytes: bytes) -> bytes:
-        """이미지 최적화"""
+    async def _prepare_image(self, model_type: AIModel, image_bytes: bytes) -> bytes:
+        """모델 최적 입력 크기로 전처리 (실패 시 원본 사용)"""
         try:
-            # PIL로 이미지 열기
-            image = Image.open(io.BytesIO(image_bytes))
-            
-            # 이미지 크기 확인
-            if len(image_bytes) > 10 * 1024 * 1024:  # 10MB 이상
-                # 크기 조정
-                max_dimension = 2048
-                image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
-                
-                # JPEG로 압축
-                output = io.BytesIO()
-                image.save(output, format='JPEG', quality=85, optimize=True)
-                return output.getvalue()
-            
-            return image_bytes
-            
+            prepared = await self.image_pipeline.prepare(image_bytes, self.models[model_type].image_target)
+            return prepared.data
         except Exception as e:
-            self.logger.warning(f"이미지 최적화 실패: {e}")
+            self.logger.warning(f"이미지 전처리 실패: {e}")
             return image_bytes
     
     def _get_model_priority_order(self, preferred_model: Optional[AIModel] = None) -> List[AIModel]:
@@ -472,6 +492,8 @@ class MultimodalAnalyzer:
         """사용 통계 반환"""
         return {
             'model_stats': self.usage_stats,
+            'latency_stats': self.dispatcher.snapshot(),
+            'image_pipeline': self.image_pipeline.get_stats(),
             'available_models': [config.name for config in self.models.values() if config.enabled],
             'total_requests': sum(stats['requests'] for stats in self.usage_stats.values())
         }
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+🗂️ 문서 파싱 실행기
+PDF/DOCX/XLSX/텍스트 파싱을 형식별 워커 풀로 분배
+
+Features:
+- CPU 를 쓰는 파싱(PyPDF2, python-docx, openpyxl)은 프로세스 풀, 텍스트 디코딩은 스레드 풀
+- 형식별 동시 실행 제한 (메모리를 많이 쓰는 XLSX 는 낮게)
+- 큰 XLSX 는 openpyxl read-only 스트리밍 모드, 모든 시트는 행을 한 번만 순회
+- 파싱 함수는 피클 가능한 dict(text_content, tables, metadata)만 반환
+
+Author: HEAL7 Development Team
+Version: 1.0.0
+Date: 2025-08-30
+"""
+
+import os
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+# 문서 처리 라이브러리
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+
+logger = logging.getLogger(__name__)
+
+# 이 크기 이상의 XLSX 는 read-only 스트리밍 모드로 열기
+XLSX_READ_ONLY_BYTES = int(os.getenv('XLSX_READ_ONLY_BYTES', 2 * 1024 * 1024))
+XLSX_MAX_TABLE_ROW = 999   # 표로 추출할 마지막 행 (헤더 포함)
+XLSX_MAX_TEXT_ROW = 100    # 텍스트로 추출할 마지막 행
+TEXT_ENCODINGS = ('utf-8', 'cp949', 'latin-1')
+
+
+def _parsed(text_content: List[str] = None, tables: List[Dict] = None,
+            metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    return {'text_content': text_content or [], 'tables': tables or [], 'metadata': metadata or {}}
+
+
+def parse_pdf(file_path: str) -> Dict[str, Any]:
+    """PDF 텍스트/메타데이터 추출"""
+    if not PyPDF2:
+        raise ImportError("PyPDF2 라이브러리가 필요합니다")
+
+    text_content = []
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        info = pdf_reader.metadata or {}
+        metadata = {
+            'pages': len(pdf_reader.pages),
+            'title': info.get('/Title', ''),
+            'author': info.get('/Author', ''),
+            'subject': info.get('/Subject', ''),
+            'creator': info.get('/Creator', '')
+        }
+
+        # 각 페이지의 텍스트 추출 (실패한 페이지는 건너뛰기)
+        for page in pdf_reader.pages:
+            try:
+                text = page.extract_text()
+            except Exception:
+                continue
+            if text and text.strip():
+                text_content.append(text)
+
+    return _parsed(text_content, metadata=metadata)
+
+
+def parse_docx(file_path: str) -> Dict[str, Any]:
+    """Word 문서 단락/표/속성 추출"""
+    if not Document:
+        raise ImportError("python-docx 라이브러리가 필요합니다")
+
+    doc = Document(file_path)
+    properties = doc.core_properties
+    metadata = {
+        'title': properties.title or '',
+        'author': properties.author or '',
+        'subject': properties.subject or '',
+        'created': str(properties.created) if properties.created else '',
+        'modified': str(properties.modified) if properties.modified else ''
+    }
+
+    text_content = [paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()]
+
+    tables = []
+    for table_idx, table in enumerate(doc.tables):
+        rows = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+        tables.append({
+            'table_index': table_idx + 1,
+            'headers': rows[0] if rows else [],
+            'rows': rows[1:]
+        })
+
+    return _parsed(text_content, tables, metadata)
+
+
+def _parse_worksheet(sheet_name: str, worksheet) -> Dict[str, Any]:
+    """워크시트 1회 순회 → 표(첫 행 헤더, 빈 행에서 중단) + 앞부분 텍스트"""
+    max_row = worksheet.max_row
+    max_column = worksheet.max_column
+    last_row = XLSX_MAX_TABLE_ROW if max_row is None else min(max_row, XLSX_MAX_TABLE_ROW)
+
+    headers: List[str] = []
+    rows: List[List[Any]] = []
+    text_lines: List[str] = []
+    table_done = False
+    row_count = 0
+    width = max_column or 0
+
+    for row_number, values in enumerate(worksheet.iter_rows(max_row=last_row, values_only=True), start=1):
+        row_count = row_number
+        if row_number <= XLSX_MAX_TEXT_ROW:
+            row_text = '\t'.join(str(cell) if cell is not None else '' for cell in values)
+            if row_text.strip():
+                text_lines.append(row_text)
+
+        if row_number == 1:
+            width = max_column or len(values)
+            headers = [str(values[col]) if col < len(values) and values[col] else f'Column{col + 1}'
+                       for col in range(width)]
+        elif not table_done:
+            row_data = list(values[:width]) + [None] * (width - len(values))
+            if any(cell is not None for cell in row_data):
+                rows.append(row_data)
+            elif rows:  # 빈 행이 나타나면 중단
+                table_done = True
+
+        if table_done and row_number >= XLSX_MAX_TEXT_ROW:
+            break
+
+    # 데이터가 있는 영역이 2행 2열 이상일 때만 표로 인정
+    has_area = (max_row if max_row is not None else row_count) > 1 and width > 1
+    return {
+        'table': {'sheet_name': sheet_name, 'headers': headers, 'rows': rows} if has_area and rows else None,
+        'text': f"=== {sheet_name} ===\n" + ''.join(line + '\n' for line in text_lines)
+    }
+
+
+def parse_xlsx(file_path: str) -> Dict[str, Any]:
+    """Excel 시트별 표/텍스트 추출 (큰 파일은 read-only 스트리밍)"""
+    if not load_workbook:
+        raise ImportError("openpyxl 라이브러리가 필요합니다")
+
+    read_only = os.path.getsize(file_path) >= XLSX_READ_ONLY_BYTES
+    workbook = load_workbook(file_path, data_only=True, read_only=read_only)
+    try:
+        metadata = {
+            'worksheets': workbook.sheetnames,
+            'active_sheet': workbook.active.title if workbook.active else '',
+            'read_only': read_only
+        }
+        text_content, tables = [], []
+        for sheet_name in workbook.sheetnames:
+            sheet = _parse_worksheet(sheet_name, workbook[sheet_name])
+            if sheet['table']:
+                tables.append(sheet['table'])
+            text_content.append(sheet['text'])
+    finally:
+        workbook.close()
+
+    return _parsed(text_content, tables, metadata)
+
+
+def parse_text(file_path: str) -> Dict[str, Any]:
+    """텍스트 파일 읽기 (다양한 인코딩 시도)"""
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+
+        for encoding in TEXT_ENCODINGS:
+            try:
+                content = raw.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            raise Exception("지원되는 인코딩으로 파일을 읽을 수 없습니다")
+
+        return _parsed([content], metadata={
+            'size_bytes': len(raw),
+            'lines': len(content.split('\n')),
+            'characters': len(content),
+            'encoding': encoding
+        })
+    except Exception as e:
+        raise Exception(f"텍스트 파일 처리 실패: {e}")
+
+
+# 형식 → (파서, 워커 종류)
+PARSERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    'pdf': parse_pdf,
+    'docx': parse_docx,
+    'xlsx': parse_xlsx,
+    'text': parse_text,
+}
+FORMAT_WORKERS = {'pdf': 'process', 'docx': 'process', 'xlsx': 'process', 'text': 'thread'}
+# 형식별 동시 실행 상한 (없으면 워커 수)
+FORMAT_CONCURRENCY = {'xlsx': 2}
+
+
+class DocumentParseExecutor:
+    """🗂️ 형식별 문서 파싱 실행기 (프로세스/스레드 풀 분배)"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or int(os.getenv('DOCUMENT_PARSE_WORKERS', os.cpu_count() or 1))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._process_pool_available = True
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats: Dict[str, Dict[str, float]] = {
+            doc_format: {'parsed': 0, 'failed': 0, 'total_seconds': 0.0} for doc_format in PARSERS
+        }
+
+    def supports(self, doc_format: str) -> bool:
+        return doc_format in PARSERS
+
+    async def parse(self, doc_format: str, file_path: str) -> Dict[str, Any]:
+        """문서 파싱 → {'text_content', 'tables', 'metadata'}"""
+        parser = PARSERS[doc_format]
+        stats = self.stats[doc_format]
+        async with self._semaphore(doc_format):
+            started = time.perf_counter()
+            try:
+                if FORMAT_WORKERS[doc_format] == 'process':
+                    parsed = await self._run_in_process(parser, file_path)
+                else:
+                    parsed = await asyncio.to_thread(parser, file_path)
+            except Exception:
+                stats['failed'] += 1
+                raise
+            finally:
+                stats['total_seconds'] += time.perf_counter() - started
+        stats['parsed'] += 1
+        return parsed
+
+    def _semaphore(self, doc_format: str) -> asyncio.Semaphore:
+        if doc_format not in self._semaphores:
+            limit = min(self.max_workers, FORMAT_CONCURRENCY.get(doc_format, self.max_workers))
+            self._semaphores[doc_format] = asyncio.Semaphore(limit)
+        return self._semaphores[doc_format]
+
+    async def _run_in_process(self, func, *args) -> Any:
+        """프로세스 풀 실행 (풀을 쓸 수 없는 환경이면 스레드로 대체)"""
+        loop = asyncio.get_running_loop()
+        if self._process_pool_available:
+            try:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                future = loop.run_in_executor(self._executor, func, *args)
+            except (BrokenProcessPool, OSError, NotImplementedError) as e:
+                self._disable_process_pool(e)
+            else:
+                try:
+                    return await future
+                except BrokenProcessPool as e:
+                    self._disable_process_pool(e)
+        return await asyncio.to_thread(func, *args)
+
+    def _disable_process_pool(self, error: Exception):
+        logger.warning(f"문서 파싱 프로세스 풀 사용 불가, 스레드로 대체: {error}")
+        self._process_pool_available = False
+        self.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """형식별 파싱 통계"""
+        return {
+            'max_workers': self.max_workers,
+            'process_pool': self._process_pool_available,
+            'formats': {
+                doc_format: {**stats, 'avg_seconds': stats['total_seconds'] / stats['parsed'] if stats['parsed'] else 0.0}
+                for doc_format, stats in self.stats.items()
+            }
+        }
+
+    def shutdown(self):
+        """프로세스 풀 정리"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
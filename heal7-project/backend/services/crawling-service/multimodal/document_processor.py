@@ -9,6 +9,7 @@ Features:
 - Excel 파일 분석
 - 이미지 문서 OCR
 - AI 기반 문서 분석
+- 형식별 워커 풀 파싱 (이벤트 루프 비차단), 배치 결과는 끝나는 순서대로 반환
 
 Author: HEAL7 Development Team
 Version: 1.0.0
@@ -18,33 +19,26 @@ Date: 2025-08-30
 import os
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, AsyncIterator, List, Optional, Union
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 
-# 문서 처리 라이브러리
+# PDF 페이지 렌더링 (텍스트/DOCX/XLSX 파싱 라이브러리는 document_parsers 에서 로드)
 try:
-    import PyPDF2
     from pdf2image import convert_from_path
 except ImportError:
-    PyPDF2 = None
     convert_from_path = None
 
-try:
-    from docx import Document
-except ImportError:
-    Document = None
-
-try:
-    from openpyxl import load_workbook
-except ImportError:
-    load_workbook = None
-
 from PIL import Image
 import io
 
 from .ai_analyzer import MultimodalAnalyzer, AIModel
+from .image_pipeline import ImageTarget
+from .document_parsers import DocumentParseExecutor
+
+# 렌더링된 페이지 인코딩 목표 (모델별 축소는 분석기에서 다시 적용)
+PAGE_IMAGE_TARGET = ImageTarget(max_side=3072, quality=90)
 
 
 logger = logging.getLogger(__name__)
@@ -99,10 +93,13 @@ class DocumentAnalysisResult:
 class DocumentProcessor:
     """📄 통합 문서 처리기"""
     
-    def __init__(self):
+    def __init__(self, parse_executor: Optional[DocumentParseExecutor] = None):
         self.logger = logging.getLogger(f"{__name__}.DocumentProcessor")
         self.ai_analyzer = MultimodalAnalyzer()
         
+        # 형식별 파싱 워커 풀
+        self.parse_executor = parse_executor or DocumentParseExecutor()
+        
         # 지원하는 문서 형식
         self.supported_formats = {
             '.pdf': DocumentType.PDF,
@@ -202,39 +199,17 @@ class DocumentProcessor:
     async def _process_pdf(self, file_path: str, result: DocumentAnalysisResult, extract_images: bool):
         """PDF 문서 처리"""
         
-        if not PyPDF2:
-            raise ImportError("PyPDF2 라이브러리가 필요합니다")
-        
-        # 1. 텍스트 추출
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            result.metadata = {
-                'pages': len(pdf_reader.pages),
-                'title': pdf_reader.metadata.get('/Title', ''),
-                'author': pdf_reader.metadata.get('/Author', ''),
-                'subject': pdf_reader.metadata.get('/Subject', ''),
-                'creator': pdf_reader.metadata.get('/Creator', '')
-            }
-            
-            # 각 페이지의 텍스트 추출
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    text = page.extract_text()
-                    if text.strip():
-                        result.text_content.append(text)
-                except:
-                    # 텍스트 추출 실패한 페이지는 건너뛰기
-                    continue
+        # 1. 텍스트 추출 (워커 풀)
+        self._apply_parsed(result, await self.parse_executor.parse(DocumentType.PDF.value, file_path))
         
         # 2. 이미지로 변환하여 테이블/이미지 추출
         if extract_images and convert_from_path:
             try:
-                images = convert_from_path(file_path, dpi=150)
+                images = await asyncio.to_thread(convert_from_path, file_path, dpi=150)
                 
                 for page_num, image in enumerate(images):
                     # 이미지를 바이트로 변환
-                    img_bytes = self._pil_to_bytes(image)
+                    img_bytes = await self._pil_to_bytes(image)
                     
                     # 테이블이 있는지 AI로 확인
                     if await self._has_table_in_image(img_bytes):
@@ -256,100 +231,12 @@ class DocumentProcessor:
     async def _process_docx(self, file_path: str, result: DocumentAnalysisResult, extract_images: bool):
         """Word 문서 처리"""
         
-        if not Document:
-            raise ImportError("python-docx 라이브러리가 필요합니다")
-        
-        doc = Document(file_path)
-        
-        # 문서 속성
-        result.metadata = {
-            'title': doc.core_properties.title or '',
-            'author': doc.core_properties.author or '',
-            'subject': doc.core_properties.subject or '',
-            'created': str(doc.core_properties.created) if doc.core_properties.created else '',
-            'modified': str(doc.core_properties.modified) if doc.core_properties.modified else ''
-        }
-        
-        # 단락별 텍스트 추출
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                result.text_content.append(paragraph.text)
-        
-        # 표 추출
-        for table_idx, table in enumerate(doc.tables):
-            table_data = {
-                'table_index': table_idx + 1,
-                'headers': [],
-                'rows': []
-            }
-            
-            for row_idx, row in enumerate(table.rows):
-                row_data = [cell.text.strip() for cell in row.cells]
-                
-                if row_idx == 0:
-                    table_data['headers'] = row_data
-                else:
-                    table_data['rows'].append(row_data)
-            
-            result.tables.append(table_data)
+        self._apply_parsed(result, await self.parse_executor.parse(DocumentType.DOCX.value, file_path))
     
     async def _process_xlsx(self, file_path: str, result: DocumentAnalysisResult, extract_images: bool):
         """Excel 파일 처리"""
         
-        if not load_workbook:
-            raise ImportError("openpyxl 라이브러리가 필요합니다")
-        
-        workbook = load_workbook(file_path, data_only=True)
-        
-        result.metadata = {
-            'worksheets': workbook.sheetnames,
-            'active_sheet': workbook.active.title if workbook.active else ''
-        }
-        
-        # 각 워크시트 처리
-        for sheet_name in workbook.sheetnames:
-            worksheet = workbook[sheet_name]
-            
-            # 데이터가 있는 영역 찾기
-            if worksheet.max_row > 1 and worksheet.max_column > 1:
-                # 첫 번째 행을 헤더로 가정
-                headers = []
-                for col in range(1, worksheet.max_column + 1):
-                    cell_value = worksheet.cell(1, col).value
-                    headers.append(str(cell_value) if cell_value else f'Column{col}')
-                
-                # 데이터 행 추출
-                rows = []
-                for row in range(2, min(worksheet.max_row + 1, 1000)):  # 최대 1000행
-                    row_data = []
-                    has_data = False
-                    
-                    for col in range(1, worksheet.max_column + 1):
-                        cell_value = worksheet.cell(row, col).value
-                        row_data.append(cell_value)
-                        if cell_value is not None:
-                            has_data = True
-                    
-                    if has_data:
-                        rows.append(row_data)
-                    elif len(rows) > 0:  # 빈 행이 나타나면 중단
-                        break
-                
-                if rows:
-                    result.tables.append({
-                        'sheet_name': sheet_name,
-                        'headers': headers,
-                        'rows': rows
-                    })
-            
-            # 텍스트 데이터도 추가
-            text_content = f"=== {sheet_name} ===\n"
-            for row in worksheet.iter_rows(max_row=min(100, worksheet.max_row), values_only=True):
-                row_text = '\t'.join(str(cell) if cell is not None else '' for cell in row)
-                if row_text.strip():
-                    text_content += row_text + '\n'
-            
-            result.text_content.append(text_content)
+        self._apply_parsed(result, await self.parse_executor.parse(DocumentType.XLSX.value, file_path))
     
     async def _process_image_document(self, file_path: str, result: DocumentAnalysisResult, extract_images: bool):
         """이미지 문서 처리 (OCR)"""
@@ -381,37 +268,13 @@ class DocumentProcessor:
     async def _process_text(self, file_path: str, result: DocumentAnalysisResult, extract_images: bool):
         """텍스트 파일 처리"""
         
-        try:
-            # 텍스트 파일 읽기 (다양한 인코딩 시도)
-            encodings = ['utf-8', 'cp949', 'latin-1']
-            content = None
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if content is None:
-                raise Exception("지원되는 인코딩으로 파일을 읽을 수 없습니다")
-            
-            # 텍스트 내용 저장
-            result.text_content = [content]
-            
-            # 파일 메타데이터
-            import os
-            file_stat = os.stat(file_path)
-            result.metadata = {
-                'size_bytes': file_stat.st_size,
-                'lines': len(content.split('\n')),
-                'characters': len(content),
-                'encoding': encoding
-            }
-            
-        except Exception as e:
-            raise Exception(f"텍스트 파일 처리 실패: {e}")
+        self._apply_parsed(result, await self.parse_executor.parse(DocumentType.TEXT.value, file_path))
+    
+    def _apply_parsed(self, result: DocumentAnalysisResult, parsed: Dict[str, Any]):
+        """워커 파싱 결과 반영"""
+        result.metadata = parsed['metadata']
+        result.text_content.extend(parsed['text_content'])
+        result.tables.extend(parsed['tables'])
     
     async def _fallback_image_processing(self, file_path: str, result: DocumentAnalysisResult):
         """지원하지 않는 형식을 이미지로 변환 후 처리"""
@@ -497,11 +360,10 @@ class DocumentProcessor:
         except Exception as e:
             self.logger.warning(f"AI 분석 실패: {e}")
     
-    def _pil_to_bytes(self, image: Image.Image) -> bytes:
-        """PIL Image를 바이트로 변환"""
-        output = io.BytesIO()
-        image.save(output, format='JPEG', quality=90)
-        return output.getvalue()
+    async def _pil_to_bytes(self, image: Image.Image) -> bytes:
+        """PIL Image를 바이트로 변환 (이미지 파이프라인 프로세스 풀에서 인코딩)"""
+        prepared = await self.ai_analyzer.image_pipeline.encode(image, PAGE_IMAGE_TARGET)
+        return prepared.data
     
     def _text_to_image(self, text: str) -> bytes:
         """텍스트를 이미지로 변환 (AI 분석용)"""
@@ -533,6 +395,28 @@ class DocumentProcessor:
         image.save(output, format='JPEG')
         return output.getvalue()
     
+    async def process_documents(
+        self,
+        file_paths: List[str],
+        max_concurrent: Optional[int] = None,
+        include_ai_analysis: bool = True,
+        extract_images: bool = True
+    ) -> AsyncIterator[DocumentAnalysisResult]:
+        """여러 문서를 동시에 처리하고 끝나는 순서대로 반환"""
+        semaphore = asyncio.Semaphore(max_concurrent or self.parse_executor.max_workers * 2)
+        
+        async def process_single(file_path: str) -> DocumentAnalysisResult:
+            async with semaphore:
+                return await self.process_document(file_path, include_ai_analysis, extract_images)
+        
+        tasks = [asyncio.ensure_future(process_single(path)) for path in file_paths]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+    
     def get_supported_formats(self) -> List[str]:
         """지원하는 파일 형식 목록"""
         return list(self.supported_formats.keys())
@@ -558,16 +442,22 @@ async def extract_tables_from_document(file_path: str) -> List[Dict]:
         return []
 
 
-async def batch_document_processing(file_paths: List[str], max_concurrent: int = 3) -> List[DocumentAnalysisResult]:
-    """배치 문서 처리"""
+async def iter_document_processing(file_paths: List[str],
+                                   max_concurrent: Optional[int] = None) -> AsyncIterator[DocumentAnalysisResult]:
+    """배치 문서 처리 (끝나는 순서대로 반환)"""
     processor = DocumentProcessor()
     await processor.initialize()
     
-    semaphore = asyncio.Semaphore(max_concurrent)
-    
-    async def process_single(file_path: str):
-        async with semaphore:
-            return await processor.process_document(file_path)
-    
-    tasks = [process_single(path) for path in file_paths]
-    return await asyncio.gather(*tasks, return_exceptions=True)
\ No newline at end of file
+    try:
+        async for result in processor.process_documents(file_paths, max_concurrent):
+            yield result
+    finally:
+        processor.parse_executor.shutdown()
+
+
+async def batch_document_processing(file_paths: List[str], max_concurrent: Optional[int] = None) -> List[DocumentAnalysisResult]:
+    """배치 문서 처리 (입력 순서대로 반환)"""
+    results = {}
+    async for result in iter_document_processing(file_paths, max_concurrent):
+        results.setdefault(result.file_path, []).append(result)
+    return [results[path].pop(0) for path in file_paths]
\ No newline at end of file
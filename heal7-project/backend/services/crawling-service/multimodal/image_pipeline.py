@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+🖼️ 이미지 전처리 파이프라인
+멀티모달 분석 전 이미지를 모델별 최적 입력 크기로 축소/재인코딩
+
+Features:
+- 프로세스 풀에서 디코딩/리사이즈/인코딩 (이벤트 루프 비차단, GIL 경합 없음)
+- JPEG 는 PIL draft() 모드로 DCT 단계에서 축소 디코딩
+- 모델별 목표 크기 (긴 변, 짧은 변, 총 픽셀, 바이트 상한)에 맞춰 적응형 축소
+- 콘텐츠 해시 + 목표 크기 기준 LRU 캐시, 같은 이미지의 동시 요청은 1회만 처리
+- 이미 목표 안에 드는 JPEG 는 재인코딩 없이 원본 사용
+
+Author: HEAL7 Development Team
+Version: 1.0.0
+Date: 2025-08-30
+"""
+
+import os
+import io
+import math
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from PIL import Image
+
+
+logger = logging.getLogger(__name__)
+
+# 이 크기 이상이면 해시 계산도 스레드에서 수행 (hashlib 은 GIL 해제)
+HASH_OFF_LOOP_BYTES = 1024 * 1024
+# 바이트 상한을 넘으면 품질/크기를 낮춰 재시도
+REENCODE_STEPS = ((1.0, 0), (0.85, -10), (0.7, -20))
+
+
+class ImageTarget(NamedTuple):
+    """모델 입력 목표 (None 은 제한 없음)"""
+    max_side: int = 2048
+    short_side: Optional[int] = None
+    max_pixels: Optional[int] = None
+    max_bytes: int = 20 * 1024 * 1024
+    quality: int = 85
+
+    def fit(self, width: int, height: int) -> Tuple[int, int]:
+        """비율을 유지하며 목표 안에 드는 크기 (확대하지 않음)"""
+        scale = min(1.0, self.max_side / max(width, height))
+        if self.short_side:
+            scale = min(scale, self.short_side / min(width, height))
+        if self.max_pixels:
+            scale = min(scale, math.sqrt(self.max_pixels / (width * height)))
+        if scale >= 1.0:
+            return width, height
+        return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+class PreparedImage(NamedTuple):
+    """전처리된 이미지 (JPEG)"""
+    data: bytes
+    size: Tuple[int, int]
+    original_size: Tuple[int, int]
+    reencoded: bool
+
+
+def _to_rgb(image: Image.Image) -> Image.Image:
+    """JPEG 호환 RGB 변환 (투명 영역은 흰 배경)"""
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        rgba = image.convert('RGBA')
+        background = Image.new('RGB', rgba.size, 'white')
+        background.paste(rgba, mask=rgba.split()[-1])
+        return background
+    return image if image.mode == 'RGB' else image.convert('RGB')
+
+
+def _encode(image: Image.Image, size: Tuple[int, int], target: ImageTarget,
+            original_size: Tuple[int, int]) -> PreparedImage:
+    image = _to_rgb(image)
+    for scale, quality_delta in REENCODE_STEPS:
+        resized = image
+        step_size = (max(1, int(size[0] * scale)), max(1, int(size[1] * scale)))
+        if resized.size != step_size:
+            resized = image.copy()
+            resized.thumbnail(step_size, Image.Resampling.LANCZOS)
+        output = io.BytesIO()
+        resized.save(output, format='JPEG', quality=target.quality + quality_delta, optimize=True)
+        if output.tell() <= target.max_bytes:
+            break
+    return PreparedImage(output.getvalue(), resized.size, original_size, True)
+
+
+def prepare_image(data: bytes, target: ImageTarget) -> PreparedImage:
+    """이미지 바이트 → 목표에 맞는 JPEG (프로세스 풀 작업 함수)"""
+    image = Image.open(io.BytesIO(data))
+    original_size = image.size
+    size = target.fit(*original_size)
+
+    if image.format == 'JPEG':
+        if size == original_size and len(data) <= target.max_bytes:
+            return PreparedImage(data, original_size, original_size, False)
+        # DCT 단계 축소 디코딩 (목표 이상인 가장 작은 1/2, 1/4, 1/8 배율)
+        image.draft('RGB', size)
+
+    return _encode(image, size, target, original_size)
+
+
+def encode_pil_image(image: Image.Image, target: ImageTarget) -> PreparedImage:
+    """PIL 이미지(렌더링된 페이지 등) → 목표에 맞는 JPEG (프로세스 풀 작업 함수)"""
+    return _encode(image, target.fit(*image.size), target, image.size)
+
+
+class ImagePipeline:
+    """🖼️ 프로세스 풀 이미지 전처리기 (콘텐츠 해시 LRU 캐시)"""
+
+    def __init__(self, max_workers: Optional[int] = None, cache_max_bytes: int = 128 * 1024 * 1024):
+        self.max_workers = max_workers or int(os.getenv('IMAGE_PIPELINE_WORKERS', min(4, os.cpu_count() or 1)))
+        self.cache_max_bytes = cache_max_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._process_pool_available = True
+        self._cache: 'OrderedDict[Tuple[str, ImageTarget], PreparedImage]' = OrderedDict()
+        self._cache_bytes = 0
+        self._inflight: Dict[Tuple[str, ImageTarget], asyncio.Future] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'reencoded': 0, 'passthrough': 0}
+
+    async def prepare(self, data: bytes, target: ImageTarget) -> PreparedImage:
+        """이미지 바이트 전처리 (같은 콘텐츠 + 목표는 캐시에서 반환)"""
+        digest = await self._digest(data)
+        key = (digest, target)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats['hits'] += 1
+            return cached
+
+        # 같은 키의 동시 요청은 작업 1개를 공유 (요청 취소가 다른 대기자의 작업을 취소하지 않도록 shield)
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats['misses'] += 1
+            task = asyncio.ensure_future(self._prepare_uncached(key, data, target))
+            self._inflight[key] = task
+        else:
+            self.stats['hits'] += 1
+        return await asyncio.shield(task)
+
+    async def _prepare_uncached(self, key: Tuple[str, ImageTarget], data: bytes,
+                                target: ImageTarget) -> PreparedImage:
+        try:
+            prepared = await self._run(prepare_image, data, target)
+        finally:
+            self._inflight.pop(key, None)
+        self.stats['reencoded' if prepared.reencoded else 'passthrough'] += 1
+        self._store(key, prepared)
+        return prepared
+
+    async def encode(self, image: Image.Image, target: ImageTarget) -> PreparedImage:
+        """PIL 이미지 인코딩 (렌더링 결과라 캐시하지 않음)"""
+        prepared = await self._run(encode_pil_image, image, target)
+        self.stats['reencoded'] += 1
+        return prepared
+
+    async def _digest(self, data: bytes) -> str:
+        if len(data) >= HASH_OFF_LOOP_BYTES:
+            return await asyncio.to_thread(lambda: hashlib.blake2b(data, digest_size=20).hexdigest())
+        return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+    async def _run(self, func, *args) -> Any:
+        """프로세스 풀 실행 (풀을 쓸 수 없는 환경이면 스레드로 대체)"""
+        loop = asyncio.get_running_loop()
+        if self._process_pool_available:
+            try:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                future = loop.run_in_executor(self._executor, func, *args)
+            except (BrokenProcessPool, OSError, NotImplementedError) as e:
+                self._disable_process_pool(e)
+            else:
+                try:
+                    return await future
+                except BrokenProcessPool as e:
+                    self._disable_process_pool(e)
+        return await loop.run_in_executor(None, func, *args)
+
+    def _disable_process_pool(self, error: Exception):
+        logger.warning(f"이미지 프로세스 풀 사용 불가, 스레드로 대체: {error}")
+        self._process_pool_available = False
+        self.shutdown()
+
+    def _store(self, key: Tuple[str, ImageTarget], prepared: PreparedImage):
+        if len(prepared.data) > self.cache_max_bytes:
+            return
+        self._cache[key] = prepared
+        self._cache_bytes += len(prepared.data)
+        while self._cache_bytes > self.cache_max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= len(evicted.data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """파이프라인 통계"""
+        return {
+            **self.stats,
+            'cache_entries': len(self._cache),
+            'cache_bytes': self._cache_bytes,
+            'process_pool': self._process_pool_available,
+            'max_workers': self.max_workers
+        }
+
+    def shutdown(self):
+        """프로세스 풀 정리"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 인스턴스 (분석기/문서 처리기 공유)
+image_pipeline = ImagePipeline()
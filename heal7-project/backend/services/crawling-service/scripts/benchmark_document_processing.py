@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+HEAL7 문서 배치 처리 벤치마크
+혼합 문서 묶음(PDF/DOCX/XLSX/TXT)에서 이벤트 루프 직접 파싱과 형식별 워커 풀 파싱의 처리량 비교
+
+- 처리량, 첫 결과까지 시간, 최대 이벤트 루프 지연 측정
+- 두 방식의 파싱 결과가 같은지 확인 (실행기 간 일치만 확인, 기존 셀 단위 XLSX 추출과의 일치는 tests/test_document_parsers.py)
+- AI 분석/페이지 렌더링은 제외 (파싱 단계만 측정)
+
+실행: python benchmark_document_processing.py [형식별 파일 수] [동시 처리 수]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from multimodal.document_parsers import PARSERS, DocumentParseExecutor
+from multimodal.document_processor import DocumentProcessor
+
+WORDS = "사주 명리 오행 운세 궁합 천간 지지 대운 세운 용신 heal7 crawler document table".split()
+
+
+def _sentence(rng: random.Random, length: int = 12) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def make_pdf(path: str, rng: random.Random, pages: int = 20):
+    """텍스트 PDF 생성 (Helvetica, 페이지당 40줄)"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for _ in range(pages):
+        lines = ''.join(f"({'line %d ' % i + ' '.join(rng.choice(['alpha', 'beta', 'gamma', 'delta']) for _ in range(10))}) Tj T* "
+                        for i in range(40))
+        stream = f"BT /F1 10 Tf 12 TL 40 800 Td {lines}ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {pages} >>"
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode('latin-1')
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += ''.join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    with open(path, 'wb') as f:
+        f.write(body)
+
+
+def make_docx(path: str, rng: random.Random, paragraphs: int = 300, tables: int = 5):
+    from docx import Document
+    doc = Document()
+    doc.core_properties.title = "HEAL7 benchmark"
+    for _ in range(paragraphs):
+        doc.add_paragraph(_sentence(rng))
+    for _ in range(tables):
+        table = doc.add_table(rows=30, cols=5)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = rng.choice(WORDS)
+    doc.save(path)
+
+
+def make_xlsx(path: str, rng: random.Random, rows: int, sheets: int = 2):
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    for sheet_index in range(sheets):
+        sheet = workbook.create_sheet(f"Sheet{sheet_index + 1}")
+        sheet.append([f"col{col}" for col in range(12)])
+        for row in range(rows):
+            sheet.append([row] + [rng.random() for _ in range(6)] + [rng.choice(WORDS) for _ in range(5)])
+    workbook.save(path)
+
+
+def make_text(path: str, rng: random.Random, lines: int = 20000):
+    with open(path, 'w', encoding='cp949') as f:
+        for _ in range(lines):
+            f.write(_sentence(rng) + '\n')
+
+
+def build_corpus(directory: str, per_format: int) -> list:
+    """혼합 문서 묶음 생성 (XLSX 는 절반을 read-only 모드 대상 크기로)"""
+    rng = random.Random(7)
+    paths = []
+    for index in range(per_format):
+        for suffix, maker in (('.pdf', make_pdf), ('.docx', make_docx), ('.txt', make_text)):
+            path = os.path.join(directory, f"doc{index}{suffix}")
+            maker(path, rng)
+            paths.append(path)
+        path = os.path.join(directory, f"sheet{index}.xlsx")
+        make_xlsx(path, rng, rows=40000 if index % 2 else 3000)
+        paths.append(path)
+    rng.shuffle(paths)
+    return paths
+
+
+class InlineParseExecutor(DocumentParseExecutor):
+    """기존 방식: 이벤트 루프에서 직접 파싱"""
+
+    async def parse(self, doc_format, file_path):
+        return PARSERS[doc_format](file_path)
+
+
+async def measure_loop_lag(stop_event: asyncio.Event, interval: float = 0.01) -> float:
+    """이벤트 루프 최대 지연(ms) 측정"""
+    max_lag = 0.0
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = (time.perf_counter() - started - interval) * 1000
+        max_lag = max(max_lag, lag)
+    return max_lag
+
+
+async def run_batch(processor: DocumentProcessor, paths: list, concurrency: int) -> dict:
+    """배치 처리 후 처리량/첫 결과 시간/루프 지연 수집"""
+    stop_event = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop_event))
+
+    results = {}
+    first_result = None
+    started = time.perf_counter()
+    async for result in processor.process_documents(paths, concurrency, include_ai_analysis=False,
+                                                    extract_images=False):
+        first_result = first_result or time.perf_counter() - started
+        results[result.file_path] = result
+    elapsed = time.perf_counter() - started
+
+    stop_event.set()
+    max_lag = await lag_task
+    return {
+        'elapsed': elapsed,
+        'throughput': len(paths) / elapsed,
+        'first_result_s': first_result,
+        'max_loop_lag_ms': max_lag,
+        'failures': sum(1 for result in results.values() if result.error),
+        'results': results,
+    }
+
+
+async def main(per_format: int, concurrency: int):
+    """메인 함수"""
+    print("🚀 HEAL7 문서 배치 처리 벤치마크")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = build_corpus(directory, per_format)
+        size_mb = sum(os.path.getsize(path) for path in paths) / 1024 / 1024
+        print(f"문서: {len(paths)}개 ({size_mb:.1f}MB), 동시 처리: {concurrency}, CPU: {os.cpu_count()}")
+
+        pool_executor = DocumentParseExecutor()
+        runs = {
+            '이벤트 루프 직접 파싱': await run_batch(DocumentProcessor(InlineParseExecutor()), paths, concurrency),
+            '형식별 워커 풀': await run_batch(DocumentProcessor(pool_executor), paths, concurrency),
+        }
+        pool_executor.shutdown()
+
+    inline, pooled = (run['results'] for run in runs.values())
+    mismatches = [path for path in paths
+                  if (inline[path].text_content, inline[path].tables) != (pooled[path].text_content, pooled[path].tables)]
+
+    print("\n" + "=" * 50)
+    for name, run in runs.items():
+        print(f"📊 {name}")
+        print(f"  처리량: {run['throughput']:.2f} docs/s (총 {run['elapsed']:.2f}s, 실패 {run['failures']}건)")
+        print(f"  첫 결과: {run['first_result_s']:.2f}s")
+        print(f"  최대 이벤트 루프 지연: {run['max_loop_lag_ms']:.1f}ms")
+    print(f"🔍 결과 일치: {len(paths) - len(mismatches)}/{len(paths)}")
+    print(f"🗂️ 형식별 통계: {pool_executor.get_stats()['formats']}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    per_format = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1) * 2
+    sys.exit(asyncio.run(main(per_format, concurrency)))
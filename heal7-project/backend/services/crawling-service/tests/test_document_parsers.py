@@ -0,0 +1,129 @@
+"""
+HEAL7 XLSX 파서 일치 테스트
+
+형식별 워커 풀 도입 전 DocumentProcessor._process_xlsx 의 셀 단위 추출 결과와
+parse_xlsx (일반 모드 / read-only 스트리밍 모드) 결과가 같은지 확인
+- 표: 첫 행 헤더(빈 헤더는 ColumnN), 최대 999행, 데이터 시작 후 빈 행에서 중단, 2행 2열 이상만 표로 인정
+- 텍스트: 시트별 앞 100행 탭 구분
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from multimodal import document_parsers
+from multimodal.document_parsers import parse_xlsx
+
+WORDS = "사주 명리 오행 운세 궁합 천간 지지 대운 세운 용신".split()
+
+
+def legacy_process_xlsx(file_path: str) -> dict:
+    """기존 DocumentProcessor._process_xlsx 추출 로직 (셀 단위 접근, 그대로 재현)"""
+    workbook = openpyxl.load_workbook(file_path, data_only=True)
+    metadata = {
+        'worksheets': workbook.sheetnames,
+        'active_sheet': workbook.active.title if workbook.active else ''
+    }
+    tables, text_contents = [], []
+
+    for sheet_name in workbook.sheetnames:
+        worksheet = workbook[sheet_name]
+
+        if worksheet.max_row > 1 and worksheet.max_column > 1:
+            headers = []
+            for col in range(1, worksheet.max_column + 1):
+                cell_value = worksheet.cell(1, col).value
+                headers.append(str(cell_value) if cell_value else f'Column{col}')
+
+            rows = []
+            for row in range(2, min(worksheet.max_row + 1, 1000)):
+                row_data = []
+                has_data = False
+
+                for col in range(1, worksheet.max_column + 1):
+                    cell_value = worksheet.cell(row, col).value
+                    row_data.append(cell_value)
+                    if cell_value is not None:
+                        has_data = True
+
+                if has_data:
+                    rows.append(row_data)
+                elif len(rows) > 0:
+                    break
+
+            if rows:
+                tables.append({'sheet_name': sheet_name, 'headers': headers, 'rows': rows})
+
+        text_content = f"=== {sheet_name} ===\n"
+        for row in worksheet.iter_rows(max_row=min(100, worksheet.max_row), values_only=True):
+            row_text = '\t'.join(str(cell) if cell is not None else '' for cell in row)
+            if row_text.strip():
+                text_content += row_text + '\n'
+        text_contents.append(text_content)
+
+    workbook.close()
+    return {'text_content': text_contents, 'tables': tables, 'metadata': metadata}
+
+
+def _fill(sheet, rows):
+    for row_index, values in enumerate(rows, start=1):
+        for col_index, value in enumerate(values, start=1):
+            if value is not None:
+                sheet.cell(row_index, col_index, value)
+
+
+def build_workbook(path: str):
+    """경계 사례 시트 모음"""
+    rng = random.Random(7)
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "기본"
+    _fill(workbook.active, [["이름", "점수", None, "메모"]] + [
+        [rng.choice(WORDS), rng.randint(0, 100), rng.random(), rng.choice([None, rng.choice(WORDS)])]
+        for _ in range(50)
+    ])
+
+    sheets = {
+        # 표 중간의 빈 행에서 중단 (텍스트는 계속)
+        "빈행중단": [["a", "b"], [1, 2], [3, None], [None, None], [5, 6], [7, 8]],
+        # 데이터 시작 전 빈 행은 건너뜀, 빈 헤더
+        "앞빈행": [[None, None, None], [None, None, None], [1, "x", None], [2, "y", 3.5]],
+        # 들쭉날쭉한 행 (마지막 열에만 값이 있는 행 포함)
+        "들쭉날쭉": [["h1", "h2", "h3", "h4"], [1], [None, None, None, "끝"], [1, 2, 3], ["", 0, False, None]],
+        # 헤더만 있는 시트 / 한 열짜리 시트 / 한 행짜리 시트
+        "헤더만": [["h1", "h2", "h3"]],
+        "한열": [["h"], [1], [2], [3]],
+        "한행": [[1, 2, 3, 4, 5]],
+        # 999행 상한, 100행 텍스트 상한
+        "긴표": [["n", "제곱", "날짜"]] + [[n, n * n, datetime(2025, 1, 1 + n % 28)] for n in range(1500)],
+        # 100행 넘어서까지 이어지는 표가 중간에 끊김
+        "긴표중단": [["n", "값"]] + [[n, rng.choice(WORDS)] for n in range(150)] + [[None, None]]
+                    + [[n, "이후"] for n in range(20)],
+    }
+    for name, rows in sheets.items():
+        _fill(workbook.create_sheet(name), rows)
+    workbook.create_sheet("빈시트")
+    workbook.save(path)
+
+
+@pytest.fixture(scope="module")
+def workbook_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("xlsx") / "edge_cases.xlsx")
+    build_workbook(path)
+    return path
+
+
+@pytest.mark.parametrize("read_only", [False, True], ids=["normal", "read_only"])
+def test_parse_xlsx_matches_legacy(workbook_path, read_only, monkeypatch):
+    monkeypatch.setattr(document_parsers, "XLSX_READ_ONLY_BYTES", 0 if read_only else 1 << 40)
+    expected = legacy_process_xlsx(workbook_path)
+    parsed = parse_xlsx(workbook_path)
+
+    assert parsed['metadata']['read_only'] is read_only
+    assert {key: parsed['metadata'][key] for key in ('worksheets', 'active_sheet')} == expected['metadata']
+    assert [table['sheet_name'] for table in parsed['tables']] == [table['sheet_name'] for table in expected['tables']]
+    for table, expected_table in zip(parsed['tables'], expected['tables']):
+        assert table == expected_table, table['sheet_name']
+    assert parsed['text_content'] == expected['text_content']
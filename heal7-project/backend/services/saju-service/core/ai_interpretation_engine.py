@@ -7,23 +7,40 @@
 - 정확한 월주 계산 엔진과 연동
 - 전통 명리학 + 현대적 해석 융합
 - 개인화된 운세 분석
+- 프롬프트 템플릿 1회 컴파일, 같은 사주 동치류의 해석은 영속 캐시에서 즉시 반환
+- 선택 모델이 지연되면 다음 모델을 병렬 발사해 먼저 도착한 응답 사용 (shared.model_dispatch)
+- 먼저 도착한 응답이 정해지면 진 모델의 호출은 취소 (비동기 SDK 클라이언트, 스레드 미사용)
 
 작성일: 2025-09-13
 목적: 치유마녀 사주 서비스의 AI 해석 품질 혁신
 """
 
 import os
+import sys
 import json
 import asyncio
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
+import functools
+import hashlib
+from string import Formatter
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Any, Union
+from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
+from pathlib import Path
 import openai
 import google.generativeai as genai
 from loguru import logger
 import random
 
+try:
+    from .interpretation_cache import InterpretationCache
+except ImportError:
+    from interpretation_cache import InterpretationCache
+
+# 공용 모델 디스패치 계층 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from shared.model_dispatch import ModelDispatcher
+
 # AI 모델 타입
 class AIModelType(Enum):
     GPT_4O = "gpt-4o"
@@ -32,6 +49,17 @@ class AIModelType(Enum):
     GEMINI_2_0_FLASH = "gemini-2.0-flash-exp"
     GEMINI_PRO = "gemini-1.5-pro-latest"
 
+OPENAI_MODELS = (AIModelType.GPT_4O, AIModelType.GPT_5, AIModelType.GPT_5_MINI)
+
+# 모델별 동시 호출 수 (제공자 속도 제한 기준)
+MODEL_CONCURRENCY = {
+    AIModelType.GPT_4O.value: 8,
+    AIModelType.GPT_5.value: 4,
+    AIModelType.GPT_5_MINI.value: 8,
+    AIModelType.GEMINI_2_0_FLASH.value: 16,
+    AIModelType.GEMINI_PRO.value: 4,
+}
+
 # 해석 타입
 class InterpretationType(Enum):
     BASIC = "basic"                    # 기본 사주 해석
@@ -73,96 +101,24 @@ class InterpretationResult:
     confidence_score: float  # AI 모델 신뢰도
     created_at: datetime
     estimated_reading_time: int  # 예상 읽기 시간(분)
+    cached: bool = False  # 해석 캐시 적중 여부
 
-class AIInterpretationEngine:
-    """
-    🤖 AI 사주 해석 엔진
-
-    다중 AI 모델을 활용한 고품질 사주 해석 시스템
-    """
-
-    def __init__(self):
-        """엔진 초기화"""
-        self._load_api_keys()
-        self._initialize_models()
-
-    def _load_api_keys(self):
-        """AI API 키 로드"""
-        try:
-            # .env.ai 파일에서 키 로드
-            env_path = "/home/ubuntu/heal7-project/.env.ai"
-            if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        if '=' in line and not line.startswith('#'):
-                            key, value = line.strip().split('=', 1)
-                            os.environ[key] = value
-
-            # API 키 설정
-            self.openai_key = os.getenv('OPENAI_API_KEY')
-            self.gemini_key = os.getenv('GEMINI_API_KEY')
-
-            if not self.openai_key or not self.gemini_key:
-                raise ValueError("Required AI API keys not found")
-
-            logger.info("✅ AI API keys loaded successfully")
+# 프롬프트 템플릿 버전 (문구를 바꾸면 올려서 이전 해석 캐시를 무효화)
+PROMPT_TEMPLATE_VERSION = "2025.09.2"
 
-        except Exception as e:
-            logger.error(f"❌ Failed to load AI API keys: {e}")
-            raise
-
-    def _initialize_models(self):
-        """AI 모델 초기화"""
-        try:
-            # OpenAI 클라이언트 초기화
-            openai.api_key = self.openai_key
-            self.openai_client = openai
-
-            # Gemini 모델 초기화
-            genai.configure(api_key=self.gemini_key)
-
-            # 사용 가능한 모델 리스트
-            self.available_models = [
-                AIModelType.GPT_4O,
-                AIModelType.GEMINI_2_0_FLASH,
-                AIModelType.GEMINI_PRO
-            ]
-
-            logger.info(f"✅ {len(self.available_models)} AI models initialized")
-
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize AI models: {e}")
-            raise
-
-    def _select_optimal_model(self, interpretation_type: InterpretationType) -> AIModelType:
-        """해석 유형에 따른 최적 모델 선택"""
-        model_preferences = {
-            InterpretationType.BASIC: AIModelType.GEMINI_2_0_FLASH,      # 빠르고 정확
-            InterpretationType.DETAILED: AIModelType.GPT_4O,            # 상세한 분석
-            InterpretationType.COMPATIBILITY: AIModelType.GEMINI_PRO,   # 관계 분석 특화
-            InterpretationType.NAMING: AIModelType.GPT_4O,              # 창의적 작명
-            InterpretationType.YEARLY_FORTUNE: AIModelType.GEMINI_PRO,  # 장기 예측
-            InterpretationType.MONTHLY_FORTUNE: AIModelType.GEMINI_2_0_FLASH,
-            InterpretationType.DAILY_FORTUNE: AIModelType.GEMINI_2_0_FLASH
-        }
-
-        return model_preferences.get(interpretation_type, AIModelType.GPT_4O)
-
-    def _create_interpretation_prompt(self, saju_data: SajuData, interpretation_type: InterpretationType) -> str:
-        """해석 타입별 AI 프롬프트 생성"""
-        base_saju_info = f"""
+# 사주 기본 정보 블록 (사주 동치류만으로 결정되는 항목만 포함 → 같은 사주는 같은 프롬프트)
+_BASE_SAJU_INFO_TEMPLATE = """
 📊 사주 정보:
-• 출생: {saju_data.birth_info.get('year')}년 {saju_data.birth_info.get('month')}월 {saju_data.birth_info.get('day')}일 {saju_data.birth_info.get('hour')}시
-• 팔자: {saju_data.palcha}
-• 일간: {saju_data.day_master} ({saju_data.day_master_element})
-• 일간 강약: {'강' if saju_data.is_strong_day_master else '약'}
-• 오행 균형: {json.dumps(saju_data.element_balance, ensure_ascii=False)}
-• 십신 분석: {json.dumps(saju_data.sipsin_analysis, ensure_ascii=False)}
-• 신살: {', '.join(saju_data.sinsal) if saju_data.sinsal else '없음'}
+• 팔자: {palcha}
+• 일간: {day_master} ({day_master_element})
+• 일간 강약: {day_master_strength}
+• 오행 균형: {element_balance}
+• 십신 분석: {sipsin_analysis}
+• 신살: {sinsal}
 """
 
-        prompts = {
-            InterpretationType.BASIC: f"""
+_PROMPT_TEMPLATE_SOURCES = {
+    InterpretationType.BASIC: """
 당신은 30년 경력의 사주명리 전문가입니다. 다음 사주를 분석해 주세요.
 
 {base_saju_info}
@@ -178,7 +134,7 @@ class AIInterpretationEngine:
 친근하고 현대적인 어조로, 실용적인 조언 위주로 작성해 주세요.
 """,
 
-            InterpretationType.DETAILED: f"""
+    InterpretationType.DETAILED: """
 당신은 한국 최고 수준의 사주명리 대가입니다. 다음 사주를 전문적으로 분석해 주세요.
 
 {base_saju_info}
@@ -216,7 +172,7 @@ class AIInterpretationEngine:
 전문적이면서도 실용적인 조언으로 작성해 주세요.
 """,
 
-            InterpretationType.COMPATIBILITY: f"""
+    InterpretationType.COMPATIBILITY: """
 당신은 궁합 전문 사주명리사입니다. 다음 사주의 궁합 특성을 분석해 주세요.
 
 {base_saju_info}
@@ -244,9 +200,176 @@ class AIInterpretationEngine:
 
 현실적이고 건설적인 조언으로 작성해 주세요.
 """
+}
+
+
+class CompiledPrompt(NamedTuple):
+    """컴파일된 프롬프트 템플릿 (기본 정보 블록 삽입 완료, 필요 필드 사전 계산)"""
+    template: str
+    fields: FrozenSet[str]
+
+
+def _compile_prompt(source: str) -> CompiledPrompt:
+    template = source.replace("{base_saju_info}", _BASE_SAJU_INFO_TEMPLATE)
+    fields = frozenset(name for _, name, _, _ in Formatter().parse(template) if name)
+    return CompiledPrompt(template, fields)
+
+
+# 임포트 시 1회 컴파일 (목록에 없는 해석 타입은 BASIC 사용)
+COMPILED_PROMPTS: Dict[InterpretationType, CompiledPrompt] = {
+    interpretation_type: _compile_prompt(source)
+    for interpretation_type, source in _PROMPT_TEMPLATE_SOURCES.items()
+}
+
+
+def compiled_prompt(interpretation_type: InterpretationType) -> CompiledPrompt:
+    """해석 타입의 컴파일된 템플릿"""
+    return COMPILED_PROMPTS.get(interpretation_type, COMPILED_PROMPTS[InterpretationType.BASIC])
+
+
+def prompt_fields(saju_data: SajuData) -> Dict[str, str]:
+    """프롬프트 필드 정규화 (딕셔너리 키 순서, 신살 순서에 무관한 문자열)"""
+    return {
+        "palcha": saju_data.palcha,
+        "day_master": saju_data.day_master,
+        "day_master_element": saju_data.day_master_element,
+        "day_master_strength": '강' if saju_data.is_strong_day_master else '약',
+        "element_balance": json.dumps(saju_data.element_balance, ensure_ascii=False, sort_keys=True),
+        "sipsin_analysis": json.dumps(saju_data.sipsin_analysis, ensure_ascii=False, sort_keys=True, default=str),
+        "sinsal": ', '.join(sorted(saju_data.sinsal)) if saju_data.sinsal else '없음',
+    }
+
+
+# 기간 한정 해석 타입: 지문에 기간 키를 넣고 기간 경계에서 만료 (오늘의 운세가 내일 재사용되지 않도록)
+PERIOD_KEY_FORMATS = {
+    InterpretationType.DAILY_FORTUNE: "%Y-%m-%d",
+    InterpretationType.MONTHLY_FORTUNE: "%Y-%m",
+    InterpretationType.YEARLY_FORTUNE: "%Y",
+}
+
+
+def period_key(interpretation_type: InterpretationType, now: Optional[datetime] = None) -> Optional[str]:
+    """해석 기간 키 (일/월/연 운세만, 나머지 타입은 None)"""
+    key_format = PERIOD_KEY_FORMATS.get(interpretation_type)
+    return (now or datetime.now()).strftime(key_format) if key_format else None
+
+
+def period_ttl_seconds(interpretation_type: InterpretationType, now: Optional[datetime] = None) -> Optional[int]:
+    """다음 기간 경계까지 남은 초 (기간 한정 타입이 아니면 None → 캐시 기본 TTL)"""
+    if interpretation_type not in PERIOD_KEY_FORMATS:
+        return None
+    now = now or datetime.now()
+    if interpretation_type == InterpretationType.DAILY_FORTUNE:
+        boundary = datetime(now.year, now.month, now.day) + timedelta(days=1)
+    elif interpretation_type == InterpretationType.MONTHLY_FORTUNE:
+        boundary = datetime(now.year + now.month // 12, now.month % 12 + 1, 1)
+    else:
+        boundary = datetime(now.year + 1, 1, 1)
+    return max(1, int((boundary - now).total_seconds()))
+
+
+def prompt_fingerprint(saju_data: SajuData, interpretation_type: InterpretationType, model: AIModelType,
+                       now: Optional[datetime] = None) -> str:
+    """프롬프트 지문 = 사주 동치류(템플릿이 쓰는 필드) + 해석 타입 + 모델 + 템플릿 버전 (+ 기간 키)
+
+    출생 연월일시 자체는 프롬프트에 들어가지 않으므로 같은 팔자/분석 결과면 같은 지문
+    일/월/연 운세는 해당 기간(now 기준)이 지문에 포함되어 기간이 바뀌면 다른 지문
+    """
+    compiled = compiled_prompt(interpretation_type)
+    fields = prompt_fields(saju_data)
+    payload = json.dumps(
+        [PROMPT_TEMPLATE_VERSION, interpretation_type.value, model.value,
+         sorted((name, fields[name]) for name in compiled.fields),
+         period_key(interpretation_type, now)],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AIInterpretationEngine:
+    """
+    🤖 AI 사주 해석 엔진
+
+    다중 AI 모델을 활용한 고품질 사주 해석 시스템
+    """
+
+    def __init__(self, cache: Optional[InterpretationCache] = None):
+        """엔진 초기화"""
+        self._load_api_keys()
+        self._initialize_models()
+        self.cache = cache or InterpretationCache()
+        self.dispatcher = ModelDispatcher(concurrency=MODEL_CONCURRENCY)
+        self.request_deadline = float(os.getenv('AI_INTERPRETATION_DEADLINE', 60))
+
+    def _load_api_keys(self):
+        """AI API 키 로드"""
+        try:
+            # .env.ai 파일에서 키 로드
+            env_path = "/home/ubuntu/heal7-project/.env.ai"
+            if os.path.exists(env_path):
+                with open(env_path, 'r') as f:
+                    for line in f:
+                        if '=' in line and not line.startswith('#'):
+                            key, value = line.strip().split('=', 1)
+                            os.environ[key] = value
+
+            # API 키 설정
+            self.openai_key = os.getenv('OPENAI_API_KEY')
+            self.gemini_key = os.getenv('GEMINI_API_KEY')
+
+            if not self.openai_key or not self.gemini_key:
+                raise ValueError("Required AI API keys not found")
+
+            logger.info("✅ AI API keys loaded successfully")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to load AI API keys: {e}")
+            raise
+
+    def _initialize_models(self):
+        """AI 모델 초기화"""
+        try:
+            # OpenAI 클라이언트 초기화 (비동기 클라이언트 1회 생성 후 재사용 - HTTP 연결 풀 유지)
+            self.openai_client = openai.AsyncOpenAI(api_key=self.openai_key)
+
+            # Gemini 모델 초기화 (모델 인스턴스는 첫 호출 시 생성 후 재사용)
+            genai.configure(api_key=self.gemini_key)
+            self._gemini_models: Dict[AIModelType, Any] = {}
+
+            # 사용 가능한 모델 리스트
+            self.available_models = [
+                AIModelType.GPT_4O,
+                AIModelType.GEMINI_2_0_FLASH,
+                AIModelType.GEMINI_PRO
+            ]
+
+            logger.info(f"✅ {len(self.available_models)} AI models initialized")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to initialize AI models: {e}")
+            raise
+
+    def _select_optimal_model(self, interpretation_type: InterpretationType) -> AIModelType:
+        """해석 유형에 따른 최적 모델 선택"""
+        model_preferences = {
+            InterpretationType.BASIC: AIModelType.GEMINI_2_0_FLASH,      # 빠르고 정확
+            InterpretationType.DETAILED: AIModelType.GPT_4O,            # 상세한 분석
+            InterpretationType.COMPATIBILITY: AIModelType.GEMINI_PRO,   # 관계 분석 특화
+            InterpretationType.NAMING: AIModelType.GPT_4O,              # 창의적 작명
+            InterpretationType.YEARLY_FORTUNE: AIModelType.GEMINI_PRO,  # 장기 예측
+            InterpretationType.MONTHLY_FORTUNE: AIModelType.GEMINI_2_0_FLASH,
+            InterpretationType.DAILY_FORTUNE: AIModelType.GEMINI_2_0_FLASH
         }
 
-        return prompts.get(interpretation_type, prompts[InterpretationType.BASIC])
+        return model_preferences.get(interpretation_type, AIModelType.GPT_4O)
+
+    def _model_candidates(self, model: AIModelType) -> List[AIModelType]:
+        """경주 후보: 선택 모델 → 나머지 사용 가능 모델 순"""
+        return [model] + [candidate for candidate in self.available_models if candidate != model]
+
+    def _create_interpretation_prompt(self, saju_data: SajuData, interpretation_type: InterpretationType) -> str:
+        """해석 타입별 AI 프롬프트 생성 (컴파일된 템플릿에 필드만 채움)"""
+        return compiled_prompt(interpretation_type).template.format_map(prompt_fields(saju_data))
 
     async def _call_openai_model(self, prompt: str, model: AIModelType) -> str:
         """OpenAI 모델 호출"""
@@ -257,8 +380,7 @@ class AIInterpretationEngine:
                 AIModelType.GPT_5_MINI: "gpt-4o-mini"
             }
 
-            response = await asyncio.to_thread(
-                self.openai_client.chat.completions.create,
+            response = await self.openai_client.chat.completions.create(
                 model=model_names[model],
                 messages=[
                     {"role": "system", "content": "당신은 전문 사주명리학자입니다."},
@@ -282,10 +404,11 @@ class AIInterpretationEngine:
                 AIModelType.GEMINI_PRO: "gemini-1.5-pro-latest"
             }
 
-            gemini_model = genai.GenerativeModel(model_names[model])
+            gemini_model = self._gemini_models.get(model)
+            if gemini_model is None:
+                gemini_model = self._gemini_models[model] = genai.GenerativeModel(model_names[model])
 
-            response = await asyncio.to_thread(
-                gemini_model.generate_content,
+            response = await gemini_model.generate_content_async(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     max_output_tokens=2000,
@@ -299,6 +422,12 @@ class AIInterpretationEngine:
             logger.error(f"Gemini API 호출 실패: {e}")
             raise
 
+    async def _call_model(self, prompt: str, model: AIModelType) -> str:
+        """제공자별 모델 호출"""
+        if model in OPENAI_MODELS:
+            return await self._call_openai_model(prompt, model)
+        return await self._call_gemini_model(prompt, model)
+
     async def generate_interpretation(
         self,
         saju_data: SajuData,
@@ -317,19 +446,45 @@ class AIInterpretationEngine:
             InterpretationResult: AI 해석 결과
         """
         try:
-            # 모델 선택
+            # 모델 선택 (선택 모델이 지연/실패하면 나머지 모델이 순서대로 경주에 참여)
             model = preferred_model or self._select_optimal_model(interpretation_type)
+            candidates = self._model_candidates(model)
+            # 조회/저장 모두 같은 시각의 기간 키 사용 (기간 경계에 걸친 요청도 한 기간에 저장)
+            now = datetime.now()
+
+            # 같은 사주 동치류 + 해석 타입 + 모델(+ 기간)의 해석이 캐시에 있으면 LLM 호출 생략
+            # 선호 모델을 지정한 요청은 그 모델의 해석만 적중으로 인정
+            for candidate in ([model] if preferred_model else candidates):
+                cached = await self._get_cached_response(
+                    prompt_fingerprint(saju_data, interpretation_type, candidate, now)
+                )
+                if cached is not None:
+                    logger.info(f"⚡ AI 해석 캐시 적중: {interpretation_type.value} with {candidate.value}")
+                    result = self._structure_interpretation_result(
+                        cached, interpretation_type, candidate, saju_data
+                    )
+                    result.cached = True
+                    return result
 
             # 프롬프트 생성
             prompt = self._create_interpretation_prompt(saju_data, interpretation_type)
 
             logger.info(f"🤖 AI 해석 시작: {interpretation_type.value} with {model.value}")
 
-            # AI 모델 호출
-            if model in [AIModelType.GPT_4O, AIModelType.GPT_5, AIModelType.GPT_5_MINI]:
-                ai_response = await self._call_openai_model(prompt, model)
-            else:
-                ai_response = await self._call_gemini_model(prompt, model)
+            # AI 모델 경주 (먼저 도착한 유효 응답 사용, 진 모델의 호출은 취소)
+            used, ai_response = await self.dispatcher.race(
+                [(candidate.value, functools.partial(self._call_model, prompt, candidate))
+                 for candidate in candidates],
+                deadline=self.request_deadline
+            )
+            model = AIModelType(used)
+
+            # 성공한 응답만 캐시 (폴백 해석은 저장하지 않음, 기간 한정 타입은 기간 경계에서 만료)
+            fingerprint = prompt_fingerprint(saju_data, interpretation_type, model, now)
+            await self._store_cached_response(
+                fingerprint, interpretation_type, model, ai_response,
+                period_ttl_seconds(interpretation_type, now)
+            )
 
             # 결과 구조화
             result = self._structure_interpretation_result(
@@ -344,6 +499,44 @@ class AIInterpretationEngine:
             # 폴백 해석 반환
             return self._create_fallback_interpretation(saju_data, interpretation_type)
 
+    async def _get_cached_response(self, fingerprint: str) -> Optional[str]:
+        """캐시된 해석 원문 조회 (캐시 오류는 미적중으로 처리)"""
+        try:
+            entry = await asyncio.to_thread(self.cache.get, fingerprint, PROMPT_TEMPLATE_VERSION)
+        except Exception as e:
+            logger.warning(f"AI 해석 캐시 조회 실패: {e}")
+            return None
+        return entry.response if entry else None
+
+    async def _store_cached_response(
+        self,
+        fingerprint: str,
+        interpretation_type: InterpretationType,
+        model: AIModelType,
+        ai_response: str,
+        ttl_seconds: Optional[int] = None
+    ):
+        """해석 원문 캐시 저장 (실패해도 해석 결과는 반환, ttl_seconds 는 캐시 기본 TTL 이내로 제한)"""
+        if not ai_response:
+            return
+        if ttl_seconds is not None:
+            ttl_seconds = min(ttl_seconds, self.cache.ttl_seconds)
+        try:
+            await asyncio.to_thread(
+                self.cache.put, fingerprint, PROMPT_TEMPLATE_VERSION,
+                interpretation_type.value, model.value, ai_response, ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"AI 해석 캐시 저장 실패: {e}")
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """모델별 호출/지연 통계 + 해석 캐시 통계"""
+        return {
+            'model_stats': self.dispatcher.snapshot(),
+            'available_models': [model.value for model in self.available_models],
+            'cache': self.cache.stats(),
+        }
+
     def _structure_interpretation_result(
         self,
         ai_response: str,
@@ -0,0 +1,240 @@
+"""
+HEAL7 Analytics Rollup Service
+대시보드 통계용 시간/일 단위 사전 집계
+
+기능:
+- 시간별(analytics_hourly_rollups) / 일별(analytics_daily_rollups) 집계 테이블 관리
+- 백그라운드 작업이 마지막 집계 시점 이후 구간만 증분 재집계
+- created_at 범위 조건만 사용 (DATE(created_at) 미사용 → 인덱스 활용)
+- 집계가 오래되었거나 실패한 경우 원본 테이블 범위 쿼리로 대체
+"""
+
+import asyncio
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from loguru import logger
+
+from database_service import db_service
+
+
+class RollupMetric(NamedTuple):
+    """집계 지표 정의"""
+    name: str
+    table: str
+    value_expr: str
+    condition: str = ""
+    additive: bool = True  # False 이면 시간별 합산 불가 (COUNT DISTINCT 등) → 일 단위로 직접 집계
+
+
+# DB 별 집계 지표 (집계 테이블은 원본 테이블과 같은 DB 에 생성)
+ROLLUP_METRICS: Dict[str, Tuple[RollupMetric, ...]] = {
+    'main': (
+        RollupMetric('active_users', 'point_transactions', 'COUNT(DISTINCT user_id)', additive=False),
+        RollupMetric('consultations', 'inquiries', 'COUNT(*)'),
+        RollupMetric('revenue', 'point_charges', 'COALESCE(SUM(amount), 0)', "status = 'completed'"),
+        RollupMetric('new_users', 'users', 'COUNT(*)'),
+    ),
+    'saju': (
+        RollupMetric('saju_calculations', 'saju_results', 'COUNT(*)'),
+        RollupMetric('api_calls', 'admin_logs', 'COUNT(*)', "action LIKE '%API%'"),
+        RollupMetric('ai_interpretations', 'ai_interpretations', 'COUNT(*)'),
+        RollupMetric('approved_content', 'generated_content', 'COUNT(*)', "status = 'approved'"),
+    ),
+}
+
+ROLLUP_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS analytics_hourly_rollups (
+           bucket_start TIMESTAMP NOT NULL,
+           metric VARCHAR(50) NOT NULL,
+           value NUMERIC NOT NULL DEFAULT 0,
+           updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+           PRIMARY KEY (bucket_start, metric)
+       )""",
+    """CREATE TABLE IF NOT EXISTS analytics_daily_rollups (
+           bucket_date DATE NOT NULL,
+           metric VARCHAR(50) NOT NULL,
+           value NUMERIC NOT NULL DEFAULT 0,
+           updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+           PRIMARY KEY (bucket_date, metric)
+       )""",
+)
+
+
+def _where(metric: RollupMetric, first_param: int = 1) -> str:
+    """created_at 범위 조건 (+ 지표별 추가 조건)"""
+    clause = f"created_at >= ${first_param} AND created_at < ${first_param + 1}"
+    return f"{clause} AND {metric.condition}" if metric.condition else clause
+
+
+def _floor_hour(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def day_range(day: date) -> Tuple[datetime, datetime]:
+    """하루 구간 [00:00, 다음날 00:00)"""
+    start = datetime.combine(day, datetime.min.time())
+    return start, start + timedelta(days=1)
+
+
+class AnalyticsRollupService:
+    def __init__(self):
+        self.refresh_interval = int(os.getenv('ANALYTICS_ROLLUP_INTERVAL', '60'))
+        self.backfill_days = int(os.getenv('ANALYTICS_ROLLUP_BACKFILL_DAYS', '1'))
+        # 늦게 커밋된 행을 반영하기 위해 직전 1시간은 매번 재집계
+        self.late_arrival = timedelta(hours=1)
+
+        self._watermark: Optional[datetime] = None
+        self._last_refresh: Dict[str, float] = {}
+        self._schema_ready: Dict[str, bool] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # ===============================================
+    # 백그라운드 작업
+    # ===============================================
+
+    def start(self):
+        """주기적 집계 작업 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Analytics rollup job started (interval: {self.refresh_interval}s)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Analytics rollup refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self, now: Optional[datetime] = None):
+        """마지막 집계 시점 이후 시간 구간과 해당 일자 집계 갱신"""
+        now = now or datetime.now()
+        current_hour = _floor_hour(now)
+        if self._watermark is None:
+            start = datetime.combine(now.date() - timedelta(days=self.backfill_days - 1), datetime.min.time())
+        else:
+            start = self._watermark - self.late_arrival
+        end = current_hour + timedelta(hours=1)
+
+        days = [start.date() + timedelta(days=i) for i in range((now.date() - start.date()).days + 1)]
+        results = await asyncio.gather(
+            *(self._refresh_db(db_type, start, end, days) for db_type in ROLLUP_METRICS),
+            return_exceptions=True
+        )
+        for db_type, result in zip(ROLLUP_METRICS, results):
+            if isinstance(result, Exception):
+                logger.error(f"Analytics rollup failed for {db_type} database: {result}")
+            else:
+                self._last_refresh[db_type] = time.monotonic()
+
+        if not any(isinstance(result, Exception) for result in results):
+            self._watermark = current_hour
+
+    async def _ensure_schema(self, db_type: str):
+        if self._schema_ready.get(db_type):
+            return
+        for statement in ROLLUP_SCHEMA:
+            await db_service.execute_query(statement, db_type=db_type)
+        self._schema_ready[db_type] = True
+
+    async def _refresh_db(self, db_type: str, start: datetime, end: datetime, days: List[date]):
+        await self._ensure_schema(db_type)
+        metrics = ROLLUP_METRICS[db_type]
+
+        await asyncio.gather(*(
+            db_service.execute_query(
+                f"""INSERT INTO analytics_hourly_rollups (bucket_start, metric, value, updated_at)
+                    SELECT date_trunc('hour', created_at), '{metric.name}', {metric.value_expr}, NOW()
+                    FROM {metric.table}
+                    WHERE {_where(metric)}
+                    GROUP BY 1
+                    ON CONFLICT (bucket_start, metric)
+                    DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()""",
+                [start, end],
+                db_type=db_type
+            )
+            for metric in metrics if metric.additive
+        ))
+
+        for day in days:
+            day_start, day_end = day_range(day)
+            # 합산 가능한 지표: 시간별 집계 합계
+            await db_service.execute_query(
+                """INSERT INTO analytics_daily_rollups (bucket_date, metric, value, updated_at)
+                   SELECT $1::date, metric, SUM(value), NOW()
+                   FROM analytics_hourly_rollups
+                   WHERE bucket_start >= $2 AND bucket_start < $3
+                   GROUP BY metric
+                   ON CONFLICT (bucket_date, metric)
+                   DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()""",
+                [day, day_start, day_end],
+                db_type=db_type
+            )
+            # 합산 불가 지표: 일 단위 범위 쿼리
+            for metric in metrics:
+                if metric.additive:
+                    continue
+                await db_service.execute_query(
+                    f"""INSERT INTO analytics_daily_rollups (bucket_date, metric, value, updated_at)
+                        SELECT $1::date, '{metric.name}', {metric.value_expr}, NOW()
+                        FROM {metric.table}
+                        WHERE {_where(metric, 2)}
+                        ON CONFLICT (bucket_date, metric)
+                        DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()""",
+                    [day, day_start, day_end],
+                    db_type=db_type
+                )
+
+    # ===============================================
+    # 조회
+    # ===============================================
+
+    def is_fresh(self, db_type: str) -> bool:
+        """최근 집계가 갱신 주기 3회 이내에 성공했는지 여부"""
+        last_refresh = self._last_refresh.get(db_type)
+        return last_refresh is not None and time.monotonic() - last_refresh < self.refresh_interval * 3
+
+    async def daily_metrics(self, db_type: str, day: Optional[date] = None) -> Dict[str, float]:
+        """일별 지표 (집계 테이블 우선, 오래된 경우 원본 범위 쿼리)"""
+        day = day or datetime.now().date()
+        if self.is_fresh(db_type):
+            try:
+                rows = await db_service.execute_query(
+                    "SELECT metric, value FROM analytics_daily_rollups WHERE bucket_date = $1",
+                    [day],
+                    db_type=db_type
+                )
+                metrics = {metric.name: 0.0 for metric in ROLLUP_METRICS[db_type]}
+                metrics.update({row['metric']: float(row['value']) for row in rows})
+                return metrics
+            except Exception as e:
+                logger.warning(f"Analytics rollup read failed, using live queries: {e}")
+        return await self.live_metrics(db_type, day)
+
+    async def live_metrics(self, db_type: str, day: date) -> Dict[str, float]:
+        """원본 테이블 범위 쿼리 (지표별 병렬 조회)"""
+        day_start, day_end = day_range(day)
+        metrics = ROLLUP_METRICS[db_type]
+        values = await asyncio.gather(*(
+            db_service.execute_count_query(
+                f"SELECT {metric.value_expr} FROM {metric.table} WHERE {_where(metric)}",
+                [day_start, day_end],
+                db_type=db_type
+            )
+            for metric in metrics
+        ))
+        return {metric.name: float(value or 0) for metric, value in zip(metrics, values)}
+
+
+analytics_rollup = AnalyticsRollupService()
@@ -3,16 +3,22 @@ HEAL7 Admin Authentication Service
 관리자 인증 보안 강화 모듈
 
 기능:
-- 비밀번호 해시 처리 (bcrypt)
-- JWT 토큰 생성/검증
+- 비밀번호 해시 처리 (bcrypt, 전용 스레드풀에서 실행)
+- bcrypt cost factor 자동 튜닝 (지연 예산 기준)
+- JWT 토큰 생성/검증 (검증 결과 단기 캐시)
 - 권한 관리
 - 세션 관리
 """
 
+import asyncio
 import bcrypt
+import hashlib
 import jwt
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import secrets
 import os
 from loguru import logger
@@ -29,7 +35,25 @@ class AuthService:
         self.max_failed_attempts = int(os.getenv('MAX_FAILED_ATTEMPTS', '3'))
         self.lockout_duration_minutes = int(os.getenv('LOCKOUT_DURATION_MINUTES', '15'))
 
-        logger.info("AuthService initialized with enhanced security")
+        # bcrypt 설정 - 이벤트 루프를 막지 않도록 전용 스레드풀에서 실행
+        self.bcrypt_max_workers = int(os.getenv('BCRYPT_MAX_WORKERS', '4'))
+        self.bcrypt_target_ms = float(os.getenv('BCRYPT_TARGET_MS', '250'))
+        self._bcrypt_executor = ThreadPoolExecutor(
+            max_workers=self.bcrypt_max_workers,
+            thread_name_prefix='bcrypt'
+        )
+        self._bcrypt_semaphore: Optional[asyncio.Semaphore] = None
+        env_rounds = os.getenv('BCRYPT_ROUNDS')
+        self.bcrypt_rounds = int(env_rounds) if env_rounds else self.tune_bcrypt_rounds(self.bcrypt_target_ms)
+
+        # 검증된 JWT 캐시 (토큰 해시 → (payload, 만료 시각))
+        self.token_cache_ttl = float(os.getenv('JWT_CACHE_TTL_SECONDS', '60'))
+        self.token_cache_max_size = int(os.getenv('JWT_CACHE_MAX_SIZE', '1024'))
+        self._token_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._revoked_tokens: Dict[str, float] = {}
+        self._token_lock = threading.Lock()
+
+        logger.info(f"AuthService initialized with enhanced security (bcrypt rounds: {self.bcrypt_rounds})")
 
     def _generate_secret_key(self) -> str:
         """JWT 비밀키 생성"""
@@ -37,12 +61,51 @@ class AuthService:
         logger.warning(f"Generated new JWT secret key. Please set JWT_SECRET_KEY in environment variables.")
         return secret_key
 
+    def tune_bcrypt_rounds(self, target_ms: float, min_rounds: int = 12, max_rounds: int = 14) -> int:
+        """지연 예산(target_ms) 안에서 가장 높은 bcrypt cost factor 선택
+
+        최소 라운드로 한 번만 측정하고, 라운드가 1 증가할 때마다
+        소요 시간이 두 배가 되는 bcrypt 특성으로 나머지를 추정한다.
+        느린 서버에서도 기존 기본값(12)보다 낮추지 않는다.
+        """
+        min_rounds = max(min_rounds, 12)
+        try:
+            started = time.perf_counter()
+            bcrypt.hashpw(b'heal7-bcrypt-calibration', bcrypt.gensalt(rounds=min_rounds))
+            base_ms = (time.perf_counter() - started) * 1000
+        except Exception as e:
+            logger.warning(f"bcrypt calibration failed, using default rounds: {e}")
+            return 12
+
+        rounds = min_rounds
+        while rounds < max_rounds and base_ms * (2 ** (rounds + 1 - min_rounds)) <= target_ms:
+            rounds += 1
+
+        logger.info(f"bcrypt rounds tuned to {rounds} (base {base_ms:.1f}ms, budget {target_ms:.0f}ms)")
+        return rounds
+
+    def _get_bcrypt_semaphore(self) -> asyncio.Semaphore:
+        """bcrypt 동시 실행 제한 세마포어 (이벤트 루프 안에서 지연 생성)"""
+        if self._bcrypt_semaphore is None:
+            self._bcrypt_semaphore = asyncio.Semaphore(self.bcrypt_max_workers)
+        return self._bcrypt_semaphore
+
+    async def _run_bcrypt(self, func, *args):
+        """bcrypt 작업을 전용 스레드풀에서 실행 (동시성 제한)"""
+        async with self._get_bcrypt_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._bcrypt_executor, func, *args)
+
     def hash_password(self, password: str) -> str:
         """비밀번호 해시 생성"""
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self.bcrypt_rounds)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
+    async def hash_password_async(self, password: str) -> str:
+        """비밀번호 해시 생성 (비동기 핸들러용)"""
+        return await self._run_bcrypt(self.hash_password, password)
+
     def verify_password(self, password: str, hashed_password: str) -> bool:
         """비밀번호 검증"""
         try:
@@ -51,6 +114,17 @@ class AuthService:
             logger.error(f"Password verification error: {e}")
             return False
 
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (비동기 핸들러용)"""
+        return await self._run_bcrypt(self.verify_password, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 해시의 cost factor가 현재 설정보다 낮은지 확인"""
+        try:
+            return int(hashed_password.split('$')[2]) < self.bcrypt_rounds
+        except (IndexError, ValueError):
+            return False
+
     def generate_jwt_token(self, user_data: Dict[str, Any]) -> str:
         """JWT 토큰 생성"""
         try:
@@ -75,8 +149,66 @@ class AuthService:
                 detail="Token generation failed"
             )
 
+    @staticmethod
+    def _token_key(token: str) -> str:
+        """토큰 원문 대신 해시를 캐시 키로 사용"""
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def _get_cached_token(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 검증 결과 조회 (만료된 항목은 제거)"""
+        with self._token_lock:
+            cached = self._token_cache.get(key)
+            if cached is None:
+                return None
+            payload, expires_at = cached
+            if time.time() >= expires_at:
+                del self._token_cache[key]
+                return None
+            return payload
+
+    def _cache_token(self, key: str, payload: Dict[str, Any]):
+        """검증 결과 캐시 저장 (TTL은 토큰 만료 시각을 넘지 않음)"""
+        now = time.time()
+        expires_at = min(now + self.token_cache_ttl, float(payload.get('exp', now)))
+        if expires_at <= now:
+            return
+
+        with self._token_lock:
+            if len(self._token_cache) >= self.token_cache_max_size:
+                for stale_key in [k for k, (_, exp) in self._token_cache.items() if exp <= now]:
+                    del self._token_cache[stale_key]
+                if len(self._token_cache) >= self.token_cache_max_size:
+                    self._token_cache.pop(next(iter(self._token_cache)))
+            self._token_cache[key] = (payload, expires_at)
+
+    def invalidate_jwt_token(self, token: str):
+        """로그아웃 시 토큰 캐시 무효화 및 이 워커에서의 재사용 차단"""
+        key = self._token_key(token)
+        now = time.time()
+
+        with self._token_lock:
+            cached = self._token_cache.pop(key, None)
+            revoked_until = now + self.jwt_expiry_hours * 3600
+            if cached is not None:
+                revoked_until = float(cached[0].get('exp', revoked_until))
+            self._revoked_tokens = {k: exp for k, exp in self._revoked_tokens.items() if exp > now}
+            self._revoked_tokens[key] = revoked_until
+
     def verify_jwt_token(self, token: str) -> Dict[str, Any]:
-        """JWT 토큰 검증"""
+        """JWT 토큰 검증 (검증 결과는 짧은 TTL로 캐시)"""
+        key = self._token_key(token)
+
+        revoked_until = self._revoked_tokens.get(key)
+        if revoked_until is not None and time.time() < revoked_until:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token revoked"
+            )
+
+        cached = self._get_cached_token(key)
+        if cached is not None:
+            return cached
+
         try:
             payload = jwt.decode(token, self.jwt_secret, algorithms=[self.jwt_algorithm])
 
@@ -87,6 +219,7 @@ class AuthService:
                     detail="Token expired"
                 )
 
+            self._cache_token(key, payload)
             return payload
 
         except jwt.ExpiredSignatureError:
@@ -0,0 +1,246 @@
+"""
+HEAL7 사주명리학 시스템 - 궁합 계산 엔진
+
+궁합 규칙을 작은 정수 조회 행렬로 인코딩하고, 한 명식과 다수 후보의 궁합을
+NumPy 행렬 연산으로 한 번에 계산합니다.
+
+Features:
+- 천간 관계 (같은 일간, 천간합), 오행 상생상극, 지지 육합/충 규칙을 정수 행렬로 인코딩
+- 일주(일간×일지, 120개) 조합 점수를 120×120 행렬 하나로 사전 계산
+- 공통 신살은 비트마스크 AND + popcount
+- score_many(): 후보 수천 명에 대한 벡터화 점수 계산 및 상위 k명 반환
+- score_matrix(): 다대다 궁합 점수 행렬
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# 천간/지지 순서 (SajuService 와 동일)
+CHEONAN = ("갑", "을", "병", "정", "무", "기", "경", "신", "임", "계")
+JIJI = ("자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해")
+ELEMENTS = ("wood", "fire", "earth", "metal", "water")
+ELEMENT_NAMES = ("목", "화", "토", "금", "수")
+
+CHEONAN_INDEX = {name: i for i, name in enumerate(CHEONAN)}
+JIJI_INDEX = {name: i for i, name in enumerate(JIJI)}
+
+# 천간 → 오행 (갑을=목, 병정=화, 무기=토, 경신=금, 임계=수)
+STEM_ELEMENT = np.arange(10, dtype=np.int8) // 2
+
+# 점수 규칙
+BASE_SCORE = 50
+SAME_DAY_STEM_SCORE = 10
+STEM_COMBINATION_SCORE = 10
+ELEMENT_SAENGSAENG_SCORE = 15
+ELEMENT_SANGGEUK_SCORE = -10
+BRANCH_HARMONY_SCORE = 10
+BRANCH_CLASH_SCORE = -10
+COMMON_SINSAL_SCORE = 5
+
+# 관계 코드
+RELATION_NONE = 0
+RELATION_SAENGSAENG = 1
+RELATION_SANGGEUK = 2
+RELATION_HARMONY = 1
+RELATION_CLASH = 2
+
+
+def _element_relation_matrix() -> np.ndarray:
+    """5×5 오행 관계 (상생/상극, 방향 무관)"""
+    matrix = np.zeros((5, 5), dtype=np.int8)
+    for element in range(5):
+        # 목→화→토→금→수→목 상생, 목→토→수→화→금→목 상극
+        for other, relation in (((element + 1) % 5, RELATION_SAENGSAENG), ((element + 2) % 5, RELATION_SANGGEUK)):
+            matrix[element, other] = matrix[other, element] = relation
+    return matrix
+
+
+def _stem_combination_matrix() -> np.ndarray:
+    """10×10 천간합 (갑기, 을경, 병신, 정임, 무계)"""
+    matrix = np.zeros((10, 10), dtype=np.int8)
+    for stem in range(5):
+        matrix[stem, stem + 5] = matrix[stem + 5, stem] = 1
+    return matrix
+
+
+def _branch_relation_matrix() -> np.ndarray:
+    """12×12 지지 관계 (육합/충)"""
+    matrix = np.zeros((12, 12), dtype=np.int8)
+    for branch in range(12):
+        # 육합: 자축, 인해, 묘술, 진유, 사신, 오미 (합이 13 또는 1 인 쌍)
+        matrix[branch, (13 - branch) % 12] = RELATION_HARMONY
+        # 충: 6칸 차이 (자오, 축미, 인신, 묘유, 진술, 사해)
+        matrix[branch, (branch + 6) % 12] = RELATION_CLASH
+    return matrix
+
+
+ELEMENT_RELATION = _element_relation_matrix()
+STEM_COMBINATION = _stem_combination_matrix()
+BRANCH_RELATION = _branch_relation_matrix()
+
+
+def _day_pillar_score_matrix() -> np.ndarray:
+    """120×120 일주 조합 점수 (행/열 = 일간 × 12 + 일지)"""
+    stems = np.repeat(np.arange(10), 12)
+    branches = np.tile(np.arange(12), 10)
+
+    same_stem = stems[:, None] == stems[None, :]
+    element_relation = ELEMENT_RELATION[STEM_ELEMENT[stems][:, None], STEM_ELEMENT[stems][None, :]]
+    branch_relation = BRANCH_RELATION[branches[:, None], branches[None, :]]
+
+    score = (
+        SAME_DAY_STEM_SCORE * same_stem
+        + STEM_COMBINATION_SCORE * STEM_COMBINATION[stems[:, None], stems[None, :]]
+        + ELEMENT_SAENGSAENG_SCORE * (element_relation == RELATION_SAENGSAENG)
+        + ELEMENT_SANGGEUK_SCORE * (element_relation == RELATION_SANGGEUK)
+        + BRANCH_HARMONY_SCORE * (branch_relation == RELATION_HARMONY)
+        + BRANCH_CLASH_SCORE * (branch_relation == RELATION_CLASH)
+    )
+    return score.astype(np.int16)
+
+
+DAY_PILLAR_SCORE = _day_pillar_score_matrix()
+
+# 0-255 popcount 조회표 (공통 신살 개수 계산용)
+_POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.int16)
+
+
+class CompatibilityChart(NamedTuple):
+    """궁합 계산용 명식 인코딩"""
+    day_stem: int      # 일간 인덱스 (0-9)
+    day_branch: int    # 일지 인덱스 (0-11)
+    sinsal_mask: int   # 신살 비트마스크
+
+    @property
+    def day_pillar_code(self) -> int:
+        return self.day_stem * 12 + self.day_branch
+
+
+def grade_for_score(score: int) -> str:
+    """궁합 등급"""
+    if score >= 85:
+        return "최상"
+    if score >= 70:
+        return "상"
+    if score >= 55:
+        return "중상"
+    if score >= 40:
+        return "중"
+    return "하"
+
+
+def _and_particle(word: str) -> str:
+    """받침 유무에 따른 접속 조사 (과/와)"""
+    has_final = (ord(word[-1]) - 0xAC00) % 28 != 0
+    return f"{word}{'과' if has_final else '와'}"
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """uint64 배열 popcount"""
+    as_bytes = values.astype(np.uint64).view(np.uint8).reshape(values.shape + (8,))
+    return _POPCOUNT_8[as_bytes].sum(axis=-1)
+
+
+class CompatibilityEngine:
+    """행렬 기반 궁합 계산 엔진"""
+
+    def __init__(self, sinsal_names: Sequence[str] = ()):
+        self.sinsal_names: Tuple[str, ...] = tuple(sinsal_names)
+        self._sinsal_bits: Dict[str, int] = {name: 1 << i for i, name in enumerate(self.sinsal_names)}
+
+    def encode(self, day_cheonan: str, day_jiji: str, sinsal: Sequence[str] = ()) -> CompatibilityChart:
+        """일간/일지/신살 → 정수 인코딩"""
+        mask = 0
+        for name in sinsal:
+            mask |= self._sinsal_bits.get(name, 0)
+        return CompatibilityChart(CHEONAN_INDEX[day_cheonan], JIJI_INDEX[day_jiji], mask)
+
+    def encode_saju(self, saju_result: Any) -> CompatibilityChart:
+        """SajuResult → 인코딩"""
+        day_pillar = saju_result.day_pillar
+        return self.encode(day_pillar.cheonan, day_pillar.jiji, saju_result.sinsal)
+
+    @staticmethod
+    def encode_candidates(candidates: Sequence[CompatibilityChart]) -> np.ndarray:
+        """후보 목록 → (N, 2) 배열 [일주 코드, 신살 마스크] (재사용 시 미리 인코딩)"""
+        encoded = np.empty((len(candidates), 2), dtype=np.uint64)
+        for i, chart in enumerate(candidates):
+            encoded[i, 0] = chart.day_pillar_code
+            encoded[i, 1] = chart.sinsal_mask
+        return encoded
+
+    def _candidate_array(self, candidates: Union[np.ndarray, Sequence[CompatibilityChart]]) -> np.ndarray:
+        if isinstance(candidates, np.ndarray):
+            return candidates
+        return self.encode_candidates(candidates)
+
+    def score_matrix(
+        self,
+        charts_a: Union[np.ndarray, Sequence[CompatibilityChart]],
+        charts_b: Union[np.ndarray, Sequence[CompatibilityChart]]
+    ) -> np.ndarray:
+        """다대다 궁합 점수 행렬 (len(a) × len(b), 0-100)"""
+        a = self._candidate_array(charts_a)
+        b = self._candidate_array(charts_b)
+
+        scores = BASE_SCORE + DAY_PILLAR_SCORE[np.ix_(a[:, 0].astype(np.intp), b[:, 0].astype(np.intp))]
+        scores = scores + COMMON_SINSAL_SCORE * _popcount(a[:, 1][:, None] & b[:, 1][None, :])
+        return np.clip(scores, 0, 100).astype(np.int16)
+
+    def score_many(
+        self,
+        chart: CompatibilityChart,
+        candidates: Union[np.ndarray, Sequence[CompatibilityChart]],
+        top_k: Optional[int] = 10
+    ) -> List[Tuple[int, int]]:
+        """한 명식 대비 후보 전체 점수 계산 후 상위 k명 [(후보 인덱스, 점수)] 반환 (동점은 인덱스 순)"""
+        encoded = self._candidate_array(candidates)
+        if len(encoded) == 0:
+            return []
+
+        scores = self.score_matrix(self.encode_candidates([chart]), encoded)[0]
+
+        if top_k is None or top_k >= len(scores):
+            order = np.argsort(-scores, kind="stable")
+        else:
+            # 상위 k개만 부분 정렬 후, 경계 동점까지 포함해 안정 정렬
+            threshold = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            selected = np.flatnonzero(scores >= threshold)
+            order = selected[np.argsort(-scores[selected], kind="stable")][:top_k]
+
+        return [(int(index), int(scores[index])) for index in order]
+
+    def score(self, chart_a: CompatibilityChart, chart_b: CompatibilityChart) -> int:
+        """1:1 궁합 점수"""
+        return int(self.score_matrix([chart_a], [chart_b])[0, 0])
+
+    def explain(self, chart_a: CompatibilityChart, chart_b: CompatibilityChart) -> List[str]:
+        """1:1 궁합 점수 근거"""
+        details = []
+        element_a = STEM_ELEMENT[chart_a.day_stem]
+        element_b = STEM_ELEMENT[chart_b.day_stem]
+
+        if chart_a.day_stem == chart_b.day_stem:
+            details.append("일간이 같아 성격적 동조화가 높음")
+        if STEM_COMBINATION[chart_a.day_stem, chart_b.day_stem]:
+            details.append(f"{CHEONAN[chart_a.day_stem]}{CHEONAN[chart_b.day_stem]} 천간합으로 서로 끌림")
+
+        relation = ELEMENT_RELATION[element_a, element_b]
+        names = f"{_and_particle(ELEMENT_NAMES[element_a])} {ELEMENT_NAMES[element_b]}"
+        if relation == RELATION_SAENGSAENG:
+            details.append(f"{names} 상생관계로 서로 도움")
+        elif relation == RELATION_SANGGEUK:
+            details.append(f"{names} 상극관계로 마찰 가능")
+
+        branches = f"{JIJI[chart_a.day_branch]}{JIJI[chart_b.day_branch]}"
+        branch_relation = BRANCH_RELATION[chart_a.day_branch, chart_b.day_branch]
+        if branch_relation == RELATION_HARMONY:
+            details.append(f"일지 {branches} 육합으로 정서적 안정")
+        elif branch_relation == RELATION_CLASH:
+            details.append(f"일지 {branches} 충으로 생활 리듬 충돌 가능")
+
+        common = [name for name, bit in self._sinsal_bits.items() if chart_a.sinsal_mask & chart_b.sinsal_mask & bit]
+        if common:
+            details.append(f"공통 신살: {', '.join(common)}")
+        return details
@@ -0,0 +1,139 @@
+"""
+HEAL7 AI 해석 캐시
+같은 사주 동치류 + 해석 타입 + 모델 조합(일/월/연 운세는 기간 포함)의 AI 해석 원문을 영속 저장
+
+기능:
+- SQLite 파일 1개에 지문(fingerprint) → 해석 원문 저장 (프로세스 재시작 후에도 유지)
+- TTL: 만료된 항목은 조회 시 무시하고 purge_expired() 로 일괄 삭제
+- 버전 태그: 프롬프트 템플릿 버전이 다른 항목은 적중으로 보지 않음
+- 스레드 안전 (연결 1개 + 잠금), 비동기 호출자는 asyncio.to_thread 로 사용
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+from loguru import logger
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[1] / "data" / "ai_interpretation_cache.db"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS interpretation_cache (
+    fingerprint TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    interpretation_type TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class CachedInterpretation(NamedTuple):
+    """캐시된 해석 원문"""
+    fingerprint: str
+    version: str
+    interpretation_type: str
+    model: str
+    response: str
+    created_at: float
+    expires_at: float
+
+
+class InterpretationCache:
+    """지문 → AI 해석 원문 영속 캐시 (TTL + 버전 태그)"""
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[int] = None):
+        self.path = str(path or os.getenv("AI_INTERPRETATION_CACHE_PATH", DEFAULT_CACHE_PATH))
+        self.ttl_seconds = ttl_seconds or int(os.getenv("AI_INTERPRETATION_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA_SQL)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, fingerprint: str, version: str) -> Optional[CachedInterpretation]:
+        """유효한(미만료, 같은 버전) 항목 조회"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT fingerprint, version, interpretation_type, model, response, created_at, expires_at "
+                "FROM interpretation_cache WHERE fingerprint = ?",
+                (fingerprint,)
+            ).fetchone()
+            if row is None or row[1] != version or row[6] <= time.time():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return CachedInterpretation(*row)
+
+    def put(self, fingerprint: str, version: str, interpretation_type: str, model: str,
+            response: str, ttl_seconds: Optional[int] = None):
+        """해석 원문 저장 (같은 지문은 덮어씀)"""
+        now = time.time()
+        expires_at = now + (ttl_seconds or self.ttl_seconds)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO interpretation_cache "
+                "(fingerprint, version, interpretation_type, model, response, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (fingerprint, version, interpretation_type, model, response, now, expires_at)
+            )
+            conn.commit()
+
+    def invalidate(self, fingerprint: str):
+        """항목 1건 삭제"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM interpretation_cache WHERE fingerprint = ?", (fingerprint,))
+            conn.commit()
+
+    def purge_expired(self, current_version: Optional[str] = None) -> int:
+        """만료 항목(및 current_version 이 아닌 항목) 삭제 → 삭제 건수"""
+        with self._lock:
+            conn = self._connection()
+            if current_version is None:
+                cursor = conn.execute("DELETE FROM interpretation_cache WHERE expires_at <= ?", (time.time(),))
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM interpretation_cache WHERE expires_at <= ? OR version != ?",
+                    (time.time(), current_version)
+                )
+            conn.commit()
+        if cursor.rowcount:
+            logger.info(f"🧹 AI 해석 캐시 정리: {cursor.rowcount}건")
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            size = self._connection().execute("SELECT COUNT(*) FROM interpretation_cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "path": self.path,
+            "size": size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -9,10 +9,13 @@ Features:
 - 진태양시 보정 (한국 시간대 역사 고려)
 - 24절기 데이터 캐싱 및 검증
 - 비동기 처리 및 에러 핸들링
+- 오프라인 천문 엔진(shared/solar_term_engine)으로 분 단위 절입 시각 제공
 """
 
 import asyncio
 import json
+import sys
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
@@ -29,6 +32,16 @@ try:
 except ImportError:
     from config.settings import get_settings
 
+# 오프라인 절기 엔진 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+try:
+    from shared.solar_term_engine import solar_term_table
+    SOLAR_TERM_ENGINE_AVAILABLE = True
+except ImportError:
+    solar_term_table = None
+    SOLAR_TERM_ENGINE_AVAILABLE = False
+    logger.warning("오프라인 절기 엔진을 불러올 수 없습니다 - KASI API만 사용")
+
 
 class SolarTermType(str, Enum):
     """24절기 타입"""
@@ -255,6 +268,43 @@ class KASIService:
         
         return solar_time, offset_minutes
     
+    def _local_term_instant(self, year: int, solar_term_code: int) -> Optional[datetime]:
+        """오프라인 엔진의 절입 시각 (KST, 분 단위)"""
+        if not SOLAR_TERM_ENGINE_AVAILABLE or not solar_term_table.supports(year):
+            return None
+        return solar_term_table.instant(year, solar_term_code)
+    
+    def _build_local_solar_term(self, solar_term_code: int, kst_datetime: datetime) -> SolarTermData:
+        """오프라인 엔진 시각으로 SolarTermData 생성"""
+        name, term_type = self.SOLAR_TERMS[solar_term_code]
+        solar_time, offset_minutes = self._apply_solar_time_correction(kst_datetime)
+        
+        return SolarTermData(
+            year=kst_datetime.year,
+            month=kst_datetime.month,
+            day=kst_datetime.day,
+            solar_term_code=solar_term_code,
+            solar_term_name=name,
+            solar_term_type=term_type,
+            kst_datetime=kst_datetime,
+            solar_time_datetime=solar_time,
+            timezone_offset_minutes=offset_minutes,
+            data_source="EPHEMERIS",
+            is_verified=False
+        )
+    
+    def _get_local_solar_terms_by_month(self, year: int, month: int) -> Optional[List[SolarTermData]]:
+        """오프라인 엔진 월별 절기 (엔진 미지원 연도는 None)"""
+        if not SOLAR_TERM_ENGINE_AVAILABLE or not solar_term_table.supports(year):
+            return None
+        
+        terms = [
+            self._build_local_solar_term(code, instant)
+            for code, _, instant in solar_term_table.terms_for_month(year, month)
+        ]
+        terms.sort(key=lambda x: x.solar_term_code)
+        return terms
+    
     async def _call_kasi_api(
         self, 
         year: int, 
@@ -362,9 +412,18 @@ class KASIService:
         self, 
         year: int, 
         month: int,
-        use_cache: bool = True
+        use_cache: bool = True,
+        prefer_local: bool = True
     ) -> List[SolarTermData]:
-        """월별 24절기 데이터 조회"""
+        """월별 24절기 데이터 조회
+        
+        prefer_local=True 이면 오프라인 천문 엔진 결과를 사용하고 KASI API를 호출하지 않습니다.
+        """
+        if prefer_local:
+            local_terms = self._get_local_solar_terms_by_month(year, month)
+            if local_terms is not None:
+                return local_terms
+        
         if not self._is_initialized:
             await self.initialize()
         
@@ -392,7 +451,7 @@ class KASIService:
                     solar_term_code = None
                     solar_term_type = None
                     
-                    for code, (name, term_type) in self.items():
+                    for code, (name, term_type) in self.SOLAR_TERMS.items():
                         if name in date_name:
                             solar_term_code = code
                             solar_term_type = term_type
@@ -406,8 +465,11 @@ class KASIService:
                     month_part = int(locdate[4:6])
                     day_part = int(locdate[6:8])
                     
-                    # 기본 시간 설정 (정오)
+                    # 절입 시각: 같은 날짜의 오프라인 엔진 시각 사용, 없으면 정오로 설정
                     kst_datetime = datetime(year_part, month_part, day_part, 12, 0, 0)
+                    local_instant = self._local_term_instant(year_part, solar_term_code)
+                    if local_instant and local_instant.date() == kst_datetime.date():
+                        kst_datetime = local_instant
                     
                     # 진태양시 보정
                     solar_time, offset_minutes = self._apply_solar_time_correction(kst_datetime)
@@ -552,6 +614,18 @@ class KASIService:
             logger.error(f"날짜별 절기 조회 실패 ({date}): {e}")
             return None
     
+    def find_governing_solar_term(self, moment: datetime) -> Optional[SolarTermData]:
+        """주어진 시각(KST)이 속한 절(節) 조회 - 월주 경계 판정용, 네트워크 호출 없음"""
+        if not SOLAR_TERM_ENGINE_AVAILABLE or not solar_term_table.supports(moment.year):
+            return None
+        
+        try:
+            _, code, instant = solar_term_table.governing_term(moment)
+            return self._build_local_solar_term(code, instant)
+        except ValueError as e:
+            logger.warning(f"절입 시각 조회 실패 ({moment}): {e}")
+            return None
+    
     async def get_next_solar_term(
         self, 
         from_date: datetime
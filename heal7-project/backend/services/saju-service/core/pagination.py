@@ -0,0 +1,131 @@
+"""
+HEAL7 Pagination Helpers
+목록 API 공용 키셋(커서) 페이지네이션 및 총 개수 캐시
+
+기능:
+- (created_at, id) 기준 키셋 커서 인코딩/디코딩
+- 커서 조건절 생성 (OFFSET 없이 인덱스 범위 탐색)
+- 총 개수 캐시: TTL 경과 시 이전 값을 즉시 반환하고 백그라운드에서 갱신
+"""
+
+import asyncio
+import base64
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+from fastapi import HTTPException, status
+
+from database_service import db_service
+
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    """마지막 행의 (created_at, id) → 불투명 커서 문자열"""
+    row_id = row['id']
+    payload = {
+        't': row['created_at'].isoformat(),
+        'id': row_id if isinstance(row_id, int) else str(row_id)
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Any]:
+    """커서 문자열 → (created_at, id)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload['t']), payload['id']
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def keyset_condition(cursor: str, params: List[Any], column_prefix: str = "") -> str:
+    """내림차순 (created_at, id) 키셋 조건 - params 에 커서 값을 추가하고 조건절 반환"""
+    created_at, row_id = decode_cursor(cursor)
+    params.extend([created_at, row_id])
+    return (
+        f"({column_prefix}created_at, {column_prefix}id) < "
+        f"(${len(params) - 1}, ${len(params)})"
+    )
+
+
+def keyset_order(column_prefix: str = "") -> str:
+    """키셋 정렬 (동일 created_at 은 id 로 구분)"""
+    return f"ORDER BY {column_prefix}created_at DESC, {column_prefix}id DESC"
+
+
+def split_page(rows: List[Any], page_size: int) -> Tuple[List[Any], Optional[str]]:
+    """page_size + 1 건 조회 결과 → (페이지 행, 다음 커서)"""
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, encode_cursor(dict(rows[-1]))
+    return rows, None
+
+
+class CountCache:
+    """
+    목록 총 개수 캐시
+    - 최초 조회는 동기 계산
+    - TTL 경과 후에는 이전 값을 반환하고 백그라운드에서 한 번만 재계산
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: int = 10000):
+        self.ttl = ttl if ttl is not None else float(os.getenv('PAGINATION_COUNT_CACHE_TTL', '60'))
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, int]] = {}
+        self._refreshing: Dict[Tuple, asyncio.Task] = {}
+
+    async def get(self, query: str, params: List[Any], db_type: str = 'main') -> int:
+        key = (db_type, query, tuple(params))
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return await self._refresh(key, query, params, db_type)
+
+        stored_at, count = entry
+        if time.monotonic() - stored_at > self.ttl and key not in self._refreshing:
+            self._refreshing[key] = asyncio.create_task(self._refresh(key, query, params, db_type))
+        return count
+
+    def invalidate(self, query: Optional[str] = None):
+        """쿼리별(또는 전체) 캐시 무효화"""
+        if query is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[1] == query]:
+            del self._entries[key]
+
+    def invalidate_prefix(self, query_prefix: str, first_param: Any):
+        """쿼리 접두어 + 첫 번째 파라미터가 같은 항목 무효화 (예: 한 사용자의 필터 조합별 내역 개수 전체)
+
+        진행 중인 백그라운드 재계산도 취소 (무효화 이전 값으로 다시 채우지 않도록)
+        """
+        def matches(key: Tuple) -> bool:
+            return key[1].startswith(query_prefix) and key[2][:1] == (first_param,)
+
+        for key in [key for key in self._entries if matches(key)]:
+            del self._entries[key]
+        for key in [key for key in self._refreshing if matches(key)]:
+            self._refreshing.pop(key).cancel()
+
+    async def _refresh(self, key: Tuple, query: str, params: List[Any], db_type: str) -> int:
+        try:
+            count = await db_service.execute_count_query(query, list(params), db_type=db_type)
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                # 가장 오래된 항목 제거
+                del self._entries[min(self._entries, key=lambda k: self._entries[k][0])]
+            self._entries[key] = (time.monotonic(), count)
+            return count
+        except Exception as e:
+            logger.warning(f"Count cache refresh failed: {e}")
+            return self._entries.get(key, (0, 0))[1]
+        finally:
+            self._refreshing.pop(key, None)
+
+
+count_cache = CountCache()
@@ -0,0 +1,193 @@
+"""
+HEAL7 Point Ledger
+포인트 충전/사용 원자적 처리 엔진
+
+기능:
+- 충전/사용 각각을 단일 SQL 문(CTE)으로 처리 → 왕복 1회, 애플리케이션 측 읽기-계산-쓰기 경쟁 제거
+- 잔액 행 잠금(FOR UPDATE) 후 최신 값 기준으로 차감 분배 (무료 → 보너스 → 추천 → 유료)
+- 거래 내역(point_transactions)만 INSERT, user_point_balances 는 DB 측 트리거가 거래 내역으로 갱신
+  (직접 UPDATE 하면 이중 반영됨) → 반환 잔액은 잠근 값 + 변동량으로 계산
+- 기록 후 해당 사용자의 내역 총 개수 캐시 무효화 (TTL 동안 이전 개수가 보이지 않도록)
+"""
+
+import json
+import uuid
+from typing import Any, Dict, NamedTuple, Optional
+from fastapi import HTTPException, status
+
+from pagination import count_cache
+
+# 사용 우선순위 (무료 → 보너스 → 추천 → 유료)
+USE_PRIORITY = ('free', 'bonus', 'referral', 'paid')
+
+# 포인트 내역 총 개수 쿼리 접두어 (필터 조건은 항상 user_id = $1 로 시작)
+HISTORY_COUNT_PREFIX = "SELECT COUNT(*) FROM point_transactions WHERE "
+
+
+class LedgerResult(NamedTuple):
+    """원장 처리 결과"""
+    transaction_id: str
+    user_id: str
+    free_points: int
+    bonus_points: int
+    referral_points: int
+    paid_points: int
+    total_points: int
+    breakdown: Dict[str, int]  # 포인트 타입별 변동량 (양수)
+
+
+USE_SQL = """
+WITH locked AS (
+    SELECT user_id, free_points, bonus_points, referral_points, paid_points, total_points
+    FROM user_point_balances
+    WHERE user_id = $1
+    FOR UPDATE
+), split AS (
+    SELECT user_id, free_points, bonus_points, referral_points, paid_points, total_points,
+           LEAST(free_points, $2) AS use_free,
+           LEAST(bonus_points, GREATEST($2 - free_points, 0)) AS use_bonus,
+           LEAST(referral_points, GREATEST($2 - free_points - bonus_points, 0)) AS use_referral,
+           LEAST(paid_points, GREATEST($2 - free_points - bonus_points - referral_points, 0)) AS use_paid
+    FROM locked
+    WHERE free_points + bonus_points + referral_points + paid_points >= $2
+), inserted AS (
+    INSERT INTO point_transactions
+    (user_id, point_type, transaction_type, amount, balance_after,
+     source, related_service, description, metadata)
+    SELECT s.user_id, t.point_type, 'spend', -t.used, t.balance - t.used,
+           'purchase', $3, $4,
+           jsonb_build_object(
+               'transaction_group', $5::text,
+               'total_amount', $2,
+               'used_breakdown', jsonb_build_object(
+                   'free', s.use_free, 'bonus', s.use_bonus,
+                   'referral', s.use_referral, 'paid', s.use_paid
+               )
+           )
+    FROM split s
+    CROSS JOIN LATERAL (VALUES
+        ('free', s.use_free, s.free_points),
+        ('bonus', s.use_bonus, s.bonus_points),
+        ('referral', s.use_referral, s.referral_points),
+        ('paid', s.use_paid, s.paid_points)
+    ) AS t(point_type, used, balance)
+    WHERE t.used > 0
+)
+SELECT l.user_id AS locked_user_id, s.user_id,
+       s.free_points - s.use_free AS free_points,
+       s.bonus_points - s.use_bonus AS bonus_points,
+       s.referral_points - s.use_referral AS referral_points,
+       s.paid_points - s.use_paid AS paid_points,
+       s.total_points - $2 AS total_points,
+       s.use_free, s.use_bonus, s.use_referral, s.use_paid
+FROM locked l
+LEFT JOIN split s ON s.user_id = l.user_id
+"""
+
+CHARGE_SQL = """
+WITH charge AS (
+    INSERT INTO point_charges
+    (id, user_id, charge_amount, point_amount, bonus_amount,
+     payment_method, payment_id, pg_name, payment_status)
+    VALUES ($1, $2, $3, $3 + $4, $4, $5, $6, $7, 'completed')
+    RETURNING id, user_id
+), locked AS (
+    SELECT user_id, free_points, bonus_points, referral_points, paid_points, total_points
+    FROM user_point_balances
+    WHERE user_id = $2
+    FOR UPDATE
+), balance AS (
+    SELECT c.user_id,
+           COALESCE(l.free_points, 0) AS free_points,
+           COALESCE(l.bonus_points, 0) + $4 AS bonus_points,
+           COALESCE(l.referral_points, 0) AS referral_points,
+           COALESCE(l.paid_points, 0) + $3 AS paid_points,
+           COALESCE(l.total_points, 0) + $3 + $4 AS total_points
+    FROM charge c
+    LEFT JOIN locked l ON l.user_id = c.user_id
+), inserted AS (
+    INSERT INTO point_transactions
+    (user_id, point_type, transaction_type, amount, balance_after,
+     source, description, metadata)
+    SELECT bal.user_id, t.point_type, t.transaction_type, t.amount, t.balance_after,
+           t.source, t.description, $8::jsonb
+    FROM balance bal
+    CROSS JOIN LATERAL (VALUES
+        ('paid', 'charge', $3::integer, bal.paid_points, 'charge', '포인트 충전'),
+        ('bonus', 'earn', $4::integer, bal.bonus_points, 'charge_bonus', '충전 보너스')
+    ) AS t(point_type, transaction_type, amount, balance_after, source, description)
+    WHERE t.amount > 0
+)
+SELECT * FROM balance
+"""
+
+
+def _result(transaction_id: str, row: Any, breakdown: Dict[str, int]) -> LedgerResult:
+    return LedgerResult(
+        transaction_id=transaction_id,
+        user_id=str(row['user_id']),
+        free_points=row['free_points'],
+        bonus_points=row['bonus_points'],
+        referral_points=row['referral_points'],
+        paid_points=row['paid_points'],
+        total_points=row['total_points'],
+        breakdown=breakdown
+    )
+
+
+class PointLedger:
+    """포인트 원장 (모든 메서드는 asyncpg 연결/풀 객체를 받아 단일 문장으로 실행)"""
+
+    def invalidate_history_count(self, user_id: str):
+        """사용자의 포인트 내역 총 개수 캐시 무효화 (트랜잭션 안에서 기록했다면 커밋 후 다시 호출)"""
+        count_cache.invalidate_prefix(HISTORY_COUNT_PREFIX, str(user_id))
+
+    async def use(
+        self,
+        conn,
+        user_id: str,
+        amount: int,
+        related_service: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> LedgerResult:
+        """포인트 사용 (우선순위 차감 + 거래 내역 기록)"""
+        if amount <= 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="사용 포인트는 0보다 커야 합니다")
+
+        transaction_id = str(uuid.uuid4())
+        row = await conn.fetchrow(USE_SQL, user_id, amount, related_service, description, transaction_id)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자 포인트 정보를 찾을 수 없습니다")
+        if row['user_id'] is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="포인트 잔액이 부족합니다")
+
+        breakdown = {point_type: row[f'use_{point_type}'] for point_type in USE_PRIORITY}
+        self.invalidate_history_count(user_id)
+        return _result(transaction_id, row, breakdown)
+
+    async def charge(
+        self,
+        conn,
+        user_id: str,
+        charge_amount: int,
+        bonus_amount: int,
+        payment_method: str,
+        payment_id: Optional[str] = None,
+        pg_name: Optional[str] = None
+    ) -> LedgerResult:
+        """포인트 충전 (충전 기록 + 유료/보너스 거래 내역, 잔액 증가는 트리거)"""
+        charge_id = str(uuid.uuid4())
+        metadata = json.dumps({
+            "charge_id": charge_id,
+            "payment_method": payment_method,
+            "charge_amount": charge_amount
+        })
+        row = await conn.fetchrow(
+            CHARGE_SQL, charge_id, user_id, charge_amount, bonus_amount,
+            payment_method, payment_id, pg_name, metadata
+        )
+        self.invalidate_history_count(user_id)
+        return _result(charge_id, row, {'paid': charge_amount, 'bonus': bonus_amount})
+
+
+point_ledger = PointLedger()
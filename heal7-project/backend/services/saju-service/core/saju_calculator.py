@@ -1,10 +1,20 @@
 """
 HEAL7 사주 계산 핵심 모듈
 년주, 월주, 일주, 시주 계산 로직
+(연/월/일이 주어지는 계산은 공용 사주 파사드 shared.saju_pillars 에 위임)
 """
 
+import sys
+from pathlib import Path
 from typing import Optional, Dict, Tuple
-from datetime import datetime, date
+from datetime import datetime, date, time
+
+# 공용 사주 파사드 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+try:
+    from shared.saju_pillars import saju_pillar_facade, day_gapja, hour_gapja
+except ImportError:
+    saju_pillar_facade = None
 
 class SajuCalculator:
     """사주 계산 클래스"""
@@ -42,7 +52,11 @@ class SajuCalculator:
         """
         년주 계산 (입춘 기준)
         입춘(2월 4일경) 이전은 전년도로 계산
+        파사드 사용 시 정오 기준 입춘 절입 시각과 비교
         """
+        if saju_pillar_facade:
+            return saju_pillar_facade.calculate(year, month, day).year
+        
         saju_year = year
         if month < 2 or (month == 2 and day < 4):
             saju_year = year - 1
@@ -69,6 +83,9 @@ class SajuCalculator:
         - 병신년: 경인월부터 시작
         - 정임년: 임인월부터 시작
         - 무계년: 갑인월부터 시작
+        
+        년간지만으로는 절입 시각을 알 수 없으므로 절기명 또는 양력 날짜로 추정.
+        연도를 알고 있으면 get_full_saju(파사드 위임)를 사용할 것.
         """
         if not year_gapja or len(year_gapja) < 2:
             return "계산불가"
@@ -142,6 +159,9 @@ class SajuCalculator:
         일주 계산 (60갑자 순환)
         1900년 1월 31일 = 갑진일 기준
         """
+        if saju_pillar_facade:
+            return day_gapja(date(year, month, day))
+        
         기준일 = date(1900, 1, 31)
         target_date = date(year, month, day)
         
@@ -162,29 +182,16 @@ class SajuCalculator:
         if not day_gapja or len(day_gapja) < 2:
             return "계산불가"
         
-        day_cheongan = day_gapja[0]
+        if saju_pillar_facade:
+            try:
+                return hour_gapja(day_gapja[0], time(hour % 24))
+            except ValueError:
+                return "계산불가"
         
-        # 시지지 결정
-        시지지_map = {
-            (23, 0, 1): '자',
-            (1, 2, 3): '축',
-            (3, 4, 5): '인',
-            (5, 6, 7): '묘',
-            (7, 8, 9): '진',
-            (9, 10, 11): '사',
-            (11, 12, 13): '오',
-            (13, 14, 15): '미',
-            (15, 16, 17): '신',
-            (17, 18, 19): '유',
-            (19, 20, 21): '술',
-            (21, 22, 23): '해'
-        }
+        day_cheongan = day_gapja[0]
         
-        시지지 = '자'
-        for hours, 지지 in 시지지_map.items():
-            if hour in hours:
-                시지지 = 지지
-                break
+        # 시지지 결정 (23:00-00:59 자시, 01:00-02:59 축시, ...)
+        시지지 = cls.지지[(hour + 1) // 2 % 12]
         
         # 일천간별 시천간 시작 (오자둔)
         오자둔_시작 = {
@@ -213,8 +220,14 @@ class SajuCalculator:
     def get_full_saju(cls, year: int, month: int, day: int, hour: int,
                       solar_term: Optional[str] = None) -> Dict[str, str]:
         """
-        완전한 사주팔자 계산
+        완전한 사주팔자 계산 (정각 기준, 파사드 사용 시 절입 시각까지 반영)
         """
+        if saju_pillar_facade:
+            return {
+                f"{name}_pillar": gapja
+                for name, gapja in saju_pillar_facade.calculate(year, month, day, hour).as_dict().items()
+            }
+        
         year_pillar = cls.calculate_year_pillar(year, month, day)
         month_pillar = cls.calculate_month_pillar(year_pillar, month, day, solar_term)
         day_pillar = cls.calculate_day_pillar(year, month, day)
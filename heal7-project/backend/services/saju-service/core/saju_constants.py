@@ -16,7 +16,16 @@ gapja = GAPJA_60[index]
 """
 
 from datetime import date
+from pathlib import Path
 import os
+import sys
+
+# 천간/지지 표기와 속성은 공용 간지 코덱(backend/shared) 사용
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from shared.hanja_codec import (
+    STEMS_HANGUL, STEMS_HANJA, BRANCHES_HANGUL, BRANCHES_HANJA,
+    STEM_ELEMENT, STEM_YIN_YANG, BRANCH_ELEMENT, BRANCH_ZODIAC, ELEMENTS_HANGUL
+)
 
 # ==========================================
 # 📍 핵심 기준점 (절대 변경 금지!)
@@ -47,40 +56,30 @@ GAPJA_60 = [
 # 📍 천간 (10개)
 # ==========================================
 
-CHEONGAN_10 = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
+CHEONGAN_10 = list(STEMS_HANGUL)
 
 CHEONGAN_PROPERTIES = {
-    "갑": {"element": "목", "yin_yang": "양", "chinese": "甲"},
-    "을": {"element": "목", "yin_yang": "음", "chinese": "乙"},
-    "병": {"element": "화", "yin_yang": "양", "chinese": "丙"},
-    "정": {"element": "화", "yin_yang": "음", "chinese": "丁"},
-    "무": {"element": "토", "yin_yang": "양", "chinese": "戊"},
-    "기": {"element": "토", "yin_yang": "음", "chinese": "己"},
-    "경": {"element": "금", "yin_yang": "양", "chinese": "庚"},
-    "신": {"element": "금", "yin_yang": "음", "chinese": "辛"},
-    "임": {"element": "수", "yin_yang": "양", "chinese": "壬"},
-    "계": {"element": "수", "yin_yang": "음", "chinese": "癸"}
+    STEMS_HANGUL[i]: {"element": STEM_ELEMENT[i], "yin_yang": STEM_YIN_YANG[i], "chinese": STEMS_HANJA[i]}
+    for i in range(10)
 }
 
 # ==========================================
 # 📍 지지 (12개)
 # ==========================================
 
-JIJI_12 = ["자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해"]
+JIJI_12 = list(BRANCHES_HANGUL)
+
+# 지지 서수별 계절 (자축 겨울, 인묘진 봄, 사오미 여름, 신유술 가을, 해 겨울)
+JIJI_SEASONS = ("겨울", "겨울", "봄", "봄", "봄", "여름", "여름", "여름", "가을", "가을", "가을", "겨울")
 
 JIJI_PROPERTIES = {
-    "자": {"zodiac": "쥐",      "element": "수", "season": "겨울", "chinese": "子"},
-    "축": {"zodiac": "소",      "element": "토", "season": "겨울", "chinese": "丑"},
-    "인": {"zodiac": "호랑이",  "element": "목", "season": "봄",   "chinese": "寅"},
-    "묘": {"zodiac": "토끼",    "element": "목", "season": "봄",   "chinese": "卯"},
-    "진": {"zodiac": "용",      "element": "토", "season": "봄",   "chinese": "辰"},
-    "사": {"zodiac": "뱀",      "element": "화", "season": "여름", "chinese": "巳"},
-    "오": {"zodiac": "말",      "element": "화", "season": "여름", "chinese": "午"},
-    "미": {"zodiac": "양",      "element": "토", "season": "여름", "chinese": "未"},
-    "신": {"zodiac": "원숭이",  "element": "금", "season": "가을", "chinese": "申"},
-    "유": {"zodiac": "닭",      "element": "금", "season": "가을", "chinese": "酉"},
-    "술": {"zodiac": "개",      "element": "토", "season": "가을", "chinese": "戌"},
-    "해": {"zodiac": "돼지",    "element": "수", "season": "겨울", "chinese": "亥"}
+    BRANCHES_HANGUL[i]: {
+        "zodiac": BRANCH_ZODIAC[i],
+        "element": BRANCH_ELEMENT[i],
+        "season": JIJI_SEASONS[i],
+        "chinese": BRANCHES_HANJA[i]
+    }
+    for i in range(12)
 }
 
 # ==========================================
@@ -105,7 +104,7 @@ SOLAR_TERMS_CHINESE = {
 # 📍 오행 (五行) 관계
 # ==========================================
 
-WUXING_5 = ["목", "화", "토", "금", "수"]
+WUXING_5 = list(ELEMENTS_HANGUL)
 
 WUXING_RELATIONS = {
     "상생": {  # 서로 생성하는 관계
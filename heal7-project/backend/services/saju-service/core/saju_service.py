@@ -20,10 +20,13 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import calendar
 import json
+import sys
+from pathlib import Path
 from loguru import logger
 from pydantic import BaseModel, Field, validator
 
-from .kasi_service import KASIService, SolarTermData
+from .kasi_service import KASIService, SolarTermData, SolarTermType
+from .compatibility_engine import CompatibilityEngine, grade_for_score
 # AI 서비스는 향후 통합 예정 - 현재 보류
 # from .ai_service import AIService, AIRequest, AnalysisType
 from .database_service import DatabaseService
@@ -32,6 +35,20 @@ try:
 except ImportError:
     from config.settings import get_settings
 
+# 오프라인 음양력 테이블 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+try:
+    from shared import lunisolar_calendar
+    LUNISOLAR_TABLE_AVAILABLE = True
+except ImportError:
+    lunisolar_calendar = None
+    LUNISOLAR_TABLE_AVAILABLE = False
+
+try:
+    from shared.saju_pillars import saju_pillar_facade
+except ImportError:
+    saju_pillar_facade = None
+
 
 class Gender(str, Enum):
     """성별"""
@@ -97,6 +114,7 @@ class BirthInfo(BaseModel):
     
     gender: Gender = Field(..., description="성별")
     is_lunar: bool = Field(default=False, description="음력 여부")
+    is_leap_month: bool = Field(default=False, description="음력 윤달 여부")
     timezone_offset: int = Field(default=540, description="시간대 오프셋(분), 한국=540")
     
     # 선택적 정보
@@ -238,6 +256,7 @@ class SajuService:
         # AI 서비스는 향후 통합 예정 - 현재 보류
         # self.ai_service = AIService() 
         self.db_service = DatabaseService()
+        self.compatibility_engine = CompatibilityEngine(tuple(self.SINSAL_PATTERNS))
         self._is_initialized = False
         
         logger.info("사주 서비스 초기화 시작")
@@ -312,7 +331,21 @@ class SajuService:
         return self.CHEONAN[cheonan_index], self.JIJI[jiji_index]
     
     def _get_month_pillar(self, year: int, month: int, solar_term: Optional[SolarTermData] = None) -> Tuple[str, str]:
-        """월주 계산 (절기 기준)"""
+        """월주 계산 (절기 기준)
+        
+        solar_term 이 출생 시각이 속한 절(節)이면 절입 시각 기준으로 계산하고,
+        없으면 양력 월 기준 간소화 계산을 사용합니다.
+        """
+        if solar_term is not None and solar_term.solar_term_type == SolarTermType.MAJOR:
+            # 입춘(1)=인월 … 대설(21)=자월, 소한(23)=축월
+            month_index = (solar_term.solar_term_code - 1) // 2
+            # 소한~입춘 전은 전년도 간지의 마지막 달
+            saju_year = solar_term.year - 1 if solar_term.solar_term_code == 23 else solar_term.year
+            year_cheonan, _ = self._get_cheonan_jiji_for_year(saju_year)
+            # 갑기년 병인월, 을경년 무인월, 병신년 경인월, 정임년 임인월, 무계년 갑인월
+            base_index = (self.CHEONAN.index(year_cheonan) % 5) * 2 + 2
+            return self.CHEONAN[(base_index + month_index) % 10], self.JIJI[(month_index + 2) % 12]
+        
         # 월지는 절기를 기준으로 결정
         month_jiji_map = {
             1: "인", 2: "묘", 3: "진", 4: "사", 5: "오", 6: "미",
@@ -514,6 +547,23 @@ class SajuService:
             )
         }
     
+    def _calculate_pillars(
+        self, birth_datetime: datetime, solar_term: Optional[SolarTermData] = None
+    ) -> Tuple[Tuple[str, str], Tuple[str, str], Tuple[str, str], Tuple[str, str]]:
+        """년주/월주/일주/시주 (천간, 지지) 계산
+
+        공용 사주 파사드(입춘/절입 시각 기준, 다른 엔진과 캐시 공유)를 사용하고,
+        파사드를 불러올 수 없으면 기존 계산으로 대체
+        """
+        if saju_pillar_facade:
+            saju = saju_pillar_facade.calculate_instant(birth_datetime, birth_datetime.date())
+            return saju.year, saju.month, saju.day, saju.hour
+
+        year = self._get_cheonan_jiji_for_year(birth_datetime.year)
+        month = self._get_month_pillar(birth_datetime.year, birth_datetime.month, solar_term)
+        day = self._get_day_pillar(birth_datetime.date())
+        return year, month, day, self._get_time_pillar(day[0], birth_datetime.hour)
+    
     async def calculate_saju(self, birth_info: BirthInfo) -> SajuResult:
         """사주 계산 메인 함수"""
         if not self._is_initialized:
@@ -522,28 +572,28 @@ class SajuService:
         try:
             logger.info(f"사주 계산 시작: {birth_info.name or '익명'} ({birth_info.birth_datetime})")
             
-            # 음력을 양력으로 변환 (필요시)
+            # 음력을 양력으로 변환 (필요시, 로컬 음양력 테이블)
+            birth_datetime = birth_info.birth_datetime
             if birth_info.is_lunar:
-                # TODO: 음양력 변환 구현 (korean-lunar-calendar 라이브러리 사용)
-                logger.warning("음력 변환은 아직 구현되지 않음")
-                pass
-            
-            birth_date = birth_info.date()
-            
-            # KASI 절기 데이터 조회 (정확한 월주 계산용)
-            solar_term = None
-            try:
-                solar_term = await self.find_solar_term_by_date(birth_info.birth_datetime)
-                if solar_term:
-                    logger.debug(f"절기 정보 확인: {solar_term.solar_term_name}")
-            except Exception as e:
-                logger.warning(f"절기 조회 실패, 기본 계산 사용: {e}")
+                if LUNISOLAR_TABLE_AVAILABLE:
+                    solar_date = lunisolar_calendar.lunar_to_solar(
+                        birth_info.year, birth_info.month, birth_info.day, birth_info.is_leap_month
+                    )
+                    birth_datetime = datetime.combine(solar_date, birth_datetime.time())
+                    logger.debug(f"음력 변환: {birth_info.birth_datetime.date()} → 양력 {solar_date}")
+                else:
+                    logger.warning("음양력 테이블을 불러올 수 없어 음력 변환을 건너뜀")
+            
+            # 출생 시각이 속한 절(節) 조회 (오프라인 천문 엔진, 정확한 월주 계산용)
+            solar_term = self.kasi_service.find_governing_solar_term(birth_datetime)
+            if solar_term:
+                logger.debug(f"절기 정보 확인: {solar_term.solar_term_name} ({solar_term.kst_datetime})")
+            else:
+                logger.warning("절입 시각 조회 실패, 기본 계산 사용")
             
             # 각 주 계산
-            year_cheonan, year_jiji = self._get_cheonan_jiji_for_year(birth_info.year)
-            month_cheonan, month_jiji = self._get_month_pillar(birth_info.year, birth_info.month, solar_term)
-            day_cheonan, day_jiji = self._get_day_pillar(birth_date)
-            time_cheonan, time_jiji = self._get_time_pillar(day_cheonan, birth_info.hour)
+            (year_cheonan, year_jiji), (month_cheonan, month_jiji), (day_cheonan, day_jiji), \
+                (time_cheonan, time_jiji) = self._calculate_pillars(birth_datetime, solar_term)
             
             # 기둥 생성
             year_pillar = Pillar(
@@ -678,73 +728,18 @@ class SajuService:
         """궁합 계산"""
         
         try:
-            # 각각의 사주 계산
-            saju_a = await self.calculate_saju(person_a)
-            saju_b = await self.calculate_saju(person_b)
-            
-            # 기본 궁합 점수 계산
-            compatibility_score = 50  # 기본 점수
-            compatibility_details = []
-            
-            # 일주 합충 관계 확인
-            day_a = saju_a.day_pillar
-            day_b = saju_b.day_pillar
-            
-            # 천간 관계
-            if day_a.cheonan == day_b.cheonan:
-                compatibility_score += 10
-                compatibility_details.append("일간이 같아 성격적 동조화가 높음")
-            
-            # 오행 상생상극 관계  
-            element_a = day_a.cheonan_element
-            element_b = day_b.cheonan_element
-            
-            # 오행 상생 관계 (간소화된 버전)
-            saengsaeng_pairs = [
-                (ElementType.WOOD, ElementType.FIRE),
-                (ElementType.FIRE, ElementType.EARTH), 
-                (ElementType.EARTH, ElementType.METAL),
-                (ElementType.METAL, ElementType.WATER),
-                (ElementType.WATER, ElementType.WOOD)
-            ]
-            
-            if (element_a, element_b) in saengsaeng_pairs or (element_b, element_a) in saengsaeng_pairs:
-                compatibility_score += 15
-                compatibility_details.append(f"{element_a.value}와 {element_b.value} 상생관계로 서로 도움")
-            
-            # 오행 상극 관계
-            sanggeuk_pairs = [
-                (ElementType.WOOD, ElementType.EARTH),
-                (ElementType.EARTH, ElementType.WATER),
-                (ElementType.WATER, ElementType.FIRE),
-                (ElementType.FIRE, ElementType.METAL),
-                (ElementType.METAL, ElementType.WOOD)
-            ]
-            
-            if (element_a, element_b) in sanggeuk_pairs or (element_b, element_a) in sanggeuk_pairs:
-                compatibility_score -= 10
-                compatibility_details.append(f"{element_a.value}와 {element_b.value} 상극관계로 마찰 가능")
-            
-            # 신살 비교
-            common_sinsal = set(saju_a.sinsal) & set(saju_b.sinsal)
-            if common_sinsal:
-                compatibility_score += len(common_sinsal) * 5
-                compatibility_details.append(f"공통 신살: {', '.join(common_sinsal)}")
-            
-            # 점수 범위 조정 (0-100)
-            compatibility_score = max(0, min(100, compatibility_score))
+            # 두 사람의 사주를 동시에 계산
+            saju_a, saju_b = await asyncio.gather(
+                self.calculate_saju(person_a),
+                self.calculate_saju(person_b)
+            )
             
-            # 등급 산정
-            if compatibility_score >= 85:
-                grade = "최상"
-            elif compatibility_score >= 70:
-                grade = "상"
-            elif compatibility_score >= 55:
-                grade = "중상"
-            elif compatibility_score >= 40:
-                grade = "중"
-            else:
-                grade = "하"
+            # 일주/신살 인코딩 후 조회 행렬로 점수 계산
+            chart_a = self.compatibility_engine.encode_saju(saju_a)
+            chart_b = self.compatibility_engine.encode_saju(saju_b)
+            compatibility_score = self.compatibility_engine.score(chart_a, chart_b)
+            compatibility_details = self.compatibility_engine.explain(chart_a, chart_b)
+            grade = grade_for_score(compatibility_score)
             
             compatibility_result = {
                 "person_a": {
@@ -772,6 +767,41 @@ class SajuService:
             logger.error(f"궁합 계산 실패: {e}")
             raise
     
+    async def rank_compatibility(
+        self,
+        person: BirthInfo,
+        candidates: List[BirthInfo],
+        top_k: int = 10
+    ) -> List[Dict[str, Any]]:
+        """한 사람과 다수 후보의 궁합 순위 (매칭용)"""
+        try:
+            sajus = await asyncio.gather(
+                self.calculate_saju(person),
+                *(self.calculate_saju(candidate) for candidate in candidates)
+            )
+            
+            chart = self.compatibility_engine.encode_saju(sajus[0])
+            encoded = self.compatibility_engine.encode_candidates(
+                [self.compatibility_engine.encode_saju(saju) for saju in sajus[1:]]
+            )
+            ranking = self.compatibility_engine.score_many(chart, encoded, top_k)
+            
+            logger.info(f"궁합 순위 계산 완료: 후보 {len(candidates)}명 중 상위 {len(ranking)}명")
+            return [
+                {
+                    "index": index,
+                    "name": candidates[index].name,
+                    "palcha": sajus[index + 1].palcha,
+                    "score": score,
+                    "grade": grade_for_score(score)
+                }
+                for index, score in ranking
+            ]
+            
+        except Exception as e:
+            logger.error(f"궁합 순위 계산 실패: {e}")
+            raise
+    
     async def save_saju_result(self, saju_result: SajuResult, user_id: Optional[str] = None) -> str:
         """사주 결과 저장"""
         try:
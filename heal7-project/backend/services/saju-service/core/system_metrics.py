@@ -0,0 +1,202 @@
+"""
+HEAL7 System Metrics Sampler
+백그라운드 /proc 샘플링 기반 시스템/프로세스 메트릭 수집
+
+기능:
+- 프로세스 CPU 사용률, RSS, 열린 FD 수, 스레드 수 (/proc/self)
+- 시스템 CPU/메모리 사용률 (/proc/stat, /proc/meminfo), 디스크 사용률 (statvfs)
+- 이벤트 루프 지연 (샘플링 주기 sleep 초과분)
+- 링 버퍼 시계열 보관 → 요청 처리 시에는 최신 샘플 조회만 수행
+- Prometheus 텍스트 포맷 출력
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+from loguru import logger
+
+PROC_AVAILABLE = os.path.exists('/proc/self/stat')
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+CPU_COUNT = os.cpu_count() or 1
+
+
+class MetricsSample(NamedTuple):
+    """단일 샘플"""
+    timestamp: float                  # epoch 초
+    process_cpu_percent: float        # 프로세스 CPU (코어 1개 = 100%)
+    process_rss_bytes: int
+    process_open_fds: int
+    process_threads: int
+    system_cpu_percent: float
+    system_memory_percent: float
+    disk_usage_percent: float
+    event_loop_lag_ms: float
+
+
+# Prometheus 노출 메트릭 (이름, 필드, 타입, 설명, 배율)
+PROMETHEUS_METRICS: Tuple[Tuple[str, str, str, str, float], ...] = (
+    ('heal7_process_cpu_percent', 'process_cpu_percent', 'gauge', 'Process CPU usage percent (100 = one core)', 1.0),
+    ('heal7_process_resident_memory_bytes', 'process_rss_bytes', 'gauge', 'Process resident memory in bytes', 1.0),
+    ('heal7_process_open_fds', 'process_open_fds', 'gauge', 'Number of open file descriptors', 1.0),
+    ('heal7_process_threads', 'process_threads', 'gauge', 'Number of OS threads', 1.0),
+    ('heal7_system_cpu_percent', 'system_cpu_percent', 'gauge', 'System-wide CPU usage percent', 1.0),
+    ('heal7_system_memory_percent', 'system_memory_percent', 'gauge', 'System memory usage percent', 1.0),
+    ('heal7_disk_usage_percent', 'disk_usage_percent', 'gauge', 'Root filesystem usage percent', 1.0),
+    ('heal7_event_loop_lag_seconds', 'event_loop_lag_ms', 'gauge', 'Event loop scheduling lag in seconds', 0.001),
+)
+
+
+def _read_process_stat() -> Tuple[int, int]:
+    """/proc/self/stat → (utime+stime 틱, 스레드 수)"""
+    with open('/proc/self/stat', 'rb') as f:
+        data = f.read()
+    # comm 필드에 공백이 있을 수 있으므로 마지막 ')' 이후부터 분리
+    fields = data[data.rindex(b')') + 2:].split()
+    # fields[0] 은 3번째 필드(state) → utime=14, stime=15, num_threads=20
+    return int(fields[11]) + int(fields[12]), int(fields[17])
+
+
+def _read_process_rss() -> int:
+    with open('/proc/self/statm', 'rb') as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+
+def _count_open_fds() -> int:
+    return len(os.listdir('/proc/self/fd'))
+
+
+def _read_system_cpu() -> Tuple[int, int]:
+    """/proc/stat 첫 줄 → (전체 틱, 유휴 틱)"""
+    with open('/proc/stat', 'rb') as f:
+        values = [int(v) for v in f.readline().split()[1:]]
+    idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+    return sum(values), idle
+
+
+def _read_memory_percent() -> float:
+    meminfo: Dict[str, int] = {}
+    with open('/proc/meminfo', 'rb') as f:
+        for line in f:
+            key, value = line.split(b':', 1)
+            meminfo[key.decode()] = int(value.split()[0])
+    total = meminfo.get('MemTotal', 0)
+    available = meminfo.get('MemAvailable', meminfo.get('MemFree', 0))
+    return (total - available) / total * 100 if total else 0.0
+
+
+def _read_disk_percent(path: str = '/') -> float:
+    stat = os.statvfs(path)
+    total = stat.f_blocks * stat.f_frsize
+    used = (stat.f_blocks - stat.f_bfree) * stat.f_frsize
+    return used / total * 100 if total else 0.0
+
+
+class SystemMetricsSampler:
+    def __init__(self):
+        self.interval = float(os.getenv('SYSTEM_METRICS_INTERVAL', '5'))
+        # 기본 1시간 분량 (5초 × 720)
+        self.history: Deque[MetricsSample] = deque(maxlen=int(os.getenv('SYSTEM_METRICS_HISTORY', '720')))
+        self.disk_path = os.getenv('SYSTEM_METRICS_DISK_PATH', '/')
+
+        self._task: Optional[asyncio.Task] = None
+        self._last_process_ticks: Optional[int] = None
+        self._last_system_cpu: Optional[Tuple[int, int]] = None
+        self._last_sampled_at: Optional[float] = None
+
+    def start(self):
+        """백그라운드 샘플링 시작"""
+        if not PROC_AVAILABLE:
+            logger.warning("/proc not available - system metrics sampling disabled")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"System metrics sampler started (interval: {self.interval}s)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        lag_ms = 0.0
+        while True:
+            try:
+                self.history.append(self.sample(lag_ms))
+            except Exception as e:
+                logger.error(f"System metrics sampling failed: {e}")
+
+            # sleep 초과 시간 = 이벤트 루프가 다른 작업에 막혀 있던 시간
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (time.perf_counter() - started - self.interval) * 1000)
+
+    def sample(self, event_loop_lag_ms: float = 0.0) -> MetricsSample:
+        """현재 메트릭 샘플 (CPU 사용률은 직전 샘플 대비 차분)"""
+        now = time.monotonic()
+        process_ticks, threads = _read_process_stat()
+        system_total, system_idle = _read_system_cpu()
+
+        process_cpu = 0.0
+        system_cpu = 0.0
+        if self._last_sampled_at is not None:
+            elapsed = now - self._last_sampled_at
+            if elapsed > 0:
+                process_cpu = (process_ticks - self._last_process_ticks) / CLOCK_TICKS / elapsed * 100
+            total_delta = system_total - self._last_system_cpu[0]
+            if total_delta > 0:
+                system_cpu = (1 - (system_idle - self._last_system_cpu[1]) / total_delta) * 100
+
+        self._last_sampled_at = now
+        self._last_process_ticks = process_ticks
+        self._last_system_cpu = (system_total, system_idle)
+
+        return MetricsSample(
+            timestamp=time.time(),
+            process_cpu_percent=round(process_cpu, 2),
+            process_rss_bytes=_read_process_rss(),
+            process_open_fds=_count_open_fds(),
+            process_threads=threads,
+            system_cpu_percent=round(system_cpu, 2),
+            system_memory_percent=round(_read_memory_percent(), 2),
+            disk_usage_percent=round(_read_disk_percent(self.disk_path), 2),
+            event_loop_lag_ms=round(event_loop_lag_ms, 3)
+        )
+
+    def latest(self) -> Optional[MetricsSample]:
+        return self.history[-1] if self.history else None
+
+    def series(self, seconds: Optional[float] = None) -> List[Dict[str, float]]:
+        """최근 N초 시계열 (None 이면 전체 버퍼)"""
+        cutoff = time.time() - seconds if seconds else 0
+        return [sample._asdict() for sample in self.history if sample.timestamp >= cutoff]
+
+    def prometheus_text(self) -> str:
+        """Prometheus 텍스트 노출 포맷"""
+        sample = self.latest()
+        lines = []
+        if sample:
+            for name, field, metric_type, description, scale in PROMETHEUS_METRICS:
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                value = getattr(sample, field)
+                lines.append(f"{name} {round(value * scale, 6) if scale != 1.0 else value}")
+
+            max_lag = round(max(s.event_loop_lag_ms for s in self.history) / 1000, 6)
+            lines.append("# HELP heal7_event_loop_lag_max_seconds Maximum event loop lag in the sample window")
+            lines.append("# TYPE heal7_event_loop_lag_max_seconds gauge")
+            lines.append(f"heal7_event_loop_lag_max_seconds {max_lag}")
+
+        lines.append("# HELP heal7_metrics_samples Number of samples in the ring buffer")
+        lines.append("# TYPE heal7_metrics_samples gauge")
+        lines.append(f"heal7_metrics_samples {len(self.history)}")
+        return "\n".join(lines) + "\n"
+
+
+system_metrics_sampler = SystemMetricsSampler()
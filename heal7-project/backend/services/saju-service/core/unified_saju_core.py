@@ -8,7 +8,7 @@
 📍 핵심 기능:
 - 60갑자 계산 (1900-01-31 갑진일 기준)
 - 음력 변환
-- 사주팔자 계산
+- 사주팔자 계산 (공용 사주 파사드 shared.saju_pillars 위임, 크기 제한 공유 캐시)
 - 절기 정보
 
 📍 사용법:
@@ -17,8 +17,9 @@ saju = UnifiedSajuCore()
 result = saju.calculate_gapja(2025, 9, 11)  # "계미"
 
 📍 폴백 정책:
-1. KASI API 호출 시도
-2. 실패 시 로컬 정확 계산 (수학적 공식)
+1. 로컬 음양력 테이블 (1900-2100, shared/lunisolar_calendar)
+2. 범위 밖이면 KASI API 호출 시도
+3. 실패 시 로컬 근사 계산 (수학적 공식)
 3. 모든 계산은 1900-01-31=갑진일 기준점 사용
 
 ⚠️ 수정 시 주의사항:
@@ -32,15 +33,22 @@ from typing import Dict, Tuple, Optional, Union, List
 import requests
 import logging
 import os
-import asyncpg
-import asyncio
+import sys
+from pathlib import Path
 
 # 전역 상수 import
-from .saju_constants import (
-    GAPJA_60, CHEONGAN_10, JIJI_12, 
-    REFERENCE_DATE, REFERENCE_GAPJA_INDEX,
-    KASI_API_KEY, SOLAR_TERMS_24
-)
+from .saju_constants import KASI_API_KEY, SOLAR_TERMS_24
+
+# 오프라인 음양력 테이블 (backend/shared)
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+try:
+    from shared import lunisolar_calendar
+    LUNISOLAR_TABLE_AVAILABLE = True
+except ImportError:
+    lunisolar_calendar = None
+    LUNISOLAR_TABLE_AVAILABLE = False
+
+from shared.saju_pillars import saju_pillar_facade, day_gapja
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +61,6 @@ class UnifiedSajuCore:
     
     def __init__(self):
         self.api_key = KASI_API_KEY
-        self._cache = {}  # 간단한 메모리 캐시
     
     # ==========================================
     # 📍 60갑자 계산 (핵심 기능)
@@ -75,20 +82,8 @@ class UnifiedSajuCore:
             "계미"
         """
         try:
-            # 캐시 확인
-            date_key = f"{year}-{month:02d}-{day:02d}"
-            if date_key in self._cache:
-                return self._cache[date_key]
-            
-            # 수학적 계산 (100% 정확)
-            target_date = date(year, month, day)
-            days_diff = (target_date - REFERENCE_DATE).days
-            gapja_index = (REFERENCE_GAPJA_INDEX + days_diff) % 60
-            
-            result = GAPJA_60[gapja_index]
-            self._cache[date_key] = result
-            
-            return result
+            # 수학적 계산 (100% 정확, 순수 연산이라 캐시 불필요)
+            return day_gapja(date(year, month, day))
             
         except Exception as e:
             logger.error(f"갑자 계산 실패 {year}-{month}-{day}: {e}")
@@ -126,10 +121,24 @@ class UnifiedSajuCore:
                 'lunar_month': int, 
                 'lunar_day': int,
                 'is_leap_month': bool,
-                'source': str  # 'kasi' 또는 'fallback'
+                'source': str  # 'local', 'kasi' 또는 'fallback'
             }
         """
-        # 1. KASI API 시도
+        # 1. 로컬 음양력 테이블
+        if LUNISOLAR_TABLE_AVAILABLE:
+            try:
+                lunar = lunisolar_calendar.solar_to_lunar(date(year, month, day))
+                return {
+                    'lunar_year': lunar.year,
+                    'lunar_month': lunar.month,
+                    'lunar_day': lunar.day,
+                    'is_leap_month': lunar.is_leap,
+                    'source': 'local'
+                }
+            except ValueError:
+                pass
+        
+        # 2. KASI API 시도
         try:
             if self._kasi_api_available():
                 lunar_data = self._kasi_solar_to_lunar(year, month, day)
@@ -139,7 +148,7 @@ class UnifiedSajuCore:
         except Exception as e:
             logger.warning(f"KASI API 실패: {e}")
         
-        # 2. 폴백 계산 (간단한 근사)
+        # 3. 폴백 계산 (간단한 근사)
         logger.info(f"폴백 음력 계산 사용: {year}-{month}-{day}")
         return self._fallback_solar_to_lunar(year, month, day)
     
@@ -213,12 +222,15 @@ class UnifiedSajuCore:
     # 📍 사주팔자 계산
     # ==========================================
     
-    def calculate_saju_pillars(self, year: int, month: int, day: int, hour: int) -> Dict[str, str]:
+    def calculate_saju_pillars(self, year: int, month: int, day: int, hour: int, minute: int = 0) -> Dict[str, str]:
         """
         사주팔자 계산 (년주, 월주, 일주, 시주)
         
+        입춘/절입 시각 기준 계산은 공용 사주 파사드에 위임 (다른 엔진과 캐시 공유)
+        
         Args:
             year, month, day, hour: 생년월일시
+            minute: 분 (절입 시각 경계 판정용)
             
         Returns:
             Dict: {
@@ -229,23 +241,13 @@ class UnifiedSajuCore:
             }
         """
         try:
-            # 일주 (기준)
-            day_pillar = self.calculate_gapja(year, month, day)
-            
-            # 년주 (입춘 기준)
-            year_pillar = self._calculate_year_pillar(year, month, day)
-            
-            # 월주 (절기 기준, DB 연동)
-            month_pillar = self._calculate_month_pillar(year, month, day, year_pillar)
-            
-            # 시주 (일간 기준)
-            hour_pillar = self._calculate_hour_pillar(day_pillar, hour)
+            saju = saju_pillar_facade.calculate(year, month, day, hour, minute)
             
             return {
-                'year_pillar': year_pillar,
-                'month_pillar': month_pillar,
-                'day_pillar': day_pillar,
-                'hour_pillar': hour_pillar
+                'year_pillar': saju.year,
+                'month_pillar': saju.month,
+                'day_pillar': saju.day,
+                'hour_pillar': saju.hour
             }
             
         except Exception as e:
@@ -256,18 +258,6 @@ class UnifiedSajuCore:
                 'day_pillar': '갑자',
                 'hour_pillar': '갑자'
             }
-    
-    def _calculate_year_pillar(self, year: int, month: int, day: int) -> str:
-        """년주 계산 (입춘 기준)"""
-        # 입춘 이전은 전년도로 계산
-        saju_year = year
-        if month < 2 or (month == 2 and day < 4):
-            saju_year = year - 1
-        
-        # 1900년 = 경자년(36번째) 기준
-        year_offset = (saju_year - 1900) % 60
-        year_index = (36 + year_offset) % 60
-        return GAPJA_60[year_index]
 
     def calculate_comprehensive_saju(self, birth_data: dict) -> dict:
         """
@@ -287,18 +277,19 @@ class UnifiedSajuCore:
             minute = birth_data.get('minute', 0)
 
             # 사주팔자 계산
-            saju_result = self.calculate_saju_pillars(year, month, day, hour)
+            saju_result = self.calculate_saju_pillars(year, month, day, hour, minute)
 
             # 추가 분석 정보
             comprehensive_result = {
                 **saju_result,
+                'time_pillar': saju_result['hour_pillar'],  # 종합 결과 소비자 호환 키
                 'birth_data': birth_data,
                 'day_master': saju_result['day_pillar'][0],  # 일간
-                'palcha': f"{saju_result['year_pillar']} {saju_result['month_pillar']} {saju_result['day_pillar']} {saju_result['time_pillar']}",
+                'palcha': f"{saju_result['year_pillar']} {saju_result['month_pillar']} {saju_result['day_pillar']} {saju_result['hour_pillar']}",
                 'element_balance': {},  # 향후 구현
                 'sipsin_analysis': {},  # 향후 구현
                 'sinsal': [],          # 향후 구현
-                'calculation_method': 'unified_db_enhanced',
+                'calculation_method': 'unified_saju_facade',
                 'created_at': datetime.now()
             }
 
@@ -318,149 +309,6 @@ class UnifiedSajuCore:
                 'calculation_method': 'error_fallback'
             }
     
-    def _calculate_month_pillar(self, year: int, month: int, day: int, year_pillar: str) -> str:
-        """
-        월주 계산 (절기 기준, DB 연동)
-
-        🔥 개선사항:
-        - healwitch_perpetual_calendars DB 직접 조회
-        - 정확한 절기 기준 계산
-        - 73,442건 데이터 기반 정밀도
-        """
-        try:
-            # 비동기 DB 조회를 동기로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(self._get_month_pillar_from_db(year, month, day))
-                return result
-            finally:
-                loop.close()
-        except Exception as e:
-            logger.error(f"DB 기반 월주 계산 실패, 폴백 사용: {e}")
-            # 폴백: 기존 간단 계산 (절기 무시)
-            return self._calculate_month_pillar_fallback(year, month, year_pillar)
-
-    async def _get_month_pillar_from_db(self, year: int, month: int, day: int) -> str:
-        """DB에서 정확한 월주 조회"""
-        try:
-            conn = await asyncpg.connect(
-                host="/var/run/postgresql",
-                database="heal7_saju",
-                user="postgres"
-            )
-
-            # 해당 날짜의 정확한 월주 조회
-            query = """
-            SELECT month_gapja FROM healwitch_perpetual_calendars
-            WHERE solar_year = $1 AND solar_month = $2 AND solar_day = $3
-            LIMIT 1
-            """
-
-            row = await conn.fetchrow(query, year, month, day)
-
-            if row and row['month_gapja']:
-                return row['month_gapja']
-            else:
-                # DB에 월주 정보가 없으면 계산해서 저장
-                return await self._calculate_and_save_month_pillar(conn, year, month, day)
-
-        except Exception as e:
-            logger.error(f"DB 월주 조회 오류: {e}")
-            raise
-        finally:
-            if 'conn' in locals():
-                await conn.close()
-
-    async def _calculate_and_save_month_pillar(self, conn, year: int, month: int, day: int) -> str:
-        """월주 계산 후 DB 저장"""
-        try:
-            # 년주 조회
-            year_query = "SELECT year_gapja FROM healwitch_perpetual_calendars WHERE solar_year = $1 LIMIT 1"
-            year_row = await conn.fetchrow(year_query, year)
-            year_pillar = year_row['year_gapja'] if year_row else f"{CHEONGAN_10[year % 10]}{JIJI_12[year % 12]}"
-
-            # 해당 월의 절기 정보 조회
-            solar_term_query = """
-            SELECT solar_term_korean, solar_day
-            FROM healwitch_perpetual_calendars
-            WHERE solar_year = $1 AND solar_month = $2 AND solar_term_korean IS NOT NULL
-            ORDER BY solar_day ASC
-            """
-
-            solar_terms = await conn.fetch(solar_term_query, year, month)
-
-            # 절기별 월지 매핑
-            solar_term_to_jiji = {
-                "입춘": 2, "경칩": 3, "청명": 4, "입하": 5, "망종": 6, "소서": 7,
-                "입추": 8, "백로": 9, "한로": 10, "입동": 11, "대설": 0, "소한": 1
-            }
-
-            # 현재 날짜가 속하는 절기 구간 찾기
-            current_jiji = 2  # 기본값: 인월
-            for term in solar_terms:
-                if day >= term['solar_day'] and term['solar_term_korean'] in solar_term_to_jiji:
-                    current_jiji = solar_term_to_jiji[term['solar_term_korean']]
-
-            # 년간별 월간 계산
-            year_cheonan = year_pillar[0]
-            year_to_month_base = {"갑": 2, "기": 2, "을": 4, "경": 4, "병": 6, "신": 6, "정": 8, "임": 8, "무": 0, "계": 0}
-            base_index = year_to_month_base.get(year_cheonan, 2)
-
-            month_offset = (current_jiji - 2 + 12) % 12
-            cheonan_index = (base_index + month_offset) % 10
-
-            month_pillar = f"{CHEONGAN_10[cheonan_index]}{JIJI_12[current_jiji]}"
-
-            # DB 업데이트
-            update_query = """
-            UPDATE healwitch_perpetual_calendars
-            SET month_gapja = $1
-            WHERE solar_year = $2 AND solar_month = $3 AND solar_day = $4
-            """
-            await conn.execute(update_query, month_pillar, year, month, day)
-
-            return month_pillar
-
-        except Exception as e:
-            logger.error(f"월주 계산 및 저장 오류: {e}")
-            # 최후 폴백
-            return "갑인"
-
-    def _calculate_month_pillar_fallback(self, year: int, month: int, year_pillar: str) -> str:
-        """폴백: 기존 간단 계산"""
-        month_map = {1: 2, 2: 3, 3: 4, 4: 5, 5: 6, 6: 7, 7: 8, 8: 9, 9: 10, 10: 11, 11: 12, 12: 1}
-        year_cheonan_index = GAPJA_60.index(year_pillar) % 10
-        base_month_index = (year_cheonan_index * 2 + month_map[month]) % 60
-        return GAPJA_60[base_month_index]
-    
-    def _calculate_hour_pillar(self, day_pillar: str, hour: int) -> str:
-        """시주 계산 (일간 기준)"""
-        # 시간을 지지로 변환
-        hour_jiji_map = {
-            23: 0, 0: 0, 1: 0,    # 자시 (23-01)
-            2: 1, 3: 1,           # 축시 (01-03) 
-            4: 2, 5: 2,           # 인시 (03-05)
-            6: 3, 7: 3,           # 묘시 (05-07)
-            8: 4, 9: 4,           # 진시 (07-09)
-            10: 5, 11: 5,         # 사시 (09-11)
-            12: 6, 13: 6,         # 오시 (11-13)
-            14: 7, 15: 7,         # 미시 (13-15)
-            16: 8, 17: 8,         # 신시 (15-17)
-            18: 9, 19: 9,         # 유시 (17-19)
-            20: 10, 21: 10,       # 술시 (19-21)
-            22: 11                # 해시 (21-23)
-        }
-        
-        hour_jiji_index = hour_jiji_map.get(hour, 0)
-        day_cheongan_index = GAPJA_60.index(day_pillar) % 10
-        
-        # 일간에 따른 시간 천간 계산
-        hour_cheongan_index = (day_cheongan_index * 2 + hour_jiji_index) % 10
-        hour_gapja_index = hour_cheongan_index * 6 + hour_jiji_index
-        
-        return GAPJA_60[hour_gapja_index % 60]
-    
     # ==========================================
     # 📍 유틸리티 함수
     # ==========================================
@@ -478,11 +326,11 @@ class UnifiedSajuCore:
         last_day = next_month - timedelta(days=1)
         return last_day.day
     
-    def get_system_status(self) -> Dict[str, Union[str, bool]]:
+    def get_system_status(self) -> Dict[str, Union[str, bool, dict]]:
         """시스템 상태 확인"""
         return {
             'kasi_api_available': self._kasi_api_available(),
-            'cache_size': len(self._cache),
+            'pillar_cache': saju_pillar_facade.cache_info(),
             'version': '2.0.0-unified',
             'source': 'unified_saju_core.py'
         }
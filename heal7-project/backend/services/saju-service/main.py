@@ -43,8 +43,18 @@ app.add_middleware(
 
 # 라우터 Import 및 등록
 try:
-    from routers.health_router import router as health_router
+    from routers.health_router import router as health_router, system_metrics_sampler
     app.include_router(health_router)
+
+    @app.on_event("startup")
+    async def start_system_metrics_sampler():
+        # /proc 기반 시스템 메트릭 백그라운드 샘플링
+        system_metrics_sampler.start()
+
+    @app.on_event("shutdown")
+    async def stop_system_metrics_sampler():
+        await system_metrics_sampler.stop()
+
     print("✅ Health router loaded successfully")
 except ImportError as e:
     print(f"⚠️ WARNING: Could not import health router: {e}")
@@ -140,8 +150,18 @@ except ImportError as e:
 
 # 실제 데이터 기반 분석 라우터 추가 (통계, AI 메트릭)
 try:
-    from routers.analytics_router import router as analytics_router
+    from routers.analytics_router import router as analytics_router, analytics_rollup
     app.include_router(analytics_router)
+
+    @app.on_event("startup")
+    async def start_analytics_rollup():
+        # 대시보드 통계 사전 집계 (시간/일 단위)
+        analytics_rollup.start()
+
+    @app.on_event("shutdown")
+    async def stop_analytics_rollup():
+        await analytics_rollup.stop()
+
     print("✅ Analytics router loaded successfully (Real data implementation)")
 except ImportError as e:
     print(f"⚠️ WARNING: Could not import analytics router: {e}")
@@ -26,6 +26,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
 from auth_service import auth_service
 from database_service import db_service
+from pagination import keyset_condition, keyset_order, split_page
 
 # AI 해석 엔진 import (선택적)
 try:
@@ -72,6 +73,7 @@ class AdminLogFilter(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     limit: int = Field(default=50, le=200)
+    cursor: Optional[str] = None  # 이전 응답의 next_cursor
 
 class AIInterpretationRequest(BaseModel):
     interpretation_type: str = Field(..., pattern="^(basic|detailed|compatibility|naming|fortune)$")
@@ -265,7 +267,7 @@ async def admin_login(request: AdminLoginRequest, req: Request):
         auth_service.validate_login_attempt(username, failed_attempts, last_failed)
 
         # 비밀번호 검증
-        if not auth_service.verify_password(password, admin['password_hash']):
+        if not await auth_service.verify_password_async(password, admin['password_hash']):
             # 실패 횟수 증가
             await db_service.execute_query(
                 """UPDATE admin_users SET
@@ -289,6 +291,15 @@ async def admin_login(request: AdminLoginRequest, req: Request):
                 detail="Invalid username or password"
             )
 
+        # cost factor가 낮은 기존 해시는 로그인 시점에 재해시
+        if auth_service.needs_rehash(admin['password_hash']):
+            new_hash = await auth_service.hash_password_async(password)
+            await db_service.execute_query(
+                "UPDATE admin_users SET password_hash = $1 WHERE id = $2",
+                [new_hash, admin['id']],
+                db_type='saju'
+            )
+
         # 로그인 성공 - 실패 카운터 리셋
         await db_service.execute_query(
             """UPDATE admin_users SET
@@ -358,10 +369,17 @@ async def admin_login(request: AdminLoginRequest, req: Request):
         )
 
 @router.post("/logout")
-async def admin_logout(req: Request, admin: dict = Depends(verify_admin_token)):
+async def admin_logout(
+    req: Request,
+    admin: dict = Depends(verify_admin_token),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
     """관리자 로그아웃 - 보안 강화"""
     ip_address = req.client.host if req.client else "unknown"
 
+    # 검증 캐시에서 토큰 제거
+    auth_service.invalidate_jwt_token(credentials.credentials)
+
     try:
         # 로그아웃 로그 기록
         await db_service.execute_query(
@@ -613,19 +631,26 @@ async def get_admin_logs(
             param_count += 1
             query += f" AND al.created_at <= ${param_count}"
             params.append(filter_params.end_date)
+
+        if filter_params.cursor:
+            query += f" AND {keyset_condition(filter_params.cursor, params, 'al.')}"
+            param_count = len(params)
         
         param_count += 1
-        query += f" ORDER BY al.created_at DESC LIMIT ${param_count}"
-        params.append(filter_params.limit)
+        query += f" {keyset_order('al.')} LIMIT ${param_count}"
+        params.append(filter_params.limit + 1)
         
-        logs = await conn.fetch(query, *params)
+        logs, next_cursor = split_page(await conn.fetch(query, *params), filter_params.limit)
         
         return {
             "success": True,
             "data": [dict(log) for log in logs],
-            "total_count": len(logs)
+            "total_count": len(logs),
+            "next_cursor": next_cursor
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Admin logs error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch admin logs")
@@ -816,9 +841,10 @@ async def list_generated_content(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: Optional[str] = None,
     admin: dict = Depends(verify_admin_token)
 ):
-    """생성된 콘텐츠 목록 조회"""
+    """생성된 콘텐츠 목록 조회 (cursor 지정 시 offset 대신 키셋 조회)"""
     conn = await get_db_connection()
     try:
         query = """
@@ -840,19 +866,25 @@ async def list_generated_content(
             query += f" AND gc.status = ${param_count}"
             params.append(status)
 
-        param_count += 1
-        param_count += 1
-        query += f" ORDER BY gc.created_at DESC LIMIT ${param_count-1} OFFSET ${param_count}"
-        params.extend([limit, offset])
+        if cursor:
+            query += f" AND {keyset_condition(cursor, params, 'gc.')}"
+            params.append(limit + 1)
+            query += f" {keyset_order('gc.')} LIMIT ${len(params)}"
+        else:
+            params.extend([limit + 1, offset])
+            query += f" {keyset_order('gc.')} LIMIT ${len(params) - 1} OFFSET ${len(params)}"
 
-        content_list = await conn.fetch(query, *params)
+        content_list, next_cursor = split_page(await conn.fetch(query, *params), limit)
 
         return {
             "success": True,
             "data": [dict(content) for content in content_list],
-            "total_count": len(content_list)
+            "total_count": len(content_list),
+            "next_cursor": next_cursor
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Content list error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch content list")
@@ -8,6 +8,9 @@ HEAL7 Analytics & Statistics Router
 - 사용자 통계
 - 비즈니스 메트릭
 - 시스템 헬스 체크
+
+일별 지표는 analytics_rollup 사전 집계 테이블에서 조회하고,
+/dashboard 종합 응답은 짧은 TTL 동안 캐시합니다.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status
@@ -16,18 +19,27 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
 from enum import Enum
+import asyncio
 import sys
 import os
+import time
 from loguru import logger
 
 # 보안 강화된 서비스 import
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
 from auth_service import auth_service
 from database_service import db_service
+from analytics_rollup import analytics_rollup
+from system_metrics import system_metrics_sampler
 
 router = APIRouter(prefix="/api/admin/analytics", tags=["admin-analytics"])
 security = HTTPBearer()
 
+# /dashboard 종합 응답 캐시 (초)
+DASHBOARD_CACHE_TTL = float(os.getenv('ANALYTICS_DASHBOARD_CACHE_TTL', '15'))
+_dashboard_cache: Dict[str, Any] = {}
+_dashboard_lock = asyncio.Lock()
+
 # ===============================================
 # Pydantic Models
 # ===============================================
@@ -104,15 +116,16 @@ async def get_system_health_metrics() -> SystemHealth:
     """시스템 헬스 메트릭 조회"""
     try:
         # DB 응답 시간 측정
-        start_time = datetime.now()
+        started = time.perf_counter()
         await db_service.execute_single_query("SELECT 1", db_type='saju')
-        db_response_time = (datetime.now() - start_time).total_seconds() * 1000
+        db_response_time = (time.perf_counter() - started) * 1000
 
-        # 실제 운영 환경에서는 시스템 모니터링 도구에서 가져와야 함
+        # 백그라운드 샘플러의 최신 값 (요청 시 /proc 을 읽지 않음)
+        sample = system_metrics_sampler.latest()
         return SystemHealth(
-            cpu_usage=25.3,  # 실제로는 psutil 등으로 측정
-            memory_usage=67.8,
-            disk_usage=45.2,
+            cpu_usage=sample.system_cpu_percent if sample else 0.0,
+            memory_usage=sample.system_memory_percent if sample else 0.0,
+            disk_usage=sample.disk_usage_percent if sample else 0.0,
             api_response_time=db_response_time
         )
     except Exception as e:
@@ -127,42 +140,16 @@ async def get_system_health_metrics() -> SystemHealth:
 async def get_business_metrics() -> BusinessMetrics:
     """비즈니스 메트릭 조회"""
     try:
-        today = datetime.now().date()
-
-        # 일일 활성 사용자 (오늘 활동한 사용자)
-        daily_active_users = await db_service.execute_count_query(
-            """SELECT COUNT(DISTINCT user_id) FROM point_transactions
-               WHERE DATE(created_at) = $1""",
-            [today],
-            db_type='main'
-        )
-
-        # 일일 상담 건수 (문의 + 결제)
-        daily_consultations = await db_service.execute_count_query(
-            """SELECT COUNT(*) FROM inquiries
-               WHERE DATE(created_at) = $1""",
-            [today],
-            db_type='main'
-        )
-
-        # 일일 매출 (포인트 충전 기준)
-        daily_revenue_result = await db_service.execute_single_query(
-            """SELECT COALESCE(SUM(amount), 0) as revenue
-               FROM point_charges
-               WHERE DATE(created_at) = $1 AND status = 'completed'""",
-            [today],
-            db_type='main'
-        )
-
-        daily_revenue = float(daily_revenue_result['revenue'] or 0)
+        # 일일 활성 사용자 / 상담 건수 / 매출 (포인트 충전 기준) - 일별 집계에서 한 번에 조회
+        metrics = await analytics_rollup.daily_metrics('main')
 
         # 전환율 (가입자 대비 결제자 비율)
         conversion_rate = 0.15  # 실제로는 복잡한 계산 필요
 
         return BusinessMetrics(
-            daily_active_users=daily_active_users,
-            daily_consultations=daily_consultations,
-            daily_revenue=daily_revenue,
+            daily_active_users=int(metrics['active_users']),
+            daily_consultations=int(metrics['consultations']),
+            daily_revenue=metrics['revenue'],
             conversion_rate=conversion_rate
         )
     except Exception as e:
@@ -177,28 +164,13 @@ async def get_business_metrics() -> BusinessMetrics:
 async def get_saju_system_metrics() -> SajuSystemMetrics:
     """사주 시스템 메트릭 조회"""
     try:
-        today = datetime.now().date()
-
-        # 오늘 사주 계산 건수
-        calculations_today = await db_service.execute_count_query(
-            """SELECT COUNT(*) FROM saju_results
-               WHERE DATE(created_at) = $1""",
-            [today],
-            db_type='saju'
-        )
-
-        # API 호출 수 (관리자 로그 기준)
-        api_calls = await db_service.execute_count_query(
-            """SELECT COUNT(*) FROM admin_logs
-               WHERE DATE(created_at) = $1 AND action LIKE '%API%'""",
-            [today],
-            db_type='saju'
-        )
+        # 오늘 사주 계산 건수 / API 호출 수 (관리자 로그 기준)
+        metrics = await analytics_rollup.daily_metrics('saju')
 
         return SajuSystemMetrics(
-            calculations_today=calculations_today,
+            calculations_today=int(metrics['saju_calculations']),
             accuracy_rate=97.8,  # 실제로는 피드백 데이터 기반 계산
-            api_calls=api_calls,
+            api_calls=int(metrics['api_calls']),
             error_rate=2.2
         )
     except Exception as e:
@@ -253,18 +225,32 @@ async def get_recent_activities() -> List[Activity]:
 async def get_dashboard_analytics(admin: dict = Depends(verify_admin_analytics)):
     """대시보드 종합 분석 데이터 조회"""
     try:
-        # 각 메트릭을 병렬로 조회
-        system_health = await get_system_health_metrics()
-        business_metrics = await get_business_metrics()
-        saju_system = await get_saju_system_metrics()
-        recent_activities = await get_recent_activities()
-
-        return DashboardAnalytics(
-            system_health=system_health,
-            business_metrics=business_metrics,
-            saju_system=saju_system,
-            recent_activities=recent_activities
-        )
+        cached = _dashboard_cache.get('value')
+        if cached and time.monotonic() - _dashboard_cache['stored_at'] < DASHBOARD_CACHE_TTL:
+            return cached
+
+        # 캐시 만료 시 동시 요청은 한 번만 조회
+        async with _dashboard_lock:
+            cached = _dashboard_cache.get('value')
+            if cached and time.monotonic() - _dashboard_cache['stored_at'] < DASHBOARD_CACHE_TTL:
+                return cached
+
+            # 각 메트릭을 병렬로 조회
+            system_health, business_metrics, saju_system, recent_activities = await asyncio.gather(
+                get_system_health_metrics(),
+                get_business_metrics(),
+                get_saju_system_metrics(),
+                get_recent_activities()
+            )
+
+            dashboard = DashboardAnalytics(
+                system_health=system_health,
+                business_metrics=business_metrics,
+                saju_system=saju_system,
+                recent_activities=recent_activities
+            )
+            _dashboard_cache.update(value=dashboard, stored_at=time.monotonic())
+            return dashboard
 
     except Exception as e:
         logger.error(f"Error getting dashboard analytics: {e}")
@@ -277,23 +263,10 @@ async def get_dashboard_analytics(admin: dict = Depends(verify_admin_analytics))
 async def get_ai_stats(admin: dict = Depends(verify_admin_analytics)):
     """AI 시스템 통계 조회"""
     try:
-        today = datetime.now().date()
-
-        # AI 해석 통계
-        interpretations_count = await db_service.execute_count_query(
-            """SELECT COUNT(*) FROM ai_interpretations
-               WHERE DATE(created_at) = $1""",
-            [today],
-            db_type='saju'
-        )
-
-        # 생성된 콘텐츠 통계
-        generated_content_count = await db_service.execute_count_query(
-            """SELECT COUNT(*) FROM generated_content
-               WHERE DATE(created_at) = $1 AND status = 'approved'""",
-            [today],
-            db_type='saju'
-        )
+        # AI 해석 / 승인된 생성 콘텐츠 통계
+        metrics = await analytics_rollup.daily_metrics('saju')
+        interpretations_count = int(metrics['ai_interpretations'])
+        generated_content_count = int(metrics['approved_content'])
 
         return {
             "success": True,
@@ -327,45 +300,28 @@ async def get_ai_stats(admin: dict = Depends(verify_admin_analytics)):
 async def get_user_stats(admin: dict = Depends(verify_admin_analytics)):
     """사용자 통계 조회"""
     try:
-        today = datetime.now().date()
-
-        # 총 사용자 수
-        total_users = await db_service.execute_count_query(
-            "SELECT COUNT(*) FROM users",
-            db_type='main'
-        )
-
-        # 오늘 활성 사용자
-        active_users_today = await db_service.execute_count_query(
-            """SELECT COUNT(DISTINCT user_id) FROM point_transactions
-               WHERE DATE(created_at) = $1""",
-            [today],
-            db_type='main'
-        )
-
-        # 오늘 신규 가입자
-        new_users_today = await db_service.execute_count_query(
-            """SELECT COUNT(*) FROM users
-               WHERE DATE(created_at) = $1""",
-            [today],
-            db_type='main'
-        )
-
-        # 총 배포된 포인트
-        total_points_result = await db_service.execute_single_query(
-            """SELECT COALESCE(SUM(total_points), 0) as total_points
-               FROM user_point_balances""",
-            db_type='main'
+        # 총 사용자 수 / 오늘 활성·신규 사용자 / 총 배포된 포인트 / 포인트 거래 수 병렬 조회
+        total_users, metrics, total_points_result, point_transactions = await asyncio.gather(
+            db_service.execute_count_query(
+                "SELECT COUNT(*) FROM users",
+                db_type='main'
+            ),
+            analytics_rollup.daily_metrics('main'),
+            db_service.execute_single_query(
+                """SELECT COALESCE(SUM(total_points), 0) as total_points
+                   FROM user_point_balances""",
+                db_type='main'
+            ),
+            db_service.execute_count_query(
+                "SELECT COUNT(*) FROM point_transactions",
+                db_type='main'
+            )
         )
 
+        active_users_today = int(metrics['active_users'])
+        new_users_today = int(metrics['new_users'])
         total_points_distributed = int(total_points_result['total_points'] or 0)
 
-        # 포인트 거래 수
-        point_transactions = await db_service.execute_count_query(
-            "SELECT COUNT(*) FROM point_transactions",
-            db_type='main'
-        )
-
         return {
             "success": True,
             "data": {
@@ -384,6 +340,22 @@ async def get_user_stats(admin: dict = Depends(verify_admin_analytics)):
             detail="Failed to fetch user statistics"
         )
 
+@router.get("/system/metrics")
+async def get_system_metrics_series(
+    minutes: int = 60,
+    admin: dict = Depends(verify_admin_analytics)
+):
+    """프로세스/시스템 메트릭 시계열 (CPU, RSS, FD, 이벤트 루프 지연)"""
+    latest = system_metrics_sampler.latest()
+    return {
+        "success": True,
+        "data": {
+            "interval_seconds": system_metrics_sampler.interval,
+            "latest": latest._asdict() if latest else None,
+            "series": system_metrics_sampler.series(minutes * 60)
+        }
+    }
+
 @router.get("/system/health")
 async def get_system_health(admin: dict = Depends(verify_admin_analytics)):
     """시스템 헬스 체크"""
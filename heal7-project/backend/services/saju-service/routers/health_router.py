@@ -3,9 +3,15 @@ Health Check Router
 사주 서비스 상태 확인 엔드포인트
 """
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 import yaml
+import sys
+import os
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+from system_metrics import system_metrics_sampler
+
 # 설정 로드
 config_path = Path(__file__).parent.parent / "config.yaml"
 with open(config_path, 'r', encoding='utf-8') as f:
@@ -42,4 +48,12 @@ async def health_endpoint():
         "status": "healthy",
         "service": config["service"]["name"],
         "timestamp": "2025-09-06T09:46:00Z"
-    }
\ No newline at end of file
+    }
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus 메트릭 (백그라운드 샘플러의 최신 값)"""
+    return PlainTextResponse(
+        system_metrics_sampler.prometheus_text(),
+        media_type="text/plain; version=0.0.4"
+    )
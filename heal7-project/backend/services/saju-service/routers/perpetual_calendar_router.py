@@ -7,6 +7,7 @@ HEAL7 Perpetual Calendar Router
 - KASI API 대체: 실시간 API 호출 → DB 쿼리로 성능 최적화
 - 월별 캘린더 데이터 일괄 조회
 - 60갑자, 음력 변환, 24절기 정보 통합 제공
+- 사주 4주 계산은 공용 사주 파사드(shared.saju_pillars) 사용 (DB 연결 없음, 엔진 간 캐시 공유)
 
 ⚡ 성능 최적화:
 - API 호출 30회 → DB 쿼리 1회 (97% 성능 향상)
@@ -25,7 +26,11 @@ import os
 
 # core 모듈 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.saju_calculator import SajuCalculator
+
+# 공용 사주 파사드 (backend/shared)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '..', '..'))
+from shared.saju_pillars import saju_pillar_facade
+from shared.solar_term_engine import solar_term_table
 
 router = APIRouter(prefix="/api/perpetual-calendar", tags=["perpetual-calendar"])
 
@@ -99,62 +104,38 @@ async def get_saju_pillars(
     - 60갑자 순환 일주 계산
     - 시간별 시주 계산 (오자둔 적용)
     """
-    conn = None
     try:
-        conn = await get_db_connection()
-        
-        # DB에서 해당 날짜 정보 조회
-        query = """
-        SELECT date_key, solar_term_name, year_gapja, day_gapja
-        FROM healwitch_perpetual_calendars
-        WHERE date_key = $1
-        """
-        
+        saju = saju_pillar_facade.calculate(year, month, day, hour)
         date_key = f"{year:04d}-{month:02d}-{day:02d}"
-        row = await conn.fetchrow(query, date_key)
-        
-        if not row:
-            # DB에 없으면 직접 계산
-            year_pillar = SajuCalculator.calculate_year_pillar(year, month, day)
-            day_pillar = SajuCalculator.calculate_day_pillar(year, month, day)
-            solar_term = None
-        else:
-            year_pillar = row['year_gapja']
-            day_pillar = row['day_gapja']
-            solar_term = row['solar_term_name']
-        
-        # 월주 및 시주 계산
-        month_pillar = SajuCalculator.calculate_month_pillar(
-            year_gapja=year_pillar,
-            month=month,
-            day=day,
-            solar_term=solar_term
-        )
-        
-        hour_pillar = SajuCalculator.calculate_hour_pillar(
-            day_gapja=day_pillar,
-            hour=hour
-        )
         
         return {
             "date": date_key,
             "hour": hour,
             "saju": {
-                "year_pillar": year_pillar,
-                "month_pillar": month_pillar,
-                "day_pillar": day_pillar,
-                "hour_pillar": hour_pillar
+                "year_pillar": saju.year,
+                "month_pillar": saju.month,
+                "day_pillar": saju.day,
+                "hour_pillar": saju.hour
             },
-            "solar_term": solar_term,
-            "data_source": "DB" if row else "Calculated"
+            "solar_term": _solar_term_on(saju.solar_date),
+            "data_source": "Calculated"
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 날짜입니다: {str(e)}")
     except Exception as e:
         logger.error(f"사주 계산 오류: {e}")
         raise HTTPException(status_code=500, detail=f"사주 계산 실패: {str(e)}")
-    finally:
-        if conn:
-            await conn.close()
+
+def _solar_term_on(target: date) -> Optional[str]:
+    """해당 날짜에 드는 절기명 (절기 연도는 입춘부터 시작하므로 전년도 테이블도 확인)"""
+    for term_year in (target.year - 1, target.year):
+        if not solar_term_table.supports(term_year):
+            continue
+        for _, name, instant in solar_term_table.terms_for_year(term_year):
+            if instant.date() == target:
+                return name
+    return None
 
 @router.get("/month/{year}/{month}", response_model=MonthlyCalendarResponse)
 async def get_monthly_calendar(
@@ -200,15 +181,12 @@ async def get_monthly_calendar(
         solar_terms = []
         
         for row in rows:
-            # 월주 계산 (DB에 없거나 비어있는 경우)
+            # 월주 계산 (DB에 없거나 비어있는 경우, 정오 기준 절입 시각 반영)
             month_gapja = row['month_gapja']
             if not month_gapja or month_gapja == '':
-                month_gapja = SajuCalculator.calculate_month_pillar(
-                    year_gapja=row['year_gapja'],
-                    month=row['solar_month'],
-                    day=row['solar_day'],
-                    solar_term=row['solar_term_name']
-                )
+                month_gapja = saju_pillar_facade.calculate(
+                    row['solar_year'], row['solar_month'], row['solar_day']
+                ).month
             
             day_data = CalendarDayData(
                 date_key=row['date_key'],
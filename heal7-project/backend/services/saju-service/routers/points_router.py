@@ -29,6 +29,8 @@ from loguru import logger
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
 from auth_service import auth_service
 from database_service import db_service
+from pagination import count_cache, keyset_condition, keyset_order, split_page
+from point_ledger import point_ledger, HISTORY_COUNT_PREFIX
 
 router = APIRouter(prefix="/api/points", tags=["points"])
 security = HTTPBearer()
@@ -95,6 +97,7 @@ class PointHistoryResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (없으면 마지막 페이지)
 
 class PointPolicyResponse(BaseModel):
     id: str
@@ -180,49 +183,6 @@ async def get_service_price(service_type: str, conn) -> int:
         return default_prices.get(service_type, 1000)
     return result
 
-async def use_points_with_priority(user_id: str, amount: int, conn) -> Dict[str, int]:
-    """포인트 사용 우선순위에 따른 차감 (무료 → 보너스 → 유료 순)"""
-    # 현재 잔액 조회
-    balance_query = """
-    SELECT free_points, bonus_points, paid_points, referral_points 
-    FROM user_point_balances WHERE user_id = $1
-    """
-    balance = await conn.fetchrow(balance_query, user_id)
-    if not balance:
-        raise HTTPException(status_code=404, detail="사용자 포인트 정보를 찾을 수 없습니다")
-    
-    remaining = amount
-    used_points = {'free': 0, 'bonus': 0, 'paid': 0, 'referral': 0}
-    
-    # 1. 무료 포인트부터 사용
-    if remaining > 0 and balance['free_points'] > 0:
-        use_free = min(remaining, balance['free_points'])
-        used_points['free'] = use_free
-        remaining -= use_free
-    
-    # 2. 보너스 포인트 사용
-    if remaining > 0 and balance['bonus_points'] > 0:
-        use_bonus = min(remaining, balance['bonus_points'])
-        used_points['bonus'] = use_bonus
-        remaining -= use_bonus
-    
-    # 3. 추천 포인트 사용
-    if remaining > 0 and balance['referral_points'] > 0:
-        use_referral = min(remaining, balance['referral_points'])
-        used_points['referral'] = use_referral
-        remaining -= use_referral
-    
-    # 4. 유료 포인트 사용
-    if remaining > 0 and balance['paid_points'] > 0:
-        use_paid = min(remaining, balance['paid_points'])
-        used_points['paid'] = use_paid
-        remaining -= use_paid
-    
-    if remaining > 0:
-        raise HTTPException(status_code=400, detail="포인트 잔액이 부족합니다")
-    
-    return used_points
-
 # ===============================================
 # API Endpoints
 # ===============================================
@@ -276,62 +236,27 @@ async def charge_points(request: PointChargeRequest, token: str = Depends(verify
     """포인트 충전"""
     conn = await get_db_connection()
     try:
-        async with conn.transaction():
-            # 보너스 포인트 계산
-            bonus_amount = await calculate_charge_bonus(request.charge_amount)
-            point_amount = request.charge_amount + bonus_amount
-            
-            # 충전 내역 기록
-            charge_id = str(uuid.uuid4())
-            charge_query = """
-            INSERT INTO point_charges 
-            (id, user_id, charge_amount, point_amount, bonus_amount, 
-             payment_method, payment_id, pg_name, payment_status)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, 'completed')
-            """
-            await conn.execute(
-                charge_query, charge_id, request.user_id, request.charge_amount,
-                point_amount, bonus_amount, request.payment_method,
-                request.payment_id, request.pg_name
-            )
-            
-            # 포인트 거래 내역 기록 (유료 포인트)
-            transaction_query = """
-            INSERT INTO point_transactions 
-            (user_id, point_type, transaction_type, amount, balance_after, 
-             source, description, metadata)
-            VALUES ($1, 'paid', 'charge', $2, 
-                   (SELECT COALESCE(paid_points, 0) + $2 FROM user_point_balances WHERE user_id = $1),
-                   'charge', '포인트 충전', $3)
-            """
-            metadata = json.dumps({
-                "charge_id": charge_id,
-                "payment_method": request.payment_method,
-                "charge_amount": request.charge_amount
-            })
-            await conn.execute(transaction_query, request.user_id, point_amount, metadata)
-            
-            # 보너스 포인트가 있으면 별도 기록
-            if bonus_amount > 0:
-                bonus_transaction_query = """
-                INSERT INTO point_transactions 
-                (user_id, point_type, transaction_type, amount, balance_after,
-                 source, description, metadata)
-                VALUES ($1, 'bonus', 'earn', $2,
-                       (SELECT COALESCE(bonus_points, 0) + $2 FROM user_point_balances WHERE user_id = $1),
-                       'charge_bonus', '충전 보너스', $3)
-                """
-                await conn.execute(bonus_transaction_query, request.user_id, bonus_amount, metadata)
-            
-            return PointChargeResponse(
-                success=True,
-                charge_id=charge_id,
-                point_amount=point_amount,
-                bonus_amount=bonus_amount,
-                payment_status="completed",
-                message=f"{request.charge_amount:,}원 충전 완료 (보너스: {bonus_amount:,}P)"
-            )
+        # 보너스 포인트 계산
+        bonus_amount = await calculate_charge_bonus(request.charge_amount)
+        point_amount = request.charge_amount + bonus_amount
+
+        # 충전 기록 + 유료/보너스 거래 내역을 단일 문장으로 처리 (잔액은 트리거가 갱신)
+        result = await point_ledger.charge(
+            conn, request.user_id, request.charge_amount, bonus_amount,
+            request.payment_method, request.payment_id, request.pg_name
+        )
+
+        return PointChargeResponse(
+            success=True,
+            charge_id=result.transaction_id,
+            point_amount=point_amount,
+            bonus_amount=bonus_amount,
+            payment_status="completed",
+            message=f"{request.charge_amount:,}원 충전 완료 (보너스: {bonus_amount:,}P)"
+        )
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"포인트 충전 실패: {e}")
         raise HTTPException(status_code=500, detail="포인트 충전 처리 실패")
@@ -351,53 +276,25 @@ async def use_points(request: PointUsageRequest, token: str = Depends(verify_tok
             if request.amount != service_price:
                 logger.warning(f"서비스 가격 불일치: 요청={request.amount}, 정책={service_price}")
             
-            # 포인트 우선순위에 따른 차감
-            used_points = await use_points_with_priority(request.user_id, request.amount, conn)
-            
-            # 각 포인트 타입별로 거래 내역 기록
-            transaction_id = str(uuid.uuid4())
-            for point_type, amount in used_points.items():
-                if amount > 0:
-                    transaction_query = """
-                    INSERT INTO point_transactions 
-                    (id, user_id, point_type, transaction_type, amount, balance_after,
-                     source, related_service, description, metadata)
-                    VALUES ($1::uuid, $2::uuid, $3::varchar, 'spend', $4::integer,
-                           (SELECT CASE 
-                                WHEN $3::varchar = 'free' THEN COALESCE(free_points, 0) - $4::integer
-                                WHEN $3::varchar = 'bonus' THEN COALESCE(bonus_points, 0) - $4::integer
-                                WHEN $3::varchar = 'paid' THEN COALESCE(paid_points, 0) - $4::integer
-                                WHEN $3::varchar = 'referral' THEN COALESCE(referral_points, 0) - $4::integer
-                            END FROM user_point_balances WHERE user_id = $2::uuid),
-                           'purchase', $5::varchar, $6::text, $7::jsonb)
-                    """
-                    metadata = json.dumps({
-                        "transaction_group": transaction_id,
-                        "total_amount": request.amount,
-                        "used_breakdown": used_points
-                    })
-                    sub_transaction_id = str(uuid.uuid4())
-                    await conn.execute(
-                        transaction_query, sub_transaction_id,
-                        request.user_id, str(point_type), -amount, str(request.service_type),
-                        str(request.description or f"{request.service_type} 서비스 이용"),
-                        metadata
-                    )
-            
-            # 잔액 조회
-            balance_query = """
-            SELECT total_points FROM user_point_balances WHERE user_id = $1
-            """
-            remaining_balance = await conn.fetchval(balance_query, request.user_id) or 0
-            
-            return PointUsageResponse(
-                success=True,
-                transaction_id=transaction_id,
-                remaining_balance=remaining_balance,
-                used_points=used_points,
-                message=f"{request.amount:,}P 사용 완료"
+            # 포인트 우선순위에 따른 차감 + 거래 내역 기록 (단일 문장, 잔액 행 잠금)
+            result = await point_ledger.use(
+                conn, request.user_id, request.amount, str(request.service_type),
+                str(request.description or f"{request.service_type} 서비스 이용")
             )
+
+        # 커밋 전 조회로 이전 개수가 다시 캐시됐을 수 있으므로 커밋 후 한 번 더 무효화
+        point_ledger.invalidate_history_count(request.user_id)
+
+        return PointUsageResponse(
+            success=True,
+            transaction_id=result.transaction_id,
+            remaining_balance=result.total_points,
+            used_points=result.breakdown,
+            message=f"{request.amount:,}P 사용 완료"
+        )
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"포인트 사용 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -409,11 +306,12 @@ async def get_point_history(
     user_id: str,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 대신 키셋 조회)"),
     point_type: Optional[str] = Query(None, pattern="^(free|paid|bonus|referral)$"),
     transaction_type: Optional[str] = Query(None, pattern="^(earn|spend|refund|expire|charge)$"),
     token: str = Depends(verify_token)
 ):
-    """포인트 사용 내역 조회"""
+    """포인트 사용 내역 조회 (cursor 지정 시 키셋 페이지네이션, 미지정 시 기존 page 방식)"""
     conn = await get_db_connection()
     try:
         # 조건 구성
@@ -433,23 +331,31 @@ async def get_point_history(
         
         where_clause = " AND ".join(conditions)
         
-        # 전체 개수 조회
-        count_query = f"SELECT COUNT(*) FROM point_transactions WHERE {where_clause}"
-        total_count = await conn.fetchval(count_query, *params)
+        # 전체 개수 조회 (캐시, 만료 시 백그라운드 갱신)
+        count_query = f"{HISTORY_COUNT_PREFIX}{where_clause}"
+        total_count = await count_cache.get(count_query, params, db_type='main')
         
-        # 페이징된 결과 조회
-        offset = (page - 1) * page_size
+        # 페이징된 결과 조회 (다음 페이지 존재 여부 확인용으로 1건 더 조회)
+        page_params = list(params)
+        if cursor:
+            page_where = f"{where_clause} AND {keyset_condition(cursor, page_params)}"
+            page_params.append(page_size + 1)
+            paging = f"LIMIT ${len(page_params)}"
+        else:
+            page_where = where_clause
+            page_params.extend([page_size + 1, (page - 1) * page_size])
+            paging = f"LIMIT ${len(page_params) - 1} OFFSET ${len(page_params)}"
+
         history_query = f"""
         SELECT id, point_type, transaction_type, amount, balance_after,
                source, related_service, description, expires_at, created_at
         FROM point_transactions 
-        WHERE {where_clause}
-        ORDER BY created_at DESC
-        LIMIT ${param_count + 1} OFFSET ${param_count + 2}
+        WHERE {page_where}
+        {keyset_order()}
+        {paging}
         """
-        params.extend([page_size, offset])
         
-        rows = await conn.fetch(history_query, *params)
+        rows, next_cursor = split_page(await conn.fetch(history_query, *page_params), page_size)
         
         transactions = [
             PointTransactionHistory(
@@ -470,9 +376,12 @@ async def get_point_history(
             transactions=transactions,
             total_count=total_count,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"포인트 내역 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="포인트 내역 조회 실패")
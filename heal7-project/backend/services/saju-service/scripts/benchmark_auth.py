@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+HEAL7 Admin 로그인 처리량 벤치마크
+동시 로그인 상황에서 bcrypt 검증 방식별 처리량과 이벤트 루프 지연 비교
+
+실행: python benchmark_auth.py [동시요청수] [총요청수]
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.auth_service import auth_service
+
+BENCH_PASSWORD = 'heal7-benchmark-password'
+
+
+async def measure_loop_lag(stop_event: asyncio.Event, interval: float = 0.01) -> float:
+    """이벤트 루프 최대 지연(ms) 측정"""
+    max_lag = 0.0
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = (time.perf_counter() - started - interval) * 1000
+        max_lag = max(max_lag, lag)
+    return max_lag
+
+
+async def run_logins(verify, hashed: str, concurrency: int, total: int) -> dict:
+    """동시 로그인 실행 후 처리량/지연 수집"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def login_once():
+        async with semaphore:
+            started = time.perf_counter()
+            assert await verify(BENCH_PASSWORD, hashed)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    stop_event = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop_event))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login_once() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    stop_event.set()
+    max_lag = await lag_task
+
+    latencies.sort()
+    return {
+        'throughput': total / elapsed,
+        'p50_ms': latencies[len(latencies) // 2],
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1],
+        'max_loop_lag_ms': max_lag,
+    }
+
+
+async def main(concurrency: int, total: int):
+    """메인 함수"""
+    print("🚀 HEAL7 로그인 처리량 벤치마크")
+    print("=" * 50)
+    print(f"bcrypt rounds: {auth_service.bcrypt_rounds}, workers: {auth_service.bcrypt_max_workers}")
+    print(f"동시 요청: {concurrency}, 총 요청: {total}")
+
+    hashed = await auth_service.hash_password_async(BENCH_PASSWORD)
+
+    async def blocking_verify(password: str, hashed_password: str) -> bool:
+        return auth_service.verify_password(password, hashed_password)
+
+    results = {
+        '이벤트 루프 직접 실행': await run_logins(blocking_verify, hashed, concurrency, total),
+        '전용 스레드풀 실행': await run_logins(auth_service.verify_password_async, hashed, concurrency, total),
+    }
+
+    print("\n" + "=" * 50)
+    for name, result in results.items():
+        print(f"📊 {name}")
+        print(f"  처리량: {result['throughput']:.1f} logins/s")
+        print(f"  지연 p50/p95: {result['p50_ms']:.1f}ms / {result['p95_ms']:.1f}ms")
+        print(f"  최대 이벤트 루프 지연: {result['max_loop_lag_ms']:.1f}ms")
+
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    asyncio.run(main(concurrency, total))
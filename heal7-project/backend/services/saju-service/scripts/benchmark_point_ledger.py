@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+HEAL7 포인트 원장 동시성 벤치마크
+같은 사용자에 대한 동시 포인트 사용 시 처리량과 잔액 정합성(초과 사용) 검증
+- 기존 방식: 기존 points_router 문장 그대로 (잔액 조회 → 파이썬 분배 → 타입별 거래 내역 INSERT → 잔액 조회)
+- 원장 방식: point_ledger 단일 문장 (잔액 행 잠금 + 분배 + 거래 내역 INSERT)
+- 두 방식 모두 잔액은 DB 측 트리거가 거래 내역으로 갱신
+
+실행: python benchmark_point_ledger.py [동시요청수] [총요청수]
+(DB_HOST/DB_USER/DB_PASSWORD/DB_NAME_MAIN 환경변수의 메인 DB 에 포인트 스키마가 있어야 함)
+"""
+
+import asyncio
+import json
+import sys
+import os
+import time
+import uuid
+
+# 프로젝트 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+
+import asyncpg
+from fastapi import HTTPException
+
+from database_service import db_service
+from point_ledger import point_ledger, USE_PRIORITY
+
+USE_AMOUNT = 10
+
+
+# 기존 points_router 의 거래 내역 INSERT 문 (그대로 재현)
+LEGACY_TRANSACTION_SQL = """
+INSERT INTO point_transactions 
+(id, user_id, point_type, transaction_type, amount, balance_after,
+ source, related_service, description, metadata)
+VALUES ($1::uuid, $2::uuid, $3::varchar, 'spend', $4::integer,
+       (SELECT CASE 
+            WHEN $3::varchar = 'free' THEN COALESCE(free_points, 0) - $4::integer
+            WHEN $3::varchar = 'bonus' THEN COALESCE(bonus_points, 0) - $4::integer
+            WHEN $3::varchar = 'paid' THEN COALESCE(paid_points, 0) - $4::integer
+            WHEN $3::varchar = 'referral' THEN COALESCE(referral_points, 0) - $4::integer
+        END FROM user_point_balances WHERE user_id = $2::uuid),
+       'purchase', $5::varchar, $6::text, $7::jsonb)
+"""
+
+
+async def legacy_use(pool, user_id: str, amount: int):
+    """기존 방식 재현: 잔액 조회 → 파이썬 분배 → 타입별 거래 내역 INSERT → 잔액 조회 (트랜잭션 내, 잠금 없음)"""
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            balance = await conn.fetchrow(
+                "SELECT free_points, bonus_points, paid_points, referral_points "
+                "FROM user_point_balances WHERE user_id = $1",
+                user_id
+            )
+            if not balance:
+                raise HTTPException(status_code=404, detail="사용자 포인트 정보를 찾을 수 없습니다")
+
+            remaining = amount
+            used_points = {'free': 0, 'bonus': 0, 'paid': 0, 'referral': 0}
+            for point_type in USE_PRIORITY:
+                used = min(remaining, balance[f'{point_type}_points'])
+                used_points[point_type] = used
+                remaining -= used
+            if remaining > 0:
+                raise HTTPException(status_code=400, detail="포인트 잔액이 부족합니다")
+
+            transaction_id = str(uuid.uuid4())
+            metadata = json.dumps({
+                "transaction_group": transaction_id,
+                "total_amount": amount,
+                "used_breakdown": used_points
+            })
+            for point_type, used in used_points.items():
+                if used > 0:
+                    await conn.execute(
+                        LEGACY_TRANSACTION_SQL, str(uuid.uuid4()), user_id, point_type, -used,
+                        'benchmark', 'legacy benchmark', metadata
+                    )
+            await conn.fetchval("SELECT total_points FROM user_point_balances WHERE user_id = $1", user_id)
+
+
+async def ledger_use(pool, user_id: str, amount: int):
+    await point_ledger.use(pool, user_id, amount, 'benchmark', 'ledger benchmark')
+
+
+async def run_uses(use, pool, initial: int, concurrency: int, total: int) -> dict:
+    """테스트 사용자 생성 → 동시 사용 → 잔액 정합성 검증 → 정리"""
+    user_id = str(uuid.uuid4())
+    await pool.execute("INSERT INTO user_point_balances (user_id) VALUES ($1)", user_id)
+    await point_ledger.charge(pool, user_id, initial, 0, 'card', pg_name='benchmark')
+
+    semaphore = asyncio.Semaphore(concurrency)
+    succeeded = 0
+    rejected = 0
+
+    async def use_once():
+        nonlocal succeeded, rejected
+        async with semaphore:
+            try:
+                await use(pool, user_id, USE_AMOUNT)
+                succeeded += 1
+            except HTTPException:
+                rejected += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(use_once() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    final_total = await pool.fetchval(
+        "SELECT total_points FROM user_point_balances WHERE user_id = $1", user_id
+    )
+    component_total = await pool.fetchval(
+        "SELECT free_points + bonus_points + referral_points + paid_points "
+        "FROM user_point_balances WHERE user_id = $1", user_id
+    )
+    ledger_total = await pool.fetchval(
+        "SELECT COALESCE(SUM(amount), 0) FROM point_transactions WHERE user_id = $1", user_id
+    )
+
+    await pool.execute("DELETE FROM point_transactions WHERE user_id = $1", user_id)
+    await pool.execute("DELETE FROM point_charges WHERE user_id = $1", user_id)
+    await pool.execute("DELETE FROM user_point_balances WHERE user_id = $1", user_id)
+
+    expected = initial - succeeded * USE_AMOUNT
+    return {
+        'tps': total / elapsed,
+        'succeeded': succeeded,
+        'rejected': rejected,
+        'expected_balance': expected,
+        'final_balance': final_total,
+        'component_balance': component_total,
+        'ledger_total': ledger_total,
+        'lost_updates': (final_total - expected) // USE_AMOUNT,
+        'overdrawn': max(0, succeeded - initial // USE_AMOUNT),
+    }
+
+
+async def main(concurrency: int, total: int):
+    """메인 함수"""
+    print("🚀 HEAL7 포인트 원장 동시성 벤치마크")
+    print("=" * 50)
+    print(f"동시 요청: {concurrency}, 총 요청: {total}, 1회 사용: {USE_AMOUNT}P")
+
+    pool = await asyncpg.create_pool(
+        host=db_service.db_host,
+        port=db_service.db_port,
+        user=db_service.db_user,
+        password=db_service.db_password,
+        database=db_service.db_name_main,
+        min_size=concurrency,
+        max_size=concurrency
+    )
+
+    # 요청의 절반만 성공할 수 있는 잔액으로 시작 (잔액 부족 경계까지 검증)
+    initial = USE_AMOUNT * total // 2
+    try:
+        results = {
+            '기존 방식 (읽기-계산-INSERT)': await run_uses(legacy_use, pool, initial, concurrency, total),
+            '원장 방식 (단일 문장)': await run_uses(ledger_use, pool, initial, concurrency, total),
+        }
+    finally:
+        await pool.close()
+
+    print("\n" + "=" * 50)
+    failed = False
+    for name, result in results.items():
+        print(f"📊 {name}")
+        print(f"  처리량: {result['tps']:.1f} uses/s")
+        print(f"  성공/잔액부족: {result['succeeded']} / {result['rejected']}")
+        print(f"  잔액 (기대/실제/구성합): {result['expected_balance']} / {result['final_balance']} / {result['component_balance']}")
+        print(f"  거래 내역 합계: {result['ledger_total']}")
+        print(f"  유실된 갱신: {result['lost_updates']}")
+        print(f"  잔액 초과 사용: {result['overdrawn']}건")
+
+    ledger = results['원장 방식 (단일 문장)']
+    # 잔액 = 구성 포인트 합 = 거래 내역 합계 여야 함
+    if (ledger['lost_updates'] or ledger['overdrawn'] or ledger['final_balance'] < 0
+            or not ledger['final_balance'] == ledger['component_balance'] == ledger['ledger_total']):
+        print("❌ 원장 방식에서 잔액 불일치 발생")
+        failed = True
+    else:
+        print("✅ 원장 방식 잔액 정합성 확인 (유실된 갱신/초과 사용 없음)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    sys.exit(asyncio.run(main(concurrency, total)))
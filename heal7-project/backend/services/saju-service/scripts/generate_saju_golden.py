@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+HEAL7 사주 엔진 골든 픽스처 생성
+공용 사주 파사드(shared.saju_pillars) 도입 전 엔진들의 4주 출력을 고정 표본 시각에 대해 기록
+- 대상: app PillarCalculator / KasiCalculatorCore, saju-service SajuCalculator / UnifiedSajuCore / SajuService
+- 표본: 10년마다 절입 시각 전후 1분, 자시/축시 경계, 입춘 전 1-2월, 고정 시드 무작위 시각
+- 계산할 수 없던 기둥(엔진 예외)은 null 로 기록
+- tests/test_saju_engine_parity.py 가 현재 엔진 출력과 비교
+
+실행 (파사드 도입 전 트리를 풀어 놓은 backend 경로 지정):
+    git archive <파사드 도입 전 커밋> heal7-project/backend | tar -x -C /tmp/golden
+    python generate_saju_golden.py /tmp/golden/heal7-project/backend [출력 파일]
+"""
+
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+SERVICE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DEFAULT_OUTPUT = os.path.join(SERVICE_DIR, 'tests', 'fixtures', 'saju_engine_golden.json')
+
+SEED = 20250830
+RANDOM_SAMPLES = 240
+START_YEAR, END_YEAR = 1901, 2049
+# 절입 경계 표본 연도 / 절(節) 코드 (입춘=1 ~ 소한=23, 홀수)
+BOUNDARY_YEARS = range(1905, 2050, 10)
+JEOL_CODES = range(1, 24, 2)
+PILLARS = ("year", "month", "day", "hour")
+
+
+def sample_instants(solar_term_table) -> list:
+    """고정 표본 시각 (분 단위)"""
+    rng = random.Random(SEED)
+    instants = set()
+    for year in BOUNDARY_YEARS:
+        for code in JEOL_CODES:
+            instant = solar_term_table.instant(year, code).replace(second=0, microsecond=0)
+            instants.update((instant - timedelta(minutes=1), instant + timedelta(minutes=1)))
+
+    start = datetime(START_YEAR, 1, 1)
+    span_minutes = int((datetime(END_YEAR, 12, 31) - start).total_seconds() // 60)
+    for _ in range(RANDOM_SAMPLES):
+        moment = start + timedelta(minutes=rng.randrange(span_minutes))
+        instants.add(moment)
+        hour, minute = rng.choice(((22, 59), (23, 0), (23, 30), (0, 59), (1, 0), (2, 0)))
+        instants.add(moment.replace(hour=hour, minute=minute))
+        # 입춘 전 양력 1-2월 (년주/월주 경계)
+        instants.add(datetime(moment.year, rng.choice((1, 2)), rng.randint(1, 28), moment.hour, moment.minute))
+    return sorted(instants)
+
+
+def _purge_core_modules():
+    for name in [name for name in sys.modules if name == 'core' or name.startswith('core.')]:
+        del sys.modules[name]
+
+
+def _safe(func, *args):
+    try:
+        return func(*args)
+    except Exception:
+        return None
+
+
+def _compute(engines: dict, instants: list) -> dict:
+    return {name: [_safe(engine, *args) for args in instants] for name, engine in engines.items()}
+
+
+def app_engines(backend_dir: str, instants: list) -> dict:
+    """app/core 엔진 출력 (saju-service 의 core 패키지와 이름이 같아 계산이 끝난 뒤 sys.modules 에서 분리)"""
+    app_dir = os.path.join(backend_dir, 'app')
+    sys.path.insert(0, app_dir)
+    try:
+        from core.atomic.pillar_calculator import PillarCalculator
+        from core.engines.saju_system.kasi_calculator_core import KasiCalculatorCore
+
+        pillar_calculator = PillarCalculator()
+        kasi_core = KasiCalculatorCore()
+
+        def pillar_calculator_engine(y, m, d, h, mi):
+            pillars = pillar_calculator.calculate_all_pillars(datetime(y, m, d, h, mi))
+            return (pillars.year_pillar.ganji, pillars.month_pillar.ganji,
+                    pillars.day_pillar.ganji, pillars.time_pillar.ganji)
+
+        def kasi_core_engine(y, m, d, h, mi):
+            pillars = kasi_core.calculate_saju(y, m, d, h, mi)['pillars']
+            return tuple(pillars[name]['gapja'] for name in PILLARS)
+
+        return _compute({"PillarCalculator": pillar_calculator_engine,
+                         "KasiCalculatorCore": kasi_core_engine}, instants)
+    finally:
+        sys.path.remove(app_dir)
+        _purge_core_modules()
+
+
+def service_engines(backend_dir: str, instants: list) -> dict:
+    """saju-service 엔진 출력"""
+    service_dir = os.path.join(backend_dir, 'services', 'saju-service')
+    sys.path.insert(0, service_dir)
+    try:
+        from core.saju_calculator import SajuCalculator
+        from core.unified_saju_core import UnifiedSajuCore
+        try:
+            from core.saju_service import SajuService
+        except ImportError as e:
+            # SajuService 는 배포 환경의 config.settings 가 있어야 임포트됨
+            print(f"⚠️ SajuService 임포트 실패, null 로 기록: {e}")
+            SajuService = None
+
+        unified_core = UnifiedSajuCore()
+        # 생성자는 설정/DB 서비스를 만들므로 우회 (기둥 계산 메서드만 사용)
+        saju_service = SajuService.__new__(SajuService) if SajuService else None
+
+        def saju_calculator_engine(y, m, d, h, mi):
+            full = SajuCalculator.get_full_saju(y, m, d, h)
+            return tuple(full[f'{name}_pillar'] for name in PILLARS)
+
+        def unified_core_engine(y, m, d, h, mi):
+            result = unified_core.calculate_saju_pillars(y, m, d, h)
+            return tuple(result[f'{name}_pillar'] for name in PILLARS)
+
+        def saju_service_engine(y, m, d, h, mi):
+            if saju_service is None:
+                return None
+            year = _safe(saju_service._get_cheonan_jiji_for_year, y)
+            month = _safe(saju_service._get_month_pillar, y, m, None)
+            day = _safe(saju_service._get_day_pillar, datetime(y, m, d).date())
+            hour = _safe(saju_service._get_time_pillar, day[0], h) if day else None
+            return tuple(''.join(pillar) if pillar else None for pillar in (year, month, day, hour))
+
+        return _compute({"SajuCalculator": saju_calculator_engine,
+                         "UnifiedSajuCore": unified_core_engine,
+                         "SajuService": saju_service_engine}, instants)
+    finally:
+        sys.path.remove(service_dir)
+        _purge_core_modules()
+
+
+def main(backend_dir: str, output: str) -> int:
+    """메인 함수"""
+    print("🔮 HEAL7 사주 엔진 골든 픽스처 생성")
+    print("=" * 50)
+    backend_dir = os.path.abspath(backend_dir)
+    sys.path.insert(0, backend_dir)
+    from shared.solar_term_engine import solar_term_table
+
+    moments = sample_instants(solar_term_table)
+    instants = [(m.year, m.month, m.day, m.hour, m.minute) for m in moments]
+    results = {**app_engines(backend_dir, instants), **service_engines(backend_dir, instants)}
+
+    # 한 줄에 시각 1개: [시각, 엔진별 [년주, 월주, 일주, 시주] | null ...] (엔진 순서는 engines)
+    cases = [
+        [moment.strftime("%Y-%m-%dT%H:%M")] + [outputs[index] for outputs in results.values()]
+        for index, moment in enumerate(moments)
+    ]
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write('{"engines": ' + json.dumps(list(results), ensure_ascii=False) + ',\n "cases": [\n')
+        f.write(',\n'.join(json.dumps(case, ensure_ascii=False) for case in cases))
+        f.write('\n]}\n')
+    print(f"✅ {len(cases)}개 시각 × {len(results)}개 엔진 → {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(main(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else DEFAULT_OUTPUT))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+HEAL7 음양력 테이블 KASI 교차 검증
+음력 월 경계(초하루 전날/당일)를 표본으로 KASI 음양력 API 응답과 로컬 테이블을 비교
+
+실행: KASI_LUNAR_API_KEY=... python validate_lunisolar_calendar.py [표본수] [시작년도] [종료년도]
+"""
+
+import asyncio
+import os
+import random
+import sys
+from datetime import timedelta
+
+import httpx
+
+# backend/shared 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from shared import lunisolar_calendar
+
+KASI_LUNAR_URL = "https://apis.data.go.kr/B090041/openapi/service/LrsrCldInfoService/getLunCalInfo"
+# KASI 사용량 정책: 호출 간 3초 간격
+CALL_INTERVAL_SECONDS = 3
+
+
+def sample_dates(count: int, start_year: int, end_year: int) -> list:
+    """음력 월 경계 표본 (초하루와 그 전날) - 오차가 나기 쉬운 날짜 위주"""
+    boundaries = []
+    for year in range(start_year, end_year + 1):
+        leap = lunisolar_calendar.leap_month(year)
+        months = [(month, False) for month in range(1, 13)] + ([(leap, True)] if leap else [])
+        for month, is_leap in months:
+            first_day = lunisolar_calendar.lunar_to_solar(year, month, 1, is_leap)
+            boundaries.extend([first_day, first_day - timedelta(days=1)])
+
+    random.shuffle(boundaries)
+    return sorted(boundaries[:count])
+
+
+async def fetch_kasi_item(client: httpx.AsyncClient, api_key: str, solar) -> dict:
+    response = await client.get(KASI_LUNAR_URL, params={
+        'serviceKey': api_key,
+        'solYear': solar.year,
+        'solMonth': f"{solar.month:02d}",
+        'solDay': f"{solar.day:02d}",
+        '_type': 'json'
+    })
+    response.raise_for_status()
+    return response.json()['response']['body']['items']['item']
+
+
+async def main(count: int, start_year: int, end_year: int):
+    """메인 함수"""
+    api_key = os.getenv('KASI_LUNAR_API_KEY', '')
+    if not api_key:
+        print("❌ KASI_LUNAR_API_KEY 환경변수가 필요합니다")
+        return 1
+
+    print("🌙 HEAL7 음양력 테이블 KASI 교차 검증")
+    print("=" * 50)
+
+    dates = sample_dates(count, start_year, end_year)
+    items = []
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        for solar in dates:
+            try:
+                items.append(await fetch_kasi_item(client, api_key, solar))
+            except Exception as e:
+                print(f"⚠️ {solar} KASI 조회 실패: {e}")
+            await asyncio.sleep(CALL_INTERVAL_SECONDS)
+
+    mismatches = lunisolar_calendar.cross_validate(items)
+    print(f"📊 일치: {len(items) - len(mismatches)}/{len(items)}")
+    for mismatch in mismatches:
+        print(f"  ❌ {mismatch['solar']}: KASI {mismatch['kasi']} / 로컬 {mismatch['calculated']}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    start_year = int(sys.argv[2]) if len(sys.argv) > 2 else 1900
+    end_year = int(sys.argv[3]) if len(sys.argv) > 3 else 2050
+    sys.exit(asyncio.run(main(count, start_year, end_year)))
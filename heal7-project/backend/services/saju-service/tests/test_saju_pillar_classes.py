@@ -0,0 +1,128 @@
+"""
+HEAL7 사주 4주 동치류 테스트
+
+4주는 시진 경계와 절입 시각에서만 바뀌므로 결과 캐시는 동치류(PillarClass) 하나당 한 항목만 저장합니다.
+표본 날짜(절입일 포함)의 모든 분(分)을 훑어 다음을 확인합니다.
+- 같은 동치류 ⇒ 같은 4주
+- 같은 캐시 키(SmartRoutingManager._cache_key, generate_saju_cache_key) ⇒ 같은 4주
+- 같은 동치류 ⇒ 같은 캐시 키 (두 캐시 키 함수가 같은 기준으로 묶음)
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+APP_DIR = BACKEND_DIR / 'app'
+
+# backend/shared 경로 추가
+sys.path.append(str(BACKEND_DIR))
+
+from shared.saju_pillars import saju_pillar_facade, calculate_pillars_at, pillar_class
+from shared.solar_term_engine import solar_term_table
+
+SEED = 20250830
+START_YEAR, END_YEAR = 1901, 2049
+TERM_DAY_YEAR_STEP = 20
+RANDOM_DAYS = 24
+
+
+def _purge_core_modules():
+    for name in [name for name in sys.modules if name == 'core' or name.startswith('core.')]:
+        del sys.modules[name]
+
+
+def sample_days() -> list:
+    """표본 날짜: 20년마다 절입일 전체 + 고정 시드 무작위 날짜"""
+    rng = random.Random(SEED)
+    days = {
+        solar_term_table.instant(year, code).date()
+        for year in range(START_YEAR, END_YEAR + 1, TERM_DAY_YEAR_STEP)
+        for code in range(1, 24, 2)
+    }
+    start = datetime(START_YEAR, 1, 1)
+    span_days = (datetime(END_YEAR, 12, 31) - start).days
+    days.update((start + timedelta(days=rng.randrange(span_days))).date() for _ in range(RANDOM_DAYS))
+    return sorted(days)
+
+
+def _minutes(day):
+    midnight = datetime.combine(day, datetime.min.time())
+    return (midnight + timedelta(minutes=offset) for offset in range(24 * 60))
+
+
+@pytest.fixture(scope="module")
+def cache_keys():
+    """app 결과 캐시 키 함수 (saju-service 의 core 패키지와 이름이 같아 로드 후 sys.modules 에서 분리)
+
+    반환: (진태양시 보정 분, 이름 → 캐시 키 함수 또는 로드 실패 사유)
+    """
+    _purge_core_modules()
+    sys.path.insert(0, str(APP_DIR))
+    key_functions = {}
+    try:
+        try:
+            from core.engines.saju_system.kasi_calculator_core import KasiCalculatorCore
+        except ImportError as e:
+            pytest.skip(f"app 사주 엔진 의존성 없음: {e}")
+        try:
+            from core.engines.saju_system.smart_routing_manager import SmartRoutingManager
+            # 생성자는 Redis 연결을 만들므로 우회 (캐시 키 메서드만 사용)
+            key_functions["SmartRoutingManager"] = SmartRoutingManager.__new__(SmartRoutingManager)._cache_key
+        except ImportError as e:
+            key_functions["SmartRoutingManager"] = f"의존성 없음: {e}"
+        try:
+            from core.engines.saju_system.performance_optimizer import generate_saju_cache_key
+            key_functions["generate_saju_cache_key"] = generate_saju_cache_key
+        except (ImportError, OSError) as e:
+            # 모듈 전역 최적화기가 배포 환경의 상수 디렉터리를 만듦
+            key_functions["generate_saju_cache_key"] = f"배포 환경 필요: {e}"
+    finally:
+        sys.path.remove(str(APP_DIR))
+        _purge_core_modules()
+    return KasiCalculatorCore.SOLAR_TIME_CORRECTION_MINUTES, key_functions
+
+
+def test_pillar_class_has_single_pillar_set():
+    """같은 동치류에 속한 모든 분의 4주가 같음 (보정이 끝난 시각 기준)"""
+    classes = {}
+    errors = []
+    minutes = 0
+    for day in sample_days():
+        for moment in _minutes(day):
+            minutes += 1
+            key = pillar_class(moment).key()
+            pillars = calculate_pillars_at(moment)[:4]
+            if classes.setdefault(key, pillars) != pillars:
+                errors.append(f"동치류 {key} {moment:%H:%M}: {classes[key]} / {pillars}")
+    assert not errors, errors[:10]
+    # 하루 1,440개 분 단위 키 대신 시진 구간당 하나 (절입이 든 구간만 전/후 둘)
+    assert len(classes) < minutes / 100
+
+
+@pytest.mark.parametrize("name", ["SmartRoutingManager", "generate_saju_cache_key"])
+def test_cache_key_has_single_pillar_set(name, cache_keys):
+    """같은 캐시 키 ⇒ 같은 4주, 같은 동치류 ⇒ 같은 캐시 키 (진태양시 보정 입력 기준)"""
+    correction, key_functions = cache_keys
+    cache_key = key_functions[name]
+    if isinstance(cache_key, str):
+        pytest.skip(f"{name}: {cache_key}")
+
+    pillars_by_key = {}
+    key_by_class = {}
+    errors = []
+    for day in sample_days():
+        for moment in _minutes(day):
+            args = (moment.year, moment.month, moment.day, moment.hour, moment.minute)
+            key = cache_key(*args, False)
+            class_key = saju_pillar_facade.equivalence_class(*args, correction_minutes=correction).key()
+            pillars = tuple(saju_pillar_facade.calculate(*args, correction_minutes=correction).as_dict().values())
+            if pillars_by_key.setdefault(key, pillars) != pillars:
+                errors.append(f"캐시 키 {key} {moment:%Y-%m-%d %H:%M}: {pillars_by_key[key]} / {pillars}")
+            if key_by_class.setdefault(class_key, key) != key:
+                errors.append(f"동치류 {class_key} {moment:%Y-%m-%d %H:%M}: 키 {key_by_class[class_key]} / {key}")
+    assert not errors, errors[:10]
+    assert len(pillars_by_key) == len(key_by_class)
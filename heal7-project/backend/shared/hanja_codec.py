@@ -0,0 +1,126 @@
+"""
+HEAL7 간지 한글/한자 코덱
+
+천간/지지/오행 표기 변환과 속성 조회를 한곳에서 제공합니다.
+상수 모듈(app/core/atomic/constants.py, myeongrihak_constants.py, saju-service saju_constants.py)과
+변환기들이 이 표를 공유하므로 매핑을 따로 정의하지 않습니다.
+
+- 서수 배열: 천간(0-9)/지지(0-11) 서수 → 한글, 한자, 오행, 음양, 띠
+- 문자 → 서수: 한글/한자 어느 쪽이든 같은 서수
+- str.translate 표: 임포트 시 1회 생성, 글자 단위 변환 (글자만으로는 구분할 수 없는 '신'은 지지 申)
+- 간지 변환: 천간 10 × 지지 12 조합을 미리 계산해 위치로 '신'(辛/申) 구분
+- 기둥 목록 일괄 변환: 라우터 응답처럼 기둥 여러 개를 한 번에 변환
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+STEMS_HANGUL: Tuple[str, ...] = ("갑", "을", "병", "정", "무", "기", "경", "신", "임", "계")
+STEMS_HANJA: Tuple[str, ...] = ("甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸")
+BRANCHES_HANGUL: Tuple[str, ...] = ("자", "축", "인", "묘", "진", "사", "오", "미", "신", "유", "술", "해")
+BRANCHES_HANJA: Tuple[str, ...] = ("子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥")
+ELEMENTS_HANGUL: Tuple[str, ...] = ("목", "화", "토", "금", "수")
+ELEMENTS_HANJA: Tuple[str, ...] = ("木", "火", "土", "金", "水")
+YIN_YANG_HANGUL: Tuple[str, ...] = ("양", "음")
+
+# 서수 → 오행 서수 (천간은 두 개씩 목화토금수, 지지는 자수 축토 인목 …)
+STEM_ELEMENT_INDEX: Tuple[int, ...] = tuple(stem // 2 for stem in range(10))
+BRANCH_ELEMENT_INDEX: Tuple[int, ...] = (4, 2, 0, 0, 2, 1, 1, 2, 3, 3, 2, 4)
+
+# 서수 → 속성 (한글 표기)
+STEM_ELEMENT: Tuple[str, ...] = tuple(ELEMENTS_HANGUL[index] for index in STEM_ELEMENT_INDEX)
+BRANCH_ELEMENT: Tuple[str, ...] = tuple(ELEMENTS_HANGUL[index] for index in BRANCH_ELEMENT_INDEX)
+STEM_YIN_YANG: Tuple[str, ...] = tuple(YIN_YANG_HANGUL[stem % 2] for stem in range(10))
+BRANCH_YIN_YANG: Tuple[str, ...] = tuple(YIN_YANG_HANGUL[branch % 2] for branch in range(12))
+BRANCH_ZODIAC: Tuple[str, ...] = ("쥐", "소", "호랑이", "토끼", "용", "뱀", "말", "양", "원숭이", "닭", "개", "돼지")
+
+# 문자 → 서수 (한글/한자 공용)
+STEM_INDEX: Dict[str, int] = {char: index for chars in (STEMS_HANGUL, STEMS_HANJA) for index, char in enumerate(chars)}
+BRANCH_INDEX: Dict[str, int] = {char: index for chars in (BRANCHES_HANGUL, BRANCHES_HANJA) for index, char in enumerate(chars)}
+ELEMENT_INDEX: Dict[str, int] = {char: index for chars in (ELEMENTS_HANGUL, ELEMENTS_HANJA) for index, char in enumerate(chars)}
+
+# 글자 단위 간지 매핑 (한글 '신'은 뒤에 오는 지지 申으로 덮임 - 기존 매핑과 동일)
+GANJI_HANGUL_TO_HANJA: Dict[str, str] = {**dict(zip(STEMS_HANGUL, STEMS_HANJA)), **dict(zip(BRANCHES_HANGUL, BRANCHES_HANJA))}
+GANJI_HANJA_TO_HANGUL: Dict[str, str] = {**dict(zip(STEMS_HANJA, STEMS_HANGUL)), **dict(zip(BRANCHES_HANJA, BRANCHES_HANGUL))}
+
+# str.translate 표 (간지 + 오행)
+TO_HANJA_TABLE = str.maketrans({**GANJI_HANGUL_TO_HANJA, **dict(zip(ELEMENTS_HANGUL, ELEMENTS_HANJA))})
+TO_HANGUL_TABLE = str.maketrans({**GANJI_HANJA_TO_HANGUL, **dict(zip(ELEMENTS_HANJA, ELEMENTS_HANGUL))})
+
+# 천간 × 지지 전체 조합 (60갑자 외 조합도 글자별 변환 결과와 같게 포함)
+_PILLAR_TO_HANJA: Dict[str, str] = {
+    STEMS_HANGUL[stem] + BRANCHES_HANGUL[branch]: STEMS_HANJA[stem] + BRANCHES_HANJA[branch]
+    for stem in range(10) for branch in range(12)
+}
+_PILLAR_TO_HANGUL: Dict[str, str] = {hanja: hangul for hangul, hanja in _PILLAR_TO_HANJA.items()}
+_STEM_TO_HANJA: Dict[str, str] = dict(zip(STEMS_HANGUL, STEMS_HANJA))
+_BRANCH_TO_HANJA: Dict[str, str] = dict(zip(BRANCHES_HANGUL, BRANCHES_HANJA))
+
+
+def to_hanja(text: str) -> str:
+    """한글 → 한자 (글자 단위, 매핑되지 않은 글자는 그대로)"""
+    return text.translate(TO_HANJA_TABLE)
+
+
+def to_hangul(text: str) -> str:
+    """한자 → 한글 (글자 단위, 매핑되지 않은 글자는 그대로)"""
+    return text.translate(TO_HANGUL_TABLE)
+
+
+def _convert_pillar_to_hanja(pillar: str) -> str:
+    stem, branch = pillar[:1], pillar[1:2]
+    return _STEM_TO_HANJA.get(stem, stem) + _BRANCH_TO_HANJA.get(branch, branch) + pillar[2:]
+
+
+def pillar_to_hanja(pillar: str) -> str:
+    """한글 간지 → 한자 간지 (첫 글자 천간, 둘째 글자 지지, 이미 한자면 그대로)"""
+    return _PILLAR_TO_HANJA.get(pillar) or _convert_pillar_to_hanja(pillar)
+
+
+def pillar_to_hangul(pillar: str) -> str:
+    """한자 간지 → 한글 간지 (이미 한글이면 그대로)"""
+    return _PILLAR_TO_HANGUL.get(pillar) or pillar.translate(TO_HANGUL_TABLE)
+
+
+def pillars_to_hanja(pillars: Iterable[str]) -> List[str]:
+    """기둥 목록 일괄 한자 변환"""
+    lookup = _PILLAR_TO_HANJA.get
+    return [lookup(pillar) or _convert_pillar_to_hanja(pillar) for pillar in pillars]
+
+
+def pillars_to_hangul(pillars: Iterable[str]) -> List[str]:
+    """기둥 목록 일괄 한글 변환"""
+    lookup = _PILLAR_TO_HANGUL.get
+    return [lookup(pillar) or pillar.translate(TO_HANGUL_TABLE) for pillar in pillars]
+
+
+def split_pillar(pillar: str) -> Tuple[int, int]:
+    """간지(한글/한자) → (천간 서수, 지지 서수)"""
+    try:
+        return STEM_INDEX[pillar[0]], BRANCH_INDEX[pillar[1]]
+    except (IndexError, KeyError):
+        raise ValueError(f"간지가 아닙니다: {pillar!r}") from None
+
+
+def stem_element(stem: str) -> Optional[str]:
+    """천간(한글/한자)의 오행 (한글)"""
+    index = STEM_INDEX.get(stem)
+    return None if index is None else STEM_ELEMENT[index]
+
+
+def branch_element(branch: str) -> Optional[str]:
+    """지지(한글/한자)의 오행 (한글)"""
+    index = BRANCH_INDEX.get(branch)
+    return None if index is None else BRANCH_ELEMENT[index]
+
+
+def stem_yin_yang(stem: str) -> Optional[str]:
+    """천간(한글/한자)의 음양"""
+    index = STEM_INDEX.get(stem)
+    return None if index is None else STEM_YIN_YANG[index]
+
+
+def branch_yin_yang(branch: str) -> Optional[str]:
+    """지지(한글/한자)의 음양"""
+    index = BRANCH_INDEX.get(branch)
+    return None if index is None else BRANCH_YIN_YANG[index]
+
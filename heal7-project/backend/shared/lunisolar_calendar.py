@@ -0,0 +1,418 @@
+"""
+HEAL7 한국 음양력 변환 엔진 (오프라인, 1900-2100)
+
+음력 한 해의 정보를 정수 하나에 담은 테이블로 양력 ↔ 음력을 O(1)에 변환합니다.
+
+연도별 정수 구조 (LSB 부터):
+- bit 0-12  : 월 대소 (해당 연도의 n번째 달이 30일이면 1, 29일이면 0, 윤달 포함 순서)
+- bit 13-16 : 윤달 위치 (0=없음, n=n월 다음이 윤달)
+- bit 17-22 : 설날의 양력 1월 1일 기준 일수 오프셋
+
+테이블은 천문 계산으로 생성합니다 (python lunisolar_calendar.py --build).
+- 합삭 시각: Meeus 49장 급수
+- 중기 시각: solar_term_engine (VSOP87)
+- 날짜 판정 기준 자오선: 1912-1954.3.20, 1961.8.10 이후 UTC+9 / 그 외 UTC+8:30
+- 동지가 든 달을 11월로 하고, 동지~동지 사이 13개월이면 첫 무중월(중기 없는 달)을 윤달로 둠
+
+KASI 음양력 API 응답과의 교차 검증은 cross_validate() 사용.
+"""
+
+import math
+import sys
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+MIN_LUNAR_YEAR = 1900
+MAX_LUNAR_YEAR = 2100
+
+_MONTH_BITS = 13
+_LEAP_SHIFT = 13
+_OFFSET_SHIFT = 17
+
+# 1900-2100 음력 연도 테이블 (--build 로 생성)
+LUNAR_YEAR_TABLE: Tuple[int, ...] = (
+    0x3d16d2, 0x620752, 0x4c0ea5, 0x38ad4a, 0x5c054b, 0x440a97, 0x309556, 0x56056a,  # 1900
+    0x400b55, 0x2a5752, 0x500752, 0x3ad725, 0x600b25, 0x480a4b, 0x32b29b, 0x580aad,  # 1908
+    0x44056a, 0x2c4b69, 0x520ba9, 0x3efb52, 0x640d92, 0x4c0d25, 0x36ba4d, 0x5c0956,  # 1916
+    0x4602b5, 0x2e95ad, 0x5606d4, 0x400da9, 0x2c5d92, 0x500e92, 0x3acd26, 0x5e0527,  # 1924
+    0x480a57, 0x32b2b6, 0x580ada, 0x4406d4, 0x2e6ea9, 0x520749, 0x3cf693, 0x620a93,  # 1932
+    0x4c052b, 0x34ca5b, 0x5a096d, 0x460b6a, 0x329b54, 0x560ba4, 0x400b49, 0x2a5a93,  # 1940
+    0x500a95, 0x38f52b, 0x5e052d, 0x480aad, 0x34b56a, 0x580db2, 0x440da4, 0x2e7d49,  # 1948
+    0x540d4a, 0x3d1a95, 0x620a96, 0x4c0556, 0x36cab5, 0x5a0ad5, 0x4606d2, 0x308ea5,  # 1956
+    0x560ea5, 0x400e4a, 0x2a6c96, 0x4e0a9b, 0x3af556, 0x5e056a, 0x480b59, 0x34b752,  # 1964
+    0x5a0752, 0x420725, 0x2c964b, 0x520a4b, 0x3d12ab, 0x6002ad, 0x4a056b, 0x36cb69,  # 1972
+    0x5c0da9, 0x460d92, 0x309b25, 0x560d25, 0x415a4d, 0x640a56, 0x4e02b6, 0x38d5ad,  # 1980
+    0x6006d4, 0x480da9, 0x34bd92, 0x5a0e92, 0x440d26, 0x2c6a56, 0x500a57, 0x3d12b6,  # 1988
+    0x620b5a, 0x4c06d4, 0x36aec9, 0x5c0749, 0x460693, 0x2e9527, 0x54052b, 0x3e0a5b,  # 1996
+    0x2a555a, 0x4e036a, 0x38fb55, 0x600ba4, 0x4a0b49, 0x32ba93, 0x580a95, 0x42052d,  # 2004
+    0x2c6a5d, 0x500aad, 0x3d35aa, 0x6205d2, 0x4c0da5, 0x36bd4a, 0x5c0d4a, 0x460a95,  # 2012
+    0x30952d, 0x540556, 0x3e0ab5, 0x2a55aa, 0x5006d2, 0x38cea5, 0x5e0ea5, 0x4a0e4a,  # 2020
+    0x34ac96, 0x560c9b, 0x42055a, 0x2c6ad5, 0x520b69, 0x3d7752, 0x620752, 0x4c0b25,  # 2028
+    0x36d64b, 0x5a0a4b, 0x4404ab, 0x2ea55b, 0x54056d, 0x3e0b69, 0x2a5b52, 0x500d92,  # 2036
+    0x3afd25, 0x5e0d25, 0x480a4d, 0x32b4ad, 0x5802b6, 0x4005b5, 0x2c6da9, 0x520ea9,  # 2044
+    0x3f1d92, 0x620e92, 0x4c0d26, 0x36ca56, 0x5a0a57, 0x4404d6, 0x2e86b5, 0x5406d5,  # 2052
+    0x400ec9, 0x2a6e92, 0x4e0693, 0x38f52b, 0x5e052b, 0x460a5b, 0x32b55a, 0x58056a,  # 2060
+    0x420b55, 0x2c9749, 0x520b49, 0x3d1a93, 0x620a95, 0x4a052d, 0x34caad, 0x5a0ab5,  # 2068
+    0x4605aa, 0x2e8ba5, 0x540da5, 0x400d4a, 0x2a7a95, 0x4e0c95, 0x38f52e, 0x5e0556,  # 2076
+    0x480ab5, 0x32b5b2, 0x5806d2, 0x420ea5, 0x2e9e4a, 0x52064a, 0x3b0c97, 0x600cab,  # 2084
+    0x4c055a, 0x34cad5, 0x5a0b69, 0x460752, 0x3096a5, 0x540b25, 0x3e064b, 0x287497,  # 2092
+    0x4e04ab,  # 2100
+)
+
+
+class LunisolarDate(NamedTuple):
+    """음력 날짜"""
+    year: int
+    month: int
+    day: int
+    is_leap: bool = False
+
+
+def _unpack(packed: int) -> Tuple[int, int, int]:
+    """(월 대소 비트, 윤달 위치, 설날 오프셋)"""
+    return (
+        packed & ((1 << _MONTH_BITS) - 1),
+        (packed >> _LEAP_SHIFT) & 0xF,
+        packed >> _OFFSET_SHIFT,
+    )
+
+
+def _pack(month_lengths: Sequence[int], leap_month: int, new_year_offset: int) -> int:
+    bits = sum(1 << i for i, length in enumerate(month_lengths) if length == 30)
+    return bits | (leap_month << _LEAP_SHIFT) | (new_year_offset << _OFFSET_SHIFT)
+
+
+def _month_count(year_index: int) -> int:
+    return 13 if _LEAP_MONTHS[year_index] else 12
+
+
+# 조회용 파생 테이블 (모듈 로드 시 1회 계산)
+_MONTH_FLAGS: Tuple[int, ...] = tuple(_unpack(packed)[0] for packed in LUNAR_YEAR_TABLE)
+_LEAP_MONTHS: Tuple[int, ...] = tuple(_unpack(packed)[1] for packed in LUNAR_YEAR_TABLE)
+_NEW_YEAR_ORDINALS: Tuple[int, ...] = tuple(
+    date(MIN_LUNAR_YEAR + i, 1, 1).toordinal() + _unpack(packed)[2]
+    for i, packed in enumerate(LUNAR_YEAR_TABLE)
+)
+
+
+def _year_index(year: int) -> int:
+    if not MIN_LUNAR_YEAR <= year <= MAX_LUNAR_YEAR or year - MIN_LUNAR_YEAR >= len(LUNAR_YEAR_TABLE):
+        raise ValueError(f"음력 변환은 {MIN_LUNAR_YEAR}-{MAX_LUNAR_YEAR}년 범위만 지원합니다: {year}")
+    return year - MIN_LUNAR_YEAR
+
+
+def _month_position(year_index: int, month: int, is_leap: bool) -> int:
+    """연도 내 달의 순번 (윤달 포함, 0부터)"""
+    leap = _LEAP_MONTHS[year_index]
+    if is_leap and leap != month:
+        raise ValueError(f"{MIN_LUNAR_YEAR + year_index}년 음력 {month}월에는 윤달이 없습니다")
+    if leap and (month > leap or is_leap):
+        return month
+    return month - 1
+
+
+def _days_before(year_index: int, position: int) -> int:
+    """연도 시작부터 position 번째 달 직전까지의 일수"""
+    flags = _MONTH_FLAGS[year_index] & ((1 << position) - 1)
+    return 29 * position + bin(flags).count("1")
+
+
+def is_supported_solar_date(value: date) -> bool:
+    """테이블 범위 내 양력 날짜 여부"""
+    ordinal = value.toordinal()
+    return bool(_NEW_YEAR_ORDINALS) and _NEW_YEAR_ORDINALS[0] <= ordinal < _year_end_ordinal(len(LUNAR_YEAR_TABLE) - 1)
+
+
+def _year_end_ordinal(year_index: int) -> int:
+    return _NEW_YEAR_ORDINALS[year_index] + _days_before(year_index, _month_count(year_index))
+
+
+def leap_month(year: int) -> int:
+    """윤달 위치 (0=없음)"""
+    return _LEAP_MONTHS[_year_index(year)]
+
+
+def month_days(year: int, month: int, is_leap: bool = False) -> int:
+    """음력 월의 일수 (29 또는 30)"""
+    index = _year_index(year)
+    position = _month_position(index, month, is_leap)
+    return 30 if _MONTH_FLAGS[index] >> position & 1 else 29
+
+
+def year_days(year: int) -> int:
+    """음력 연도의 일수"""
+    index = _year_index(year)
+    return _days_before(index, _month_count(index))
+
+
+def lunar_to_solar(year: int, month: int, day: int, is_leap: bool = False) -> date:
+    """음력 → 양력"""
+    if not 1 <= month <= 12:
+        raise ValueError(f"음력 월은 1-12 범위여야 합니다: {month}")
+    index = _year_index(year)
+    position = _month_position(index, month, is_leap)
+    length = 30 if _MONTH_FLAGS[index] >> position & 1 else 29
+    if not 1 <= day <= length:
+        raise ValueError(f"{year}년 음력 {'윤' if is_leap else ''}{month}월은 {length}일까지입니다")
+    return date.fromordinal(_NEW_YEAR_ORDINALS[index] + _days_before(index, position) + day - 1)
+
+
+def solar_to_lunar(value: date) -> LunisolarDate:
+    """양력 → 음력"""
+    ordinal = value.toordinal()
+    index = value.year - MIN_LUNAR_YEAR
+    if 0 <= index < len(_NEW_YEAR_ORDINALS) and ordinal < _NEW_YEAR_ORDINALS[index]:
+        index -= 1
+    if not 0 <= index < len(_NEW_YEAR_ORDINALS) or ordinal >= _year_end_ordinal(index):
+        raise ValueError(f"음력 변환 지원 범위를 벗어난 날짜입니다: {value}")
+
+    remaining = ordinal - _NEW_YEAR_ORDINALS[index]
+    flags = _MONTH_FLAGS[index]
+    leap = _LEAP_MONTHS[index]
+    for position in range(_month_count(index)):
+        length = 30 if flags >> position & 1 else 29
+        if remaining < length:
+            break
+        remaining -= length
+
+    if leap and position > leap:
+        month, is_leap = position, False
+    elif leap and position == leap:
+        month, is_leap = leap, True
+    else:
+        month, is_leap = position + 1, False
+    return LunisolarDate(MIN_LUNAR_YEAR + index, month, remaining + 1, is_leap)
+
+
+# === 일괄 변환 ===
+
+def _build_month_index() -> Tuple[List[int], List[Tuple[int, int, bool]]]:
+    """전체 음력 월의 시작 서수와 (연, 월, 윤달) 라벨"""
+    starts: List[int] = []
+    labels: List[Tuple[int, int, bool]] = []
+    for index, new_year in enumerate(_NEW_YEAR_ORDINALS):
+        leap = _LEAP_MONTHS[index]
+        for position in range(_month_count(index)):
+            starts.append(new_year + _days_before(index, position))
+            if leap and position == leap:
+                labels.append((MIN_LUNAR_YEAR + index, leap, True))
+            else:
+                labels.append((MIN_LUNAR_YEAR + index, position if leap and position > leap else position + 1, False))
+    if _NEW_YEAR_ORDINALS:
+        starts.append(_year_end_ordinal(len(_NEW_YEAR_ORDINALS) - 1))
+    return starts, labels
+
+
+_MONTH_STARTS, _MONTH_LABELS = _build_month_index()
+
+
+def solar_to_lunar_batch(values: Iterable[date]) -> List[LunisolarDate]:
+    """양력 → 음력 일괄 변환 (NumPy 사용 가능 시 벡터화)"""
+    ordinals = [value.toordinal() for value in values]
+    if not ordinals:
+        return []
+
+    if NUMPY_AVAILABLE:
+        ordinal_array = np.asarray(ordinals, dtype=np.int64)
+        positions = np.searchsorted(np.asarray(_MONTH_STARTS, dtype=np.int64), ordinal_array, side="right") - 1
+        out_of_range = (positions < 0) | (positions >= len(_MONTH_LABELS))
+        if out_of_range.any():
+            raise ValueError(f"음력 변환 지원 범위를 벗어난 날짜가 있습니다: {date.fromordinal(int(ordinal_array[out_of_range][0]))}")
+        days = ordinal_array - np.asarray(_MONTH_STARTS, dtype=np.int64)[positions] + 1
+        return [
+            LunisolarDate(*_MONTH_LABELS[position][:2], int(day), _MONTH_LABELS[position][2])
+            for position, day in zip(positions.tolist(), days.tolist())
+        ]
+
+    results = []
+    for ordinal in ordinals:
+        position = bisect_right(_MONTH_STARTS, ordinal) - 1
+        if not 0 <= position < len(_MONTH_LABELS):
+            raise ValueError(f"음력 변환 지원 범위를 벗어난 날짜입니다: {date.fromordinal(ordinal)}")
+        year, month, is_leap = _MONTH_LABELS[position]
+        results.append(LunisolarDate(year, month, ordinal - _MONTH_STARTS[position] + 1, is_leap))
+    return results
+
+
+def lunar_to_solar_batch(values: Iterable[Tuple[int, int, int, bool]]) -> List[date]:
+    """음력 (연, 월, 일, 윤달) → 양력 일괄 변환"""
+    return [lunar_to_solar(year, month, day, is_leap) for year, month, day, is_leap in values]
+
+
+# === KASI 교차 검증 ===
+
+def cross_validate(kasi_items: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
+    """KASI getLunCalInfo 응답 항목과 비교, 불일치 목록 반환
+
+    항목 필드: solYear, solMonth, solDay, lunYear, lunMonth, lunDay, lunLeapmonth('윤'/'평')
+    """
+    mismatches = []
+    for item in kasi_items:
+        solar = date(int(item["solYear"]), int(item["solMonth"]), int(item["solDay"]))
+        expected = LunisolarDate(
+            int(item["lunYear"]), int(item["lunMonth"]), int(item["lunDay"]),
+            item.get("lunLeapmonth") == "윤"
+        )
+        try:
+            calculated = solar_to_lunar(solar)
+        except ValueError as e:
+            calculated = str(e)
+        if calculated != expected:
+            mismatches.append({"solar": solar.isoformat(), "kasi": expected, "calculated": calculated})
+    return mismatches
+
+
+# === 테이블 생성 (천문 계산) ===
+
+def _korean_calendar_offset_hours(utc: datetime) -> float:
+    """음력 날짜 판정에 쓰는 기준 자오선의 UTC 오프셋"""
+    if datetime(1912, 1, 1) <= utc < datetime(1954, 3, 21) or utc >= datetime(1961, 8, 10):
+        return 9.0
+    return 8.5
+
+
+def _new_moon_jde(k: int) -> float:
+    """k 번째 합삭 시각 (TT 율리우스일, k=0 은 2000-01-06)"""
+    t = k / 1236.85
+    jde = (2451550.09766 + 29.530588861 * k + 0.00015437 * t ** 2
+           - 0.000000150 * t ** 3 + 0.00000000073 * t ** 4)
+    e = 1 - 0.002516 * t - 0.0000074 * t ** 2
+    m = math.radians(2.5534 + 29.10535670 * k - 0.0000014 * t ** 2 - 0.00000011 * t ** 3)
+    mp = math.radians(201.5643 + 385.81693528 * k + 0.0107582 * t ** 2
+                      + 0.00001238 * t ** 3 - 0.000000058 * t ** 4)
+    f = math.radians(160.7108 + 390.67050284 * k - 0.0016118 * t ** 2
+                     - 0.00000227 * t ** 3 + 0.000000011 * t ** 4)
+    omega = math.radians(124.7746 - 1.56375588 * k + 0.0020672 * t ** 2 + 0.00000215 * t ** 3)
+
+    jde += (-0.40720 * math.sin(mp) + 0.17241 * e * math.sin(m)
+            + 0.01608 * math.sin(2 * mp) + 0.01039 * math.sin(2 * f)
+            + 0.00739 * e * math.sin(mp - m) - 0.00514 * e * math.sin(mp + m)
+            + 0.00208 * e * e * math.sin(2 * m) - 0.00111 * math.sin(mp - 2 * f)
+            - 0.00057 * math.sin(mp + 2 * f) + 0.00056 * e * math.sin(2 * mp + m)
+            - 0.00042 * math.sin(3 * mp) + 0.00042 * e * math.sin(m + 2 * f)
+            + 0.00038 * e * math.sin(m - 2 * f) - 0.00024 * e * math.sin(2 * mp - m)
+            - 0.00017 * math.sin(omega) - 0.00007 * math.sin(mp + 2 * m)
+            + 0.00004 * math.sin(2 * mp - 2 * f) + 0.00004 * math.sin(3 * m)
+            + 0.00003 * math.sin(mp + m - 2 * f) + 0.00003 * math.sin(2 * mp + 2 * f)
+            - 0.00003 * math.sin(mp + m + 2 * f) + 0.00003 * math.sin(mp - m + 2 * f)
+            - 0.00002 * math.sin(mp - m - 2 * f) - 0.00002 * math.sin(3 * mp + m)
+            + 0.00002 * math.sin(4 * mp))
+
+    # 행성 섭동 보정
+    planetary = (
+        (325, 299.77 + 0.107408 * k - 0.009173 * t ** 2), (165, 251.88 + 0.016321 * k),
+        (164, 251.83 + 26.651886 * k), (126, 349.42 + 36.412478 * k),
+        (110, 84.66 + 18.206239 * k), (62, 141.74 + 53.303771 * k),
+        (60, 207.14 + 2.453732 * k), (56, 154.84 + 7.306860 * k),
+        (47, 34.52 + 27.261239 * k), (42, 207.19 + 0.121824 * k),
+        (40, 291.34 + 1.844379 * k), (37, 161.72 + 24.198154 * k),
+        (35, 239.56 + 25.513099 * k), (23, 331.55 + 3.592518 * k),
+    )
+    jde += sum(coefficient * math.sin(math.radians(angle)) for coefficient, angle in planetary) / 1e6
+    return jde
+
+
+def _solar_term_engine():
+    try:
+        from . import solar_term_engine
+    except ImportError:
+        import solar_term_engine
+    return solar_term_engine
+
+
+def _local_ordinal(utc: datetime) -> int:
+    return (utc + timedelta(hours=_korean_calendar_offset_hours(utc))).toordinal()
+
+
+def _new_moon_ordinals(first_year: int, last_year: int) -> List[int]:
+    engine = _solar_term_engine()
+    ordinals = []
+    k_start = math.floor((first_year - 2000) * 12.3685) - 1
+    k_end = math.ceil((last_year + 1 - 2000) * 12.3685) + 1
+    for k in range(k_start, k_end + 1):
+        jde = _new_moon_jde(k)
+        decimal_year = 2000 + (jde - engine.J2000) / 365.2425
+        utc = engine._datetime_from_jd(jde - engine.delta_t_seconds(decimal_year) / 86400)
+        ordinals.append(_local_ordinal(utc))
+    return ordinals
+
+
+def _zhongqi_ordinals(first_year: int, last_year: int) -> Dict[Tuple[int, int], int]:
+    """(연도, 중기 코드) → 날짜 서수"""
+    engine = _solar_term_engine()
+    return {
+        (year, code): _local_ordinal(engine.compute_term_instant(year, code) - timedelta(hours=9))
+        for year in range(first_year, last_year + 1)
+        for code in range(2, 25, 2)
+    }
+
+
+def build_year_table() -> List[int]:
+    """천문 계산으로 1900-2100 음력 연도 테이블 생성"""
+    first_year, last_year = MIN_LUNAR_YEAR - 1, MAX_LUNAR_YEAR + 1
+    new_moons = _new_moon_ordinals(first_year, last_year)
+    zhongqi = _zhongqi_ordinals(first_year, last_year)
+    zhongqi_sorted = sorted(zhongqi.values())
+
+    def month_of(ordinal: int) -> int:
+        return bisect_right(new_moons, ordinal) - 1
+
+    def has_zhongqi(i: int) -> bool:
+        position = bisect_right(zhongqi_sorted, new_moons[i] - 1)
+        return position < len(zhongqi_sorted) and zhongqi_sorted[position] < new_moons[i + 1]
+
+    # 달 순번 → (음력 연도, 월, 윤달)
+    labels: Dict[int, Tuple[int, int, bool]] = {}
+    for year in range(first_year, last_year):
+        start = month_of(zhongqi[(year, 22)])
+        end = month_of(zhongqi[(year + 1, 22)])
+        leap_index = None
+        if end - start == 13:
+            leap_index = next(i for i in range(start + 1, end) if not has_zhongqi(i))
+
+        number = 10
+        for i in range(start, end):
+            if i != leap_index:
+                number = number % 12 + 1
+            # 11, 12월(및 그 윤달)은 동지가 속한 해, 1-10월은 다음 해
+            labels[i] = (year if number >= 11 else year + 1, number, i == leap_index)
+
+    table = []
+    for year in range(MIN_LUNAR_YEAR, MAX_LUNAR_YEAR + 1):
+        months = sorted(i for i, (label_year, _, _) in labels.items() if label_year == year)
+        lengths = [new_moons[i + 1] - new_moons[i] for i in months]
+        leap = next((number for i in months for _, number, is_leap in [labels[i]] if is_leap), 0)
+        new_year_offset = new_moons[months[0]] - date(year, 1, 1).toordinal()
+        assert all(length in (29, 30) for length in lengths) and len(lengths) == (13 if leap else 12)
+        table.append(_pack(lengths, leap, new_year_offset))
+    return table
+
+
+def format_year_table(table: Sequence[int], per_line: int = 8) -> str:
+    """소스 코드에 붙여 넣을 테이블 리터럴"""
+    lines = ["LUNAR_YEAR_TABLE: Tuple[int, ...] = ("]
+    for i in range(0, len(table), per_line):
+        chunk = ", ".join(f"0x{value:06x}" for value in table[i:i + per_line])
+        lines.append(f"    {chunk},  # {MIN_LUNAR_YEAR + i}")
+    lines.append(")")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if "--build" in sys.argv:
+        print(format_year_table(build_year_table()))
+
+    if "--verify" in sys.argv:
+        built = build_year_table()
+        diffs = [MIN_LUNAR_YEAR + i for i, (a, b) in enumerate(zip(built, LUNAR_YEAR_TABLE)) if a != b]
+        print(f"📊 천문 계산 ↔ 저장 테이블: {len(built) - len(diffs)}/{len(built)} 일치")
+        for year in diffs:
+            print(f"  ❌ {year}")
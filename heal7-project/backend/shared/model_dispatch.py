@@ -0,0 +1,299 @@
+"""
+HEAL7 호출 경주(헤징) 공용 계층
+사주 티어 라우터 / 사주 AI 해석 엔진 / 멀티모달 분석기가 공유하는 지연 통계와 경주(race) 실행기
+
+- 후보를 순서대로 발사: 앞선 후보가 지연 임계값(후보별 p95, 상하한 적용) 안에 끝나지 않으면
+  다음 후보를 병렬로 시작, 먼저 도착한 유효 결과 사용
+- 진 호출: 기본은 취소 (비동기 SDK 호출처럼 실제로 취소되는 호출 전용),
+  on_late_result 를 주면 끝까지 실행해 유효한 결과를 호출자(캐시)에 전달 (스레드 호출처럼 취소할 수 없는 경우)
+- 실패한 후보는 임계값을 기다리지 않고 즉시 다음 후보로 교체 (failover), 전체 마감 시간(deadline) 초과 시 TimeoutError
+- 후보별 지연 히스토그램 (고정 버킷) + 성공/실패/취소 횟수 + 오류율 EWMA
+  (취소된 호출은 경과 시간이 실제 지연보다 짧으므로 지연 표본에 넣지 않음)
+- 모델별 동시 실행 수 제한 (asyncio 세마포어)
+"""
+
+import asyncio
+import bisect
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+ModelCall = Callable[[], Awaitable[Any]]
+LateResultHandler = Callable[[str, Any], Any]
+
+# 지연 히스토그램 버킷 상한 (ms) - 마지막 버킷은 상한 없음
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000, 30000, 60000)
+
+# 경주에 진 뒤 끝까지 실행 중인 호출 (가비지 컬렉션 방지)
+_late_tasks: Set[asyncio.Future] = set()
+
+
+class ModelDispatchError(RuntimeError):
+    """모든 후보 실패"""
+
+
+class InvalidModelResult(RuntimeError):
+    """모델이 오류 결과(빈 응답, success=False, error 플래그)를 반환"""
+
+
+def is_valid_result(result: Any) -> bool:
+    """유효한 모델 응답 여부"""
+    if not result:
+        return False
+    if isinstance(result, dict):
+        return result.get("success", True) is not False and not result.get("error")
+    return True
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 히스토그램 (버킷 내 선형 보간으로 백분위 추정)"""
+
+    def __init__(self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, latency_ms: float):
+        self.counts[bisect.bisect_left(self.buckets_ms, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.count:
+            return None
+        target = pct / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= target:
+                lower = self.buckets_ms[index - 1] if index else 0.0
+                upper = min(self.buckets_ms[index], self.max_ms) if index < len(self.buckets_ms) else self.max_ms
+                return lower + (upper - lower) * (target - seen) / bucket_count
+            seen += bucket_count
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{int(bound)}ms" for bound in self.buckets_ms] + ["le_inf"]
+        percentiles = {f"p{pct}_ms": self.percentile(pct) for pct in (50, 95, 99)}
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1) if self.count else None,
+            **{name: round(value, 1) if value is not None else None for name, value in percentiles.items()},
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class CallStats:
+    """후보별 지연/결과 통계 (지연 히스토그램 + 오류율 EWMA)"""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.histogram = LatencyHistogram()
+        self.error_ewma = 0.0
+        self.successes = 0
+        self.failures = 0
+        self.cancelled = 0
+
+    def record(self, latency: float, success: bool):
+        """끝까지 실행된 호출의 지연(초)/성공 여부 기록"""
+        self.histogram.observe(latency * 1000)
+        self.error_ewma += self.alpha * ((0.0 if success else 1.0) - self.error_ewma)
+        if success:
+            self.successes += 1
+        else:
+            self.failures += 1
+
+    def record_cancelled(self):
+        """경주에서 져서 취소된 호출 (지연 표본에서 제외)"""
+        self.cancelled += 1
+
+    def hedge_delay(self, default: float, lower: float, upper: float) -> float:
+        """다음 후보 발사 지연(초) = p95 지연 (표본 없으면 기본값, 상하한 적용)"""
+        p95_ms = self.histogram.percentile(95)
+        delay = default if p95_ms is None else p95_ms / 1000
+        return min(upper, max(lower, delay))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "successes": self.successes,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "error_rate_ewma": round(self.error_ewma, 4),
+            "latency": self.histogram.snapshot(),
+        }
+
+
+async def race(attempts: Sequence[Tuple[str, ModelCall]],
+               delay_for: Callable[[str], float],
+               deadline: Optional[float] = None,
+               failover: bool = True,
+               on_late_result: Optional[LateResultHandler] = None) -> Tuple[str, Any]:
+    """후보 경주 → (이긴 후보, 결과)
+
+    attempts: 우선순위 순 (이름, 호출) 목록 - 호출은 실패/무효 결과 시 예외를 던져야 함
+    delay_for: 직전 발사 후보 이름 → 다음 후보 발사까지 기다릴 시간(초)
+    deadline: 전체 마감 시간(초), 초과 시 asyncio.TimeoutError
+    failover: 후보가 실패하면 임계값을 기다리지 않고 다음 후보 발사
+        (False 면 실행 중인 다른 후보가 없을 때 바로 실패 - 호출자가 다음 단계를 직접 선택)
+    on_late_result: (이름, 결과) 콜백 - 진 호출을 취소하지 않고 끝까지 실행해 유효한 결과 전달
+    """
+    if not attempts:
+        raise ModelDispatchError("사용 가능한 후보 없음")
+
+    loop = asyncio.get_running_loop()
+    expires_at = loop.time() + deadline if deadline else None
+    queue = list(attempts)
+    pending: Dict[asyncio.Future, str] = {}
+    errors: List[str] = []
+    last_launched = ""
+
+    def launch():
+        nonlocal last_launched
+        name, factory = queue.pop(0)
+        pending[asyncio.ensure_future(factory())] = name
+        last_launched = name
+
+    launch()
+    try:
+        while pending:
+            timeout = delay_for(last_launched) if queue else None
+            if expires_at is not None:
+                remaining = expires_at - loop.time()
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                if expires_at is not None and loop.time() >= expires_at:
+                    raise asyncio.TimeoutError(f"응답 마감 초과 ({deadline}s): {', '.join(pending.values())}")
+                logger.info(f"⏱️ {last_launched} 지연 - {queue[0][0]} 병렬 발사")
+                launch()
+                continue
+
+            for task in done:
+                name = pending.pop(task)
+                if task.exception() is None:
+                    return name, task.result()
+                errors.append(f"{name}: {task.exception()}")
+                logger.warning(f"❌ {name} 실패: {task.exception()}")
+                if queue and failover:
+                    launch()
+    finally:
+        for task, name in pending.items():
+            if on_late_result is None:
+                task.cancel()
+            else:
+                late = asyncio.ensure_future(_deliver_late(name, task, on_late_result))
+                _late_tasks.add(late)
+                late.add_done_callback(_late_tasks.discard)
+    raise ModelDispatchError("; ".join(errors))
+
+
+async def _deliver_late(name: str, task: asyncio.Future, on_late_result: LateResultHandler):
+    """진 호출을 끝까지 기다려 유효한 결과 전달 (지연/성공은 각 호출기가 실제 값으로 기록)"""
+    try:
+        result = await task
+    except Exception:
+        return  # 실패는 호출기에서 이미 집계
+    try:
+        outcome = on_late_result(name, result)
+        if inspect.isawaitable(outcome):
+            await outcome
+    except Exception as e:
+        logger.warning(f"{name} 늦은 결과 처리 실패: {e}")
+
+
+class ModelPool(CallStats):
+    """모델별 동시 실행 제한 + 통계"""
+
+    def __init__(self, name: str, concurrency: int):
+        super().__init__()
+        self.name = name
+        self.concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"concurrency": self.concurrency, **super().snapshot()}
+
+
+class ModelDispatcher:
+    """모델 호출기 - 동시 실행 제한, 지연 기록, 경주(헤징)"""
+
+    def __init__(self,
+                 concurrency: Optional[Dict[str, int]] = None,
+                 default_concurrency: int = 8,
+                 default_hedge_delay: float = 5.0,
+                 min_hedge_delay: float = 0.5,
+                 max_hedge_delay: float = 20.0):
+        self.default_concurrency = default_concurrency
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.pools: Dict[str, ModelPool] = {}
+        for name, limit in (concurrency or {}).items():
+            self.pools[name] = ModelPool(name, limit)
+
+    def pool(self, name: str) -> ModelPool:
+        if name not in self.pools:
+            self.pools[name] = ModelPool(name, self.default_concurrency)
+        return self.pools[name]
+
+    def hedge_delay(self, name: str) -> float:
+        """다음 모델 발사 지연 = 모델 p95 지연 (표본 없으면 기본값, 상하한 적용)"""
+        return self.pool(name).hedge_delay(self.default_hedge_delay, self.min_hedge_delay, self.max_hedge_delay)
+
+    async def call(self, name: str, factory: ModelCall,
+                   validate: Callable[[Any], bool] = is_valid_result) -> Any:
+        """단일 모델 호출 (동시 실행 수 제한, 지연/성공/실패 기록)"""
+        pool = self.pool(name)
+        async with pool.semaphore:
+            started = time.perf_counter()
+            try:
+                result = await factory()
+            except asyncio.CancelledError:
+                pool.record_cancelled()
+                raise
+            except Exception:
+                pool.record(time.perf_counter() - started, False)
+                raise
+
+        valid = validate(result)
+        pool.record(time.perf_counter() - started, valid)
+        if not valid:
+            raise InvalidModelResult(f"{name} 응답 없음")
+        return result
+
+    async def race(self, attempts: Sequence[Tuple[str, ModelCall]],
+                   deadline: Optional[float] = None,
+                   hedge_delay: Optional[float] = None,
+                   validate: Callable[[Any], bool] = is_valid_result,
+                   on_late_result: Optional[LateResultHandler] = None) -> Tuple[str, Any]:
+        """후보 모델 경주 → (사용된 모델, 결과)
+
+        attempts: 우선순위 순 (모델 이름, 호출) 목록
+        deadline: 전체 마감 시간(초), 초과 시 asyncio.TimeoutError
+        hedge_delay: 다음 모델 발사 지연 고정값 (없으면 직전 발사 모델의 p95)
+        on_late_result: 진 모델의 유효한 응답을 받을 콜백 (없으면 진 호출 취소)
+        """
+        return await race(
+            [(name, lambda name=name, factory=factory: self.call(name, factory, validate))
+             for name, factory in attempts],
+            delay_for=(lambda _: hedge_delay) if hedge_delay is not None else self.hedge_delay,
+            deadline=deadline,
+            on_late_result=on_late_result
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """모델별 동시 실행/지연 통계"""
+        return {name: pool.snapshot() for name, pool in sorted(self.pools.items())}
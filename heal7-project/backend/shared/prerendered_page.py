@@ -0,0 +1,80 @@
+"""
+🗜️ 사전 렌더링 페이지
+- 정적 HTML을 한 번만 인코딩/압축해 바이트 버퍼로 보관
+- 통합 백엔드(app)와 크롤링 서비스 대시보드가 공용으로 사용
+- Accept-Encoding 협상 (br > gzip > identity)
+- ETag / If-None-Match 기반 304 응답
+"""
+
+import gzip
+import hashlib
+from typing import Dict
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+class PrerenderedPage:
+    """압축된 HTML 바이트 버퍼와 ETag를 보관하는 페이지"""
+
+    ENCODING_PREFERENCE = ("br", "gzip")
+
+    def __init__(self, html: str, media_type: str = "text/html; charset=utf-8"):
+        body = html.encode("utf-8")
+        self.media_type = media_type
+        # 압축 방식만 다른 동일 콘텐츠이므로 약한(weak) ETag 사용
+        self.etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        self.variants: Dict[str, bytes] = {
+            "identity": body,
+            "gzip": gzip.compress(body, compresslevel=9),
+        }
+        if BROTLI_AVAILABLE:
+            self.variants["br"] = brotli.compress(body, quality=11)
+
+    def _select_encoding(self, accept_encoding: str) -> str:
+        """Accept-Encoding 헤더에서 사용할 인코딩 선택 (q=0은 제외)"""
+        accepted = set()
+        for part in accept_encoding.lower().split(","):
+            token, _, params = part.strip().partition(";")
+            quality = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    quality = float(params.strip()[2:])
+                except ValueError:
+                    pass
+            if quality > 0:
+                accepted.add(token.strip())
+
+        for encoding in self.ENCODING_PREFERENCE:
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+    def _is_not_modified(self, if_none_match: str) -> bool:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        weak_value = self.etag[2:]
+        return "*" in tags or any(tag in (self.etag, weak_value) for tag in tags)
+
+    def response(self, request: Request) -> Response:
+        """요청 헤더에 맞는 압축 버퍼 또는 304 응답 반환"""
+        headers = {
+            "ETag": self.etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "no-cache",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._is_not_modified(if_none_match):
+            return Response(status_code=304, headers=headers)
+
+        encoding = self._select_encoding(request.headers.get("accept-encoding", ""))
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+
+        return Response(content=self.variants[encoding], media_type=self.media_type, headers=headers)
@@ -0,0 +1,386 @@
+"""
+HEAL7 사주 4주 계산 단일 진입점 (오프라인)
+
+모든 라우터/엔진이 공유하는 사주 계산 파사드입니다.
+입력(양력/음력, 시각 보정)을 정규화한 출생 시각(canonical instant)을 키로
+크기 제한 LRU 캐시 하나를 공유하므로, 엔진별 캐시가 나뉘거나 무한히 커지지 않습니다.
+
+- 년주: 입춘 절입 시각 기준 (solar_term_engine 테이블)
+- 월주: 출생 시각이 속한 절(節) 기준, 오호둔(年干 → 寅月 천간)
+- 일주: 1900-01-31 = 갑진일 기준 60갑자 순환 (자시도 당일 일주 유지)
+- 시주: 자시 23:00-00:59 / 축시 01:00-02:59 …, 오자둔(日干 → 子時 천간)
+- 음력 입력: lunisolar_calendar 로 양력 변환 후 계산
+- 절기 테이블을 불러올 수 없으면 절입일 근사(양력 일자)로 계산
+- 동치류(PillarClass): 4주는 시진 경계와 절입 시각에서만 바뀌므로,
+  결과 캐시는 분 단위 시각 대신 (날짜, 시진 구간, 절입 전/후) 하나당 한 항목만 저장
+
+기존 엔진과의 일치 여부 검증: services/saju-service/tests/test_saju_engine_parity.py
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple, Union
+
+try:
+    from . import solar_term_engine
+except ImportError:
+    try:
+        import solar_term_engine
+    except ImportError:
+        solar_term_engine = None
+
+try:
+    from . import lunisolar_calendar
+except ImportError:
+    try:
+        import lunisolar_calendar
+    except ImportError:
+        lunisolar_calendar = None
+
+try:
+    from .hanja_codec import STEMS_HANGUL, STEMS_HANJA, BRANCHES_HANGUL, BRANCHES_HANJA, pillar_to_hanja
+except ImportError:
+    from hanja_codec import STEMS_HANGUL, STEMS_HANJA, BRANCHES_HANGUL, BRANCHES_HANJA, pillar_to_hanja
+
+# 간지 표기는 hanja_codec 공용 표 사용
+CHEONGAN: Tuple[str, ...] = STEMS_HANGUL
+JIJI: Tuple[str, ...] = BRANCHES_HANGUL
+CHEONGAN_HANJA: Tuple[str, ...] = STEMS_HANJA
+JIJI_HANJA: Tuple[str, ...] = BRANCHES_HANJA
+GAPJA_60: Tuple[str, ...] = tuple(CHEONGAN[i % 10] + JIJI[i % 12] for i in range(60))
+GAPJA_INDEX: Dict[str, int] = {name: index for index, name in enumerate(GAPJA_60)}
+
+# 일주 기준점 (1900-01-31 = 갑진일, 60갑자 인덱스 40)
+DAY_REFERENCE_ORDINAL = date(1900, 1, 31).toordinal()
+DAY_REFERENCE_INDEX = 40
+
+# 년주 기준점 (1900년 = 경자년, 인덱스 36)
+YEAR_REFERENCE = 1900
+YEAR_REFERENCE_INDEX = 36
+
+# 절기 테이블이 없을 때 사용할 양력 월별 절입일 근사 (소한, 입춘, 경칩 … 대설)
+MAJOR_TERM_APPROX_DAYS = (6, 4, 6, 5, 6, 6, 7, 8, 8, 8, 7, 7)
+
+# 한국표준시 자오선(135°E) 기준 경도 1°당 4분
+STANDARD_MERIDIAN = 135.0
+
+
+class SajuPillars(NamedTuple):
+    """사주 4주 계산 결과 (간지는 한글 표기)"""
+    year: str
+    month: str
+    day: str
+    hour: str
+    instant: datetime                 # 보정이 적용된 출생 시각 (캐시 키)
+    solar_date: date                  # 입력 날짜의 양력 (보정 전)
+    lunar: Optional[Tuple[int, int, int, bool]]  # 입력 날짜의 음력 (연, 월, 일, 윤달)
+    month_term: Optional[Tuple[int, datetime]]   # 월주를 결정한 절 (절기 코드, 절입 시각)
+
+    @property
+    def ilgan(self) -> str:
+        return self.day[0]
+
+    def pillar(self, name: str) -> str:
+        return getattr(self, "hour" if name in ("time", "hour") else name)
+
+    def as_dict(self) -> Dict[str, str]:
+        return {"year": self.year, "month": self.month, "day": self.day, "hour": self.hour}
+
+    def __str__(self) -> str:
+        return f"{self.year} {self.month} {self.day} {self.hour}"
+
+
+def to_hanja(gapja: str) -> str:
+    """한글 간지 → 한자 간지 (첫 글자 천간, 둘째 글자 지지 - '신'은 위치로 辛/申 구분)"""
+    return pillar_to_hanja(gapja)
+
+
+def pillar_detail(gapja: str, hanja: bool = False) -> Dict[str, Any]:
+    """간지 → {gapja, cheongan, jiji, cheongan_index, jiji_index}"""
+    index = GAPJA_INDEX[gapja]
+    stem, branch = index % 10, index % 12
+    labels = (CHEONGAN_HANJA, JIJI_HANJA) if hanja else (CHEONGAN, JIJI)
+    return {
+        "gapja": labels[0][stem] + labels[1][branch],
+        "cheongan": labels[0][stem],
+        "jiji": labels[1][branch],
+        "cheongan_index": stem,
+        "jiji_index": branch,
+    }
+
+
+def _gapja(stem: int, branch: int) -> str:
+    return CHEONGAN[stem % 10] + JIJI[branch % 12]
+
+
+def day_gapja(value: Union[date, datetime]) -> str:
+    """일주 (60갑자 순환)"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return GAPJA_60[(DAY_REFERENCE_INDEX + value.toordinal() - DAY_REFERENCE_ORDINAL) % 60]
+
+
+def hour_branch(moment: Union[datetime, time]) -> int:
+    """시지 인덱스 (자시 23:00-00:59)"""
+    return (moment.hour + 1) // 2 % 12
+
+
+def hour_gapja(day_stem: Union[int, str], moment: Union[datetime, time]) -> str:
+    """시주 (오자둔: 갑기일 갑자시, 을경일 병자시 …)"""
+    if isinstance(day_stem, str):
+        day_stem = CHEONGAN.index(day_stem[0])
+    branch = hour_branch(moment)
+    return _gapja(day_stem * 2 + branch, branch)
+
+
+def month_gapja(year_stem: Union[int, str], month_index: int) -> str:
+    """월주 (오호둔) - month_index 0 = 인월 … 11 = 축월"""
+    if isinstance(year_stem, str):
+        year_stem = CHEONGAN.index(year_stem[0])
+    return _gapja(year_stem % 5 * 2 + 2 + month_index, month_index + 2)
+
+
+def _solar_term_table():
+    if solar_term_engine is None:
+        return None
+    return solar_term_engine.solar_term_table
+
+
+def _saju_year(moment: datetime) -> int:
+    """입춘 절입 시각 기준 사주 연도"""
+    table = _solar_term_table()
+    if table is not None and table.supports(moment.year):
+        return moment.year if moment >= table.instant(moment.year, 1) else moment.year - 1
+    return moment.year if (moment.month, moment.day) >= (2, MAJOR_TERM_APPROX_DAYS[1]) else moment.year - 1
+
+
+def _governing_month(moment: datetime) -> Tuple[int, Optional[Tuple[int, datetime]]]:
+    """(월 인덱스 0=인월…11=축월, (절기 코드, 절입 시각) 또는 None)"""
+    table = _solar_term_table()
+    if table is not None and table.supports(moment.year) and table.supports(moment.year - 1):
+        try:
+            _, code, instant = table.governing_term(moment)
+            return (code - 1) // 2, (code, instant)
+        except ValueError:
+            pass
+
+    # 근사: 양력 월의 절입일 이후면 해당 절의 달, 이전이면 직전 달 (1월 소한 = 축월)
+    month_index = (moment.month + 10) % 12
+    if moment.day < MAJOR_TERM_APPROX_DAYS[moment.month - 1]:
+        month_index = (month_index - 1) % 12
+    return month_index, None
+
+
+def calculate_pillars_at(moment: datetime) -> Tuple[str, str, str, str, Optional[Tuple[int, datetime]]]:
+    """보정된 시각 → (년주, 월주, 일주, 시주, 월주 절기) - 캐시 없이 계산"""
+    year_index = (YEAR_REFERENCE_INDEX + _saju_year(moment) - YEAR_REFERENCE) % 60
+    month_index, month_term = _governing_month(moment)
+    day = day_gapja(moment)
+    return (
+        GAPJA_60[year_index],
+        month_gapja(year_index % 10, month_index),
+        day,
+        hour_gapja(GAPJA_INDEX[day] % 10, moment),
+        month_term,
+    )
+
+
+def sijin_slot(moment: Union[datetime, time]) -> int:
+    """시진 구간 (0: 00:00-00:59 자시, 1: 축시 … 11: 해시, 12: 23:00-23:59 자시)
+
+    자시는 날짜가 바뀌는 자정에 걸쳐 있어 같은 날짜 안에서 두 구간(0, 12)으로 나뉩니다.
+    """
+    return (moment.hour + 1) // 2
+
+
+def _slot_window(day: date, slot: int) -> Tuple[datetime, datetime]:
+    """시진 구간의 [시작, 끝) 시각"""
+    midnight = datetime.combine(day, time())
+    return (
+        midnight + timedelta(hours=max(0, slot * 2 - 1)),
+        midnight + timedelta(hours=min(24, slot * 2 + 1)),
+    )
+
+
+class PillarClass(NamedTuple):
+    """4주 동치류 - 같은 동치류에 속한 출생 시각은 4주가 모두 같음"""
+    solar_date: date                  # 입력 날짜의 양력 (달력 정보가 입력 날짜를 따르므로 키에 포함)
+    day: date                         # 보정 시각의 날짜 (일주)
+    slot: int                         # 시진 구간 (sijin_slot)
+    term_instant: Optional[datetime]  # 구간 안에 든 절입 시각 (없으면 None)
+    after_term: Optional[bool]        # 절입 시각 이후 여부 (구간 안에 절입이 있을 때만)
+
+    @property
+    def near_term_boundary(self) -> bool:
+        return self.term_instant is not None
+
+    def key(self) -> str:
+        """캐시 키 문자열 (예: 2025-02-03:2025-02-03:12:a)"""
+        key = f"{self.solar_date.isoformat()}:{self.day.isoformat()}:{self.slot:02d}"
+        if self.near_term_boundary:
+            key += ":a" if self.after_term else ":b"
+        return key
+
+
+def pillar_class(moment: datetime, solar_date: Optional[date] = None) -> PillarClass:
+    """보정된 출생 시각 → 4주 동치류
+
+    시진 구간의 시작과 끝에서 월주를 정한 절이 다르면 구간 안에 절입이 있는 것이므로
+    절입 전/후로 동치류를 나눕니다 (절은 약 30일 간격이라 한 구간에 둘 이상 들지 않음).
+    """
+    moment = moment.replace(second=0, microsecond=0)
+    day = moment.date()
+    slot = sijin_slot(moment)
+    term_instant = _slot_term_instant(day, slot)
+    after_term = None if term_instant is None else moment >= term_instant
+    return PillarClass(solar_date or day, day, slot, term_instant, after_term)
+
+
+@lru_cache(maxsize=4096)
+def _slot_term_instant(day: date, slot: int) -> Optional[datetime]:
+    """시진 구간 안에 든 절입 시각 (없으면 None)"""
+    start, end = _slot_window(day, slot)
+    _, start_term = _governing_month(start)
+    _, end_term = _governing_month(end - timedelta(minutes=1))
+    if end_term is not None and end_term != start_term:
+        return end_term[1]
+    return None
+
+
+class LRUCache:
+    """스레드 안전 크기 제한 LRU 캐시"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def info(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class SajuPillarFacade:
+    """사주 4주 계산 파사드 (정규화된 출생 시각 기준 공유 캐시)"""
+
+    def __init__(self, cache_size: Optional[int] = None):
+        self.cache = LRUCache(cache_size or int(os.getenv("SAJU_PILLAR_CACHE_SIZE", "20000")))
+
+    @staticmethod
+    def canonical_instant(
+        year: int, month: int, day: int, hour: int = 12, minute: int = 0,
+        is_lunar: bool = False, is_leap: bool = False,
+        correction_minutes: float = 0, longitude: Optional[float] = None
+    ) -> Tuple[datetime, date]:
+        """입력 → (보정된 출생 시각, 양력 날짜)
+
+        correction_minutes: 고정 시각 보정 (분)
+        longitude: 지정 시 진태양시 보정 ((경도 - 135°) × 4분) 추가
+        """
+        if is_lunar:
+            if lunisolar_calendar is None:
+                raise ValueError("음양력 테이블을 불러올 수 없어 음력 입력을 계산할 수 없습니다")
+            solar = lunisolar_calendar.lunar_to_solar(year, month, day, is_leap)
+        else:
+            solar = date(year, month, day)
+
+        if longitude is not None:
+            correction_minutes += (longitude - STANDARD_MERIDIAN) * 4
+        moment = datetime.combine(solar, time(hour, minute))
+        if correction_minutes:
+            # 분 단위로 정규화 (같은 분의 입력은 같은 캐시 키)
+            moment += timedelta(minutes=round(correction_minutes))
+        return moment, solar
+
+    def calculate(
+        self, year: int, month: int, day: int, hour: int = 12, minute: int = 0,
+        is_lunar: bool = False, is_leap: bool = False,
+        correction_minutes: float = 0, longitude: Optional[float] = None
+    ) -> SajuPillars:
+        """생년월일시 → 사주 4주"""
+        moment, solar = self.canonical_instant(
+            year, month, day, hour, minute, is_lunar, is_leap, correction_minutes, longitude
+        )
+        return self.calculate_instant(moment, solar)
+
+    def equivalence_class(
+        self, year: int, month: int, day: int, hour: int = 12, minute: int = 0,
+        is_lunar: bool = False, is_leap: bool = False,
+        correction_minutes: float = 0, longitude: Optional[float] = None
+    ) -> PillarClass:
+        """생년월일시 → 4주 동치류 (결과 캐시 키 정규화용)"""
+        moment, solar = self.canonical_instant(
+            year, month, day, hour, minute, is_lunar, is_leap, correction_minutes, longitude
+        )
+        return pillar_class(moment, solar)
+
+    def calculate_datetime(self, birth: datetime, **options) -> SajuPillars:
+        return self.calculate(birth.year, birth.month, birth.day, birth.hour, birth.minute, **options)
+
+    def calculate_instant(self, moment: datetime, solar_date: Optional[date] = None) -> SajuPillars:
+        """보정이 끝난 출생 시각 → 사주 4주 (캐시 조회)"""
+        moment = moment.replace(second=0, microsecond=0)
+        solar_date = solar_date or moment.date()
+        key = (moment, solar_date)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        year, month, day, hour, month_term = calculate_pillars_at(moment)
+        lunar = None
+        if lunisolar_calendar is not None:
+            try:
+                lunar = tuple(lunisolar_calendar.solar_to_lunar(solar_date))
+            except ValueError:
+                lunar = None
+
+        result = SajuPillars(year, month, day, hour, moment, solar_date, lunar, month_term)
+        self.cache.put(key, result)
+        return result
+
+    def cache_info(self) -> Dict[str, Any]:
+        return self.cache.info()
+
+
+saju_pillar_facade = SajuPillarFacade()
+
+
+def calculate_pillars(year: int, month: int, day: int, hour: int = 12, minute: int = 0, **options) -> SajuPillars:
+    """편의 함수: 공유 파사드로 사주 4주 계산"""
+    return saju_pillar_facade.calculate(year, month, day, hour, minute, **options)
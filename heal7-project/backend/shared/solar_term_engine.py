@@ -0,0 +1,362 @@
+"""
+HEAL7 24절기 천문 계산 엔진 (오프라인)
+
+VSOP87 축약 급수(Meeus, Astronomical Algorithms 부록 III)로 겉보기 태양 황경을 구하고,
+황경이 15°의 배수가 되는 순간을 뉴턴 반복으로 찾아 1800-2200년 24절기 시각을 분 단위로 산출합니다.
+
+- 겉보기 황경 = VSOP87 지구 일심 황경 + 180° + FK5 보정 + 황경 장동 + 광행차
+- ΔT(지구시 - 세계시)는 Espenak-Meeus 다항식 사용
+- 시각은 한국표준시(UTC+9) 기준 naive datetime
+- 계산 결과는 압축 테이블(연도 × 24절기, 1800-01-01 00:00 KST 기준 경과 분, uint32)로 미리 저장
+- 요청 처리 경로에서는 테이블 조회만 수행 (네트워크/급수 계산 없음)
+
+절기 코드는 KASIService 와 동일합니다 (1=입춘 … 22=동지, 23=소한, 24=대한).
+연도 Y 의 소한/대한은 Y년 1월, 나머지는 Y년 2-12월에 위치합니다.
+
+테이블 재생성: python solar_term_engine.py --build
+KASI 기준 데이터 검증: python solar_term_engine.py --validate
+"""
+
+import math
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 지원 연도 범위
+MIN_YEAR = 1800
+MAX_YEAR = 2200
+TERMS_PER_YEAR = 24
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solar_terms_1800_2200.bin")
+TABLE_EPOCH = datetime(MIN_YEAR, 1, 1)
+
+# 절기 코드 순서 (인덱스 = 코드 - 1)
+SOLAR_TERM_NAMES: Tuple[str, ...] = (
+    "입춘", "우수", "경칩", "춘분", "청명", "곡우",
+    "입하", "소만", "망종", "하지", "소서", "대서",
+    "입추", "처서", "백로", "추분", "한로", "상강",
+    "입동", "소설", "대설", "동지", "소한", "대한",
+)
+SOLAR_TERM_CODES: Dict[str, int] = {name: code for code, name in enumerate(SOLAR_TERM_NAMES, 1)}
+
+# 월주 경계가 되는 절(節) - 홀수 코드
+MAJOR_TERM_CODES: Tuple[int, ...] = tuple(range(1, TERMS_PER_YEAR + 1, 2))
+
+J2000 = 2451545.0
+J2000_DATETIME = datetime(2000, 1, 1, 12, 0, 0)
+KST_OFFSET_DAYS = 9 / 24
+
+# VSOP87D 지구 일심 황경 급수 (A, B, C): A * cos(B + C * tau), 단위 1e-8 rad
+_EARTH_L0 = (
+    (175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517),
+    (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+    (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+    (1273, 2.0371, 529.691), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+    (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+    (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+    (357, 2.92, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+    (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314),
+    (205, 1.869, 5573.143), (202, 2.458, 6069.777), (156, 0.833, 213.299),
+    (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+    (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+    (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69),
+    (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15),
+    (79, 3.04, 12036.46), (75, 1.76, 5088.63), (74, 3.5, 3154.69),
+    (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+    (61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5),
+    (56, 3.47, 6279.55), (52, 0.19, 12139.55), (52, 1.33, 1748.02),
+    (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24),
+    (41, 2.4, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+    (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+    (33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87),
+    (25, 3.16, 4690.48),
+)
+_EARTH_L1 = (
+    (628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517),
+    (425, 1.59, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344),
+    (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15),
+    (67, 4.41, 5507.55), (59, 2.89, 5223.69), (56, 2.17, 155.42),
+    (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+    (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3),
+    (17, 2.99, 6275.96), (16, 0.03, 2544.31), (16, 1.43, 2146.17),
+    (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63),
+    (12, 5.27, 1194.45), (12, 2.08, 4694.0), (11, 0.77, 553.57),
+    (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+    (9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76),
+    (6, 4.67, 4690.48),
+)
+_EARTH_L2 = (
+    (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+    (27, 0.05, 3.52), (16, 5.19, 26.3), (16, 3.68, 155.42),
+    (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+    (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+    (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+    (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+    (2, 4.38, 5223.69), (2, 3.75, 0.98),
+)
+_EARTH_L3 = (
+    (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+    (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23),
+    (1, 5.97, 242.73),
+)
+_EARTH_L4 = ((114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15))
+_EARTH_L5 = ((1, 3.14, 0),)
+_EARTH_L = (_EARTH_L0, _EARTH_L1, _EARTH_L2, _EARTH_L3, _EARTH_L4, _EARTH_L5)
+
+# 지구-태양 거리(광행차 보정용) 주요 항, 단위 1e-8 AU
+_EARTH_R0 = ((100013989, 0, 0), (1670700, 3.0984635, 6283.07585), (13956, 3.05525, 12566.1517))
+_EARTH_R1 = ((103019, 1.10749, 6283.07585),)
+
+
+def _series(terms: Sequence[Tuple[float, float, float]], tau: float) -> float:
+    return sum(a * math.cos(b + c * tau) for a, b, c in terms)
+
+
+def delta_t_seconds(decimal_year: float) -> float:
+    """ΔT = TT - UT (초), Espenak-Meeus 다항식 (1800-2200 구간)"""
+    y = decimal_year
+    if y < 1860:
+        t = y - 1800
+        return (13.72 - 0.332447 * t + 0.0068612 * t ** 2 + 0.0041116 * t ** 3
+                - 0.00037436 * t ** 4 + 0.0000121272 * t ** 5
+                - 0.0000001699 * t ** 6 + 0.000000000875 * t ** 7)
+    if y < 1900:
+        t = y - 1860
+        return (7.62 + 0.5737 * t - 0.251754 * t ** 2 + 0.01680668 * t ** 3
+                - 0.0004473624 * t ** 4 + t ** 5 / 233174)
+    if y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t ** 2 + 0.0061966 * t ** 3 - 0.000197 * t ** 4
+    if y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t ** 2 + 0.0020936 * t ** 3
+    if y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t ** 2 / 233 + t ** 3 / 2547
+    if y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t ** 2 / 260 - t ** 3 / 718
+    if y < 2005:
+        t = y - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3
+                + 0.000651814 * t ** 4 + 0.00002373599 * t ** 5)
+    if y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+    u = (y - 1820) / 100
+    if y < 2150:
+        return -20 + 32 * u ** 2 - 0.5628 * (2150 - y)
+    return -20 + 32 * u ** 2
+
+
+def apparent_solar_longitude(jde: float) -> float:
+    """겉보기 태양 황경(도), jde 는 역학시(TT) 기준 율리우스일"""
+    tau = (jde - J2000) / 365250
+    t = tau * 10
+
+    # VSOP87 지구 일심 황경 → 지심 태양 황경
+    heliocentric = sum(_series(terms, tau) * tau ** power for power, terms in enumerate(_EARTH_L)) / 1e8
+    longitude = math.degrees(heliocentric) + 180.0
+
+    # FK5 기준계 보정
+    longitude -= 0.09033 / 3600
+
+    # 황경 장동 (Meeus 22장 간이식, 0.5" 정밀도)
+    omega = math.radians(125.04452 - 1934.136261 * t)
+    sun_mean = math.radians(280.4665 + 36000.7698 * t)
+    moon_mean = math.radians(218.3165 + 481267.8813 * t)
+    nutation = (-17.20 * math.sin(omega) - 1.32 * math.sin(2 * sun_mean)
+                - 0.23 * math.sin(2 * moon_mean) + 0.21 * math.sin(2 * omega))
+    longitude += nutation / 3600
+
+    # 광행차
+    radius = (_series(_EARTH_R0, tau) + _series(_EARTH_R1, tau) * tau) / 1e8
+    longitude -= 20.4898 / 3600 / radius
+
+    return longitude % 360.0
+
+
+def term_longitude(code: int) -> float:
+    """절기 코드의 태양 황경 (입춘 315° 부터 15° 간격)"""
+    return (315.0 + 15.0 * (code - 1)) % 360.0
+
+
+def _datetime_from_jd(jd: float) -> datetime:
+    return J2000_DATETIME + timedelta(days=jd - J2000)
+
+
+def _jd_from_datetime(value: datetime) -> float:
+    return J2000 + (value - J2000_DATETIME).total_seconds() / 86400
+
+
+def solve_term_jde(year: int, code: int) -> float:
+    """절기 시각(TT 율리우스일)을 뉴턴 반복으로 계산"""
+    target = term_longitude(code)
+
+    # 초기값: 입춘(2/4)부터 절기당 평균 15.22일, 소한/대한은 같은 해 1월
+    jde = _jd_from_datetime(datetime(year, 2, 4)) + (code - 1) * 365.2422 / TERMS_PER_YEAR
+    if code >= 23:
+        jde -= 365.2422
+
+    for _ in range(10):
+        correction = 58.13 * math.sin(math.radians(target - apparent_solar_longitude(jde)))
+        jde += correction
+        if abs(correction) < 1e-7:
+            break
+    return jde
+
+
+def compute_term_instant(year: int, code: int) -> datetime:
+    """절기 시각 (KST, 초 단위) - 테이블을 거치지 않고 직접 계산"""
+    jde = solve_term_jde(year, code)
+    decimal_year = 2000 + (jde - J2000) / 365.2425
+    jd_ut = jde - delta_t_seconds(decimal_year) / 86400
+    return _datetime_from_jd(jd_ut + KST_OFFSET_DAYS)
+
+
+def _year_minutes(year: int) -> List[int]:
+    """한 해 24절기의 테이블 값(기준 시각 이후 경과 분)"""
+    return [
+        round((compute_term_instant(year, code) - TABLE_EPOCH).total_seconds() / 60)
+        for code in range(1, TERMS_PER_YEAR + 1)
+    ]
+
+
+def _uint32_array() -> array:
+    return array('I') if array('I').itemsize == 4 else array('L')
+
+
+def build_table(path: str = TABLE_PATH) -> int:
+    """1800-2200년 절기 테이블 생성 및 저장 (리틀 엔디안 uint32), 저장된 항목 수 반환"""
+    table = _uint32_array()
+    for year in range(MIN_YEAR, MAX_YEAR + 1):
+        table.extend(_year_minutes(year))
+
+    if sys.byteorder == 'big':
+        table.byteswap()
+    with open(path, 'wb') as f:
+        table.tofile(f)
+    return len(table)
+
+
+class SolarTermTable:
+    """미리 계산된 24절기 테이블 조회기"""
+
+    def __init__(self, path: str = TABLE_PATH):
+        self.path = path
+        self._table: Optional[array] = None
+        # 테이블 파일이 없을 때 계산한 연도 캐시
+        self._computed: Dict[int, List[int]] = {}
+
+    def _load(self) -> Optional[array]:
+        if self._table is None and os.path.exists(self.path):
+            table = _uint32_array()
+            with open(self.path, 'rb') as f:
+                table.frombytes(f.read())
+            if sys.byteorder == 'big':
+                table.byteswap()
+            if len(table) == (MAX_YEAR - MIN_YEAR + 1) * TERMS_PER_YEAR:
+                self._table = table
+        return self._table
+
+    @staticmethod
+    def supports(year: int) -> bool:
+        return MIN_YEAR <= year <= MAX_YEAR
+
+    def _minutes(self, year: int, code: int) -> int:
+        if not self.supports(year):
+            raise ValueError(f"절기 테이블은 {MIN_YEAR}-{MAX_YEAR}년 범위만 지원합니다: {year}")
+        if not 1 <= code <= TERMS_PER_YEAR:
+            raise ValueError(f"절기 코드는 1-24 범위여야 합니다: {code}")
+
+        table = self._load()
+        if table is not None:
+            return table[(year - MIN_YEAR) * TERMS_PER_YEAR + code - 1]
+
+        if year not in self._computed:
+            self._computed[year] = _year_minutes(year)
+        return self._computed[year][code - 1]
+
+    def instant(self, year: int, code: int) -> datetime:
+        """절기 시각 (KST, 분 단위)"""
+        return TABLE_EPOCH + timedelta(minutes=self._minutes(year, code))
+
+    def terms_for_year(self, year: int) -> List[Tuple[int, str, datetime]]:
+        """연도별 24절기 (코드, 이름, KST 시각) - 시각순"""
+        terms = [(code, SOLAR_TERM_NAMES[code - 1], self.instant(year, code)) for code in range(1, TERMS_PER_YEAR + 1)]
+        terms.sort(key=lambda term: term[2])
+        return terms
+
+    def terms_for_month(self, year: int, month: int) -> List[Tuple[int, str, datetime]]:
+        """월별 절기 (코드, 이름, KST 시각) - 시각순"""
+        return [term for term in self.terms_for_year(year) if term[2].month == month]
+
+    def governing_term(self, moment: datetime, major_only: bool = True) -> Tuple[int, int, datetime]:
+        """주어진 시각(KST) 직전에 시작된 절기 (절기 연도, 코드, 시각)
+
+        major_only=True 이면 월주 경계가 되는 절(節)만 고려합니다.
+        """
+        codes = MAJOR_TERM_CODES if major_only else tuple(range(1, TERMS_PER_YEAR + 1))
+        candidates: List[Tuple[datetime, int, int]] = []
+        for year in (moment.year - 1, moment.year):
+            if self.supports(year):
+                candidates.extend((self.instant(year, code), year, code) for code in codes)
+        candidates.sort()
+
+        position = bisect_right([instant for instant, _, _ in candidates], moment)
+        if position == 0:
+            raise ValueError(f"절기 테이블 범위를 벗어난 시각입니다: {moment}")
+        instant, year, code = candidates[position - 1]
+        return year, code, instant
+
+
+def validate_against_reference(
+    reference: Dict[int, Iterable[Tuple[str, int, int]]],
+    table: Optional[SolarTermTable] = None
+) -> List[Dict[str, object]]:
+    """(절기명, 월, 일) 형식의 기준 데이터와 날짜 비교, 불일치 목록 반환"""
+    table = table or solar_term_table
+    mismatches = []
+    for year, terms in reference.items():
+        for name, month, day in terms:
+            instant = table.instant(year, SOLAR_TERM_CODES[name])
+            if (instant.month, instant.day) != (month, day):
+                mismatches.append({
+                    "year": year,
+                    "name": name,
+                    "reference": f"{year}-{month:02d}-{day:02d}",
+                    "calculated": instant.isoformat(),
+                })
+    return mismatches
+
+
+solar_term_table = SolarTermTable()
+
+
+if __name__ == "__main__":
+    if "--build" in sys.argv:
+        count = build_table()
+        print(f"✅ 절기 테이블 생성 완료: {count}개 ({TABLE_PATH})")
+
+    if "--validate" in sys.argv:
+        import importlib.util
+
+        # 패키지 __init__ 의 부수 효과 없이 데이터 로더 모듈만 로드
+        loader_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "app", "core", "engines", "saju_system", "solar_terms_data_loader.py"
+        )
+        spec = importlib.util.spec_from_file_location("solar_terms_data_loader", loader_path)
+        loader_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader_module)
+        SolarTermsDataLoader = loader_module.SolarTermsDataLoader
+
+        reference = SolarTermsDataLoader().exact_dates_2024_2026
+        mismatches = validate_against_reference(reference)
+        total = sum(len(terms) for terms in reference.values())
+        print(f"📊 KASI 기준 데이터 검증: {total - len(mismatches)}/{total} 일치")
+        for mismatch in mismatches:
+            print(f"  ❌ {mismatch['year']} {mismatch['name']}: 기준 {mismatch['reference']} / 계산 {mismatch['calculated']}")